@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Sequence
+
+_HERE = Path(__file__).resolve().parent
+_SRC = _HERE.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))  # same layout run.ps1 uses (PYTHONPATH=src)
+
+from benchmarks import datagen, runner  # noqa: E402
+
+CACHE_DIR = _HERE / ".data"
+RESULTS_DIR = _HERE / "results"
+
+
+def _rows(args: argparse.Namespace) -> int:
+    return int(args.rows) if args.rows else datagen.SCALES[args.scale]
+
+
+def _dataset(args: argparse.Namespace) -> datagen.DatasetInfo:
+    rows = _rows(args)
+    anchor = date.fromisoformat(args.anchor)
+    if not datagen.cache_path(CACHE_DIR, rows, args.seed, anchor, args.years).exists():
+        print(f"Generating {rows} rows (seed {args.seed}) …", flush=True)
+    info = datagen.open_or_generate(CACHE_DIR, rows, args.seed, anchor, args.years)
+    if info.generate_s:
+        print(f"  generated in {info.generate_s:.1f} s: {info.path.name}")
+    return info
+
+
+def _cmd_generate(args: argparse.Namespace) -> int:
+    info = _dataset(args)
+    for table, n in info.counts.items():
+        print(f"  {table}: {n}")
+    return 0
+
+
+def _cmd_list(args: argparse.Namespace) -> int:
+    for c in runner.select(args.k):
+        print(f"{c.name}{'  (write)' if c.write else ''}")
+    return 0
+
+
+def _print_case(res: runner.CaseResult) -> None:
+    size = "" if res.result_size is None else f"  [{res.result_size}]"
+    counters = "".join(f"  {k}={v}" for k, v in res.counters.items())
+    print(f"  {res.name:<58} {res.median_ms:>10.3f} ms  p95 {res.p95_ms:>10.3f}  n={res.n}{size}{counters}", flush=True)
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    cases = runner.select(args.k)
+    if not cases:
+        print("No matching cases", file=sys.stderr)
+        return 2
+    info = _dataset(args)
+    doc = runner.run_cases(info, cases, args.seed, repeat=args.repeat, budget_s=args.budget, progress=_print_case)
+    return _finish(doc, args, info.rows)
+
+
+def _cmd_ui(args: argparse.Namespace) -> int:
+    try:
+        from benchmarks import ui
+    except ImportError as e:
+        print(f"UI benchmarks need PySide6: {e}", file=sys.stderr)
+        return 2
+
+    cases = ui.select(args.k)
+    if not cases:
+        print("No matching cases", file=sys.stderr)
+        return 2
+    info = _dataset(args)
+    doc = ui.run_ui_cases(info, cases, args.seed, repeat=args.repeat, budget_s=args.budget, progress=_print_case)
+    return _finish(doc, args, info.rows)
+
+
+def _finish(doc: dict, args: argparse.Namespace, rows: int) -> int:
+    """Report failures, write the result and run the optional baseline check."""
+    for name, r in doc["cases"].items():
+        if "error" in r:
+            print(f"  {name}: FAILED {r['error']}", file=sys.stderr)
+
+    meta = doc["meta"]
+    out = Path(args.out) if args.out else RESULTS_DIR / (
+        f"{meta['created_at'][:10]}-{meta['commit'] or 'nogit'}-{meta['suite']}-{rows}.json"
+    )
+    runner.write_result(doc, out)
+    print(f"Wrote {out}")
+    if args.baseline:
+        return _report(runner.load_result(Path(args.baseline)), doc, args.threshold, args.floor_ms)
+    return 0
+
+
+def _report(base: dict, cur: dict, threshold: float, floor_ms: float) -> int:
+    cmp = runner.compare(base, cur, threshold=threshold, floor_ms=floor_ms)
+    for w in cmp.warnings:
+        print(f"warning: {w}")
+    for d in cmp.regressions:
+        print(f"REGRESSION {d.name}: {d.base_ms:.3f} -> {d.cur_ms:.3f} ms (x{d.ratio:.2f})")
+    for d in cmp.improvements:
+        print(f"improved   {d.name}: {d.base_ms:.3f} -> {d.cur_ms:.3f} ms (x{d.ratio:.2f})")
+    for name in cmp.missing:
+        print(f"MISSING    {name} (failed or removed)")
+    for note in cmp.counts_changed:
+        print(f"note       {note}")
+    print(
+        f"{len(cmp.regressions)} regressed, {len(cmp.improvements)} improved, {cmp.unchanged} unchanged "
+        f"(threshold {threshold:.0%}, floor {floor_ms} ms)"
+    )
+    return 1 if cmp.regressions or cmp.missing else 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    try:
+        base = runner.load_result(Path(args.baseline))
+        cur = runner.load_result(Path(args.current))
+    except (OSError, ValueError) as e:
+        print(f"Compare failed: {e}", file=sys.stderr)
+        return 2
+    return _report(base, cur, args.threshold, args.floor_ms)
+
+
+def _add_dataset_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--scale", choices=tuple(datagen.SCALES), default="small", help="Dataset size preset")
+    p.add_argument("--rows", type=int, help="Approximate total rows (overrides --scale)")
+    p.add_argument("--seed", type=int, default=1, help="Generator and case seed")
+    p.add_argument("--anchor", default=datagen.ANCHOR.isoformat(), help="Dataset 'now' (YYYY-MM-DD)")
+    p.add_argument("--years", type=int, default=4, help="Years of history before the anchor")
+
+
+def _add_threshold_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--threshold", type=float, default=runner.DEFAULT_THRESHOLD, help="Allowed relative slowdown")
+    p.add_argument("--floor-ms", type=float, default=runner.DEFAULT_FLOOR_MS, help="Ignore changes below this")
+
+
+def _add_run_args(p: argparse.ArgumentParser) -> None:
+    _add_dataset_args(p)
+    p.add_argument("-k", action="append", default=[], help="Only cases whose name contains this (repeatable)")
+    p.add_argument("--repeat", type=int, default=runner.DEFAULT_REPEAT, help="Timed calls per case")
+    p.add_argument("--budget", type=float, default=runner.CASE_BUDGET_S, help="Seconds per case before stopping early")
+    p.add_argument("--out", help="Result file (default: benchmarks/results/<date>-<commit>-<suite>-<rows>.json)")
+    p.add_argument("--baseline", help="Compare against this result and exit 1 on regressions")
+    _add_threshold_args(p)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Lux Planner benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Generate (or reuse) a cached dataset")
+    _add_dataset_args(gen)
+    gen.set_defaults(func=_cmd_generate)
+
+    lst = sub.add_parser("list", help="List benchmark cases")
+    lst.add_argument("-k", action="append", default=[], help="Only cases whose name contains this")
+    lst.set_defaults(func=_cmd_list)
+
+    run = sub.add_parser("run", help="Run data layer cases and write a JSON result")
+    _add_run_args(run)
+    run.set_defaults(func=_cmd_run)
+
+    ui = sub.add_parser("ui", help="Run headless (offscreen Qt) view cases and write a JSON result")
+    _add_run_args(ui)
+    ui.set_defaults(func=_cmd_ui)
+
+    cmp = sub.add_parser("compare", help="Compare two results; exit 1 on regressions")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    _add_threshold_args(cmp)
+    cmp.set_defaults(func=_cmd_compare)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import io
+import random
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Iterator
+
+from lux.core.events import ChangeBus
+from lux.core.scheduler.autoschedule import PlanItem
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.core.scheduler.service import SchedulerService
+from lux.core.undo import UndoJournal
+from lux.data.change_feed import ChangeFeed
+from lux.data.repositories.change_log_repo import ChangeLogRepo
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.data.repositories.undo_repo import UndoLogRepo
+from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.scheduler_provider import register_tasks_scheduler_provider
+from lux.features.tasks.service import TasksService
+
+from benchmarks.datagen import DatasetInfo
+
+
+@dataclass
+class BenchContext:
+    conn: sqlite3.Connection
+    info: DatasetInfo
+    rng: random.Random
+    tasks_repo: TasksRepository
+    schedule_repo: ScheduledEntryRepo
+    tasks: TasksService
+    scheduler: SchedulerService
+    registry: SchedulerProviderRegistry
+    bus: ChangeBus
+    journal: UndoJournal
+
+    @property
+    def anchor(self) -> date:
+        return self.info.anchor
+
+    def day(self, offset: int = 0) -> str:
+        return (self.anchor + timedelta(days=offset)).isoformat()
+
+    def ts(self, offset: int = 0, hour: int = 0) -> str:
+        return f"{self.day(offset)} {hour:02d}:00:00"
+
+    def ids(self, table: str, k: int) -> list[int]:
+        n = max(1, self.info.counts.get(table, 1))
+        return [self.rng.randrange(1, n + 1) for _ in range(k)]
+
+
+def open_context(conn: sqlite3.Connection, info: DatasetInfo, seed: int) -> BenchContext:
+    """Wire repos and services the way open_profile_session does."""
+    bus = ChangeBus()
+    feed = ChangeFeed(ChangeLogRepo(conn), bus)
+    journal = UndoJournal(store=UndoLogRepo(conn))
+    journal.load()
+    schedule_repo = ScheduledEntryRepo(conn, on_commit=feed.pump)
+    registry = SchedulerProviderRegistry()
+    tasks_repo = TasksRepository(conn, on_commit=feed.pump)
+    adapter = TasksRepo(tasks_repo)
+
+    @contextmanager
+    def undo_transaction() -> Iterator[None]:
+        with schedule_repo.transaction(), tasks_repo.transaction():
+            yield
+
+    journal.set_atomic(undo_transaction)
+    register_tasks_scheduler_provider(registry, adapter, bus)
+    return BenchContext(
+        conn=conn,
+        info=info,
+        rng=random.Random(seed),
+        tasks_repo=tasks_repo,
+        schedule_repo=schedule_repo,
+        tasks=TasksService(repo=adapter, journal=journal),
+        scheduler=SchedulerService(repo=schedule_repo, registry=registry, journal=journal),
+        registry=registry,
+        bus=bus,
+        journal=journal,
+    )
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    build: Callable[[BenchContext], Callable[[], Any]]
+    write: bool = False
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, write: bool = False):
+    def register(build: Callable[[BenchContext], Callable[[], Any]]):
+        CASES.append(Case(name, build, write))
+        return build
+
+    return register
+
+
+def _cycle(values: list) -> Callable[[], Any]:
+    """Next value on each call (so repeated calls do not hit one hot row)."""
+    it = iter(values * 1000)
+    return lambda: next(it)
+
+
+# Windows: "week"/"month" are around the anchor (hot), "cold" reaches into history.
+_WINDOWS = {"day": (0, 1), "week": (0, 7), "month": (-14, 17), "year": (-365, 1), "cold": (-730, -700)}
+
+
+# -------------------------
+# TasksRepository
+# -------------------------
+@case("tasks_repo.get_task")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.get_task(nxt())
+
+
+@case("tasks_repo.list_tasks")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.list_tasks(limit=200)
+
+
+@case("tasks_repo.list_recurring_tasks_for_range[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.list_recurring_tasks_for_range(ctx.day(-14), ctx.day(16))
+
+
+@case("tasks_repo.list_recurrence_exceptions[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.list_recurrence_exceptions(ctx.day(-14), ctx.day(16))
+
+
+@case("tasks_repo.find_materialized_occurrence")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.find_materialized_occurrence(nxt(), ctx.day(0))
+
+
+@case("tasks_repo.next_sort_key_for_date")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.next_sort_key_for_date(ctx.day(0))
+
+
+@case("tasks_repo.get_occurrence")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks_repo.get_occurrence(nxt())
+
+
+for _w in ("day", "week", "month", "cold"):
+    @case(f"tasks_repo.list_occurrences_for_range[{_w}]")
+    def _(ctx: BenchContext, w: str = _w):
+        a, b = _WINDOWS[w]
+        return lambda: ctx.tasks_repo.list_occurrences_for_range(ctx.day(a), ctx.day(b - 1), limit=5000)
+
+    @case(f"tasks_repo.list_occurrences_joined_for_range[{_w}]")
+    def _(ctx: BenchContext, w: str = _w):
+        a, b = _WINDOWS[w]
+        return lambda: ctx.tasks_repo.list_occurrences_joined_for_range(ctx.day(a), ctx.day(b - 1), limit=5000)
+
+
+@case("tasks_repo.completion_counts_by_day[year]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.completion_counts_by_day(ctx.day(-365), ctx.day(0))
+
+
+@case("tasks_repo.get_occurrence_titles[200]")
+def _(ctx: BenchContext):
+    ids = ctx.ids("task_occurrences", 200)
+    return lambda: ctx.tasks_repo.get_occurrence_titles(ids)
+
+
+@case("tasks_repo.create_task", write=True)
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks_repo.create_task("Benchmark task")
+
+
+@case("tasks_repo.update_task_title", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.update_task_title(nxt(), "Renamed")
+
+
+@case("tasks_repo.set_task_planning", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.set_task_planning(nxt(), 2, 45)
+
+
+@case("tasks_repo.set_task_recurrence", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.set_task_recurrence(nxt(), "FREQ=WEEKLY;BYDAY=TU", ctx.day(0), None)
+
+
+@case("tasks_repo.create_occurrence", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks_repo.create_occurrence(nxt(), ctx.day(1))
+
+
+@case("tasks_repo.update_occurrence_due_date", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks_repo.update_occurrence_due_date(nxt(), ctx.day(2))
+
+
+@case("tasks_repo.set_occurrence_due", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks_repo.set_occurrence_due(nxt(), ctx.day(3), 1)
+
+
+@case("tasks_repo.set_occurrence_completed", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks_repo.set_occurrence_completed(nxt(), True)
+
+
+@case("tasks_repo.archive_occurrence", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks_repo.archive_occurrence(nxt())
+
+
+# -------------------------
+# ScheduledEntryRepo
+# -------------------------
+@case("schedule_repo.get")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_entries", 200))
+    return lambda: ctx.schedule_repo.get(nxt())
+
+
+for _w in ("day", "week", "month", "cold"):
+    @case(f"schedule_repo.list_for_range[{_w}]")
+    def _(ctx: BenchContext, w: str = _w):
+        a, b = _WINDOWS[w]
+        return lambda: ctx.schedule_repo.list_for_range(ctx.ts(a), ctx.ts(b), limit=5000)
+
+
+@case("schedule_repo.day_hour_counts[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.schedule_repo.day_hour_counts(ctx.ts(-14), ctx.ts(17))
+
+
+@case("schedule_repo.get_series")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_series", 200))
+    return lambda: ctx.schedule_repo.get_series(nxt())
+
+
+@case("schedule_repo.list_series_for_range[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.schedule_repo.list_series_for_range(ctx.ts(-14), ctx.ts(17))
+
+
+@case("schedule_repo.list_series_exceptions[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.schedule_repo.list_series_exceptions(ctx.ts(-14), ctx.ts(17))
+
+
+@case("schedule_repo.get_series_exception")
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_series", 200))
+    return lambda: ctx.schedule_repo.get_series_exception(nxt(), ctx.ts(0, 9))
+
+
+@case("schedule_repo.all_series_exceptions")
+def _(ctx: BenchContext):
+    return ctx.schedule_repo.all_series_exceptions
+
+
+@case("schedule_repo.iter_active_entries")
+def _(ctx: BenchContext):
+    return lambda: sum(1 for _ in ctx.schedule_repo.iter_active_entries())
+
+
+@case("schedule_repo.entry_ids_by_ref[500]")
+def _(ctx: BenchContext):
+    refs = [f"evt-{i}@bench" for i in ctx.ids("scheduled_entries", 500)]
+    return lambda: ctx.schedule_repo.entry_ids_by_ref("ics", refs, history=True)
+
+
+@case("schedule_repo.create", write=True)
+def _(ctx: BenchContext):
+    def run() -> int:
+        return ctx.schedule_repo.create(
+            {"item_kind": "adhoc", "item_ref": "bench", "start_dt": ctx.ts(1, 10), "end_dt": ctx.ts(1, 11)}
+        )
+
+    return run
+
+
+@case("schedule_repo.update_time", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_entries", 200))
+    return lambda: ctx.schedule_repo.update_time(nxt(), ctx.ts(2, 14), ctx.ts(2, 15))
+
+
+@case("schedule_repo.archive", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_entries", 200))
+    return lambda: ctx.schedule_repo.archive(nxt())
+
+
+@case("schedule_repo.create_series", write=True)
+def _(ctx: BenchContext):
+    def run() -> int:
+        return ctx.schedule_repo.create_series(
+            {
+                "item_kind": "adhoc", "item_ref": "bench", "start_dt": ctx.ts(0, 8), "end_dt": ctx.ts(0, 9),
+                "rrule": "FREQ=DAILY",
+            }
+        )
+
+    return run
+
+
+@case("schedule_repo.add_series_exception", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle([(sid, ctx.ts(k, 7)) for sid, k in zip(ctx.ids("scheduled_series", 200), range(200))])
+
+    def run() -> None:
+        sid, start = nxt()
+        ctx.schedule_repo.add_series_exception(sid, start)
+
+    return run
+
+
+# -------------------------
+# TasksService
+# -------------------------
+@case("tasks_service.list_today")
+def _(ctx: BenchContext):
+    return ctx.tasks.list_today
+
+
+@case("tasks_service.list_upcoming[7]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.list_upcoming(days=7)
+
+
+@case("tasks_service.list_upcoming[31]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.list_upcoming(days=31)
+
+
+@case("tasks_service.completion_by_day[year]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.completion_by_day(ctx.anchor - timedelta(days=365), ctx.anchor)
+
+
+@case("tasks_service.add_task_for_today", write=True)
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.add_task_for_today("Benchmark task")
+
+
+@case("tasks_service.set_completed", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks.set_completed(nxt(), True)
+
+
+@case("tasks_service.rename_task", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_definitions", 200))
+    return lambda: ctx.tasks.rename_task(nxt(), "Renamed")
+
+
+@case("tasks_service.reschedule_occurrence", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("task_occurrences", 200))
+    return lambda: ctx.tasks.reschedule_occurrence(nxt(), ctx.day(4))
+
+
+@case("tasks_service.add_recurring_task", write=True)
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.add_recurring_task("Benchmark habit", "FREQ=DAILY", ctx.day(0))
+
+
+@case("tasks_service.plan_items[7]")
+def _(ctx: BenchContext):
+    return lambda: ctx.tasks.plan_items(days=7)
+
+
+# -------------------------
+# SchedulerService
+# -------------------------
+for _w in ("day", "week", "month", "cold"):
+    @case(f"scheduler_service.list_range[{_w}]")
+    def _(ctx: BenchContext, w: str = _w):
+        a, b = _WINDOWS[w]
+        return lambda: ctx.scheduler.list_range(ctx.ts(a), ctx.ts(b), limit=5000)
+
+
+@case("scheduler_service.day_summaries[month]")
+def _(ctx: BenchContext):
+    return lambda: ctx.scheduler.day_summaries(ctx.anchor - timedelta(days=14), ctx.anchor + timedelta(days=16))
+
+
+@case("scheduler_service.find_conflicts[week]")
+def _(ctx: BenchContext):
+    return lambda: ctx.scheduler.find_conflicts(ctx.ts(0), ctx.ts(7))
+
+
+@case("scheduler_service.resolve_labels[week]")
+def _(ctx: BenchContext):
+    rows = ctx.scheduler.list_range(ctx.ts(0), ctx.ts(7), limit=5000)
+    pairs = [(r.item_kind, r.item_ref) for r in rows]
+
+    def run() -> dict:
+        ctx.registry.invalidate()
+        return ctx.registry.resolve_labels(pairs)
+
+    return run
+
+
+@case("scheduler_service.export_ics")
+def _(ctx: BenchContext):
+    return lambda: ctx.scheduler.export_ics(io.StringIO())
+
+
+@case("scheduler_service.schedule", write=True)
+def _(ctx: BenchContext):
+    return lambda: ctx.scheduler.schedule("adhoc", "bench", ctx.ts(1, 12), ctx.ts(1, 13), title_cache="Bench")
+
+
+@case("scheduler_service.reschedule", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle(ctx.ids("scheduled_entries", 200))
+    return lambda: ctx.scheduler.reschedule(nxt(), ctx.ts(3, 9), ctx.ts(3, 10))
+
+
+@case("scheduler_service.skip_instance", write=True)
+def _(ctx: BenchContext):
+    nxt = _cycle([(sid, ctx.ts(k, 6)) for sid, k in zip(ctx.ids("scheduled_series", 200), range(200))])
+    return lambda: ctx.scheduler.skip_instance(*nxt())
+
+
+@case("scheduler_service.schedule_series", write=True)
+def _(ctx: BenchContext):
+    return lambda: ctx.scheduler.schedule_series("adhoc", "bench", ctx.ts(0, 7), ctx.ts(0, 8), "FREQ=WEEKLY;BYDAY=MO")
+
+
+@case("scheduler_service.auto_schedule[week]", write=True)
+def _(ctx: BenchContext):
+    start = ctx.anchor + timedelta(days=7)
+    items = [
+        PlanItem("adhoc", f"plan-{i}", "Planned", (start + timedelta(days=i % 5)).isoformat(), 30 + 15 * (i % 4), i % 3)
+        for i in range(20)
+    ]
+    batch = iter(range(10**9))
+
+    def run():
+        n = next(batch)  # fresh refs each call; placed items are skipped otherwise
+        return ctx.scheduler.auto_schedule(
+            [PlanItem(p.item_kind, f"{p.item_ref}-{n}", p.title, p.day, p.duration_min, p.priority) for p in items],
+            start,
+            start + timedelta(days=6),
+            not_before=datetime(start.year, start.month, start.day),
+        ).placed
+
+    return run
+
+
+@case("scheduler_service.import_ics[500]", write=True)
+def _(ctx: BenchContext):
+    start = ctx.anchor + timedelta(days=30)
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0"]
+    for i in range(500):
+        d = (start + timedelta(days=i % 60)).strftime("%Y%m%d")
+        lines += [
+            "BEGIN:VEVENT", f"UID:bench-import-{i}@bench", f"DTSTART:{d}T{8 + i % 9:02d}0000",
+            f"DTEND:{d}T{9 + i % 9:02d}0000", f"SUMMARY:Imported {i}", "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    text = [line + "\r\n" for line in lines]
+    return lambda: ctx.scheduler.import_ics(text).events
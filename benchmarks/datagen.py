@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from lux.data.cold_storage import ColdStorage
+from lux.data.db import ensure_db_ready
+
+# Bump when the generated shape changes (invalidates cached databases and
+# makes results of different shapes incomparable).
+GENERATOR_VERSION = 1
+
+ANCHOR = date(2026, 7, 1)
+
+SCALES: dict[str, int] = {
+    "small": 10_000,
+    "medium": 250_000,
+    "large": 1_000_000,
+    "xlarge": 5_000_000,
+}
+
+_CHANGE_LOG_RETAIN = 50_000  # ChangeFeed default
+_CHUNK = 20_000
+
+_TASK_RULES = (
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=MONTHLY",
+    "FREQ=YEARLY",
+)
+# (rrule, period in days) - fixed periods so exception starts land on instances
+_SERIES_RULES = (("FREQ=DAILY", 1), ("FREQ=WEEKLY", 7), ("FREQ=WEEKLY;INTERVAL=2", 14))
+_WORDS = (
+    "review", "plan", "call", "write", "fix", "email", "read", "prepare", "gym", "groceries",
+    "report", "budget", "meeting", "draft", "clean", "backup", "invoice", "study", "walk", "design",
+)
+
+
+@dataclass(frozen=True)
+class DatasetInfo:
+    path: Path
+    rows: int
+    seed: int
+    anchor: date
+    years: int
+    counts: dict[str, int]
+    generate_s: float
+
+    @property
+    def first_day(self) -> date:
+        return self.anchor - timedelta(days=365 * self.years)
+
+    @property
+    def last_day(self) -> date:
+        return self.anchor + timedelta(days=365)
+
+
+def _ts(d: date, minute_of_day: int = 9 * 60) -> str:
+    return f"{d.isoformat()} {minute_of_day // 60:02d}:{minute_of_day % 60:02d}:00"
+
+
+def _title(rng: random.Random) -> str:
+    return f"{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS)} {rng.randrange(1000)}"
+
+
+def _chunks(rows: list[tuple]):
+    for i in range(0, len(rows), _CHUNK):
+        yield rows[i : i + _CHUNK]
+
+
+def _counts(rows: int) -> dict[str, int]:
+    rows = max(1_000, int(rows))
+    return {
+        "task_definitions": max(50, rows // 100),
+        "task_occurrences": rows * 55 // 100,
+        "scheduled_entries": rows * 40 // 100,
+        "scheduled_series": max(10, rows // 200),
+        "scheduled_series_exceptions": rows * 35 // 1000,
+    }
+
+
+def cache_path(cache_dir: Path, rows: int, seed: int, anchor: date = ANCHOR, years: int = 4) -> Path:
+    return cache_dir / f"planner-v{GENERATOR_VERSION}-{rows}-s{seed}-{anchor.isoformat()}-{years}y.db"
+
+
+def generate(path: Path, rows: int, seed: int = 1, anchor: date = ANCHOR, years: int = 4) -> DatasetInfo:
+    """Create a new database at `path` (must not exist) filled with synthetic data."""
+    if path.exists():
+        raise FileExistsError(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    t0 = time.perf_counter()
+    rng = random.Random(seed)
+    counts = _counts(rows)
+    first = anchor - timedelta(days=365 * years)
+    span = (anchor + timedelta(days=365) - first).days
+
+    conn = ensure_db_ready(path)
+    try:
+        with conn:
+            rec_tasks = _gen_definitions(conn, rng, counts["task_definitions"], first, span)
+            _gen_occurrences(conn, rng, counts, rec_tasks, first, anchor, span)
+            series = _gen_series(conn, rng, counts["scheduled_series"], first, span)
+            _gen_entries(conn, rng, counts, series, first, span)
+        _settle(conn, anchor)
+        counts = {t: _count_all(conn, t) for t in counts}
+    finally:
+        conn.close()
+    return DatasetInfo(path, int(rows), seed, anchor, years, counts, time.perf_counter() - t0)
+
+
+def open_or_generate(cache_dir: Path, rows: int, seed: int = 1, anchor: date = ANCHOR, years: int = 4) -> DatasetInfo:
+    """Reuse a cached dataset for these parameters, generating it on first use."""
+    path = cache_path(cache_dir, rows, seed, anchor, years)
+    if path.exists():
+        conn = sqlite3.connect(str(path))
+        try:
+            counts = {t: _count_all(conn, t) for t in _counts(rows)}
+        finally:
+            conn.close()
+        return DatasetInfo(path, int(rows), seed, anchor, years, counts, 0.0)
+    tmp = path.with_suffix(".tmp")
+    for p in (tmp, Path(f"{tmp}-wal"), Path(f"{tmp}-shm")):
+        p.unlink(missing_ok=True)
+    info = generate(tmp, rows, seed, anchor, years)
+    tmp.replace(path)
+    return DatasetInfo(path, info.rows, seed, anchor, years, info.counts, info.generate_s)
+
+
+def _count_all(conn: sqlite3.Connection, table: str) -> int:
+    view = f"{table}_all" if table in ("task_occurrences", "scheduled_entries") else table
+    return int(conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0])
+
+
+# -------------------------
+# Tables
+# -------------------------
+def _gen_definitions(conn: sqlite3.Connection, rng: random.Random, n: int, first: date, span: int) -> list[int]:
+    rows: list[tuple] = []
+    recurring: list[int] = []
+    for tid in range(1, n + 1):
+        created = first + timedelta(days=rng.randrange(span - 365))
+        parent = rng.randrange(1, tid) if tid > 10 and rng.random() < 0.1 else None
+        rule = start = None
+        if rng.random() < 0.05:
+            rule, start = rng.choice(_TASK_RULES), created.isoformat()
+            recurring.append(tid)
+        rows.append((
+            tid, _title(rng), "" if rng.random() < 0.8 else _title(rng), int(rng.random() < 0.03),
+            _ts(created), _ts(created), parent, rule, start,
+            rng.choice((0, 0, 0, 1, 2, 3)), rng.choice((None, 15, 30, 45, 60, 120)),
+        ))
+    conn.executemany(
+        """
+        INSERT INTO task_definitions(
+            id, title, notes, archived, created_at, updated_at, parent_task_id,
+            recur_rule, recur_start, priority, estimate_min
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    return recurring
+
+
+def _gen_occurrences(
+    conn: sqlite3.Connection,
+    rng: random.Random,
+    counts: dict[str, int],
+    recurring: list[int],
+    first: date,
+    anchor: date,
+    span: int,
+) -> None:
+    n_tasks = counts["task_definitions"]
+    sort_keys: dict[date, int] = {}
+    materialized: set[tuple[int, str]] = set()
+    rows: list[tuple] = []
+    for oid in range(1, counts["task_occurrences"] + 1):
+        due = first + timedelta(days=rng.randrange(span))
+        task_id = rng.randrange(1, n_tasks + 1)
+        recur_date = None
+        if recurring and rng.random() < 0.04:
+            task_id = rng.choice(recurring)
+            key = (task_id, due.isoformat())
+            if key not in materialized:
+                materialized.add(key)
+                recur_date = key[1]
+        sk = sort_keys.get(due, 0) + 1
+        sort_keys[due] = sk
+        done = None
+        if due < anchor and rng.random() < 0.85:
+            done = _ts(due, rng.randrange(7 * 60, 22 * 60))
+        due_time = f"{rng.randrange(6, 21):02d}:{rng.choice((0, 15, 30, 45)):02d}" if rng.random() < 0.3 else None
+        stamp = done or _ts(due - timedelta(days=rng.randrange(0, 14)))
+        rows.append((oid, task_id, due.isoformat(), due_time, sk, done, int(rng.random() < 0.03), stamp, stamp, recur_date))
+    for chunk in _chunks(rows):
+        conn.executemany(
+            """
+            INSERT INTO task_occurrences(
+                id, task_id, due_date, due_time, sort_key, completed_at, archived, created_at, updated_at, recur_date
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            chunk,
+        )
+    conn.execute("UPDATE task_occurrences SET archived_at = updated_at WHERE archived = 1")
+
+
+def _gen_series(conn: sqlite3.Connection, rng: random.Random, n: int, first: date, span: int) -> list[tuple[int, date, int, int, int]]:
+    """Returns (series id, first day, start minute, period days, instance count) per series."""
+    rows: list[tuple] = []
+    out: list[tuple[int, date, int, int, int]] = []
+    for sid in range(1, n + 1):
+        day = first + timedelta(days=rng.randrange(span - 30))
+        minute = rng.randrange(7 * 4, 19 * 4) * 15
+        rule, period = rng.choice(_SERIES_RULES)
+        left = (first + timedelta(days=span) - day).days // period
+        instances = max(2, min(left, rng.choice((10, 50, 200, left))))
+        until = None
+        if instances < left or rng.random() < 0.5:
+            until = _ts(day + timedelta(days=period * (instances - 1)), minute + 60)
+        rows.append((
+            sid, "adhoc", f"series-{sid}", _ts(day, minute), _ts(day, minute + rng.choice((30, 60, 90))),
+            rule, until, _title(rng), None, int(rng.random() < 0.02), _ts(day), _ts(day),
+        ))
+        out.append((sid, day, minute, period, instances))
+    conn.executemany(
+        """
+        INSERT INTO scheduled_series(
+            id, item_kind, item_ref, start_dt, end_dt, rrule, until_dt, title_cache, notes_cache,
+            archived, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    return out
+
+
+def _gen_entries(
+    conn: sqlite3.Connection,
+    rng: random.Random,
+    counts: dict[str, int],
+    series: list[tuple[int, date, int, int, int]],
+    first: date,
+    span: int,
+) -> None:
+    n_occ = counts["task_occurrences"]
+    rows: list[tuple] = []
+    exceptions: list[tuple] = []
+    taken: set[tuple[int, int]] = set()
+    eid = 0
+
+    # Series exceptions: ~40% edited instances (with a one-off entry), the rest skips.
+    for _ in range(counts["scheduled_series_exceptions"]):
+        sid, day, minute, period, instances = rng.choice(series)
+        k = rng.randrange(instances)
+        if (sid, k) in taken:
+            continue
+        taken.add((sid, k))
+        original = _ts(day + timedelta(days=period * k), minute)
+        entry_id = None
+        if rng.random() < 0.4:
+            eid += 1
+            entry_id = eid
+            d = day + timedelta(days=period * k)
+            m = minute + rng.choice((-60, -30, 30, 60))
+            rows.append((eid, "adhoc", f"moved-{sid}-{k}", _ts(d, m), _ts(d, m + 60), _title(rng), None, 0, _ts(d), _ts(d)))
+        exceptions.append((sid, original, entry_id, original))
+
+    while eid < counts["scheduled_entries"]:
+        eid += 1
+        d = first + timedelta(days=rng.randrange(span))
+        m = rng.randrange(7 * 4, 20 * 4) * 15
+        length = rng.choice((15, 30, 30, 60, 60, 90, 120))
+        r = rng.random()
+        if r < 0.35:
+            kind, ref = "task_occurrence", str(rng.randrange(1, n_occ + 1))
+        elif r < 0.5:
+            kind, ref = "ics", f"evt-{eid}@bench"
+        else:
+            kind, ref = "adhoc", f"adhoc-{eid}"
+        notes = _title(rng) if rng.random() < 0.2 else None
+        rows.append((eid, kind, ref, _ts(d, m), _ts(d, m + length), _title(rng), notes, int(rng.random() < 0.02), _ts(d), _ts(d)))
+
+    for chunk in _chunks(rows):
+        conn.executemany(
+            """
+            INSERT INTO scheduled_entries(
+                id, item_kind, item_ref, start_dt, end_dt, title_cache, notes_cache, archived, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            chunk,
+        )
+    conn.executemany(
+        "INSERT INTO scheduled_series_exceptions(series_id, original_start, entry_id, created_at) VALUES (?, ?, ?, ?)",
+        exceptions,
+    )
+
+
+def _settle(conn: sqlite3.Connection, anchor: date) -> None:
+    """Bring the fresh file to the steady state of a long-used planner database."""
+    mover = ColdStorage(conn, batch_rows=_CHUNK)
+    now = datetime(anchor.year, anchor.month, anchor.day)
+    for table in ("task_occurrences", "scheduled_entries"):
+        while mover.move_batch(table, now=now) >= _CHUNK:
+            pass
+    top = int(conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0])
+    conn.execute("DELETE FROM change_log WHERE seq <= ?", (top - _CHANGE_LOG_RETAIN,))
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
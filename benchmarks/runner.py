@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from benchmarks.cases import CASES, Case, open_context
+from benchmarks.datagen import GENERATOR_VERSION, DatasetInfo
+
+RESULT_FORMAT = 1
+
+DEFAULT_REPEAT = 30
+MIN_REPEAT = 5
+CASE_BUDGET_S = 3.0
+
+DEFAULT_THRESHOLD = 0.25   # relative slowdown of the median
+DEFAULT_FLOOR_MS = 0.10    # ignore absolute changes below this
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    name: str
+    n: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    mean_ms: float
+    result_size: int | None
+    counters: dict[str, int] = field(default_factory=dict)  # e.g. widgets created (UI cases)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "n": self.n,
+            "min_ms": round(self.min_ms, 4),
+            "median_ms": round(self.median_ms, 4),
+            "p95_ms": round(self.p95_ms, 4),
+            "mean_ms": round(self.mean_ms, 4),
+            "result_size": self.result_size,
+            **self.counters,
+        }
+
+
+def _percentile(sorted_ms: list[float], q: float) -> float:
+    idx = min(len(sorted_ms) - 1, max(0, int(round(q * (len(sorted_ms) - 1)))))
+    return sorted_ms[idx]
+
+
+def _size(result: Any) -> int | None:
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def time_case(
+    name: str,
+    fn: Callable[[], Any],
+    repeat: int,
+    budget_s: float,
+    min_repeat: int = MIN_REPEAT,
+    sized: bool = True,
+) -> CaseResult:
+    first = fn()  # warm-up: statement cache, page cache, lazy imports
+    size = _size(first) if sized else None
+    times: list[float] = []
+    deadline = time.perf_counter() + budget_s
+    while len(times) < repeat and (len(times) < min_repeat or time.perf_counter() < deadline):
+        t0 = time.perf_counter_ns()
+        fn()
+        times.append((time.perf_counter_ns() - t0) / 1e6)
+    times.sort()
+    return CaseResult(
+        name=name,
+        n=len(times),
+        min_ms=times[0],
+        median_ms=_percentile(times, 0.5),
+        p95_ms=_percentile(times, 0.95),
+        mean_ms=sum(times) / len(times),
+        result_size=size,
+    )
+
+
+def _git_commit(root: Path) -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, timeout=5, check=True
+        )
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root, capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def select(patterns: Iterable[str] = ()) -> list[Case]:
+    """Cases whose name contains any of the patterns (all if none); reads before writes."""
+    pats = [p for p in patterns if p]
+    chosen = [c for c in CASES if not pats or any(p in c.name for p in pats)]
+    return sorted(chosen, key=lambda c: c.write)
+
+
+@contextmanager
+def working_copy(info: DatasetInfo) -> Iterator[sqlite3.Connection]:
+    """Migrated connection to a temporary copy of the dataset (removed afterwards)."""
+    from lux.data.db import ensure_db_ready
+
+    with tempfile.TemporaryDirectory(prefix="lux-bench-") as tmp:
+        work = Path(tmp) / "planner.db"
+        shutil.copyfile(info.path, work)
+        conn = ensure_db_ready(work)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def run_cases(
+    info: DatasetInfo,
+    cases: list[Case],
+    seed: int,
+    repeat: int = DEFAULT_REPEAT,
+    budget_s: float = CASE_BUDGET_S,
+    progress: Callable[[CaseResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run cases against a temporary copy of the dataset; returns the result document."""
+    results: dict[str, Any] = {}
+    with working_copy(info) as conn:
+        ctx = open_context(conn, info, seed)
+        for c in cases:
+            try:
+                res = time_case(c.name, c.build(ctx), repeat, budget_s, sized=not c.write)
+            except Exception as e:  # keep the run going; the case is reported as failed
+                if conn.in_transaction:
+                    conn.rollback()
+                results[c.name] = {"error": f"{type(e).__name__}: {e}"}
+                continue
+            results[c.name] = res.to_json()
+            if progress is not None:
+                progress(res)
+
+    return {"format": RESULT_FORMAT, "meta": environment_meta(info, repeat), "cases": results}
+
+
+def environment_meta(info: DatasetInfo, repeat: int, suite: str = "data") -> dict[str, Any]:
+    root = Path(__file__).resolve().parents[1]
+    return {
+        "suite": suite,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(root),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "sqlite": sqlite3.sqlite_version,
+        "generator": GENERATOR_VERSION,
+        "rows": info.rows,
+        "seed": info.seed,
+        "anchor": info.anchor.isoformat(),
+        "years": info.years,
+        "counts": info.counts,
+        "repeat": repeat,
+    }
+
+
+def write_result(doc: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_result(path: Path) -> dict[str, Any]:
+    doc = json.loads(path.read_text(encoding="utf-8"))
+    if doc.get("format") != RESULT_FORMAT:
+        raise ValueError(f"{path}: unsupported result format {doc.get('format')!r}")
+    return doc
+
+
+# -------------------------
+# Regression check
+# -------------------------
+@dataclass(frozen=True)
+class Delta:
+    name: str
+    base_ms: float       # medians
+    cur_ms: float
+    base_min_ms: float
+    cur_min_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.cur_ms / self.base_ms if self.base_ms > 0 else float("inf")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    regressions: list[Delta]
+    improvements: list[Delta]
+    unchanged: int
+    missing: list[str]        # in baseline, not in current (or failed)
+    counts_changed: list[str]  # "case: counter a -> b" (result size, widgets created, ...)
+    warnings: list[str]
+
+
+_COMPARABLE_META = ("suite", "generator", "rows", "seed", "anchor", "years")
+_TIMING_KEYS = frozenset(("n", "min_ms", "median_ms", "p95_ms", "mean_ms"))
+
+
+def compare(
+    base: dict[str, Any],
+    cur: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    floor_ms: float = DEFAULT_FLOOR_MS,
+) -> Comparison:
+    warnings = [
+        f"{k} differs: {base['meta'].get(k)!r} -> {cur['meta'].get(k)!r}"
+        for k in _COMPARABLE_META
+        if base["meta"].get(k) != cur["meta"].get(k)
+    ]
+    for k in ("machine", "python", "sqlite", "qt"):
+        if base["meta"].get(k) != cur["meta"].get(k):
+            warnings.append(f"{k} differs: {base['meta'].get(k)!r} -> {cur['meta'].get(k)!r} (timings may not be comparable)")
+
+    regressions: list[Delta] = []
+    improvements: list[Delta] = []
+    missing: list[str] = []
+    counts_changed: list[str] = []
+    unchanged = 0
+    for name, b in sorted(base["cases"].items()):
+        c = cur["cases"].get(name)
+        if "median_ms" not in b:
+            continue
+        if c is None or "median_ms" not in c:
+            missing.append(name)
+            continue
+        for key in sorted((b.keys() | c.keys()) - _TIMING_KEYS):
+            if b.get(key) != c.get(key):
+                counts_changed.append(f"{name}: {key} {b.get(key)} -> {c.get(key)}")
+        d = Delta(name, float(b["median_ms"]), float(c["median_ms"]), float(b["min_ms"]), float(c["min_ms"]))
+        limit = 1.0 + threshold
+        if abs(d.cur_ms - d.base_ms) < floor_ms:
+            unchanged += 1
+        elif d.cur_ms > d.base_ms * limit and d.cur_min_ms > d.base_min_ms * limit:
+            regressions.append(d)
+        elif d.cur_ms < d.base_ms / limit and d.cur_min_ms < d.base_min_ms / limit:
+            improvements.append(d)
+        else:
+            unchanged += 1
+    regressions.sort(key=lambda d: d.ratio, reverse=True)
+    improvements.sort(key=lambda d: d.ratio)
+    return Comparison(regressions, improvements, unchanged, missing, counts_changed, warnings)
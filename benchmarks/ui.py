@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import tempfile  # noqa: E402
+from dataclasses import dataclass, replace  # noqa: E402
+from datetime import timedelta  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Any, Callable  # noqa: E402
+
+import PySide6  # noqa: E402
+import shiboken6  # noqa: E402
+from PySide6.QtCore import QDate, QEvent, QObject, qVersion  # noqa: E402
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget  # noqa: E402
+
+import lux.ui.qt.theme as theme_mod  # noqa: E402
+from lux.app.navigation import build_default_registry  # noqa: E402
+from lux.app.services import SystemServices  # noqa: E402
+from lux.core.settings.schema import THEMES_AVAILABLE  # noqa: E402
+from lux.core.settings.store import SettingsStore  # noqa: E402
+from lux.features.scheduler.ui.day_view import SchedulerDayView  # noqa: E402
+from lux.features.scheduler.ui.month_view import SchedulerMonthView  # noqa: E402
+from lux.features.scheduler.ui.panel import SchedulerLeftPanel  # noqa: E402
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher  # noqa: E402
+from lux.features.scheduler.ui.state import SchedulerState  # noqa: E402
+from lux.features.scheduler.ui.week_view import SchedulerWeekView  # noqa: E402
+from lux.features.tasks.ui.panel import TasksLeftPanel  # noqa: E402
+from lux.features.tasks.ui.view import TasksRightView  # noqa: E402
+from lux.ui.qt.main_window import MainWindow  # noqa: E402
+
+from benchmarks import runner  # noqa: E402
+from benchmarks.cases import BenchContext, open_context  # noqa: E402
+from benchmarks.datagen import DatasetInfo  # noqa: E402
+
+# Same size as MainWindow's default geometry.
+WINDOW_W, WINDOW_H = 1200, 780
+
+
+class WidgetCounter(QObject):
+    """App-wide event filter: distinct widgets that get a parent while armed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._seen: set[int] = set()
+        self._armed = False
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802 (Qt override)
+        if self._armed and event.type() == QEvent.ChildAdded:
+            child = event.child()
+            if child is not None and child.isWidgetType():
+                self._seen.add(shiboken6.getCppPointer(child)[0])
+        return False
+
+    def start(self) -> None:
+        self._seen.clear()
+        self._armed = True
+
+    def stop(self) -> int:
+        self._armed = False
+        return len(self._seen)
+
+
+class _BenchSettings(SettingsStore):
+    """Settings in a temporary file (theme switches must not touch the user's file)."""
+
+    def __init__(self, path: Path) -> None:
+        self._bench_path = path
+        super().__init__()
+
+    def _settings_path(self) -> Path:
+        return self._bench_path
+
+
+class _Host(QWidget):
+    """Visible top-level surface holding one view at a time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lay = QVBoxLayout(self)
+        self._lay.setContentsMargins(0, 0, 0, 0)
+        self._content: QWidget | None = None
+        self.resize(WINDOW_W, WINDOW_H)
+        self.show()
+
+    def set_content(self, w: QWidget) -> QWidget:
+        old, self._content = self._content, w
+        if old is not None:
+            old.setParent(None)
+            old.deleteLater()
+        self._lay.addWidget(w, 1)
+        return w
+
+    @property
+    def content(self) -> QWidget | None:
+        return self._content
+
+
+@dataclass
+class UiContext:
+    app: QApplication
+    bench: BenchContext
+    services: SystemServices
+    settings: SettingsStore
+    host: _Host
+    state: SchedulerState
+    prefetcher: SchedulerPrefetcher
+    window: MainWindow | None = None
+
+    def flush(self, w: QWidget | None = None) -> None:
+        """Run what the event loop would before the user sees the result."""
+        self.app.processEvents()
+        self.app.sendPostedEvents(None, QEvent.DeferredDelete)
+        (w or self.host).grab()
+
+    def main_window(self) -> MainWindow:
+        if self.window is None:
+            self.window = MainWindow(self.settings, build_default_registry(), self.services, self.app)
+            self.window.show()
+            self.flush(self.window)
+        return self.window
+
+
+@dataclass(frozen=True)
+class UiCase:
+    name: str
+    build: Callable[[UiContext], Callable[[], Any]]
+
+
+UI_CASES: list[UiCase] = []
+
+
+def ui_case(name: str):
+    def register(build: Callable[[UiContext], Callable[[], Any]]):
+        UI_CASES.append(UiCase(name, build))
+        return build
+
+    return register
+
+
+def select(patterns: list[str]) -> list[UiCase]:
+    pats = [p for p in patterns if p]
+    return [c for c in UI_CASES if not pats or any(p in c.name for p in pats)]
+
+
+def _in_host(ctx: UiContext, make: Callable[[], QWidget]) -> Callable[[], Any]:
+    def run() -> None:
+        ctx.host.set_content(make())
+        ctx.flush()
+
+    return run
+
+
+def _refresh(ctx: UiContext, make: Callable[[], QWidget], before: Callable[[], None] | None = None):
+    view = ctx.host.set_content(make())
+    ctx.flush()
+
+    def run() -> None:
+        if before is not None:
+            before()
+        view._refresh()
+        ctx.flush()
+
+    return run
+
+
+# -------------------------
+# Tasks
+# -------------------------
+@ui_case("tasks_view.construct")
+def _(ctx: UiContext):
+    return _in_host(ctx, lambda: TasksRightView(ctx.services))
+
+
+@ui_case("tasks_view.refresh")
+def _(ctx: UiContext):
+    return _refresh(ctx, lambda: TasksRightView(ctx.services))
+
+
+@ui_case("tasks_panel.construct")
+def _(ctx: UiContext):
+    return _in_host(ctx, lambda: TasksLeftPanel(ctx.services))
+
+
+# -------------------------
+# Scheduler
+# -------------------------
+def _day_view(ctx: UiContext) -> SchedulerDayView:
+    return SchedulerDayView(ctx.services.scheduler_service, ctx.state, ctx.prefetcher)
+
+
+def _week_view(ctx: UiContext) -> SchedulerWeekView:
+    return SchedulerWeekView(ctx.services.scheduler_service, ctx.state, ctx.prefetcher)
+
+
+def _month_view(ctx: UiContext) -> SchedulerMonthView:
+    return SchedulerMonthView(ctx.services.scheduler_service, ctx.state)
+
+
+@ui_case("scheduler_day.construct")
+def _(ctx: UiContext):
+    return _in_host(ctx, lambda: _day_view(ctx))
+
+
+@ui_case("scheduler_day.refresh[cached]")
+def _(ctx: UiContext):
+    return _refresh(ctx, lambda: _day_view(ctx))
+
+
+@ui_case("scheduler_day.refresh[uncached]")
+def _(ctx: UiContext):
+    return _refresh(ctx, lambda: _day_view(ctx), before=ctx.prefetcher.invalidate)
+
+
+@ui_case("scheduler_day.step_day")
+def _(ctx: UiContext):
+    ctx.host.set_content(_day_view(ctx))
+    ctx.flush()
+    start = ctx.state.selected_date()
+    days = iter(range(10**9))
+
+    def run() -> None:
+        ctx.state.set_selected_date(start.addDays(next(days) % 28 + 1))
+        ctx.flush()
+
+    return run
+
+
+@ui_case("scheduler_week.construct")
+def _(ctx: UiContext):
+    return _in_host(ctx, lambda: _week_view(ctx))
+
+
+@ui_case("scheduler_week.refresh[uncached]")
+def _(ctx: UiContext):
+    return _refresh(ctx, lambda: _week_view(ctx), before=ctx.prefetcher.invalidate)
+
+
+@ui_case("scheduler_month.construct")
+def _(ctx: UiContext):
+    return _in_host(ctx, lambda: _month_view(ctx))
+
+
+@ui_case("scheduler_month.refresh")
+def _(ctx: UiContext):
+    return _refresh(ctx, lambda: _month_view(ctx))
+
+
+@ui_case("scheduler_panel.construct")
+def _(ctx: UiContext):
+    return _in_host(
+        ctx,
+        lambda: SchedulerLeftPanel(
+            ctx.services.scheduler_service, ctx.state, ctx.prefetcher, task_ratios=ctx.services.tasks_service.completion_by_day
+        ),
+    )
+
+
+# -------------------------
+# MainWindow
+# -------------------------
+@ui_case("main_window.construct")
+def _(ctx: UiContext):
+    def run() -> None:
+        w = MainWindow(ctx.settings, build_default_registry(), ctx.services, ctx.app)
+        w.show()
+        ctx.flush(w)
+        w.close()
+        w.deleteLater()
+        ctx.app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    return run
+
+
+for _key in ("journal", "scheduler", "meals", "exercise", "goals", "tasks"):
+    @ui_case(f"main_window.switch[{_key}]")
+    def _(ctx: UiContext, key: str = _key):
+        win = ctx.main_window()
+
+        def run() -> None:
+            win._switch_to(key)
+            ctx.flush(win)
+
+        return run
+
+
+@ui_case("main_window.theme_switch[scheduler]")
+def _(ctx: UiContext):
+    win = ctx.main_window()
+    win._switch_to("scheduler")
+    ctx.flush(win)
+    themes = iter(THEMES_AVAILABLE * 10**6)
+
+    def run() -> None:
+        theme_mod.apply_theme_by_name(
+            ctx.app,
+            theme_name=next(themes),
+            font_scale=ctx.settings.get_font_scale(),
+            font_scheme_id=ctx.settings.get_font_scheme_id(),
+        )
+        ctx.flush(win)
+
+    return run
+
+
+# -------------------------
+# Runner
+# -------------------------
+def _app() -> QApplication:
+    app = QApplication.instance()
+    return app if app is not None else QApplication(["lux-bench"])
+
+
+def run_ui_cases(
+    info: DatasetInfo,
+    cases: list[UiCase],
+    seed: int,
+    repeat: int = runner.DEFAULT_REPEAT,
+    budget_s: float = runner.CASE_BUDGET_S,
+    progress: Callable[[runner.CaseResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run UI cases against a temporary copy of the dataset; returns the result document."""
+    app = _app()
+    counter = WidgetCounter()
+    app.installEventFilter(counter)
+    results: dict[str, Any] = {}
+    with runner.working_copy(info) as conn, tempfile.TemporaryDirectory(prefix="lux-bench-ui-") as tmp:
+        bench = open_context(conn, info, seed)
+        services = SystemServices(
+            scheduler_service=bench.scheduler,
+            tasks_service=bench.tasks,
+            undo_journal=bench.journal,
+            change_bus=bench.bus,
+        )
+        settings = _BenchSettings(Path(tmp) / "settings.json")
+        theme_mod.apply_theme_by_name(
+            app,
+            theme_name=settings.get_theme(),
+            font_scale=settings.get_font_scale(),
+            font_scheme_id=settings.get_font_scheme_id(),
+        )
+        state = SchedulerState()
+        anchor = info.anchor + timedelta(days=1)  # a weekday inside the generated span
+        state.set_selected_date(QDate(anchor.year, anchor.month, anchor.day))
+        prefetcher = SchedulerPrefetcher(bench.scheduler, parent=state)
+        bench.bus.subscribe(prefetcher.apply_changes, entities=prefetcher.WATCHED_ENTITIES)
+        host = _Host()
+        ctx = UiContext(app, bench, services, settings, host, state, prefetcher)
+        try:
+            for c in cases:
+                try:
+                    fn = c.build(ctx)
+                    res = runner.time_case(c.name, fn, repeat, budget_s, sized=False)
+                    counter.start()
+                    fn()
+                    created = counter.stop()
+                    res = replace(res, counters={"widgets_created": created, "widgets_live": len(app.allWidgets())})
+                except Exception as e:  # keep the run going; the case is reported as failed
+                    results[c.name] = {"error": f"{type(e).__name__}: {e}"}
+                    continue
+                results[c.name] = res.to_json()
+                if progress is not None:
+                    progress(res)
+        finally:
+            app.removeEventFilter(counter)
+            if ctx.window is not None:
+                ctx.window.close()
+            host.close()
+            for w in (ctx.window, host):
+                if w is not None:
+                    w.deleteLater()
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    meta = runner.environment_meta(info, repeat, suite="ui")
+    meta.update(qt=qVersion(), pyside=PySide6.__version__, qpa=app.platformName())
+    return {"format": runner.RESULT_FORMAT, "meta": meta, "cases": results}
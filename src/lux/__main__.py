@@ -1,4 +1,6 @@
-from lux.app.bootstrap import run_app
+import sys
+
+from lux.app.cli import main
 
 if __name__ == "__main__":
-    run_app()
+    sys.exit(main())
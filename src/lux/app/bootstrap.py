@@ -1,52 +1,180 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
+from contextlib import contextmanager
+from typing import Iterator
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 
+from lux.app.config import app_data_dir
+from lux.app.lifecycle import PHASE_CLOSE, PHASE_DRAIN, PHASE_MAINTAIN, Lifecycle
 from lux.app.navigation import build_default_registry
+from lux.app.profiles import DEFAULT_PROFILE, Profile, ProfilePool, ProfileSession, ProfileStore
 from lux.app.services import SystemServices
+from lux.core import instrumentation
 from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
 from lux.core.scheduler.service import SchedulerService
+from lux.core.events import ChangeBus
 from lux.core.settings.store import SettingsStore
+from lux.core.undo import UndoJournal
+from lux.data.change_feed import ChangeFeed
+from lux.data.backup import BackupService
+from lux.data.cold_storage import ColdStorage
 from lux.data.db import ensure_db_ready
+from lux.data.maintenance import DbMaintenance
+from lux.data.profiling import SqlProfiler
+from lux.data.repositories.change_log_repo import ChangeLogRepo
 from lux.data.repositories.schedule_repo import ScheduledEntryRepo
 from lux.data.repositories.tasks_repo import TasksRepository
+from lux.data.repositories.undo_repo import UndoLogRepo
 from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.scheduler_provider import register_tasks_scheduler_provider
 from lux.features.tasks.service import TasksService
+from lux.ui.qt.idle import IdleRunner
 from lux.ui.qt.main_window import MainWindow
+from lux.ui.qt.optimistic import OptimisticQueue
 import lux.ui.qt.theme as theme_mod
 
 log = logging.getLogger(__name__)
 
+# Undo history bound (steps); persisted in undo_log.
+UNDO_CAPACITY = 200
 
+# Shutdown budget shares (seconds) for optional housekeeping.
+SHUTDOWN_IDLE_JOBS_S = 1.0
+SHUTDOWN_MAINTENANCE_S = 2.0
 
-def run_app() -> None:
-    app = QApplication(sys.argv)
+# Set to 1 to record hot-path timings from the first frame (Settings → Performance toggles it too).
+INSTRUMENT_ENV = "LUX_INSTRUMENT"
+# Set to 1 to profile repository SQL from the start; stats are written to the profile cache at exit.
+PROFILE_SQL_ENV = "LUX_PROFILE_SQL"
+SQL_PROFILE_FILE = "sql-profile.json"
 
-    # Settings must be created in bootstrap (composition root)
-    settings = SettingsStore()
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip() not in ("", "0")
+
+
+def open_profile_session(profile: Profile) -> ProfileSession:
+    """Build one profile's DB connection, change feed, repos and services (ProfilePool factory)."""
     # DB lifecycle is bootstrap-owned (NOT inside services)
-    conn = ensure_db_ready()
+    conn = ensure_db_ready(profile.db_file)
+
+    # System change feed: triggers fill change_log; repos pump it after each commit
+    change_bus = ChangeBus()
+    change_log_repo = ChangeLogRepo(conn)
+    change_feed = ChangeFeed(change_log_repo, change_bus)
+
+    # Shutdown hooks + warm caches of this profile (stamped with its change_log seq)
+    lifecycle = Lifecycle(cache_dir=profile.cache_dir, data_version=change_log_repo.max_seq)
+
+    # Undo journal (system-owned; services register their inverse-op handlers)
+    undo_journal = UndoJournal(capacity=UNDO_CAPACITY, store=UndoLogRepo(conn))
+    undo_journal.load()
+
+    # Repositories share one profiled view of the connection (pass-through until enabled)
+    sql_profiler = SqlProfiler(enabled=_env_flag(PROFILE_SQL_ENV))
+    repo_conn = sql_profiler.wrap(conn)
 
     # Scheduler system spine (repo injected; registry accessed via service.registry)
-    scheduler_repo = ScheduledEntryRepo(conn)
+    scheduler_repo = ScheduledEntryRepo(repo_conn, on_commit=change_feed.pump)
     scheduler_registry = SchedulerProviderRegistry()
-    scheduler_service = SchedulerService(repo=scheduler_repo, registry=scheduler_registry)
+    scheduler_service = SchedulerService(repo=scheduler_repo, registry=scheduler_registry, journal=undo_journal)
 
     # Tasks feature spine (repo/service constructed here; no feature-owned DB init)
-    tasks_repo = TasksRepository(conn)
+    tasks_repo = TasksRepository(repo_conn, on_commit=change_feed.pump)
     tasks_repo_adapter = TasksRepo(tasks_repo)
-    tasks_service = TasksService(repo=tasks_repo_adapter)
+    tasks_service = TasksService(repo=tasks_repo_adapter, journal=undo_journal)
+
+    # Replayed steps may touch both repos: one transaction on the shared connection.
+    @contextmanager
+    def undo_transaction() -> Iterator[None]:
+        with scheduler_repo.transaction(), tasks_repo.transaction():
+            yield
+
+    undo_journal.set_atomic(undo_transaction)
+
+    # Hot backups: own connection on a worker thread; rotated snapshots per profile
+    backup_service = BackupService(db_file=profile.db_file, dest_dir=profile.backup_dir)
+
+    # Scheduler label providers (features register; registry stays feature-agnostic)
+    register_tasks_scheduler_provider(scheduler_registry, tasks_repo_adapter, change_bus)
 
     services = SystemServices(
         scheduler_service=scheduler_service,
         tasks_service=tasks_service,
+        undo_journal=undo_journal,
+        change_bus=change_bus,
+        lifecycle=lifecycle,
+        backup_service=backup_service,
+        sql_profiler=sql_profiler,
+    )
+
+    maintenance = DbMaintenance(conn)
+
+    def save_sql_profile(_budget: float) -> None:
+        if sql_profiler.enabled and sql_profiler.stats():
+            n = sql_profiler.export(profile.cache_dir / SQL_PROFILE_FILE)
+            log.info("Wrote SQL profile (%d statements) to %s", n, profile.cache_dir / SQL_PROFILE_FILE)
+
+    def close_db(_budget: float) -> None:
+        if conn.in_transaction:
+            log.warning("Closing the database with an open transaction; rolling back")
+            conn.rollback()
+        maintenance.checkpoint()
+        conn.close()
+
+    # Release order: drain writes -> save caches -> housekeeping -> close.
+    lifecycle.add_shutdown_hook("optimistic-writes", lambda _b: OptimisticQueue.flush_all(), PHASE_DRAIN, required=True)
+    lifecycle.add_shutdown_hook(
+        "db-maintenance", lambda b: maintenance.run_shutdown(deadline_s=min(b, SHUTDOWN_MAINTENANCE_S)), PHASE_MAINTAIN
+    )
+    lifecycle.add_shutdown_hook("backup", backup_service.shutdown, PHASE_MAINTAIN)
+    lifecycle.add_shutdown_hook("sql-profile", save_sql_profile, PHASE_MAINTAIN)
+    lifecycle.add_shutdown_hook("db-close", close_db, PHASE_CLOSE, required=True)
+
+    return ProfileSession(
+        profile=profile,
+        conn=conn,
+        services=services,
+        lifecycle=lifecycle,
+        # Background maintenance: small slices while the user is idle (active profile only).
+        idle_jobs={
+            "cold-storage": ColdStorage(conn).step,
+            "db-maintenance": maintenance.step,
+            "daily-backup": backup_service.auto_step,
+        },
     )
 
-    # Apply theme once we have settings + app (SSOT path)
+
+def run_app() -> None:
+    if _env_flag(INSTRUMENT_ENV):
+        instrumentation.enable()
+
+    app = QApplication(sys.argv)
+
+    # Settings must be created in bootstrap (composition root)
+    settings = SettingsStore()
+
+    # App-wide shutdown + caches (profiles own their DB hooks; see open_profile_session)
+    lifecycle = Lifecycle(cache_dir=app_data_dir() / "cache")
+    app.aboutToQuit.connect(lifecycle.shutdown)  # type: ignore[arg-type]
+
+    # Profiles: one session per open database; the last active one opens first
+    profiles = ProfilePool(ProfileStore(), open_profile_session)
+    try:
+        session = profiles.activate(profiles.store.active_id)
+    except Exception:
+        log.exception("Opening profile %s failed; using the default profile", profiles.store.active_id)
+        session = profiles.activate(DEFAULT_PROFILE)
+
+    # Apply theme once we have settings + app (SSOT path); compiled QSS is cached across launches
+    saved_qss = lifecycle.load_cache("stylesheets")
+    if saved_qss is not None:
+        theme_mod.restore_stylesheet_cache(saved_qss.data)
+    lifecycle.register_cache("stylesheets", theme_mod.stylesheet_cache_snapshot)
     try:
         theme_mod.apply_theme_by_name(
             app=app,
@@ -63,14 +191,58 @@ def run_app() -> None:
         log.error("THEME_APPLY_CODE: %r", getattr(fn, "__code__", None))
         raise
 
-    registry = build_default_registry()
+    # Background maintenance: the active profile's jobs, plus lazy release of inactive profiles.
+    idle = IdleRunner(app, parent=app)
+    for name in session.idle_jobs:
+        idle.add(name, lambda n=name: profiles.run_idle(n))
+    idle.add("profile-release", profiles.release_idle)
 
-    win = MainWindow(
-        settings=settings,
-        registry=registry,
-        services=services,
-        app=app,
-    )
+    # Shutdown order: drain writes -> save caches -> housekeeping -> close profiles.
+    lifecycle.add_shutdown_hook("optimistic-writes", lambda _b: OptimisticQueue.flush_all(), PHASE_DRAIN, required=True)
+    lifecycle.add_shutdown_hook("idle-jobs", lambda b: idle.run_all_now(min(b, SHUTDOWN_IDLE_JOBS_S)), PHASE_MAINTAIN)
+    lifecycle.add_shutdown_hook("profiles", profiles.close_all, PHASE_CLOSE, required=True)
+
+    registry = build_default_registry()
+    windows: list[MainWindow] = []
+
+    def open_window(s: ProfileSession) -> MainWindow:
+        # Gauges follow the profile on screen.
+        instrumentation.register_gauge("cache.provider_labels.hit_rate", s.services.scheduler_service.registry.cache.hit_rate)
+        win = MainWindow(
+            settings=settings,
+            registry=registry,
+            services=s.services,
+            app=app,
+            profiles=profiles.store,
+            on_switch_profile=switch_profile,
+        )
+        win.setWindowTitle(f"Lux Planner — {s.profile.name}" if s.profile.id != DEFAULT_PROFILE else "Lux Planner")
+        return win
+
+    def switch_profile(profile_id: str) -> None:
+        """Runtime switch: a new window on the other profile's services; no restart."""
+        current = profiles.active
+        if current is not None and current.profile.id == profile_id:
+            return
+        OptimisticQueue.flush_all()
+        try:
+            s = profiles.activate(profile_id)
+        except Exception as e:
+            log.exception("Switching to profile %s failed", profile_id)
+            QMessageBox.warning(windows[-1] if windows else None, "Switch profile", f"{type(e).__name__}: {e}")
+            return
+        old = windows.pop() if windows else None
+        win = open_window(s)
+        windows.append(win)
+        if old is not None:
+            win.setGeometry(old.geometry())
+        win.show()  # shown before the old window closes, so the app does not quit
+        if old is not None:
+            old.close()
+            old.deleteLater()
+
+    win = open_window(session)
+    windows.append(win)
     win.show()
 
     sys.exit(app.exec())
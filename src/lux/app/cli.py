@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Sequence
+
+log = logging.getLogger(__name__)
+
+
+def _open_db(path: str | None):
+    """--db file, else the active profile's database."""
+    from lux.app.profiles import ProfileStore
+    from lux.data.db import ensure_db_ready
+
+    return ensure_db_ready(Path(path) if path else ProfileStore().active().db_file)
+
+
+def _cmd_profiles(args: argparse.Namespace) -> int:
+    from lux.app.profiles import ProfileStore
+
+    store = ProfileStore()
+    if args.create:
+        print(f"Created {store.create(args.create).id}")
+    if args.activate:
+        try:
+            store.set_active(args.activate)
+        except KeyError:
+            print(f"Unknown profile: {args.activate}", file=sys.stderr)
+            return 1
+    for p in store.list():
+        mark = "*" if p.id == store.active_id else " "
+        print(f"{mark} {p.id:<20} {p.name:<24} {p.db_file}")
+    return 0
+
+
+def _cmd_agenda(args: argparse.Namespace) -> int:
+    from datetime import date, timedelta
+
+    from lux.app.profiles import ProfileStore, combined_agenda
+
+    store = ProfileStore()
+    first = date.fromisoformat(args.start) if args.start else date.today()
+    items = combined_agenda(
+        store.list(),
+        f"{first.isoformat()} 00:00:00",
+        f"{(first + timedelta(days=args.days)).isoformat()} 00:00:00",
+        limit=args.limit,
+    )
+    names = {p.id: p.name for p in store.list()}
+    for it in items:
+        print(f"{it.start_dt[:16]}  {it.end_dt[11:16]}  [{names.get(it.profile_id, it.profile_id)}] {it.title}")
+    return 0
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    from lux.data.columnar import CODEC_ZLIB, CODEC_ZSTD, HistoryArchive
+
+    codec = {"zlib": CODEC_ZLIB, "zstd": CODEC_ZSTD}.get(args.codec) if args.codec else None
+    conn = _open_db(args.db)
+    try:
+        stats = HistoryArchive(conn, chunk_rows=args.chunk_rows, codec=codec).export_to(Path(args.path))
+    finally:
+        conn.close()
+    print(f"Exported {sum(stats.rows.values())} rows ({stats.bytes} bytes) in {stats.duration_ms:.0f} ms")
+    for table, n in stats.rows.items():
+        print(f"  {table}: {n}")
+    return 0
+
+
+def _cmd_import(args: argparse.Namespace) -> int:
+    from lux.data.columnar import HistoryArchive
+
+    conn = _open_db(args.db)
+    try:
+        stats = HistoryArchive(conn).import_from(Path(args.path))
+    except ValueError as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    print(f"Imported {sum(stats.rows.values())} rows in {stats.duration_ms:.0f} ms")
+    return 0
+
+
+def _scheduler_service(conn):
+    from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+    from lux.core.scheduler.service import SchedulerService
+    from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+
+    return SchedulerService(repo=ScheduledEntryRepo(conn), registry=SchedulerProviderRegistry())
+
+
+def _cmd_ics_import(args: argparse.Namespace) -> int:
+    conn = _open_db(args.db)
+    try:
+        with open(args.path, encoding="utf-8", errors="replace", newline="") as f:
+            stats = _scheduler_service(conn).import_ics(f)
+    finally:
+        conn.close()
+    print(
+        f"Imported {stats.events} events in {stats.duration_ms:.0f} ms: "
+        f"{stats.entries} entries, {stats.series} series, {stats.exceptions} exceptions"
+    )
+    if stats.unsupported_rules:
+        print(f"  {stats.unsupported_rules} recurrence rules unsupported (first instance only)")
+    if stats.cold_skipped:
+        print(f"  {stats.cold_skipped} events already in cold storage (unchanged)")
+    if stats.orphan_overrides:
+        print(f"  {stats.orphan_overrides} edited instances without their series (kept as one-offs)")
+    if stats.errors:
+        print(f"  {len(stats.errors)} malformed events skipped (first: {stats.errors[0]})")
+    return 0
+
+
+def _cmd_ics_export(args: argparse.Namespace) -> int:
+    conn = _open_db(args.db)
+    try:
+        with open(args.path, "w", encoding="utf-8", newline="") as f:
+            n = _scheduler_service(conn).export_ics(f)
+    finally:
+        conn.close()
+    print(f"Exported {n} events")
+    return 0
+
+
+def _print_sync_stats(label: str, stats) -> None:
+    print(
+        f"  {label}: {stats.inserted} inserted, {stats.updated} updated, {stats.stale} kept (newer), "
+        f"{stats.merged} merged, {stats.deleted} deleted, {stats.unresolved} unresolved"
+    )
+
+
+def _cmd_sync(args: argparse.Namespace) -> int:
+    from lux.data.sync import SyncError, sync_databases
+
+    local = _open_db(args.db)
+    remote = _open_db(args.other)
+    try:
+        result = sync_databases(local, remote)
+    except SyncError as e:
+        print(f"Sync failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        remote.close()
+        local.close()
+    print(f"Synced: sent {result.sent} rows, received {result.received} rows")
+    _print_sync_stats("here", result.local)
+    _print_sync_stats("other", result.remote)
+    return 0
+
+
+def _cmd_sync_export(args: argparse.Namespace) -> int:
+    from lux.data.sync import SyncError, build_changeset, write_changeset
+
+    conn = _open_db(args.db)
+    try:
+        cs = build_changeset(conn, peer=args.peer)
+    except SyncError as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    size = write_changeset(cs, Path(args.path))
+    print(f"Wrote {cs.size} changed rows ({size} bytes{', full' if cs.full else ''}) for {cs.peer}")
+    return 0
+
+
+def _cmd_sync_import(args: argparse.Namespace) -> int:
+    from lux.data.sync import SyncError, apply_changeset, read_changeset
+
+    conn = _open_db(args.db)
+    try:
+        cs = read_changeset(Path(args.path))
+        stats = apply_changeset(conn, cs)
+    except (SyncError, OSError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    print(f"Applied {stats.received} rows from {cs.site} in {stats.duration_ms:.0f} ms")
+    _print_sync_stats("here", stats)
+    return 0
+
+
+def _cmd_sync_id(args: argparse.Namespace) -> int:
+    from lux.data.sync import reset_site_id, site_id
+
+    conn = _open_db(args.db)
+    try:
+        print(reset_site_id(conn) if args.reset else site_id(conn))
+    finally:
+        conn.close()
+    return 0
+
+
+def _cmd_profile_sql(args: argparse.Namespace) -> int:
+    """Run the app's main read paths through the SQL profiler and report per-statement stats."""
+    from datetime import date, timedelta
+
+    from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+    from lux.core.scheduler.service import SchedulerService
+    from lux.data.profiling import SqlProfiler
+    from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+    from lux.data.repositories.tasks_repo import TasksRepository
+    from lux.features.tasks.repo import TasksRepo
+    from lux.features.tasks.service import TasksService
+
+    profiler = SqlProfiler(slow_ms=args.slow_ms, enabled=True)
+    conn = _open_db(args.db)
+    try:
+        repo_conn = profiler.wrap(conn)
+        tasks = TasksService(TasksRepo(TasksRepository(repo_conn)))
+        scheduler = SchedulerService(repo=ScheduledEntryRepo(repo_conn), registry=SchedulerProviderRegistry())
+        day = date.fromisoformat(args.day) if args.day else date.today()
+        month = day.replace(day=1)
+        for _ in range(max(1, args.repeat)):
+            # What the Tasks and Scheduler modules read on open and while stepping days.
+            tasks.list_today()
+            tasks.list_upcoming(days=7)
+            tasks.completion_by_day(month, month + timedelta(days=41))
+            for span in (1, 7, 42):
+                scheduler.list_range(day, day + timedelta(days=span))
+            scheduler.day_summaries(month, month + timedelta(days=41))
+    finally:
+        conn.close()
+
+    stats = profiler.stats()
+    for s in stats[: args.top]:
+        print(f"{s.total_ms:>9.2f} ms  {s.calls:>4}x  p95 {s.p95_ms:>8.2f}  rows {s.rows:>7}  slow {s.slow:>3}  {s.sql[:110]}")
+        if s.plan:
+            for line in s.plan:
+                print(f"{'':>14}{line}")
+    if args.out:
+        n = profiler.export(Path(args.out))
+        print(f"Wrote {n} statements to {args.out}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lux", description="Lux Planner")
+    sub = parser.add_subparsers(dest="command")
+
+    exp = sub.add_parser("export", help="Export the full history to a compressed columnar archive")
+    exp.add_argument("path", help="Archive file to write")
+    exp.add_argument("--db", help="Database file (default: the planner database)")
+    exp.add_argument("--chunk-rows", type=int, default=20_000, help="Rows per chunk (bounds memory)")
+    exp.add_argument("--codec", choices=("zlib", "zstd"), help="Compression (default: zstd if installed)")
+    exp.set_defaults(func=_cmd_export)
+
+    imp = sub.add_parser("import", help="Load a history archive into an empty database")
+    imp.add_argument("path", help="Archive file to read")
+    imp.add_argument("--db", help="Database file (default: the planner database)")
+    imp.set_defaults(func=_cmd_import)
+
+    ics_in = sub.add_parser("ics-import", help="Import events from an iCalendar (.ics) file")
+    ics_in.add_argument("path", help=".ics file to read")
+    ics_in.add_argument("--db", help="Database file (default: the planner database)")
+    ics_in.set_defaults(func=_cmd_ics_import)
+
+    ics_out = sub.add_parser("ics-export", help="Export the schedule as an iCalendar (.ics) file")
+    ics_out.add_argument("path", help=".ics file to write")
+    ics_out.add_argument("--db", help="Database file (default: the planner database)")
+    ics_out.set_defaults(func=_cmd_ics_export)
+
+    prof = sub.add_parser("profiles", help="List, create or activate profiles")
+    prof.add_argument("--create", metavar="NAME", help="Register a new profile")
+    prof.add_argument("--activate", metavar="ID", help="Profile opened by the next app start")
+    prof.set_defaults(func=_cmd_profiles)
+
+    agenda = sub.add_parser("agenda", help="Combined read-only agenda across all profiles")
+    agenda.add_argument("--start", help="First day (YYYY-MM-DD, default: today)")
+    agenda.add_argument("--days", type=int, default=7, help="Number of days")
+    agenda.add_argument("--limit", type=int, default=500, help="Maximum items")
+    agenda.set_defaults(func=_cmd_agenda)
+
+    syn = sub.add_parser("sync", help="Two-way sync with another planner database file")
+    syn.add_argument("other", help="The other database file")
+    syn.add_argument("--db", help="Database file (default: the planner database)")
+    syn.set_defaults(func=_cmd_sync)
+
+    syn_out = sub.add_parser("sync-export", help="Write the changes a peer has not acknowledged yet")
+    syn_out.add_argument("path", help="Change set file to write")
+    syn_out.add_argument("--peer", required=True, help="Site id of the receiving database (see sync-id)")
+    syn_out.add_argument("--db", help="Database file (default: the planner database)")
+    syn_out.set_defaults(func=_cmd_sync_export)
+
+    syn_in = sub.add_parser("sync-import", help="Apply a change set written by a peer")
+    syn_in.add_argument("path", help="Change set file to read")
+    syn_in.add_argument("--db", help="Database file (default: the planner database)")
+    syn_in.set_defaults(func=_cmd_sync_import)
+
+    syn_id = sub.add_parser("sync-id", help="Print this database's site id")
+    syn_id.add_argument("--reset", action="store_true", help="Give a copied file its own site id")
+    syn_id.add_argument("--db", help="Database file (default: the planner database)")
+    syn_id.set_defaults(func=_cmd_sync_id)
+
+    prof_sql = sub.add_parser("profile-sql", help="Profile the main read queries against a database")
+    prof_sql.add_argument("--db", help="Database file (default: the planner database)")
+    prof_sql.add_argument("--day", help="Day the views are opened on (YYYY-MM-DD, default: today)")
+    prof_sql.add_argument("--repeat", type=int, default=3, help="Times to run the read paths")
+    prof_sql.add_argument("--slow-ms", type=float, default=25.0, help="Log statements slower than this with their plan")
+    prof_sql.add_argument("--top", type=int, default=15, help="Statements to print")
+    prof_sql.add_argument("--out", help="Also write all statement stats to this JSON file")
+    prof_sql.set_defaults(func=_cmd_profile_sql)
+
+    return parser
+
+
+_COMMANDS = (
+    "export", "import", "ics-import", "ics-export", "profiles", "agenda", "sync", "sync-export", "sync-import", "sync-id",
+    "profile-sql",
+)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or (argv[0] not in _COMMANDS and argv[0] not in ("-h", "--help")):
+        # No data command: start the app (Qt parses its own flags from sys.argv).
+        from lux.app.bootstrap import run_app
+
+        run_app()
+        return 0
+
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    return int(args.func(args))
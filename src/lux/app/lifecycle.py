@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+PHASE_DRAIN = 0
+PHASE_PERSIST = 10
+PHASE_MAINTAIN = 20
+PHASE_CLOSE = 30
+
+SHUTDOWN_DEADLINE_S = 5.0
+
+_CACHE_FORMAT = 1
+_CACHE_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+ShutdownHook = Callable[[float], None]  # receives the remaining budget in seconds
+
+
+@dataclass(frozen=True)
+class SavedCache:
+    data: Any
+    current: bool  # True if no write was committed since the cache was saved
+
+
+@dataclass(frozen=True)
+class _Hook:
+    name: str
+    fn: ShutdownHook
+    phase: int
+    required: bool
+    order: int
+
+
+class Lifecycle:
+    """Shutdown hook registry plus a small JSON store for warm caches."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        data_version: Callable[[], int] | None = None,
+        deadline_s: float = SHUTDOWN_DEADLINE_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._data_version = data_version
+        self._deadline_s = max(0.0, float(deadline_s))
+        self._clock = clock
+        self._hooks: list[_Hook] = []
+        self._caches: dict[str, Callable[[], Any]] = {}
+        self._order = 0
+        self._done = False
+
+    @property
+    def is_shut_down(self) -> bool:
+        return self._done
+
+    # -------------------------
+    # Registration
+    # -------------------------
+    def add_shutdown_hook(
+        self,
+        name: str,
+        hook: ShutdownHook,
+        phase: int = PHASE_MAINTAIN,
+        required: bool = False,
+    ) -> Callable[[], None]:
+        """Register hook(budget_s); returns a remove callable (widgets call it on `destroyed`)."""
+        self._order += 1
+        entry = _Hook(name=str(name), fn=hook, phase=int(phase), required=bool(required), order=self._order)
+        self._hooks.append(entry)
+
+        def remove() -> None:
+            try:
+                self._hooks.remove(entry)
+            except ValueError:
+                pass
+
+        return remove
+
+    def register_cache(self, name: str, snapshot: Callable[[], Any]) -> None:
+        """Save snapshot() (JSON-serializable) as `name` during PHASE_PERSIST."""
+        self._caches[self._check_name(name)] = snapshot
+
+    # -------------------------
+    # Warm caches
+    # -------------------------
+    def load_cache(self, name: str) -> SavedCache | None:
+        """The cache saved by the last shutdown, or None (missing, unreadable or other format)."""
+        path = self._cache_path(name)
+        if path is None or not path.exists():
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            log.warning("Ignoring unreadable cache file: %s", path)
+            return None
+        if not isinstance(raw, dict) or raw.get("format") != _CACHE_FORMAT:
+            return None
+        saved_version = raw.get("version")
+        current = saved_version is not None and saved_version == self._version()
+        return SavedCache(data=raw.get("data"), current=current)
+
+    def save_caches(self) -> None:
+        if self._cache_dir is None or not self._caches:
+            return
+        version = self._version()
+        for name, snapshot in list(self._caches.items()):
+            path = self._cache_path(name)
+            if path is None:
+                continue
+            try:
+                payload = {"format": _CACHE_FORMAT, "version": version, "data": snapshot()}
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, path)  # atomic: a crash never leaves half a file
+            except Exception:
+                log.exception("Saving cache failed: %s", name)
+
+    # -------------------------
+    # Shutdown
+    # -------------------------
+    def shutdown(self, deadline_s: float | None = None) -> None:
+        """Run all hooks once, in phase order, within the deadline (or `deadline_s` if given)."""
+        if self._done:
+            return
+        self._done = True
+
+        start = self._clock()
+        end = start + (self._deadline_s if deadline_s is None else max(0.0, float(deadline_s)))
+        hooks = sorted(self._hooks, key=lambda h: (h.phase, h.order))
+        if self._caches:
+            hooks.append(_Hook("caches", lambda _budget: self.save_caches(), PHASE_PERSIST, False, 0))
+            hooks.sort(key=lambda h: (h.phase, h.order))
+
+        for hook in hooks:
+            remaining = end - self._clock()
+            if remaining <= 0 and not hook.required:
+                log.warning("Shutdown deadline passed; skipping %s", hook.name)
+                continue
+            t0 = time.perf_counter()
+            try:
+                hook.fn(max(0.0, remaining))
+            except Exception:
+                log.exception("Shutdown hook failed: %s", hook.name)
+            log.info("Shutdown %s: %.1f ms", hook.name, (time.perf_counter() - t0) * 1000.0)
+
+        log.info("Shutdown finished in %.1f ms", (self._clock() - start) * 1000.0)
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    @staticmethod
+    def _check_name(name: str) -> str:
+        nn = str(name).strip().lower()
+        if not _CACHE_NAME_RE.match(nn):
+            raise ValueError(f"Invalid cache name: {name!r}")
+        return nn
+
+    def _cache_path(self, name: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{self._check_name(name)}.json"
+
+    def _version(self) -> int | None:
+        if self._data_version is None:
+            return None
+        try:
+            return int(self._data_version())
+        except Exception:
+            log.exception("Reading data version failed")
+            return None
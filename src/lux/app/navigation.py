@@ -38,11 +38,11 @@ def build_default_registry() -> list[AppModuleSpec]:
     from lux.features.goals.ui.panel import GoalsLeftPanel
     from lux.features.goals.ui.view import GoalsRightView
 
-    # Tasks (Inbox / unassigned tasks)
-    from lux.features.tasks.ui.panel import TasksLeftPanel
-    from lux.features.tasks.ui.view import TasksRightView
+    # Tasks (Inbox / unassigned tasks; both panes share one controller)
+    from lux.features.tasks.ui.factories import make_tasks_factories
 
     scheduler_left_factory, scheduler_right_factory = make_scheduler_factories()
+    tasks_left_factory, tasks_right_factory = make_tasks_factories()
 
     return [
         AppModuleSpec(
@@ -78,7 +78,7 @@ def build_default_registry() -> list[AppModuleSpec]:
         AppModuleSpec(
             key="tasks",
             title="Lux Tasks",
-            make_left_panel=lambda services: TasksLeftPanel(services=services),
-            make_right_view=lambda services: TasksRightView(services=services),
+            make_left_panel=tasks_left_factory,
+            make_right_view=tasks_right_factory,
         ),
     ]
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+from lux.app.config import app_data_dir
+from lux.app.lifecycle import Lifecycle
+from lux.app.services import SystemServices
+from lux.core.recurrence import parse_rrule
+from lux.core.scheduler.expansion import EpochFormatter, SeriesSpec, expand_batch, to_epoch
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+PROFILE_IDLE_RELEASE_S = 10 * 60
+MAX_OPEN_PROFILES = 3
+
+# SQLite allows 10 attached databases by default (SQLITE_MAX_ATTACHED).
+MAX_ATTACHED = 10
+
+_REGISTRY_FILE = "profiles.json"
+_REGISTRY_FORMAT = 1
+_DB_FILE = "planner.db"
+
+
+@dataclass(frozen=True)
+class Profile:
+    id: str
+    name: str
+    data_dir: Path
+
+    @property
+    def db_file(self) -> Path:
+        return self.data_dir / _DB_FILE
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.data_dir / "cache"
+
+    @property
+    def backup_dir(self) -> Path:
+        return self.data_dir / "backups"
+
+
+# -------------------------
+# Registry
+# -------------------------
+class ProfileStore:
+    """Profile list and the active profile, persisted in profiles.json."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root or app_data_dir()
+        self._names: dict[str, str] = {DEFAULT_PROFILE: "Default"}
+        self._active = DEFAULT_PROFILE
+        self._load()
+
+    def list(self) -> list[Profile]:
+        return [self._profile(pid) for pid in self._names]
+
+    def get(self, profile_id: str) -> Profile | None:
+        return self._profile(profile_id) if profile_id in self._names else None
+
+    @property
+    def active_id(self) -> str:
+        return self._active
+
+    def active(self) -> Profile:
+        return self._profile(self._active)
+
+    def set_active(self, profile_id: str) -> None:
+        if profile_id not in self._names:
+            raise KeyError(profile_id)
+        if profile_id != self._active:
+            self._active = profile_id
+            self._save()
+
+    def create(self, name: str) -> Profile:
+        """Register a new profile (its database is created when first opened)."""
+        name = str(name).strip()
+        if not name:
+            raise ValueError("Profile name is empty")
+        base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:40] or "profile"
+        pid, n = base, 2
+        while pid in self._names:
+            pid, n = f"{base}-{n}", n + 1
+        self._names[pid] = name
+        profile = self._profile(pid)
+        profile.data_dir.mkdir(parents=True, exist_ok=True)
+        self._save()
+        return profile
+
+    def rename(self, profile_id: str, name: str) -> None:
+        if profile_id not in self._names or not str(name).strip():
+            raise ValueError(f"Cannot rename profile {profile_id!r}")
+        self._names[profile_id] = str(name).strip()
+        self._save()
+
+    def _profile(self, profile_id: str) -> Profile:
+        data_dir = self._root if profile_id == DEFAULT_PROFILE else self._root / "profiles" / profile_id
+        return Profile(id=profile_id, name=self._names[profile_id], data_dir=data_dir)
+
+    def _load(self) -> None:
+        path = self._root / _REGISTRY_FILE
+        if not path.exists():
+            return
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            log.warning("Ignoring unreadable profile registry: %s", path)
+            return
+        if not isinstance(raw, dict) or raw.get("format") != _REGISTRY_FORMAT:
+            return
+        for item in raw.get("profiles", []):
+            pid, name = str(item.get("id", "")), str(item.get("name", "")).strip()
+            if re.fullmatch(r"[a-z0-9][a-z0-9-]{0,63}", pid) and name:
+                self._names[pid] = name
+        if raw.get("active") in self._names:
+            self._active = str(raw["active"])
+
+    def _save(self) -> None:
+        path = self._root / _REGISTRY_FILE
+        payload = {
+            "format": _REGISTRY_FORMAT,
+            "active": self._active,
+            "profiles": [{"id": pid, "name": name} for pid, name in self._names.items()],
+        }
+        try:
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            log.exception("Saving the profile registry failed")
+
+
+# -------------------------
+# Open sessions
+# -------------------------
+@dataclass
+class ProfileSession:
+    """Everything bootstrap built for one open profile."""
+    profile: Profile
+    conn: sqlite3.Connection
+    services: SystemServices
+    lifecycle: Lifecycle                     # this profile's shutdown hooks and warm caches
+    idle_jobs: dict[str, Callable[[], bool]] = field(default_factory=dict)
+    last_active: float = 0.0
+
+
+SessionFactory = Callable[[Profile], ProfileSession]
+
+
+class ProfilePool:
+    """Open profile sessions: one active, the others released lazily."""
+
+    def __init__(
+        self,
+        store: ProfileStore,
+        factory: SessionFactory,
+        idle_release_s: float = PROFILE_IDLE_RELEASE_S,
+        max_open: int = MAX_OPEN_PROFILES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._store = store
+        self._factory = factory
+        self._idle_release_s = max(0.0, float(idle_release_s))
+        self._max_open = max(1, int(max_open))
+        self._clock = clock
+        self._sessions: dict[str, ProfileSession] = {}
+        self._active: str | None = None
+
+    @property
+    def store(self) -> ProfileStore:
+        return self._store
+
+    @property
+    def active(self) -> ProfileSession | None:
+        return self._sessions.get(self._active) if self._active else None
+
+    def open_ids(self) -> list[str]:
+        return list(self._sessions)
+
+    def activate(self, profile_id: str) -> ProfileSession:
+        """Open (or reuse) a profile's session and make it the active one."""
+        profile = self._store.get(profile_id)
+        if profile is None:
+            raise KeyError(profile_id)
+        now = self._clock()
+        previous = self.active
+        if previous is not None:
+            previous.last_active = now
+
+        session = self._sessions.get(profile_id)
+        if session is None:
+            t0 = time.perf_counter()
+            profile.data_dir.mkdir(parents=True, exist_ok=True)
+            session = self._factory(profile)
+            self._sessions[profile_id] = session
+            log.info("Opened profile %s in %.1f ms", profile_id, (time.perf_counter() - t0) * 1000.0)
+
+        session.last_active = now
+        self._active = profile_id
+        self._store.set_active(profile_id)
+
+        # Over the cap: release the least recently used inactive sessions now.
+        inactive = sorted((s for s in self._sessions.values() if s is not session), key=lambda s: s.last_active)
+        for s in inactive[: max(0, len(self._sessions) - self._max_open)]:
+            self.release(s.profile.id)
+        return session
+
+    def run_idle(self, name: str) -> bool:
+        """Idle-runner bridge: run the active profile's job `name` (other profiles stay idle)."""
+        session = self.active
+        step = session.idle_jobs.get(name) if session is not None else None
+        return bool(step()) if step is not None else False
+
+    def release_idle(self) -> bool:
+        """Idle job: release sessions inactive for idle_release_s. Never pending."""
+        now = self._clock()
+        for pid, s in list(self._sessions.items()):
+            if pid != self._active and now - s.last_active >= self._idle_release_s:
+                self.release(pid)
+        return False
+
+    def release(self, profile_id: str, budget_s: float | None = None) -> None:
+        """Shut a session down through its own lifecycle (caches, housekeeping, close)."""
+        session = self._sessions.pop(profile_id, None)
+        if session is None:
+            return
+        if profile_id == self._active:
+            self._active = None
+        session.lifecycle.shutdown(deadline_s=budget_s)
+        log.info("Released profile %s", profile_id)
+
+    def close_all(self, budget_s: float) -> None:
+        """App shutdown: inactive sessions first, the active one last, within the budget."""
+        end = self._clock() + max(0.0, budget_s)
+        order = sorted(self._sessions, key=lambda pid: pid == self._active)
+        for i, pid in enumerate(order):
+            left = len(order) - i
+            self.release(pid, budget_s=max(0.0, end - self._clock()) / left)
+
+
+# -------------------------
+# Combined agenda
+# -------------------------
+@dataclass(frozen=True)
+class AgendaItem:
+    profile_id: str
+    start_dt: str
+    end_dt: str
+    title: str
+    item_kind: str
+    item_ref: str
+    series_id: int | None = None
+
+
+def combined_agenda(profiles: Sequence[Profile], start_dt: str, end_dt: str, limit: int = 500) -> list[AgendaItem]:
+    """
+    Entries and series instances overlapping [start_dt, end_dt) across profiles,
+    ordered by start. One read-only connection; the others are ATTACHed.
+    """
+    present = [p for p in profiles if p.db_file.exists()]
+    out: list[AgendaItem] = []
+    # Chunks stay within SQLite's attach limit (main + attached).
+    for i in range(0, len(present), MAX_ATTACHED + 1):
+        out.extend(_agenda_chunk(present[i : i + MAX_ATTACHED + 1], start_dt, end_dt, limit))
+    out.sort(key=lambda a: (a.start_dt, a.profile_id))
+    return out[: max(1, int(limit))]
+
+
+def _ro_uri(path: Path) -> str:
+    return f"file:{path.resolve().as_posix()}?mode=ro"
+
+
+def _agenda_chunk(profiles: Sequence[Profile], start_dt: str, end_dt: str, limit: int) -> list[AgendaItem]:
+    conn = sqlite3.connect(_ro_uri(profiles[0].db_file), uri=True)
+    try:
+        schemas = ["main"]
+        for n, p in enumerate(profiles[1:], start=1):
+            conn.execute("ATTACH DATABASE ? AS ?", (_ro_uri(p.db_file), f"p{n}"))
+            schemas.append(f"p{n}")
+
+        usable: list[tuple[int, str, str, bool]] = []  # (profile index, schema, entries source, has series)
+        for idx, schema in enumerate(schemas):
+            names = {
+                str(r[0])
+                for r in conn.execute(f"SELECT name FROM {schema}.sqlite_master WHERE type IN ('table', 'view')")
+            }
+            if "scheduled_entries" not in names:
+                continue  # never migrated (profile created but empty)
+            has_series = "scheduled_series" in names and "scheduled_series_exceptions" in names
+            entries = "scheduled_entries_all" if "scheduled_entries_all" in names else "scheduled_entries"
+            usable.append((idx, schema, entries, has_series))
+        if not usable:
+            return []
+
+        parts, params = [], []
+        for idx, schema, entries, _ in usable:
+            parts.append(
+                f"""
+                SELECT {idx}, start_dt, end_dt, title_cache, item_kind, item_ref
+                  FROM {schema}.{entries}
+                 WHERE start_dt < ? AND end_dt > ? AND archived = 0
+                """
+            )
+            params += [end_dt, start_dt]
+        sql = " UNION ALL ".join(parts) + " ORDER BY 2 LIMIT ?"
+        out = [
+            AgendaItem(
+                profiles[int(r[0])].id, str(r[1]), str(r[2]), str(r[3] or "Scheduled Item"), str(r[4]), str(r[5])
+            )
+            for r in conn.execute(sql, (*params, int(limit)))
+        ]
+
+        for idx, schema, _, has_series in usable:
+            if has_series:
+                out.extend(_series_instances(conn, schema, profiles[idx].id, start_dt, end_dt))
+        return out
+    finally:
+        conn.close()
+
+
+def _series_instances(
+    conn: sqlite3.Connection, schema: str, profile_id: str, start_dt: str, end_dt: str
+) -> list[AgendaItem]:
+    """Expand one schema's series like SchedulerService.list_range (exceptions skipped)."""
+    rows = conn.execute(
+        f"""
+        SELECT id, start_dt, end_dt, rrule, title_cache, item_kind, item_ref
+          FROM {schema}.scheduled_series
+         WHERE archived = 0 AND start_dt < ? AND (until_dt IS NULL OR until_dt > ?)
+        """,
+        (end_dt, start_dt),
+    ).fetchall()
+    specs: list[SeriesSpec] = []
+    for idx, r in enumerate(rows):
+        try:
+            first = to_epoch(str(r[1]))
+            duration = to_epoch(str(r[2])) - first
+            specs.append(SeriesSpec(key=idx, rule=parse_rrule(str(r[3])), first_start=first, duration=duration))
+        except ValueError:
+            continue
+    if not specs:
+        return []
+
+    range_start, range_end = to_epoch(start_dt), to_epoch(end_dt)
+    expanded = expand_batch(specs, range_start, range_end)
+    if not expanded:
+        return []
+    fmt = EpochFormatter()
+    longest = max(sp.duration for sp in specs)
+    skipped = {
+        (int(r[0]), str(r[1]))
+        for r in conn.execute(
+            f"""
+            SELECT series_id, original_start FROM {schema}.scheduled_series_exceptions
+             WHERE original_start >= ? AND original_start < ?
+            """,
+            (fmt(range_start - longest), end_dt),
+        )
+    }
+    out: list[AgendaItem] = []
+    for s, e, idx in expanded:
+        r = rows[idx]
+        start_s = fmt(s)
+        if (int(r[0]), start_s) in skipped:
+            continue
+        out.append(
+            AgendaItem(profile_id, start_s, fmt(e), str(r[4] or "Scheduled Item"), str(r[5]), str(r[6]), int(r[0]))
+        )
+    return out
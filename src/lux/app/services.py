@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from lux.app.lifecycle import Lifecycle
+from lux.core.events import ChangeBus
 from lux.core.scheduler.service import SchedulerService
+from lux.core.undo import UndoJournal
+from lux.data.backup import BackupService
+from lux.data.profiling import SqlProfiler
 from lux.features.tasks.service import TasksService
 
 
@@ -18,3 +23,8 @@ class SystemServices:
     """
     scheduler_service: SchedulerService
     tasks_service: TasksService
+    undo_journal: UndoJournal | None = None
+    change_bus: ChangeBus | None = None
+    lifecycle: Lifecycle | None = None
+    backup_service: BackupService | None = None
+    sql_profiler: SqlProfiler | None = None
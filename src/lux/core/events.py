@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+log = logging.getLogger(__name__)
+
+# Entity names written by the change_log triggers.
+ENTITY_TASK_DEFINITION = "task_definition"
+ENTITY_TASK_OCCURRENCE = "task_occurrence"
+ENTITY_SCHEDULED_ENTRY = "scheduled_entry"
+ENTITY_SCHEDULED_SERIES = "scheduled_series"
+ENTITY_SERIES_EXCEPTION = "series_exception"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    seq: int                 # change_log sequence (monotonic)
+    entity: str              # ENTITY_* name
+    entity_id: int
+    op: str                  # "insert" | "update" | "delete"
+    start: str | None        # earliest touched date/datetime; None = unbounded
+    end: str | None          # latest touched date/datetime; None = unbounded
+
+    @property
+    def start_day(self) -> str | None:
+        return self.start[:10] if self.start else None
+
+    @property
+    def end_day(self) -> str | None:
+        return self.end[:10] if self.end else None
+
+    def touches_days(self, first_day: str, last_day: str) -> bool:
+        """True if the change may affect any day in [first_day, last_day] (YYYY-MM-DD)."""
+        if self.start_day is not None and self.start_day > last_day:
+            return False
+        if self.end_day is not None and self.end_day < first_day:
+            return False
+        return True
+
+
+ChangeCallback = Callable[[Sequence[ChangeEvent]], None]
+
+
+class ChangeBus:
+    """Publish/subscribe for committed changes, filtered by entity."""
+
+    def __init__(self) -> None:
+        self._subs: list[tuple[ChangeCallback, frozenset[str] | None]] = []
+
+    def subscribe(self, callback: ChangeCallback, entities: Iterable[str] | None = None) -> Callable[[], None]:
+        """
+        Receive batches of events (only `entities`, if given).
+        Returns an unsubscribe callable; widgets call it on `destroyed`.
+        """
+        sub = (callback, frozenset(entities) if entities is not None else None)
+        self._subs.append(sub)
+
+        def unsubscribe() -> None:
+            try:
+                self._subs.remove(sub)
+            except ValueError:
+                pass
+
+        return unsubscribe
+
+    def publish(self, events: Sequence[ChangeEvent]) -> None:
+        if not events:
+            return
+        for callback, entities in list(self._subs):
+            batch = events if entities is None else [e for e in events if e.entity in entities]
+            if not batch:
+                continue
+            try:
+                callback(batch)
+            except Exception:
+                log.exception("Change subscriber failed")
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Iterator, TextIO
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+    ZoneInfo = None  # type: ignore[assignment,misc]
+
+# Events without DTEND/DURATION and with a DATE-TIME start still need a span.
+POINT_EVENT_MINUTES = 30
+
+_FOLD_OCTETS = 75
+_PRODID = "-//Lux Planner//Scheduler//EN"
+
+
+@dataclass(frozen=True)
+class IcsEvent:
+    uid: str
+    start: str                          # naive local YYYY-MM-DD HH:MM:SS
+    end: str
+    summary: str = ""
+    description: str | None = None
+    rrule: str | None = None            # raw RRULE value (no "RRULE:" prefix)
+    recurrence_id: str | None = None    # original start of an edited instance
+    exdates: tuple[str, ...] = ()       # skipped instance starts
+    cancelled: bool = False
+
+
+@dataclass
+class _Raw:
+    props: dict[str, tuple[dict[str, str], str]] = field(default_factory=dict)
+    exdates: list[tuple[dict[str, str], str]] = field(default_factory=list)
+
+
+# -------------------------
+# Reading
+# -------------------------
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded lines (continuations start with a space or tab)."""
+    pending: str | None = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending:
+        yield pending
+
+
+def _split_property(line: str) -> tuple[str, dict[str, str], str] | None:
+    """NAME;PARAM=V;...:VALUE -> (NAME, params, value); quoted params may hold ':' and ';'."""
+    if '"' not in line:
+        # Fast path: no quoting, the first ':' ends the name/params part.
+        head, sep, value = line.partition(":")
+        if not sep:
+            return None
+        name, *params = head.split(";")
+    else:
+        in_quotes = False
+        cut = -1
+        for i, ch in enumerate(line):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                cut = i
+                break
+        if cut < 0:
+            return None
+        head, value = line[:cut], line[cut + 1 :]
+        params, buf, in_quotes = [], "", False
+        for ch in head:
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ";" and not in_quotes:
+                params.append(buf)
+                buf = ""
+                continue
+            buf += ch
+        params.append(buf)
+        name, params = params[0], params[1:]
+
+    out: dict[str, str] = {}
+    for p in params:
+        k, _, v = p.partition("=")
+        out[k.strip().upper()] = v.strip().strip('"')
+    return name.strip().upper(), out, value
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == "\\" and i + 1 < n:
+            nxt = text[i + 1]
+            out.append("\n" if nxt in "nN" else nxt)
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+@lru_cache(maxsize=64)
+def _zone(tzid: str):
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(tzid)
+    except Exception:
+        return None
+
+
+def _parse_time(value: str, params: dict[str, str]) -> tuple[datetime, bool]:
+    """-> (naive local datetime, is_all_day). Raises ValueError."""
+    v = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or (len(v) == 8 and v.isdigit()):
+        return datetime(int(v[0:4]), int(v[4:6]), int(v[6:8])), True
+    if len(v) < 15 or v[8] != "T":
+        raise ValueError(f"invalid DATE-TIME: {value!r}")
+    dt = datetime(int(v[0:4]), int(v[4:6]), int(v[6:8]), int(v[9:11]), int(v[11:13]), int(v[13:15]))
+    if v.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None), False
+    tzid = params.get("TZID")
+    if tzid:
+        zone = _zone(tzid)
+        if zone is not None:
+            return dt.replace(tzinfo=zone).astimezone().replace(tzinfo=None), False
+    return dt, False
+
+
+def _parse_duration(value: str) -> timedelta:
+    """RFC 5545 DURATION (e.g. PT1H30M, P1D, P2W, -PT15M). Raises ValueError."""
+    v = value.strip().upper()
+    sign = -1 if v.startswith("-") else 1
+    v = v.lstrip("+-")
+    if not v.startswith("P"):
+        raise ValueError(f"invalid DURATION: {value!r}")
+    total = 0
+    num = ""
+    in_time = False
+    units = {"W": 7 * 86400, "D": 86400}
+    time_units = {"H": 3600, "M": 60, "S": 1}
+    for ch in v[1:]:
+        if ch == "T":
+            in_time = True
+        elif ch.isdigit():
+            num += ch
+        else:
+            table = time_units if in_time else units
+            if ch not in table or not num:
+                raise ValueError(f"invalid DURATION: {value!r}")
+            total += int(num) * table[ch]
+            num = ""
+    return timedelta(seconds=sign * total)
+
+
+def _fmt(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _build_event(raw: _Raw) -> IcsEvent:
+    if "DTSTART" not in raw.props:
+        raise ValueError("VEVENT without DTSTART")
+    sp, sv = raw.props["DTSTART"]
+    start, all_day = _parse_time(sv, sp)
+
+    if "DTEND" in raw.props:
+        ep, ev = raw.props["DTEND"]
+        end, _ = _parse_time(ev, ep)
+    elif "DURATION" in raw.props:
+        end = start + _parse_duration(raw.props["DURATION"][1])
+    else:
+        end = start + (timedelta(days=1) if all_day else timedelta(minutes=POINT_EVENT_MINUTES))
+    if end <= start:
+        end = start + timedelta(minutes=POINT_EVENT_MINUTES)
+
+    summary = _unescape(raw.props["SUMMARY"][1]) if "SUMMARY" in raw.props else ""
+    description = _unescape(raw.props["DESCRIPTION"][1]) if "DESCRIPTION" in raw.props else None
+
+    recurrence_id = None
+    if "RECURRENCE-ID" in raw.props:
+        rp, rv = raw.props["RECURRENCE-ID"]
+        recurrence_id = _fmt(_parse_time(rv, rp)[0])
+
+    exdates: list[str] = []
+    for ep, ev in raw.exdates:
+        for part in ev.split(","):
+            if part.strip():
+                exdates.append(_fmt(_parse_time(part, ep)[0]))
+
+    uid = raw.props["UID"][1].strip() if "UID" in raw.props else ""
+    if not uid:
+        seed = f"{sv}|{raw.props.get('DTEND', ({}, ''))[1]}|{summary}"
+        uid = "lux-" + hashlib.sha1(seed.encode("utf-8")).hexdigest()
+
+    rrule = raw.props["RRULE"][1].strip() if "RRULE" in raw.props and recurrence_id is None else None
+    status = raw.props.get("STATUS", ({}, ""))[1].strip().upper()
+
+    return IcsEvent(
+        uid=uid,
+        start=_fmt(start),
+        end=_fmt(end),
+        summary=summary,
+        description=description,
+        rrule=rrule or None,
+        recurrence_id=recurrence_id,
+        exdates=tuple(exdates),
+        cancelled=status == "CANCELLED",
+    )
+
+
+def iter_events(lines: Iterable[str], errors: list[str] | None = None) -> Iterator[IcsEvent]:
+    """
+    Stream VEVENTs from iCalendar text lines (e.g. an open file).
+    Malformed events are skipped; their reasons are appended to `errors`.
+    """
+    raw: _Raw | None = None
+    skip_depth = 0  # nested components inside a VEVENT (VALARM, ...)
+
+    for line in _unfold(lines):
+        if not line:
+            continue
+        upper = line[:12].upper()
+        if upper.startswith("BEGIN:"):
+            comp = line[6:].strip().upper()
+            if raw is None and comp == "VEVENT":
+                raw = _Raw()
+            elif raw is not None:
+                skip_depth += 1
+            continue
+        if upper.startswith("END:"):
+            comp = line[4:].strip().upper()
+            if raw is not None and skip_depth:
+                skip_depth -= 1
+            elif raw is not None and comp == "VEVENT":
+                try:
+                    yield _build_event(raw)
+                except (ValueError, KeyError, IndexError) as e:
+                    if errors is not None:
+                        errors.append(str(e))
+                raw = None
+            continue
+        if raw is None or skip_depth:
+            continue
+
+        prop = _split_property(line)
+        if prop is None:
+            continue
+        name, params, value = prop
+        if name == "EXDATE":
+            raw.exdates.append((params, value))
+        elif name not in raw.props:
+            raw.props[name] = (params, value)
+
+
+# -------------------------
+# Writing
+# -------------------------
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold to 75 octets per physical line (never splitting a UTF-8 sequence)."""
+    data = line.encode("utf-8")
+    if len(data) <= _FOLD_OCTETS:
+        return line + "\r\n"
+    parts = []
+    limit = _FOLD_OCTETS
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        limit = _FOLD_OCTETS - 1  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_time(local: str) -> str:
+    """"YYYY-MM-DD HH:MM:SS" -> floating "YYYYMMDDTHHMMSS"."""
+    return local[0:4] + local[5:7] + local[8:10] + "T" + local[11:13] + local[14:16] + local[17:19]
+
+
+def _time_prop(name: str, local: str, all_day: bool) -> str:
+    if all_day:
+        return f"{name};VALUE=DATE:{local[0:4]}{local[5:7]}{local[8:10]}"
+    return f"{name}:{_ics_time(local)}"
+
+
+def _is_all_day(start: str, end: str) -> bool:
+    return start.endswith("00:00:00") and end.endswith("00:00:00") and start[:10] < end[:10]
+
+
+class IcsWriter:
+    """Streams VCALENDAR text to a file object, one VEVENT at a time."""
+
+    def __init__(self, out: TextIO) -> None:
+        self._out = out
+        self._stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        self.count = 0
+
+    def __enter__(self) -> "IcsWriter":
+        self._out.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{_PRODID}\r\nCALSCALE:GREGORIAN\r\n")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._out.write("END:VCALENDAR\r\n")
+
+    def write(self, ev: IcsEvent) -> None:
+        all_day = _is_all_day(ev.start, ev.end)
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{ev.uid}",
+            f"DTSTAMP:{self._stamp}",
+            _time_prop("DTSTART", ev.start, all_day),
+            _time_prop("DTEND", ev.end, all_day),
+        ]
+        if ev.recurrence_id:
+            lines.append(f"RECURRENCE-ID:{_ics_time(ev.recurrence_id)}")
+        if ev.summary:
+            lines.append(f"SUMMARY:{_escape(ev.summary)}")
+        if ev.description:
+            lines.append(f"DESCRIPTION:{_escape(ev.description)}")
+        if ev.rrule:
+            lines.append(f"RRULE:{ev.rrule}")
+        if ev.exdates:
+            lines.append("EXDATE:" + ",".join(_ics_time(x) for x in ev.exdates))
+        if ev.cancelled:
+            lines.append("STATUS:CANCELLED")
+        lines.append("END:VEVENT")
+        self._out.write("".join(_fold(line) for line in lines))
+        self.count += 1
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import math
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Iterable, TypeVar
+
+log = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+_BUCKET_BASE_MS = 0.001      # 1 µs
+_BUCKET_GROWTH = 1.25
+_BUCKETS = 96                # up to ~35 minutes
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+
+_enabled = False
+_queries = 0                 # repository calls so far (spans record the delta)
+_NULL = nullcontext()
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+# -------------------------
+# Aggregation
+# -------------------------
+class Histogram:
+    """Log-bucket latency histogram for one name."""
+
+    __slots__ = ("count", "total_ms", "max_ms", "queries", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.queries = 0     # repository calls made inside these spans
+        self._buckets = [0] * _BUCKETS
+
+    def record(self, ms: float, queries: int = 0) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.queries += queries
+        if ms > self.max_ms:
+            self.max_ms = ms
+        idx = int(math.log(ms / _BUCKET_BASE_MS) / _LOG_GROWTH) if ms > _BUCKET_BASE_MS else 0
+        self._buckets[min(idx, _BUCKETS - 1)] += 1
+
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for idx, n in enumerate(self._buckets):
+            seen += n
+            if seen >= rank:
+                return min(self.max_ms, _BUCKET_BASE_MS * _BUCKET_GROWTH ** (idx + 0.5))
+        return self.max_ms
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    name: str
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    total_ms: float
+    queries_per_call: float
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    timings: list[TimingStats]   # sorted by name
+    counters: dict[str, int]
+    gauges: dict[str, float]     # failing or None-returning gauges are left out
+
+
+_timings: dict[str, Histogram] = {}
+_counters: dict[str, int] = {}
+_gauges: dict[str, Callable[[], float | None]] = {}
+
+
+def _record(name: str, ms: float, queries: int) -> None:
+    h = _timings.get(name)
+    if h is None:
+        h = _timings[name] = Histogram()
+    h.record(ms, queries)
+
+
+def record(name: str, ms: float) -> None:
+    """Add one externally measured sample (no-op while disabled)."""
+    if _enabled:
+        _record(name, float(ms), 0)
+
+
+def count(name: str, n: int = 1) -> None:
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def register_gauge(name: str, fn: Callable[[], float | None]) -> None:
+    """Register (or replace) a value read at snapshot time, e.g. a cache hit rate."""
+    _gauges[name] = fn
+
+
+def unregister_gauge(name: str) -> None:
+    _gauges.pop(name, None)
+
+
+def reset() -> None:
+    """Drop recorded timings and counters (gauges stay registered)."""
+    _timings.clear()
+    _counters.clear()
+
+
+def snapshot() -> Snapshot:
+    timings = [
+        TimingStats(
+            name=name,
+            count=h.count,
+            p50_ms=h.percentile(0.50),
+            p95_ms=h.percentile(0.95),
+            max_ms=h.max_ms,
+            total_ms=h.total_ms,
+            queries_per_call=h.queries / h.count if h.count else 0.0,
+        )
+        for name, h in sorted(_timings.items())
+    ]
+    gauges: dict[str, float] = {}
+    for name, fn in sorted(_gauges.items()):
+        try:
+            v = fn()
+        except Exception:
+            log.debug("Gauge %s failed", name, exc_info=True)
+            continue
+        if v is not None:
+            gauges[name] = float(v)
+    return Snapshot(timings=timings, counters=dict(sorted(_counters.items())), gauges=gauges)
+
+
+# -------------------------
+# Spans
+# -------------------------
+class _Span:
+    __slots__ = ("_name", "_query", "_t0", "_q0")
+
+    def __init__(self, name: str, query: bool = False) -> None:
+        self._name = name
+        self._query = query
+
+    def __enter__(self) -> None:
+        global _queries
+        if self._query:
+            _queries += 1
+        self._q0 = _queries
+        self._t0 = time.perf_counter_ns()
+
+    def __exit__(self, *_exc: object) -> None:
+        _record(self._name, (time.perf_counter_ns() - self._t0) / 1e6, _queries - self._q0)
+
+
+def timer(name: str, query: bool = False) -> ContextManager[None]:
+    """Time a block under `name`; `query=True` also counts it as one repository call."""
+    return _Span(name, query) if _enabled else _NULL
+
+
+def timed(name: str, query: bool = False) -> Callable[[F], F]:
+    """Decorator form of timer(); the flag is checked per call, so enable() applies at once."""
+
+    def deco(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, query):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+def instrument_methods(prefix: str, query: bool = False, skip: Iterable[str] = ()) -> Callable[[C], C]:
+    """
+    Class decorator: time every public method defined on the class as
+    "<prefix>.<method>". Generators, context managers, properties and
+    static/class methods are left alone (their call time is not their cost).
+    """
+    skipped = frozenset(skip)
+
+    def deco(cls: C) -> C:
+        for attr, fn in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skipped or not inspect.isfunction(fn):
+                continue
+            if inspect.isgeneratorfunction(inspect.unwrap(fn)):
+                continue
+            setattr(cls, attr, timed(f"{prefix}.{attr}", query=query)(fn))
+        return cls
+
+    return deco
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# Hard bound for COUNT resolution so a hostile rule cannot stall the UI thread.
+MAX_COUNT = 10_000
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    by_weekday: tuple[int, ...] = ()  # 0=Mon .. 6=Sun (WEEKLY only)
+    until: date | None = None          # inclusive
+    count: int | None = None
+
+
+def _parse_until(raw: str) -> date:
+    s = raw.strip().upper().rstrip("Z")
+    if "-" in s:
+        return date.fromisoformat(s[:10])
+    if "T" in s:
+        return datetime.strptime(s, "%Y%m%dT%H%M%S").date()
+    return datetime.strptime(s, "%Y%m%d").date()
+
+
+def parse_rrule(text: str) -> RecurrenceRule:
+    """Parse an RRULE string (optionally prefixed with 'RRULE:'). Raises ValueError."""
+    s = str(text or "").strip()
+    if s.upper().startswith("RRULE:"):
+        s = s[6:]
+    if not s:
+        raise ValueError("recurrence rule is required")
+
+    parts: dict[str, str] = {}
+    for chunk in s.split(";"):
+        if not chunk.strip():
+            continue
+        if "=" not in chunk:
+            raise ValueError(f"invalid rule part: {chunk!r}")
+        k, v = chunk.split("=", 1)
+        parts[k.strip().upper()] = v.strip()
+
+    freq = parts.get("FREQ", "").upper()
+    if freq not in FREQUENCIES:
+        raise ValueError(f"unsupported FREQ: {freq!r}")
+
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+    except ValueError:
+        raise ValueError("INTERVAL must be an integer")
+    if interval < 1:
+        raise ValueError("INTERVAL must be >= 1")
+
+    by_weekday: tuple[int, ...] = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        days: set[int] = set()
+        for code in parts["BYDAY"].split(","):
+            cc = code.strip().upper()
+            if cc not in WEEKDAY_CODES:
+                raise ValueError(f"invalid BYDAY value: {code!r}")
+            days.add(WEEKDAY_CODES.index(cc))
+        by_weekday = tuple(sorted(days))
+
+    until: date | None = None
+    if "UNTIL" in parts:
+        try:
+            until = _parse_until(parts["UNTIL"])
+        except ValueError:
+            raise ValueError(f"invalid UNTIL: {parts['UNTIL']!r}")
+
+    count: int | None = None
+    if "COUNT" in parts:
+        try:
+            count = int(parts["COUNT"])
+        except ValueError:
+            raise ValueError("COUNT must be an integer")
+        if count < 1 or count > MAX_COUNT:
+            raise ValueError(f"COUNT must be between 1 and {MAX_COUNT}")
+
+    if until is not None and count is not None:
+        raise ValueError("UNTIL and COUNT are mutually exclusive")
+
+    return RecurrenceRule(freq=freq, interval=interval, by_weekday=by_weekday, until=until, count=count)
+
+
+def format_rrule(rule: RecurrenceRule) -> str:
+    parts = [f"FREQ={rule.freq}"]
+    if rule.interval != 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.by_weekday:
+        parts.append("BYDAY=" + ",".join(WEEKDAY_CODES[d] for d in rule.by_weekday))
+    if rule.until is not None:
+        parts.append("UNTIL=" + rule.until.strftime("%Y%m%d"))
+    if rule.count is not None:
+        parts.append(f"COUNT={rule.count}")
+    return ";".join(parts)
+
+
+# -------------------------
+# Expansion
+# -------------------------
+def _month_index(d: date) -> int:
+    return d.year * 12 + (d.month - 1)
+
+
+def _date_or_none(year: int, month: int, day: int) -> date | None:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        # RFC 5545: invalid dates (e.g. Feb 30) are skipped, not clamped.
+        return None
+
+
+def _iter_from(rule: RecurrenceRule, dtstart: date, seek: date) -> Iterator[date]:
+    """
+    Yield instances in ascending order, starting at the period that contains `seek`.
+    Instances before `seek` inside that first period may still be yielded.
+    """
+    step = rule.interval
+
+    if rule.freq == "DAILY":
+        k = max(0, -(-(seek - dtstart).days // step))
+        d = dtstart + timedelta(days=k * step)
+        delta = timedelta(days=step)
+        while True:
+            yield d
+            d += delta
+
+    if rule.freq == "WEEKLY":
+        weekdays = rule.by_weekday or (dtstart.weekday(),)
+        anchor = dtstart - timedelta(days=dtstart.weekday())
+        p = max(0, (seek - anchor).days // (7 * step))
+        while True:
+            week = anchor + timedelta(days=7 * step * p)
+            for wd in weekdays:
+                d = week + timedelta(days=wd)
+                if d >= dtstart:
+                    yield d
+            p += 1
+
+    if rule.freq == "MONTHLY":
+        base = _month_index(dtstart)
+        p = max(0, (_month_index(seek) - base) // step)
+        while True:
+            mi = base + p * step
+            d = _date_or_none(mi // 12, mi % 12 + 1, dtstart.day)
+            if d is not None:
+                yield d
+            p += 1
+
+    if rule.freq == "YEARLY":
+        p = max(0, (seek.year - dtstart.year) // step)
+        while True:
+            d = _date_or_none(dtstart.year + p * step, dtstart.month, dtstart.day)
+            if d is not None:
+                yield d
+            p += 1
+
+    raise ValueError(f"unsupported FREQ: {rule.freq!r}")
+
+
+@lru_cache(maxsize=1024)
+def last_date(rule: RecurrenceRule, dtstart: date) -> date | None:
+    """
+    Return the final instance date, or None for unbounded rules.
+    COUNT rules are walked once (bounded by MAX_COUNT); results are cached.
+    """
+    if rule.until is not None:
+        return rule.until
+    if rule.count is None:
+        return None
+
+    n = 0
+    last = dtstart
+    for d in _iter_from(rule, dtstart, dtstart):
+        n += 1
+        last = d
+        if n >= rule.count:
+            break
+    return last
+
+
+def expand_dates(rule: RecurrenceRule, dtstart: date, start: date, end: date) -> list[date]:
+    """Return instance dates within [start, end] inclusive."""
+    if end < start or end < dtstart:
+        return []
+
+    final = last_date(rule, dtstart)
+    if final is not None:
+        if final < start:
+            return []
+        end = min(end, final)
+
+    out: list[date] = []
+    for d in _iter_from(rule, dtstart, max(start, dtstart)):
+        if d > end:
+            break
+        if d >= start:
+            out.append(d)
+    return out
@@ -1,4 +1,12 @@
 from .service import SchedulerService
-from .provider_registry import SchedulerProviderRegistry, SchedulerProvider
+from .provider_registry import LabelCache, SchedulerProviderRegistry, SchedulerProvider, SingleRefProviderAdapter
+from .conflicts import IntervalIndex
 
-__all__ = ["SchedulerService", "SchedulerProviderRegistry", "SchedulerProvider"]
+__all__ = [
+    "SchedulerService",
+    "SchedulerProviderRegistry",
+    "SchedulerProvider",
+    "SingleRefProviderAdapter",
+    "LabelCache",
+    "IntervalIndex",
+]
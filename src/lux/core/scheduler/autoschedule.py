@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Iterable, Sequence
+
+from lux.core.scheduler.expansion import EpochFormatter, to_epoch
+
+
+@dataclass(frozen=True)
+class PlanItem:
+    item_kind: str
+    item_ref: str
+    title: str
+    day: str                       # YYYY-MM-DD (earliest day the item may be placed)
+    duration_min: int = 30
+    priority: int = 0              # higher is placed first
+    fixed_time: str | None = None  # HH:MM pin (placed there when free)
+    # Called only for placed items, right before the entry is written: returns the
+    # real item_ref (e.g. materializes a virtual instance); "" skips the placement.
+    resolve_ref: Callable[[], str] | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class Placement:
+    item: PlanItem
+    start_dt: str
+    end_dt: str
+
+
+@dataclass(frozen=True)
+class WorkingHours:
+    start: str = "09:00"  # HH:MM
+    end: str = "18:00"    # HH:MM
+
+
+@dataclass
+class PlanResult:
+    placed: list[Placement] = field(default_factory=list)
+    unplaced: list[PlanItem] = field(default_factory=list)
+
+
+def _hhmm_seconds(s: str) -> int:
+    hh, mm = str(s).strip()[:5].split(":")
+    return int(hh) * 3600 + int(mm) * 60
+
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort + merge overlapping/touching intervals."""
+    out: list[tuple[int, int]] = []
+    for s, e in sorted(intervals):
+        if e <= s:
+            continue
+        if out and s <= out[-1][1]:
+            if e > out[-1][1]:
+                out[-1] = (out[-1][0], e)
+        else:
+            out.append((s, e))
+    return out
+
+
+def free_intervals(busy_merged: Sequence[tuple[int, int]], lo: int, hi: int) -> list[tuple[int, int]]:
+    """Complement of merged busy intervals within [lo, hi)."""
+    out: list[tuple[int, int]] = []
+    cur = lo
+    for s, e in busy_merged:
+        if e <= cur:
+            continue
+        if s >= hi:
+            break
+        if s > cur:
+            out.append((cur, s))
+        cur = max(cur, e)
+        if cur >= hi:
+            break
+    if cur < hi:
+        out.append((cur, hi))
+    return out
+
+
+def _take(free: list[tuple[int, int]], i: int, s: int, e: int) -> None:
+    """Remove [s, e) from free[i] (which must contain it)."""
+    fs, fe = free[i]
+    parts = [(a, b) for a, b in ((fs, s), (e, fe)) if b > a]
+    free[i:i + 1] = parts
+
+
+def plan(
+    items: Sequence[PlanItem],
+    busy: Iterable[tuple[str, str]],
+    start_day: date,
+    end_day: date,
+    hours: WorkingHours = WorkingHours(),
+    not_before: str | None = None,
+) -> PlanResult:
+    """
+    Pack items into free time between start_day and end_day (inclusive).
+
+    busy: (start_dt, end_dt) ISO strings of existing entries.
+    not_before: ISO datetime; no placement starts earlier (e.g. "now").
+    Items are placed on their own day, or the next day with room.
+    """
+    result = PlanResult()
+    if end_day < start_day:
+        result.unplaced = list(items)
+        return result
+
+    merged = merge_intervals((to_epoch(s), to_epoch(e)) for s, e in busy)
+    floor = to_epoch(not_before) if not_before else None
+    h_lo = _hhmm_seconds(hours.start)
+    h_hi = _hhmm_seconds(hours.end)
+
+    days: list[str] = []
+    free_by_day: dict[str, list[tuple[int, int]]] = {}
+    d = start_day
+    while d <= end_day:
+        base = to_epoch(d.isoformat() + " 00:00:00")
+        lo, hi = base + h_lo, base + h_hi
+        if floor is not None:
+            lo = max(lo, floor)
+        ds = d.isoformat()
+        days.append(ds)
+        free_by_day[ds] = free_intervals(merged, lo, hi) if lo < hi else []
+        d += timedelta(days=1)
+
+    fmt = EpochFormatter()
+
+    def place(item: PlanItem, s: int, e: int) -> None:
+        result.placed.append(Placement(item=item, start_dt=fmt(s), end_dt=fmt(e)))
+
+    # 1) Pinned items: exact slot if free, otherwise fall through to packing.
+    floating: list[PlanItem] = []
+    for item in items:
+        dur = max(1, int(item.duration_min)) * 60
+        slots = free_by_day.get(item.day)
+        if item.fixed_time and slots is not None:
+            s = to_epoch(f"{item.day} {item.fixed_time[:5]}:00")
+            e = s + dur
+            hit = next((i for i, (fs, fe) in enumerate(slots) if fs <= s and e <= fe), None)
+            if hit is not None:
+                _take(slots, hit, s, e)
+                place(item, s, e)
+                continue
+        floating.append(item)
+
+    # 2) Greedy first-fit: high priority first, longer items first within a priority.
+    floating.sort(key=lambda it: (-int(it.priority), -int(it.duration_min), it.day))
+    for item in floating:
+        dur = max(1, int(item.duration_min)) * 60
+        placed = False
+        for ds in days:
+            if ds < item.day:
+                continue
+            slots = free_by_day[ds]
+            for i, (fs, fe) in enumerate(slots):
+                if fe - fs >= dur:
+                    _take(slots, i, fs, fs + dur)
+                    place(item, fs, fs + dur)
+                    placed = True
+                    break
+            if placed:
+                break
+        if not placed:
+            result.unplaced.append(item)
+
+    result.placed.sort(key=lambda p: p.start_dt)
+    return result
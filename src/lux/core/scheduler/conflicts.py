@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Generic, Iterable, TypeVar
+
+K = TypeVar("K")
+
+
+class IntervalIndex(Generic[K]):
+    """Static interval tree over intervals sorted by start."""
+
+    def __init__(self, items: Iterable[tuple[Any, Any, K]]) -> None:
+        data = sorted(items, key=lambda t: (t[0], t[1]))
+        self._starts = [t[0] for t in data]
+        self._ends = [t[1] for t in data]
+        self._keys: list[K] = [t[2] for t in data]
+        # Implicit tree: node = midpoint of an index range, holding the max end of its subtree.
+        self._max_end: list[Any] = list(self._ends)
+        if data:
+            self._build(0, len(data))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _build(self, lo: int, hi: int) -> Any:
+        mid = (lo + hi) // 2
+        m = self._ends[mid]
+        if lo < mid:
+            left = self._build(lo, mid)
+            if left > m:
+                m = left
+        if mid + 1 < hi:
+            right = self._build(mid + 1, hi)
+            if right > m:
+                m = right
+        self._max_end[mid] = m
+        return m
+
+    def overlapping(self, start: Any, end: Any, exclude: K | None = None) -> list[K]:
+        """Keys whose interval overlaps [start, end), in start order."""
+        out: list[K] = []
+        if not self._keys or start >= end:
+            return out
+
+        starts, ends, keys, max_end = self._starts, self._ends, self._keys, self._max_end
+        # In-order traversal with pruning; explicit stack avoids recursion overhead.
+        stack: list[tuple[int, int, bool]] = [(0, len(keys), False)]
+        while stack:
+            lo, hi, visit = stack.pop()
+            mid = (lo + hi) // 2
+            if visit:
+                if ends[mid] > start and keys[mid] != exclude:
+                    out.append(keys[mid])
+                continue
+            if lo >= hi or max_end[mid] <= start:
+                continue
+            # Right subtree only if this node starts before the query end.
+            if starts[mid] < end:
+                stack.append((mid + 1, hi, False))
+                stack.append((lo, hi, True))
+            stack.append((lo, mid, False))
+        return out
+
+    def conflicts(self) -> list[tuple[K, K]]:
+        """All overlapping pairs (earlier-starting key first)."""
+        out: list[tuple[K, K]] = []
+        active: list[tuple[Any, int]] = []  # min-heap of (end, index)
+        for i, s in enumerate(self._starts):
+            while active and active[0][0] <= s:
+                heapq.heappop(active)
+            for _end, j in active:
+                out.append((self._keys[j], self._keys[i]))
+            heapq.heappush(active, (self._ends[i], i))
+        return out
+
+    def conflict_counts(self) -> dict[K, int]:
+        """Number of other intervals each key overlaps (keys without conflicts omitted)."""
+        counts: dict[K, int] = {}
+        for a, b in self.conflicts():
+            counts[a] = counts.get(a, 0) + 1
+            counts[b] = counts.get(b, 0) + 1
+        return counts
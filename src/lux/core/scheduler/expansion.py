@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Sequence
+
+from lux.core.recurrence import RecurrenceRule, expand_dates, last_date
+
+
+_DAY = 86_400
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    """Expansion input: one recurring series, already parsed."""
+    key: int               # caller-defined (e.g. index or series id)
+    rule: RecurrenceRule
+    first_start: int       # epoch seconds of DTSTART
+    duration: int          # seconds (> 0)
+
+
+def to_epoch(iso: str) -> int:
+    dt = datetime.fromisoformat(str(iso).strip().replace("T", " ")[:19])
+    return (dt - _EPOCH) // timedelta(seconds=1)
+
+
+class EpochFormatter:
+    """Memoized epoch -> 'YYYY-MM-DD HH:MM:SS' (repeated days/times are common)."""
+
+    def __init__(self) -> None:
+        self._days: dict[int, str] = {}
+        self._tods: dict[int, str] = {}
+
+    def __call__(self, ts: int) -> str:
+        day, tod = divmod(int(ts), _DAY)
+        ds = self._days.get(day)
+        if ds is None:
+            ds = date.fromordinal(_EPOCH_ORDINAL + day).isoformat()
+            self._days[day] = ds
+        ts_ = self._tods.get(tod)
+        if ts_ is None:
+            h, rem = divmod(tod, 3600)
+            m, sec = divmod(rem, 60)
+            ts_ = f"{h:02d}:{m:02d}:{sec:02d}"
+            self._tods[tod] = ts_
+        return f"{ds} {ts_}"
+
+
+def _epoch_date(ts: int) -> date:
+    return date.fromordinal(_EPOCH_ORDINAL + ts // _DAY)
+
+
+def _progression(first: int, period: int, lo: int, hi: int, stop: int | None) -> range:
+    """Starts s = first + k*period (k >= 0) with lo <= s < hi and s <= stop."""
+    last = hi - 1 if stop is None else min(hi - 1, stop)
+    if last < first or last < lo:
+        return range(0)
+    k0 = max(0, -(-(lo - first) // period))
+    k1 = (last - first) // period
+    if k1 < k0:
+        return range(0)
+    return range(first + k0 * period, first + k1 * period + 1, period)
+
+
+def _final_start(spec: SeriesSpec, d0: date, tod: int) -> int | None:
+    final = last_date(spec.rule, d0)
+    if final is None:
+        return None
+    return (final.toordinal() - _EPOCH_ORDINAL) * _DAY + tod
+
+
+def series_end(spec: SeriesSpec) -> int | None:
+    """Upper bound for the end of the last instance (None for unbounded series)."""
+    tod = spec.first_start % _DAY
+    stop = _final_start(spec, _epoch_date(spec.first_start), tod)
+    return None if stop is None else stop + max(1, int(spec.duration))
+
+
+def expand_batch(specs: Sequence[SeriesSpec], range_start: int, range_end: int) -> list[tuple[int, int, int]]:
+    """
+    Expand all series at once into instances overlapping [range_start, range_end).
+    Returns (start, end, key) tuples sorted by start.
+    """
+    out: list[tuple[int, int, int]] = []
+    if range_end <= range_start:
+        return out
+
+    for spec in specs:
+        dur = max(1, int(spec.duration))
+        # Overlap: start < range_end and start + dur > range_start.
+        lo = range_start - dur + 1
+        hi = range_end
+        if spec.first_start >= hi:
+            continue
+
+        rule = spec.rule
+        tod = spec.first_start % _DAY
+        d0 = _epoch_date(spec.first_start)
+        stop = _final_start(spec, d0, tod)
+        if stop is not None and stop < lo:
+            continue
+
+        key = spec.key
+        if rule.freq == "DAILY":
+            for s in _progression(spec.first_start, rule.interval * _DAY, lo, hi, stop):
+                out.append((s, s + dur, key))
+        elif rule.freq == "WEEKLY":
+            period = rule.interval * 7 * _DAY
+            week_anchor = spec.first_start - d0.weekday() * _DAY
+            for wd in rule.by_weekday or (d0.weekday(),):
+                first = week_anchor + wd * _DAY
+                if first < spec.first_start:
+                    first += period
+                for s in _progression(first, period, lo, hi, stop):
+                    out.append((s, s + dur, key))
+        else:
+            for d in expand_dates(rule, d0, _epoch_date(max(lo, spec.first_start)), _epoch_date(hi - 1)):
+                s = (d.toordinal() - _EPOCH_ORDINAL) * _DAY + tod
+                if lo <= s < hi:
+                    out.append((s, s + dur, key))
+
+    out.sort()
+    return out
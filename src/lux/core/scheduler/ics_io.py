@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, TextIO
+
+from lux.core.ics import IcsEvent, IcsWriter, iter_events
+from lux.core.recurrence import parse_rrule
+from lux.core.scheduler.expansion import EpochFormatter, SeriesSpec, series_end, to_epoch
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+
+ICS_KIND = "ics"
+IMPORT_BATCH = 2000
+
+_EXPORT_UID_DOMAIN = "lux-planner"
+
+
+@dataclass
+class IcsImportStats:
+    events: int = 0
+    entries: int = 0
+    series: int = 0
+    overrides: int = 0
+    exceptions: int = 0
+    cold_skipped: int = 0        # already in cold storage
+    unsupported_rules: int = 0   # imported as their first instance only
+    orphan_overrides: int = 0    # RECURRENCE-ID without a matching series (kept as one-offs)
+    errors: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+def _override_ref(uid: str, original_start: str) -> str:
+    return f"{uid}#{original_start}"
+
+
+class IcsImporter:
+    """Streams events from .ics lines into the scheduler tables in batches."""
+
+    def __init__(self, repo: ScheduledEntryRepo, batch_size: int = IMPORT_BATCH) -> None:
+        self._repo = repo
+        self._batch = max(1, int(batch_size))
+        self._fmt = EpochFormatter()
+        self._overridden: set[tuple[str, str]] = set()  # (uid, original start) with an edited instance
+
+    def run(self, lines: Iterable[str]) -> IcsImportStats:
+        t0 = time.perf_counter()
+        stats = IcsImportStats()
+        self._overridden.clear()
+        pending: list[tuple[str, str, str | None]] = []  # (series uid, original start, override ref or None)
+
+        batch: list[IcsEvent] = []
+        for ev in iter_events(lines, errors=stats.errors):
+            stats.events += 1
+            batch.append(ev)
+            if len(batch) >= self._batch:
+                pending = self._write_batch(batch, pending, stats)
+                batch = []
+        pending = self._write_batch(batch, pending, stats)
+
+        stats.orphan_overrides = sum(1 for p in pending if p[2] is not None)
+        stats.duration_ms = (time.perf_counter() - t0) * 1000.0
+        return stats
+
+    # -------------------------
+    # Batches
+    # -------------------------
+    def _series_row(self, ev: IcsEvent) -> tuple | None:
+        """Series upsert row, or None if the RRULE is outside the supported subset."""
+        try:
+            rule = parse_rrule(ev.rrule or "")
+        except ValueError:
+            return None
+        first = to_epoch(ev.start)
+        last_end = series_end(SeriesSpec(key=0, rule=rule, first_start=first, duration=to_epoch(ev.end) - first))
+        until_dt = self._fmt(last_end) if last_end is not None else None
+        return (ev.uid, ev.start, ev.end, ev.rrule, until_dt, ev.summary or None, ev.description, int(ev.cancelled))
+
+    def _write_batch(
+        self,
+        batch: list[IcsEvent],
+        pending: list[tuple[str, str, str | None]],
+        stats: IcsImportStats,
+    ) -> list[tuple[str, str, str | None]]:
+        """Write one batch in one transaction; returns exception links still waiting for their series."""
+        if not batch and not pending:
+            return []
+
+        series_rows: list[tuple] = []
+        entry_rows: list[tuple] = []
+        links = list(pending)
+
+        for ev in batch:
+            if ev.recurrence_id is not None:
+                if ev.cancelled:
+                    links.append((ev.uid, ev.recurrence_id, None))
+                    continue
+                ref = _override_ref(ev.uid, ev.recurrence_id)
+                entry_rows.append((ref, ev.start, ev.end, ev.summary or None, ev.description, 0))
+                links.append((ev.uid, ev.recurrence_id, ref))
+                stats.overrides += 1
+                continue
+
+            if ev.rrule:
+                row = self._series_row(ev)
+                if row is not None:
+                    series_rows.append(row)
+                    links.extend((ev.uid, x, None) for x in ev.exdates)
+                    continue
+                stats.unsupported_rules += 1
+
+            entry_rows.append((ev.uid, ev.start, ev.end, ev.summary or None, ev.description, int(ev.cancelled)))
+
+        repo = self._repo
+        with repo.transaction():
+            if entry_rows:
+                cold = repo.entry_ids_by_ref(ICS_KIND, [r[0] for r in entry_rows], history=True)
+                if cold:
+                    stats.cold_skipped += sum(1 for r in entry_rows if r[0] in cold)
+                    entry_rows = [r for r in entry_rows if r[0] not in cold]
+                repo.upsert_entries_by_ref(ICS_KIND, entry_rows)
+                stats.entries += len(entry_rows)
+            if series_rows:
+                repo.upsert_series_by_ref(ICS_KIND, series_rows)
+                stats.series += len(series_rows)
+
+            still_pending: list[tuple[str, str, str | None]] = []
+            # An edited instance wins over an EXDATE of the same start, in any order.
+            self._overridden.update((uid, start) for uid, start, ref in links if ref)
+            links = [link for link in links if link[2] is not None or (link[0], link[1]) not in self._overridden]
+            if links:
+                series_ids = repo.series_ids_by_ref(ICS_KIND, sorted({uid for uid, _, _ in links}))
+                entry_ids = repo.entry_ids_by_ref(ICS_KIND, sorted({ref for _, _, ref in links if ref}))
+                exceptions: list[tuple[int, str, int | None]] = []
+                for uid, original_start, ref in links:
+                    sid = series_ids.get(uid)
+                    if sid is None:
+                        still_pending.append((uid, original_start, ref))
+                        continue
+                    exceptions.append((sid, original_start, entry_ids.get(ref) if ref else None))
+                if exceptions:
+                    repo.add_series_exceptions(exceptions)
+                    stats.exceptions += len(exceptions)
+        return still_pending
+
+
+def import_ics(repo: ScheduledEntryRepo, lines: Iterable[str], batch_size: int = IMPORT_BATCH) -> IcsImportStats:
+    return IcsImporter(repo, batch_size=batch_size).run(lines)
+
+
+def export_ics(repo: ScheduledEntryRepo, out: TextIO) -> int:
+    """
+    Write all active series and entries as one VCALENDAR; returns the event count.
+    Imported items keep their UIDs; native items get stable synthetic ones.
+    Edited instances are written as RECURRENCE-ID events of their series.
+    """
+    exdates: dict[int, list[str]] = {}
+    overrides: dict[int, tuple[int, str]] = {}  # entry id -> (series id, original start)
+    for sid, original_start, entry_id in repo.all_series_exceptions():
+        if entry_id is None:
+            exdates.setdefault(sid, []).append(original_start)
+        else:
+            overrides[entry_id] = (sid, original_start)
+
+    series_uids: dict[int, str] = {}
+    with IcsWriter(out) as writer:
+        for sr in repo.iter_active_series():
+            uid = sr.item_ref if sr.item_kind == ICS_KIND else f"series-{sr.id}@{_EXPORT_UID_DOMAIN}"
+            series_uids[sr.id] = uid
+            writer.write(
+                IcsEvent(
+                    uid=uid,
+                    start=sr.start_dt,
+                    end=sr.end_dt,
+                    summary=sr.title_cache or "",
+                    description=sr.notes_cache,
+                    rrule=sr.rrule,
+                    exdates=tuple(sorted(exdates.get(sr.id, ()))),
+                )
+            )
+
+        for e in repo.iter_active_entries():
+            link = overrides.get(e.id)
+            recurrence_id = None
+            if link is not None and link[0] in series_uids:
+                uid, recurrence_id = series_uids[link[0]], link[1]
+            elif e.item_kind == ICS_KIND:
+                uid = e.item_ref
+            else:
+                uid = f"entry-{e.id}@{_EXPORT_UID_DOMAIN}"
+            writer.write(
+                IcsEvent(
+                    uid=uid,
+                    start=e.start_dt,
+                    end=e.end_dt,
+                    summary=e.title_cache or "Scheduled Item",
+                    description=e.notes_cache,
+                    recurrence_id=recurrence_id,
+                )
+            )
+        return writer.count
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def layout_columns(items: Iterable[tuple[Any, Any, K]]) -> dict[K, tuple[int, int]]:
+    """Map key -> (column, columns_in_cluster)."""
+    data = sorted(items, key=lambda t: (t[0], t[1]))
+    out: dict[K, tuple[int, int]] = {}
+
+    active: list[tuple[Any, int]] = []  # min-heap of (end, column)
+    free: list[int] = []                # min-heap of released columns
+    cluster: list[tuple[K, int]] = []
+    width = 0
+
+    def close_cluster() -> None:
+        for key, col in cluster:
+            out[key] = (col, width)
+        cluster.clear()
+
+    for start, end, key in data:
+        while active and active[0][0] <= start:
+            _, col = heapq.heappop(active)
+            heapq.heappush(free, col)
+
+        if not active and cluster:
+            # Nothing running: the previous cluster is complete.
+            close_cluster()
+            free.clear()
+            width = 0
+
+        col = heapq.heappop(free) if free else width
+        if col == width:
+            width += 1
+        heapq.heappush(active, (end, col))
+        cluster.append((key, col))
+
+    close_cluster()
+    return out
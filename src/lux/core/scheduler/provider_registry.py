@@ -1,27 +1,164 @@
 from __future__ import annotations
 
-from typing import Protocol
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Protocol, Sequence, runtime_checkable
 
 
 class SchedulerProvider(Protocol):
+    """Feature-provided label source for one item_kind (resolve_labels is the bulk path)."""
+
     def resolve_label(self, item_ref: str) -> str | None:
         ...
 
+    def resolve_labels(self, item_refs: Sequence[str]) -> dict[str, str]:
+        ...
+
+
+@runtime_checkable
+class _BulkCapable(Protocol):
+    def resolve_labels(self, item_refs: Sequence[str]) -> dict[str, str]:
+        ...
+
+
+class SingleRefProviderAdapter:
+    """Fallback for providers that only implement resolve_label (one call per ref)."""
+
+    def __init__(self, provider) -> None:
+        self._provider = provider
+
+    def resolve_label(self, item_ref: str) -> str | None:
+        return self._provider.resolve_label(item_ref)
+
+    def resolve_labels(self, item_refs: Sequence[str]) -> dict[str, str]:
+        out: dict[str, str] = {}
+        for ref in item_refs:
+            try:
+                label = self._provider.resolve_label(ref)
+            except Exception:
+                continue
+            if label:
+                out[ref] = str(label)
+        return out
+
+
+class LabelCache:
+    """Bounded TTL + LRU cache of resolved labels (misses included) keyed by (item_kind, item_ref)."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_s: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max = max(1, int(max_entries))
+        self._ttl = float(ttl_s)
+        self._clock = clock
+        self._data: OrderedDict[tuple[str, str], tuple[str | None, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, ref: str) -> tuple[bool, str | None]:
+        """Return (found, label)."""
+        key = (kind, ref)
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return False, None
+        label, expires = item
+        if expires <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return False, None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return True, label
+
+    def put(self, kind: str, ref: str, label: str | None) -> None:
+        key = (kind, ref)
+        self._data[key] = (label, self._clock() + self._ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def invalidate(self, kind: str | None = None, refs: Iterable[str] | None = None) -> None:
+        if kind is None:
+            self._data.clear()
+            return
+        if refs is not None:
+            for ref in refs:
+                self._data.pop((kind, str(ref)), None)
+            return
+        for key in [k for k in self._data if k[0] == kind]:
+            del self._data[key]
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
 
 class SchedulerProviderRegistry:
     """System-level registry to resolve labels without feature-to-feature imports."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: LabelCache | None = None) -> None:
         self._providers: dict[str, SchedulerProvider] = {}
+        self._cache = cache if cache is not None else LabelCache()
 
-    def register(self, kind: str, provider: SchedulerProvider) -> None:
+    @property
+    def cache(self) -> LabelCache:
+        return self._cache
+
+    def register(self, kind: str, provider) -> None:
         kk = str(kind).strip()
         if not kk:
             return
+        if not isinstance(provider, _BulkCapable):
+            provider = SingleRefProviderAdapter(provider)
         self._providers[kk] = provider
+        self._cache.invalidate(kk)
 
     def get(self, kind: str) -> SchedulerProvider | None:
         kk = str(kind).strip()
         if not kk:
             return None
         return self._providers.get(kk)
+
+    def resolve_labels(self, pairs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], str]:
+        """
+        Resolve many (item_kind, item_ref) pairs at once.
+
+        Cache first; remaining refs are grouped by kind and resolved with one
+        provider call per kind. Kinds without a provider are skipped.
+        """
+        out: dict[tuple[str, str], str] = {}
+        pending: dict[str, dict[str, None]] = {}  # kind -> ordered unique refs
+
+        for kind, ref in pairs:
+            kk = str(kind).strip()
+            rr = str(ref)
+            if kk not in self._providers or (kk, rr) in out:
+                continue
+            found, label = self._cache.get(kk, rr)
+            if found:
+                if label:
+                    out[(kk, rr)] = label
+                continue
+            pending.setdefault(kk, {})[rr] = None
+
+        for kk, refs in pending.items():
+            try:
+                resolved = self._providers[kk].resolve_labels(list(refs))
+            except Exception:
+                # Fail-soft: callers fall back to title_cache; do not cache failures.
+                continue
+            for rr in refs:
+                label = resolved.get(rr)
+                self._cache.put(kk, rr, label or None)
+                if label:
+                    out[(kk, rr)] = str(label)
+
+        return out
+
+    def invalidate(self, kind: str | None = None, refs: Iterable[str] | None = None) -> None:
+        """Drop cached labels after the source feature writes (all kinds when kind is None)."""
+        self._cache.invalidate(None if kind is None else str(kind).strip(), refs)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator, Sequence, TextIO
 
+from lux.core.instrumentation import instrument_methods
+from lux.core.recurrence import parse_rrule
+from lux.core.scheduler.autoschedule import PlanItem, PlanResult, Placement, WorkingHours, plan
+from lux.core.scheduler.conflicts import IntervalIndex
+from lux.core.scheduler.expansion import EpochFormatter, SeriesSpec, expand_batch, series_end, to_epoch
+from lux.core.scheduler.ics_io import IcsImportStats, export_ics, import_ics
 from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
-from lux.data.models.schedule import ScheduledEntryRow
+from lux.data.models.schedule import ScheduledDaySummary, ScheduledEntryRow, ScheduledSeriesRow
+from lux.core.undo import UndoJournal, UndoOp
 from lux.data.repositories.schedule_repo import ScheduledEntryRepo
 
+# Undo handler target for this service's inverse operations.
+UNDO_TARGET = "scheduler"
+
 
 def _to_iso(dt: str | datetime | date) -> str:
     if isinstance(dt, datetime):
@@ -17,6 +28,7 @@ def _to_iso(dt: str | datetime | date) -> str:
     return s.replace("T", " ")
 
 
+@instrument_methods("service.scheduler")
 class SchedulerService:
     """
     System write path for scheduled entries.
@@ -32,14 +44,55 @@ class SchedulerService:
         self,
         repo: ScheduledEntryRepo,
         registry: SchedulerProviderRegistry,
+        journal: UndoJournal | None = None,
     ) -> None:
         self._repo = repo
         self._registry = registry
+        self._journal = journal
+        if journal is not None:
+            journal.register(UNDO_TARGET, self._apply_undo)
 
     @property
     def registry(self) -> SchedulerProviderRegistry:
         return self._registry
 
+    @contextmanager
+    def batch(self, label: str = "Edit schedule") -> Iterator[None]:
+        """Run several writes as one transaction (single commit, rollback on error) and one undo step."""
+        group = self._journal.group(label) if self._journal is not None else nullcontext()
+        # The group closes first, so its undo_log row commits (or rolls back) with the batch.
+        with self._repo.transaction(), group:
+            yield
+
+    # -------------------------
+    # Undo
+    # -------------------------
+    def _record(self, label: str, undo: UndoOp | list[UndoOp], redo: UndoOp | list[UndoOp]) -> None:
+        if self._journal is not None:
+            self._journal.record(label, undo, redo)
+
+    def _apply_undo(self, name: str, args: tuple) -> None:
+        """Replay one inverse operation (repo-level: no validation, no re-recording)."""
+        if name == "set_entry_archived":
+            self._repo.set_archived(int(args[0]), bool(args[1]))
+        elif name == "set_entry_time":
+            self._repo.update_time(int(args[0]), str(args[1]), str(args[2]))
+        elif name == "set_series_archived":
+            self._repo.set_series_archived(int(args[0]), bool(args[1]))
+        elif name == "set_series_exception":
+            series_id, original_start, present, entry_id = args
+            if present:
+                self._repo.add_series_exception(int(series_id), str(original_start), entry_id=entry_id)
+            else:
+                self._repo.remove_series_exception(int(series_id), str(original_start))
+        else:
+            raise ValueError(f"unknown scheduler undo op: {name}")
+
+    def _exception_op(self, series_id: int, original_start: str) -> UndoOp:
+        """Op restoring the current exception state of one instance key."""
+        present, entry_id = self._repo.get_series_exception(series_id, original_start)
+        return UndoOp(UNDO_TARGET, "set_series_exception", (series_id, original_start, present, entry_id))
+
     def schedule(
         self,
         item_kind: str,
@@ -76,7 +129,13 @@ class SchedulerService:
                 "notes_cache": notes_cache,
             }
         )
-        return int(entry_id)
+        entry_id = int(entry_id)
+        self._record(
+            "Schedule entry",
+            UndoOp(UNDO_TARGET, "set_entry_archived", (entry_id, True)),
+            UndoOp(UNDO_TARGET, "set_entry_archived", (entry_id, False)),
+        )
+        return entry_id
 
     def reschedule(
         self,
@@ -96,7 +155,14 @@ class SchedulerService:
         if start_iso >= end_iso:
             raise ValueError("new_end must be after new_start")
 
+        before = self._repo.get(eid) if self._journal is not None else None
         self._repo.update_time(eid, start_iso, end_iso)
+        if before is not None:
+            self._record(
+                "Move entry",
+                UndoOp(UNDO_TARGET, "set_entry_time", (eid, before.start_dt, before.end_dt)),
+                UndoOp(UNDO_TARGET, "set_entry_time", (eid, start_iso, end_iso)),
+            )
 
     def archive(self, entry_id: int | str) -> None:
         try:
@@ -104,6 +170,11 @@ class SchedulerService:
         except Exception:
             raise ValueError("entry_id is required")
         self._repo.archive(eid)
+        self._record(
+            "Archive entry",
+            UndoOp(UNDO_TARGET, "set_entry_archived", (eid, False)),
+            UndoOp(UNDO_TARGET, "set_entry_archived", (eid, True)),
+        )
 
     def list_range(
         self,
@@ -119,9 +190,299 @@ class SchedulerService:
         if start_iso > end_iso:
             raise ValueError("start must be <= end")
 
-        return self._repo.list_for_range(
+        rows = self._repo.list_for_range(
             start_iso,
             end_iso,
             include_archived=include_archived,
             limit=limit,
         )
+
+        instances = self._expand_series(start_iso, end_iso)
+        if not instances:
+            return rows
+
+        # Both inputs are start-ordered; sort is a cheap merge (timsort runs).
+        merged = sorted(rows + instances, key=lambda r: r.start_dt)
+        return merged[: max(1, int(limit))]
+
+    def day_summaries(self, start_day: date, end_day: date) -> dict[str, ScheduledDaySummary]:
+        """
+        Per-day counts + hour histogram for start_day..end_day (inclusive), keyed by YYYY-MM-DD.
+
+        Stored entries are aggregated in SQL; series instances are expanded in
+        memory and counted by start. Days with nothing scheduled are omitted.
+        """
+        start_iso = _to_iso(start_day)
+        end_iso = _to_iso(end_day + timedelta(days=1))
+        if start_iso >= end_iso:
+            return {}
+
+        hours: dict[str, list[int]] = {}
+        for day, hour, n in self._repo.day_hour_counts(start_iso, end_iso):
+            hours.setdefault(day, [0] * 24)[hour % 24] += n
+
+        for inst in self._expand_series(start_iso, end_iso):
+            if inst.start_dt < start_iso:
+                continue  # started the day before; counted there
+            day = inst.start_dt[:10]
+            hours.setdefault(day, [0] * 24)[int(inst.start_dt[11:13]) % 24] += 1
+
+        return {
+            day: ScheduledDaySummary(day=day, count=sum(h), hours=tuple(h))
+            for day, h in sorted(hours.items())
+        }
+
+    def find_conflicts(
+        self,
+        start: str | datetime | date,
+        end: str | datetime | date,
+        limit: int = 2000,
+    ) -> list[tuple[ScheduledEntryRow, ScheduledEntryRow]]:
+        """
+        All double-bookings in a range (e.g. a week): one range query + sweep line.
+        Pairs are ordered by start time.
+        """
+        rows = self.list_range(start, end, include_archived=False, limit=limit)
+        index = IntervalIndex((r.start_dt, r.end_dt, i) for i, r in enumerate(rows))
+        return [(rows[a], rows[b]) for a, b in index.conflicts()]
+
+    # -------------------------
+    # Auto-scheduling
+    # -------------------------
+    def auto_schedule(
+        self,
+        items: Sequence[PlanItem],
+        start_day: date,
+        end_day: date,
+        hours: WorkingHours = WorkingHours(),
+        not_before: str | datetime | None = None,
+    ) -> PlanResult:
+        """
+        Place items into free time between start_day and end_day (inclusive).
+
+        - Busy time is read with one range query (series instances included).
+        - Items already on the calendar (same item_kind/item_ref) are skipped.
+        - All placements are written through schedule() in one transaction
+          and undo as one step; PlanItem.resolve_ref runs inside it, for placed
+          items only (an item that resolves to "" is returned as unplaced).
+        """
+        range_start = _to_iso(start_day)
+        range_end = _to_iso(end_day + timedelta(days=1))
+        rows = self.list_range(range_start, range_end, include_archived=False, limit=50_000)
+
+        scheduled = {(r.item_kind, r.item_ref) for r in rows}
+        pending = [it for it in items if (it.item_kind, str(it.item_ref)) not in scheduled]
+
+        result = plan(
+            pending,
+            ((r.start_dt, r.end_dt) for r in rows),
+            start_day,
+            end_day,
+            hours=hours,
+            not_before=_to_iso(not_before) if not_before else None,
+        )
+        if not result.placed:
+            return result
+
+        written: list[Placement] = []
+        with self.batch("Auto-schedule"):
+            for p in result.placed:
+                item_ref = p.item.resolve_ref() if p.item.resolve_ref is not None else p.item.item_ref
+                if not item_ref:
+                    result.unplaced.append(p.item)
+                    continue
+                self.schedule(
+                    item_kind=p.item.item_kind,
+                    item_ref=item_ref,
+                    start=p.start_dt,
+                    end=p.end_dt,
+                    title_cache=p.item.title,
+                )
+                written.append(p)
+        result.placed = written
+        return result
+
+    # -------------------------
+    # Recurring series
+    # -------------------------
+    def schedule_series(
+        self,
+        item_kind: str,
+        item_ref: Any,
+        start: str | datetime | date,
+        end: str | datetime | date,
+        rrule: str,
+        title_cache: str | None = None,
+        notes_cache: str | None = None,
+    ) -> int:
+        """
+        Create one recurring series row (instances are expanded on read).
+        start/end describe the first instance. Raises ValueError on invalid input.
+        """
+        kind = str(item_kind or "").strip()
+        if not kind:
+            raise ValueError("item_kind is required")
+
+        ref = str(item_ref).strip()
+        if not ref:
+            raise ValueError("item_ref is required")
+
+        start_iso = _to_iso(start)
+        end_iso = _to_iso(end)
+        if start_iso >= end_iso:
+            raise ValueError("end must be after start")
+
+        rule_text = str(rrule or "").strip()
+        rule = parse_rrule(rule_text)
+
+        # Resolve the series end once so range queries can prune by until_dt.
+        first = to_epoch(start_iso)
+        spec = SeriesSpec(key=0, rule=rule, first_start=first, duration=to_epoch(end_iso) - first)
+        last_end = series_end(spec)
+        until_dt = EpochFormatter()(last_end) if last_end is not None else None
+
+        series_id = self._repo.create_series(
+            {
+                "item_kind": kind,
+                "item_ref": ref,
+                "start_dt": start_iso,
+                "end_dt": end_iso,
+                "rrule": rule_text,
+                "until_dt": until_dt,
+                "title_cache": title_cache,
+                "notes_cache": notes_cache,
+            }
+        )
+        series_id = int(series_id)
+        self._record(
+            "Schedule series",
+            UndoOp(UNDO_TARGET, "set_series_archived", (series_id, True)),
+            UndoOp(UNDO_TARGET, "set_series_archived", (series_id, False)),
+        )
+        return series_id
+
+    def archive_series(self, series_id: int | str) -> None:
+        try:
+            sid = int(series_id)
+        except Exception:
+            raise ValueError("series_id is required")
+        self._repo.archive_series(sid)
+        self._record(
+            "Archive series",
+            UndoOp(UNDO_TARGET, "set_series_archived", (sid, False)),
+            UndoOp(UNDO_TARGET, "set_series_archived", (sid, True)),
+        )
+
+    def skip_instance(self, series_id: int, original_start: str | datetime | date) -> None:
+        """Hide one instance of a series (archive semantics for a single occurrence)."""
+        sid, key = int(series_id), _to_iso(original_start)
+        undo = self._exception_op(sid, key) if self._journal is not None else None
+        self._repo.add_series_exception(sid, key, entry_id=None)
+        if undo is not None:
+            self._record("Skip instance", undo, UndoOp(UNDO_TARGET, "set_series_exception", (sid, key, True, None)))
+
+    def reschedule_instance(
+        self,
+        series_id: int,
+        original_start: str | datetime | date,
+        new_start: str | datetime | date,
+        new_end: str | datetime | date,
+    ) -> int:
+        """
+        Move one instance: materialize it as a one-off entry and record the exception.
+        Returns the new entry id.
+        """
+        series = self._repo.get_series(int(series_id))
+        if series is None:
+            raise ValueError("series not found")
+
+        key = _to_iso(original_start)
+        with self.batch("Move instance"):
+            undo = self._exception_op(series.id, key) if self._journal is not None else None
+            entry_id = self.schedule(
+                item_kind=series.item_kind,
+                item_ref=series.item_ref,
+                start=new_start,
+                end=new_end,
+                title_cache=series.title_cache,
+                notes_cache=series.notes_cache,
+            )
+            self._repo.add_series_exception(series.id, key, entry_id=entry_id)
+            if undo is not None:
+                self._record(
+                    "Move instance",
+                    undo,
+                    UndoOp(UNDO_TARGET, "set_series_exception", (series.id, key, True, entry_id)),
+                )
+        return entry_id
+
+    # -------------------------
+    # iCalendar interchange
+    # -------------------------
+    def import_ics(self, lines: Iterable[str]) -> IcsImportStats:
+        """
+        Stream VEVENTs into the schedule as item_kind "ics" (batched; dedupes on UID).
+        Not recorded in the undo journal: re-importing the source file is the way back.
+        """
+        return import_ics(self._repo, lines)
+
+    def export_ics(self, out: TextIO) -> int:
+        """Write all active entries and series as iCalendar; returns the event count."""
+        return export_ics(self._repo, out)
+
+    def _expand_series(self, start_iso: str, end_iso: str) -> list[ScheduledEntryRow]:
+        series = self._repo.list_series_for_range(start_iso, end_iso)
+        if not series:
+            return []
+
+        specs: list[SeriesSpec] = []
+        for idx, sr in enumerate(series):
+            try:
+                first = to_epoch(sr.start_dt)
+                specs.append(
+                    SeriesSpec(
+                        key=idx,
+                        rule=parse_rrule(sr.rrule),
+                        first_start=first,
+                        duration=to_epoch(sr.end_dt) - first,
+                    )
+                )
+            except ValueError:
+                # Fail-soft: a corrupt series must not break the whole range.
+                continue
+
+        range_start = to_epoch(start_iso)
+        range_end = to_epoch(end_iso)
+        expanded = expand_batch(specs, range_start, range_end)
+        if not expanded:
+            return []
+
+        # Exceptions are keyed by original start; look back by the longest duration.
+        longest = max(sp.duration for sp in specs)
+        fmt = EpochFormatter()
+        exceptions = self._repo.list_series_exceptions(fmt(range_start - longest), end_iso)
+
+        out: list[ScheduledEntryRow] = []
+        for s, e, idx in expanded:
+            sr = series[idx]
+            start_s = fmt(s)
+            if (sr.id, start_s) in exceptions:
+                continue
+            out.append(_instance_row(sr, start_s, fmt(e)))
+        return out
+
+
+def _instance_row(sr: ScheduledSeriesRow, start_dt: str, end_dt: str) -> ScheduledEntryRow:
+    return ScheduledEntryRow(
+        id=0,
+        item_kind=sr.item_kind,
+        item_ref=sr.item_ref,
+        start_dt=start_dt,
+        end_dt=end_dt,
+        title_cache=sr.title_cache,
+        notes_cache=sr.notes_cache,
+        archived=False,
+        created_at=sr.created_at,
+        updated_at=sr.updated_at,
+        series_id=sr.id,
+    )
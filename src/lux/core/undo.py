@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Iterator, Protocol, Sequence
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UndoOp:
+    target: str       # handler key, e.g. "tasks" / "scheduler"
+    name: str         # handler-defined operation name
+    args: tuple = ()  # JSON-serializable positional args
+
+
+@dataclass(frozen=True)
+class UndoStep:
+    label: str
+    undo: tuple[UndoOp, ...]  # applied in order on undo
+    redo: tuple[UndoOp, ...]  # applied in order on redo
+    id: int = 0               # store row id (0 = not persisted)
+
+
+# (op name, args) -> None; raises on failure.
+UndoHandler = Callable[[str, tuple], None]
+
+
+class UndoStore(Protocol):
+    """Persistence for steps (see lux.data.repositories.undo_repo)."""
+
+    def append(self, label: str, undo_json: str, redo_json: str) -> int:
+        ...
+
+    def set_undone(self, step_id: int, undone: bool) -> None:
+        ...
+
+    def discard(self, step_id: int) -> None:
+        ...
+
+    def discard_undone(self) -> None:
+        ...
+
+    def trim(self, keep: int) -> None:
+        ...
+
+    def load(self, limit: int) -> list[tuple[int, str, str, str, bool]]:
+        """(id, label, undo_json, redo_json, undone) rows in id order."""
+        ...
+
+
+def _ops_to_json(ops: Sequence[UndoOp]) -> str:
+    return json.dumps([[op.target, op.name, list(op.args)] for op in ops], separators=(",", ":"))
+
+
+def _ops_from_json(text: str) -> tuple[UndoOp, ...]:
+    return tuple(UndoOp(str(t), str(n), tuple(a)) for t, n, a in json.loads(text))
+
+
+@dataclass
+class _Group:
+    label: str
+    undo: list[tuple[UndoOp, ...]] = field(default_factory=list)  # one chunk per record
+    redo: list[UndoOp] = field(default_factory=list)
+
+    def undo_ops(self) -> tuple[UndoOp, ...]:
+        # Later writes are undone first.
+        return tuple(op for chunk in reversed(self.undo) for op in chunk)
+
+
+class UndoJournal:
+    """Bounded undo/redo stacks with grouping."""
+
+    def __init__(
+        self,
+        capacity: int = 200,
+        store: UndoStore | None = None,
+        atomic: Callable[[], ContextManager[Any]] | None = None,
+    ) -> None:
+        self._capacity = max(1, int(capacity))
+        self._store = store
+        self._atomic = atomic or nullcontext
+        self._handlers: dict[str, UndoHandler] = {}
+        self._undo: deque[UndoStep] = deque(maxlen=self._capacity)
+        self._redo: list[UndoStep] = []
+        self._group: _Group | None = None
+        self._group_depth = 0
+        self._replaying = False
+        self._listeners: list[Callable[[str], None]] = []
+
+    # -------------------------
+    # Wiring
+    # -------------------------
+    def register(self, target: str, handler: UndoHandler) -> None:
+        self._handlers[str(target)] = handler
+
+    def set_atomic(self, atomic: Callable[[], ContextManager[Any]]) -> None:
+        """Transaction factory wrapping each replayed step (set once services exist)."""
+        self._atomic = atomic
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Called with "record", "undo", "redo" or "clear" after the stacks change.
+        Replays bypass feature signals, so UI caches should drop on "undo"/"redo".
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def load(self) -> None:
+        """Restore the persisted stacks (startup). Fail-soft: a bad store means an empty history."""
+        if self._store is None:
+            return
+        try:
+            rows = self._store.load(self._capacity)
+        except Exception:
+            log.exception("Undo history load failed")
+            return
+
+        undone: list[UndoStep] = []
+        for step_id, label, undo_json, redo_json, is_undone in rows:
+            try:
+                step = UndoStep(label, _ops_from_json(undo_json), _ops_from_json(redo_json), int(step_id))
+            except (ValueError, TypeError):
+                continue
+            (undone if is_undone else self._undo).append(step)
+        # Undo runs newest-first, so the oldest undone step is the next redo.
+        self._redo = list(reversed(undone))
+
+    # -------------------------
+    # Recording
+    # -------------------------
+    @property
+    def replaying(self) -> bool:
+        return self._replaying
+
+    def record(self, label: str, undo: UndoOp | Sequence[UndoOp], redo: UndoOp | Sequence[UndoOp]) -> None:
+        if self._replaying:
+            return
+        undo_ops = (undo,) if isinstance(undo, UndoOp) else tuple(undo)
+        redo_ops = (redo,) if isinstance(redo, UndoOp) else tuple(redo)
+        if not undo_ops:
+            return
+
+        if self._group is not None:
+            self._group.undo.append(undo_ops)
+            self._group.redo.extend(redo_ops)
+            return
+        self._push(UndoStep(label, undo_ops, redo_ops))
+
+    @contextmanager
+    def group(self, label: str) -> Iterator[None]:
+        """
+        Merge every record inside into one step (nestable; the outermost label wins).
+        Nothing is recorded if the block raises.
+        """
+        if self._replaying:
+            yield
+            return
+
+        if self._group_depth == 0:
+            self._group = _Group(label)
+        self._group_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._group_depth -= 1
+            if self._group_depth == 0:
+                self._group = None
+            raise
+        self._group_depth -= 1
+        if self._group_depth == 0:
+            grp, self._group = self._group, None
+            if grp is not None and grp.undo:
+                self._push(UndoStep(grp.label, grp.undo_ops(), tuple(grp.redo)))
+
+    def _push(self, step: UndoStep) -> None:
+        if self._store is not None:
+            try:
+                if self._redo:
+                    self._store.discard_undone()
+                step_id = self._store.append(step.label, _ops_to_json(step.undo), _ops_to_json(step.redo))
+                self._store.trim(self._capacity)
+                step = UndoStep(step.label, step.undo, step.redo, step_id)
+            except Exception:
+                # Fail-soft: history stays in memory for this session.
+                log.exception("Undo history write failed")
+        self._redo.clear()
+        self._undo.append(step)  # deque(maxlen) drops the oldest
+        self._notify("record")
+
+    # -------------------------
+    # Replay
+    # -------------------------
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo_label(self) -> str | None:
+        return self._undo[-1].label if self._undo else None
+
+    def redo_label(self) -> str | None:
+        return self._redo[-1].label if self._redo else None
+
+    def undo(self) -> str | None:
+        """Revert the newest step; returns its label (None if there is nothing to undo)."""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        self._replay(step, step.undo)
+        self._redo.append(step)
+        self._mark(step, undone=True)
+        self._notify("undo")
+        return step.label
+
+    def redo(self) -> str | None:
+        """Re-apply the most recently undone step; returns its label."""
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._replay(step, step.redo)
+        self._undo.append(step)
+        self._mark(step, undone=False)
+        self._notify("redo")
+        return step.label
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._notify("clear")
+
+    def _replay(self, step: UndoStep, ops: tuple[UndoOp, ...]) -> None:
+        """
+        Apply ops in one transaction. A step that fails to replay (e.g. its rows
+        were changed outside the journal) is dropped and the error re-raised.
+        """
+        self._replaying = True
+        try:
+            with self._atomic():
+                for op in ops:
+                    handler = self._handlers.get(op.target)
+                    if handler is None:
+                        raise LookupError(f"no undo handler for {op.target!r}")
+                    handler(op.name, op.args)
+        except Exception:
+            if self._store is not None and step.id:
+                try:
+                    self._store.discard(step.id)
+                except Exception:
+                    log.exception("Undo history cleanup failed")
+            raise
+        finally:
+            self._replaying = False
+
+    def _mark(self, step: UndoStep, undone: bool) -> None:
+        if self._store is not None and step.id:
+            try:
+                self._store.set_undone(step.id, undone)
+            except Exception:
+                log.exception("Undo history update failed")
+
+    def _notify(self, kind: str) -> None:
+        for cb in list(self._listeners):
+            try:
+                cb(kind)
+            except Exception:
+                log.exception("Undo listener failed")
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+log = logging.getLogger(__name__)
+
+PAGES_PER_STEP = 256
+STEP_SLEEP_S = 0.005
+KEEP_SNAPSHOTS = 7
+AUTO_INTERVAL_S = 24 * 60 * 60
+
+SNAPSHOT_PREFIX = "planner-"
+SNAPSHOT_SUFFIXES = (".db", ".db.gz")
+
+
+class BackupCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class BackupResult:
+    path: Path | None       # None when the backup failed or was cancelled
+    ok: bool
+    duration_ms: float
+    pages: int
+    size_bytes: int
+    detail: str             # "ok" or the failure reason
+
+
+BackupCallback = Callable[[BackupResult], None]
+ProgressCallback = Callable[[int, int], None]  # copied pages, total pages
+
+
+def list_snapshots(dest_dir: Path) -> list[Path]:
+    """Rotated snapshots in dest_dir, newest first (names sort by timestamp)."""
+    if not dest_dir.exists():
+        return []
+    out = [
+        p for p in dest_dir.iterdir()
+        if p.is_file() and p.name.startswith(SNAPSHOT_PREFIX) and p.name.endswith(SNAPSHOT_SUFFIXES)
+    ]
+    return sorted(out, key=lambda p: p.name, reverse=True)
+
+
+def rotate_snapshots(dest_dir: Path, keep: int) -> list[Path]:
+    """Delete all but the newest `keep` snapshots; returns the removed paths."""
+    removed: list[Path] = []
+    for p in list_snapshots(dest_dir)[max(1, int(keep)):]:
+        try:
+            p.unlink()
+            removed.append(p)
+        except OSError:
+            log.warning("Could not remove old backup: %s", p)
+    return removed
+
+
+def backup_database(
+    src_path: Path,
+    dest_path: Path,
+    compress: bool = False,
+    pages_per_step: int = PAGES_PER_STEP,
+    step_sleep_s: float = STEP_SLEEP_S,
+    progress: ProgressCallback | None = None,
+    cancelled: Callable[[], bool] | None = None,
+) -> BackupResult:
+    """
+    Copy src_path to dest_path (gzip-compressed if `compress`) and verify it.
+    Blocking: call from a worker thread (BackupService) or a CLI.
+    """
+    t0 = time.perf_counter()
+    dest_path = Path(dest_path)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    raw_part = dest_path.with_name(dest_path.name + ".part")
+    gz_part = dest_path.with_name(dest_path.name + ".gz.part") if compress else None
+    copied = [0]
+
+    def on_step(_status: int, remaining: int, total: int) -> None:
+        copied[0] = total - remaining
+        if cancelled is not None and cancelled():
+            raise BackupCancelled()
+        if progress is not None:
+            progress(total - remaining, total)
+
+    def fail(detail: str) -> BackupResult:
+        for part in (raw_part, gz_part):
+            if part is not None:
+                try:
+                    part.unlink()
+                except OSError:
+                    pass
+        return BackupResult(None, False, (time.perf_counter() - t0) * 1000.0, copied[0], 0, detail)
+
+    try:
+        src = sqlite3.connect(f"file:{Path(src_path).as_posix()}?mode=ro", uri=True)
+        try:
+            dst = sqlite3.connect(str(raw_part))
+            try:
+                src.backup(dst, pages=max(1, int(pages_per_step)), progress=on_step, sleep=max(0.0, step_sleep_s))
+                dst.execute("PRAGMA journal_mode = DELETE")
+                row = dst.execute("PRAGMA integrity_check").fetchone()
+                if not row or str(row[0]).lower() != "ok":
+                    return fail(f"integrity_check: {row[0] if row else 'no result'}")
+            finally:
+                dst.close()
+        finally:
+            src.close()
+
+        if gz_part is not None:
+            with open(raw_part, "rb") as fin, gzip.open(gz_part, "wb", compresslevel=6) as fout:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+            raw_part.unlink()
+            os.replace(gz_part, dest_path)
+        else:
+            os.replace(raw_part, dest_path)
+    except BackupCancelled:
+        return fail("cancelled")
+    except (sqlite3.Error, OSError) as e:
+        log.warning("Backup to %s failed: %s", dest_path, e)
+        return fail(f"{type(e).__name__}: {e}")
+
+    size = dest_path.stat().st_size
+    result = BackupResult(dest_path, True, (time.perf_counter() - t0) * 1000.0, copied[0], size, "ok")
+    log.info("Backup %s: %.1f ms, %d pages, %d bytes", dest_path.name, result.duration_ms, result.pages, size)
+    return result
+
+
+class BackupService:
+    """Background backups into a rotated snapshot folder; callbacks run on the worker thread."""
+
+    def __init__(
+        self,
+        db_file: Path,
+        dest_dir: Path,
+        keep: int = KEEP_SNAPSHOTS,
+        compress: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._db_file = Path(db_file)
+        self._dest_dir = Path(dest_dir)
+        self._keep = max(1, int(keep))
+        self._compress = bool(compress)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._cancel = threading.Event()
+        self._last: BackupResult | None = None
+
+    @property
+    def dest_dir(self) -> Path:
+        return self._dest_dir
+
+    @property
+    def last_result(self) -> BackupResult | None:
+        return self._last
+
+    def snapshots(self) -> list[Path]:
+        return list_snapshots(self._dest_dir)
+
+    def is_running(self) -> bool:
+        t = self._thread
+        return t is not None and t.is_alive()
+
+    # -------------------------
+    # Jobs
+    # -------------------------
+    def start_snapshot(self, on_done: BackupCallback | None = None, progress: ProgressCallback | None = None) -> bool:
+        """Start a rotated snapshot; False if a job is already running."""
+        stamp = datetime.fromtimestamp(self._clock()).strftime("%Y%m%d-%H%M%S")
+        suffix = ".db.gz" if self._compress else ".db"
+        dest = self._dest_dir / f"{SNAPSHOT_PREFIX}{stamp}{suffix}"
+        return self._start(dest, self._compress, rotate=True, on_done=on_done, progress=progress)
+
+    def start_export(
+        self,
+        dest: Path,
+        on_done: BackupCallback | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> bool:
+        """Export a verified copy to a user-chosen path (compressed if it ends in .gz)."""
+        dest = Path(dest)
+        return self._start(dest, dest.suffix.lower() == ".gz", rotate=False, on_done=on_done, progress=progress)
+
+    def auto_step(self, interval_s: float = AUTO_INTERVAL_S) -> bool:
+        """Idle job: start a snapshot when the newest one is older than interval_s. Never pending."""
+        if self.is_running():
+            return False
+        newest = self.snapshots()[:1]
+        if newest:
+            try:
+                if self._clock() - newest[0].stat().st_mtime < interval_s:
+                    return False
+            except OSError:
+                pass
+        self.start_snapshot()
+        return False
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def wait(self, timeout_s: float | None = None) -> bool:
+        """Join the running job; True if none is running afterwards."""
+        t = self._thread
+        if t is not None:
+            t.join(timeout_s)
+        return not self.is_running()
+
+    def shutdown(self, budget_s: float) -> None:
+        """Lifecycle hook: let a running job finish within the budget, else cancel it."""
+        if not self.wait(max(0.0, budget_s)):
+            self.cancel()
+            self.wait(1.0)
+
+    def _start(
+        self,
+        dest: Path,
+        compress: bool,
+        rotate: bool,
+        on_done: BackupCallback | None,
+        progress: ProgressCallback | None,
+    ) -> bool:
+        with self._lock:
+            if self.is_running():
+                return False
+            self._cancel.clear()
+
+            def run() -> None:
+                result = backup_database(
+                    self._db_file,
+                    dest,
+                    compress=compress,
+                    progress=progress,
+                    cancelled=self._cancel.is_set,
+                )
+                if result.ok and rotate:
+                    rotate_snapshots(self._dest_dir, self._keep)
+                self._last = result
+                if on_done is not None:
+                    try:
+                        on_done(result)
+                    except Exception:
+                        log.exception("Backup callback failed")
+
+            self._thread = threading.Thread(target=run, name="lux-backup", daemon=True)
+            self._thread.start()
+            return True
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+
+from lux.core.events import ChangeBus
+from lux.data.repositories.change_log_repo import ChangeLogRepo
+
+log = logging.getLogger(__name__)
+
+
+class ChangeFeed:
+    """Tails change_log and publishes new rows on the ChangeBus."""
+
+    def __init__(
+        self,
+        repo: ChangeLogRepo,
+        bus: ChangeBus,
+        retain: int = 50_000,
+        prune_every: int = 500,
+    ) -> None:
+        self._repo = repo
+        self._bus = bus
+        self._retain = max(0, int(retain))
+        self._prune_every = max(1, int(prune_every))
+        self._pumps = 0
+        self._last_seq = repo.max_seq()  # only changes from this session are published
+
+    @property
+    def bus(self) -> ChangeBus:
+        return self._bus
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def pump(self) -> None:
+        try:
+            while True:
+                events = self._repo.read_since(self._last_seq)
+                if not events:
+                    break
+                self._last_seq = events[-1].seq
+                self._bus.publish(events)
+        except Exception:
+            # Fail-soft: a broken feed must never fail the write that triggered it.
+            log.exception("Change feed pump failed")
+            return
+
+        self._pumps += 1
+        if self._pumps % self._prune_every == 0 and self._last_seq > self._retain:
+            try:
+                self._repo.prune(self._last_seq - self._retain)
+            except Exception:
+                log.exception("Change log prune failed")
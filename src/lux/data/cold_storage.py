@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Sequence
+
+log = logging.getLogger(__name__)
+
+HOT_DAYS = 180
+ARCHIVE_GRACE_DAYS = 30
+BATCH_ROWS = 500
+
+_OCC_COLS = (
+    "id, task_id, due_date, due_time, sort_key, completed_at, archived, "
+    "created_at, updated_at, archived_at, recur_date"
+)
+_ENTRY_COLS = "id, item_kind, item_ref, start_dt, end_dt, title_cache, notes_cache, archived, created_at, updated_at"
+
+# hot table -> (history table, column list)
+_TABLES: dict[str, tuple[str, str]] = {
+    "task_occurrences": ("task_occurrences_history", _OCC_COLS),
+    "scheduled_entries": ("scheduled_entries_history", _ENTRY_COLS),
+}
+
+
+def history_horizon(conn: sqlite3.Connection, table: str) -> str | None:
+    """Active rows of `table` before this key may live in history (None = nothing moved)."""
+    row = conn.execute("SELECT horizon FROM cold_storage_state WHERE name = ?", (table,)).fetchone()
+    return str(row[0]) if row else None
+
+
+def thaw(conn: sqlite3.Connection, table: str, row_id: int) -> bool:
+    """
+    Move one row back from history into the hot table (no commit: runs inside the
+    caller's write). Used when a write by id finds nothing in the hot table.
+    """
+    history, cols = _TABLES[table]
+    cur = conn.execute(f"INSERT INTO {table}({cols}) SELECT {cols} FROM {history} WHERE id = ?", (int(row_id),))
+    if cur.rowcount <= 0:
+        return False
+    conn.execute(f"DELETE FROM {history} WHERE id = ?", (int(row_id),))
+    return True
+
+
+def needs_history(conn: sqlite3.Connection, table: str, range_start: str) -> bool:
+    """True if an active-rows range read starting at range_start must include history."""
+    horizon = history_horizon(conn, table)
+    return horizon is not None and range_start < horizon
+
+
+class ColdStorage:
+    """Batch mover between hot tables and their *_history counterparts."""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        hot_days: int = HOT_DAYS,
+        grace_days: int = ARCHIVE_GRACE_DAYS,
+        batch_rows: int = BATCH_ROWS,
+    ) -> None:
+        self._conn = conn
+        self._hot_days = max(1, int(hot_days))
+        self._grace_days = max(0, int(grace_days))
+        self._batch = max(1, int(batch_rows))
+
+    def step(self) -> bool:
+        """Move at most one batch per table; True while more work remains (idle-runner contract)."""
+        more = False
+        for table in _TABLES:
+            try:
+                more = self.move_batch(table) >= self._batch or more
+            except sqlite3.Error:
+                # Fail-soft: retried on the next idle slice.
+                log.exception("Cold storage batch failed (%s)", table)
+        return more
+
+    def move_batch(self, table: str, now: datetime | None = None) -> int:
+        """Move up to batch_rows candidate rows of `table`; returns the number moved."""
+        if self._conn.in_transaction:
+            return 0  # never interleave with an open repo transaction
+        history, cols = _TABLES[table]
+        now = now or datetime.utcnow()
+        grace = (now - timedelta(days=self._grace_days)).strftime("%Y-%m-%d %H:%M:%S")
+        if table == "task_occurrences":
+            horizon = (now - timedelta(days=self._hot_days)).date().isoformat()
+        else:
+            horizon = (now - timedelta(days=self._hot_days)).strftime("%Y-%m-%d 00:00:00")
+
+        ids = self._candidates(table, grace, horizon)
+        if not ids:
+            return 0
+
+        marks = ",".join("?" for _ in ids)
+        try:
+            # Raise the horizon first (never lower it): reads switch to the union
+            # before any active row below it leaves the hot table.
+            self._conn.execute(
+                """
+                INSERT INTO cold_storage_state(name, horizon) VALUES (?, ?)
+                ON CONFLICT(name) DO UPDATE SET horizon = max(horizon, excluded.horizon)
+                """,
+                (table, horizon),
+            )
+            self._conn.execute(
+                f"INSERT INTO {history}({cols}) SELECT {cols} FROM {table} WHERE id IN ({marks})",
+                ids,
+            )
+            self._conn.execute(f"DELETE FROM {table} WHERE id IN ({marks})", ids)
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        return len(ids)
+
+    def _candidates(self, table: str, grace: str, horizon: str) -> Sequence[int]:
+        if table == "task_occurrences":
+            sql = """
+                SELECT id FROM task_occurrences
+                 WHERE archived = 1 AND updated_at < ?
+                UNION
+                SELECT id FROM task_occurrences
+                 WHERE archived = 0 AND completed_at IS NOT NULL AND due_date < ?
+                 LIMIT ?
+            """
+        else:
+            sql = """
+                SELECT id FROM scheduled_entries
+                 WHERE archived = 1 AND updated_at < ?
+                UNION
+                SELECT id FROM scheduled_entries
+                 WHERE archived = 0 AND end_dt < ?
+                 LIMIT ?
+            """
+        return [int(r[0]) for r in self._conn.execute(sql, (grace, horizon, self._batch)).fetchall()]
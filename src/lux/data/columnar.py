@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import struct
+import sys
+import time
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Sequence
+
+try:  # optional: better ratio and speed when available
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on the environment
+    _zstd = None
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"LUXC"
+FORMAT_VERSION = 1
+CHUNK_ROWS = 20_000
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Export order respects foreign keys (parents first). Reads use the *_all
+# views so cold-storage rows are included; writes go to the hot tables.
+HISTORY_TABLES: tuple[tuple[str, str], ...] = (
+    ("task_definitions", "task_definitions"),
+    ("task_occurrences", "task_occurrences_all"),
+    ("scheduled_series", "scheduled_series"),
+    ("scheduled_entries", "scheduled_entries_all"),
+    ("scheduled_series_exceptions", "scheduled_series_exceptions"),
+)
+
+_FRAME = struct.Struct("<BII")
+_FRAME_TABLE = 1
+_FRAME_ROWS = 2
+_FRAME_END = 3
+
+_ENC_NULL = 0
+_ENC_INT = 1
+_ENC_REAL = 2
+_ENC_DATETIME = 3
+_ENC_DATE = 4
+_ENC_DICT = 5
+_ENC_JSON = 6
+
+_U32 = struct.Struct("<I")
+_SWAP = sys.byteorder != "little"   # blocks are little-endian on disk
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class ArchiveFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ArchiveStats:
+    rows: dict[str, int] = field(default_factory=dict)
+    bytes: int = 0
+    duration_ms: float = 0.0
+
+
+ProgressCallback = Callable[[str, int], None]  # table, rows so far
+
+
+# -------------------------
+# Array helpers
+# -------------------------
+def _pack(typecode: str, values: Sequence[Any]) -> bytes:
+    arr = array(typecode, values)
+    if _SWAP:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack(typecode: str, data: bytes | memoryview) -> array:
+    arr = array(typecode)
+    arr.frombytes(data)
+    if _SWAP:
+        arr.byteswap()
+    return arr
+
+
+def _deltas(values: Sequence[int]) -> list[int]:
+    prev = 0
+    out = []
+    for v in values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def _undeltas(deltas: Sequence[int]) -> list[int]:
+    acc = 0
+    out = []
+    for d in deltas:
+        acc += d
+        out.append(acc)
+    return out
+
+
+# -------------------------
+# Column blocks
+# -------------------------
+def _encode_masked_ints(values: list, keys: list[int]) -> bytes:
+    """Null mask (only if needed) + int64 deltas of keys (nulls repeat the previous key)."""
+    has_nulls = any(v is None for v in values)
+    head = b"\x01" + bytes(0 if v is None else 1 for v in values) if has_nulls else b"\x00"
+    return head + _pack("q", _deltas(keys))
+
+
+def _decode_masked_ints(data: memoryview, n: int) -> tuple[bytes | None, list[int]]:
+    if data[0]:
+        mask = bytes(data[1 : 1 + n])
+        return mask, _undeltas(_unpack("q", data[1 + n :]))
+    return None, _undeltas(_unpack("q", data[1:]))
+
+
+def _fill_keys(values: list, key: Callable[[Any], int]) -> list[int]:
+    out = []
+    prev = 0
+    for v in values:
+        if v is not None:
+            prev = key(v)
+        out.append(prev)
+    return out
+
+
+@lru_cache(maxsize=8192)
+def _date_key(s: str) -> int:
+    """Days since 1970-01-01 for a canonical YYYY-MM-DD (ValueError otherwise)."""
+    d = date.fromisoformat(s)
+    if d.isoformat() != s:
+        raise ValueError(s)
+    return d.toordinal() - _EPOCH_ORDINAL
+
+
+def _datetime_key(s: str) -> int:
+    """Seconds since the epoch for a canonical "YYYY-MM-DD HH:MM:SS" (ValueError otherwise)."""
+    # Timestamps share few distinct days: the date part is memoized, the time parsed inline.
+    hms = s[11:13] + s[14:16] + s[17:19]
+    if s[10] != " " or s[13] != ":" or s[16] != ":" or not (hms.isascii() and hms.isdigit()):
+        raise ValueError(s)
+    h, m, sec = int(hms[0:2]), int(hms[2:4]), int(hms[4:6])
+    if h > 23 or m > 59 or sec > 59:
+        raise ValueError(s)
+    return _date_key(s[:10]) * 86400 + h * 3600 + m * 60 + sec
+
+
+def _format_datetime(v: int) -> str:
+    days, secs = divmod(v, 86400)
+    d = date.fromordinal(days + _EPOCH_ORDINAL)
+    h, rem = divmod(secs, 3600)
+    m, s = divmod(rem, 60)
+    return f"{d.isoformat()} {h:02d}:{m:02d}:{s:02d}"
+
+
+def _encode_column(values: list) -> tuple[int, bytes]:
+    present = [v for v in values if v is not None]
+    if not present:
+        return _ENC_NULL, b""
+
+    kinds = {type(v) for v in present}
+    if kinds == {int}:
+        return _ENC_INT, _encode_masked_ints(values, _fill_keys(values, int))
+    if kinds == {float}:
+        mask = bytes(0 if v is None else 1 for v in values)
+        return _ENC_REAL, mask + _pack("d", [0.0 if v is None else float(v) for v in values])
+    if kinds == {str}:
+        lengths = {len(v) for v in present}
+        try:
+            if lengths == {19}:
+                return _ENC_DATETIME, _encode_masked_ints(values, _fill_keys(values, _datetime_key))
+            if lengths == {10}:
+                return _ENC_DATE, _encode_masked_ints(values, _fill_keys(values, _date_key))
+        except ValueError:
+            pass  # not a canonical timestamp: dictionary path
+        index: dict[str, int] = {}
+        codes = [0 if v is None else index.setdefault(v, len(index) + 1) for v in values]
+        blobs = [s.encode("utf-8") for s in index]
+        return _ENC_DICT, (
+            _U32.pack(len(blobs))
+            + _pack("I", [len(b) for b in blobs])
+            + b"".join(blobs)
+            + _pack("I", codes)
+        )
+    return _ENC_JSON, json.dumps(values, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_column(enc: int, data: memoryview, n: int) -> list:
+    if enc == _ENC_NULL:
+        return [None] * n
+    if enc in (_ENC_INT, _ENC_DATETIME, _ENC_DATE):
+        mask, keys = _decode_masked_ints(data, n)
+        if enc == _ENC_INT:
+            out: list = keys
+        elif enc == _ENC_DATETIME:
+            out = [_format_datetime(k) for k in keys]
+        else:
+            out = [date.fromordinal(k + _EPOCH_ORDINAL).isoformat() for k in keys]
+        if mask is not None:
+            out = [v if m else None for v, m in zip(out, mask)]
+        return out
+    if enc == _ENC_REAL:
+        mask = bytes(data[:n])
+        return [v if m else None for v, m in zip(_unpack("d", data[n:]), mask)]
+    if enc == _ENC_DICT:
+        (count,) = _U32.unpack_from(data, 0)
+        pos = 4
+        lengths = _unpack("I", data[pos : pos + 4 * count])
+        pos += 4 * count
+        strings: list[str | None] = [None]
+        for ln in lengths:
+            strings.append(bytes(data[pos : pos + ln]).decode("utf-8"))
+            pos += ln
+        return [strings[c] for c in _unpack("I", data[pos:])]
+    if enc == _ENC_JSON:
+        return json.loads(bytes(data).decode("utf-8"))
+    raise ArchiveFormatError(f"Unknown column encoding {enc}")
+
+
+def _encode_rows(rows: Sequence[Sequence[Any]]) -> bytes:
+    parts = [_U32.pack(len(rows))]
+    for values in zip(*rows):
+        enc, block = _encode_column(list(values))
+        parts.append(struct.pack("<BI", enc, len(block)))
+        parts.append(block)
+    return b"".join(parts)
+
+
+def _decode_rows(payload: bytes, ncols: int) -> list[tuple]:
+    view = memoryview(payload)
+    (n,) = _U32.unpack_from(view, 0)
+    pos = 4
+    columns = []
+    for _ in range(ncols):
+        enc, size = struct.unpack_from("<BI", view, pos)
+        pos += 5
+        columns.append(_decode_column(enc, view[pos : pos + size], n))
+        pos += size
+    return list(zip(*columns)) if columns else []
+
+
+# -------------------------
+# Compression
+# -------------------------
+_DECOMPRESS_ERRORS: tuple[type[Exception], ...] = (zlib.error,) + ((_zstd.ZstdError,) if _zstd is not None else ())
+
+
+def _default_codec() -> int:
+    return CODEC_ZSTD if _zstd is not None else CODEC_ZLIB
+
+
+def _compressor(codec: int) -> Callable[[bytes], bytes]:
+    if codec == CODEC_ZSTD:
+        if _zstd is None:
+            raise ArchiveFormatError("zstd archives need the 'zstandard' package")
+        return _zstd.ZstdCompressor(level=6).compress
+    return lambda b: zlib.compress(b, 6)
+
+
+def _decompressor(codec: int) -> Callable[[bytes, int], bytes]:
+    if codec == CODEC_ZSTD:
+        if _zstd is None:
+            raise ArchiveFormatError("zstd archives need the 'zstandard' package")
+        d = _zstd.ZstdDecompressor()
+        return lambda b, raw_len: d.decompress(b, max_output_size=raw_len)
+    if codec == CODEC_ZLIB:
+        return lambda b, _raw_len: zlib.decompress(b)
+    raise ArchiveFormatError(f"Unknown codec {codec}")
+
+
+# -------------------------
+# Archive
+# -------------------------
+class HistoryArchive:
+    """Export/import the full planner history to/from a columnar archive file."""
+
+    def __init__(self, conn: sqlite3.Connection, chunk_rows: int = CHUNK_ROWS, codec: int | None = None) -> None:
+        self._conn = conn
+        self._chunk = max(1, int(chunk_rows))
+        self._codec = int(codec) if codec is not None else _default_codec()
+
+    def export_to(self, path: Path, progress: ProgressCallback | None = None) -> ArchiveStats:
+        t0 = time.perf_counter()
+        compress = _compressor(self._codec)
+        counts: dict[str, int] = {}
+        path = Path(path)
+        part = path.with_name(path.name + ".part")
+        if self._conn.in_transaction:
+            raise RuntimeError("export_to() needs the connection outside a transaction")
+        with open(part, "wb") as f:
+            f.write(MAGIC + bytes([FORMAT_VERSION, self._codec]))
+            self._conn.execute("BEGIN")  # one read snapshot for every table
+            try:
+                for table, source in HISTORY_TABLES:
+                    columns = self._columns(table)
+                    meta = json.dumps({"table": table, "columns": columns}).encode()
+                    self._write_frame(f, compress, _FRAME_TABLE, meta)
+                    cur = self._conn.execute(f"SELECT {', '.join(columns)} FROM {source} ORDER BY id")
+                    total = 0
+                    while True:
+                        rows = cur.fetchmany(self._chunk)
+                        if not rows:
+                            break
+                        self._write_frame(f, compress, _FRAME_ROWS, _encode_rows([tuple(r) for r in rows]))
+                        total += len(rows)
+                        if progress is not None:
+                            progress(table, total)
+                    counts[table] = total
+            finally:
+                self._conn.commit()
+            self._write_frame(f, compress, _FRAME_END, json.dumps({"rows": counts}).encode())
+        part.replace(path)
+
+        stats = ArchiveStats(rows=counts, bytes=path.stat().st_size, duration_ms=(time.perf_counter() - t0) * 1000.0)
+        log.info("History export: %s rows, %d bytes, %.1f ms", sum(counts.values()), stats.bytes, stats.duration_ms)
+        return stats
+
+    def import_from(self, path: Path, progress: ProgressCallback | None = None) -> ArchiveStats:
+        """Load an archive into empty history tables (one transaction; all or nothing)."""
+        t0 = time.perf_counter()
+        self._require_empty()
+        counts: dict[str, int] = {}
+        path = Path(path)
+
+        with open(path, "rb") as f:
+            head = f.read(6)
+            if len(head) != 6 or head[:4] != MAGIC:
+                raise ArchiveFormatError("Not a Lux history archive")
+            if head[4] != FORMAT_VERSION:
+                raise ArchiveFormatError(f"Unsupported archive version {head[4]}")
+            decompress = _decompressor(head[5])
+
+            if self._conn.in_transaction:
+                raise RuntimeError("import_from() needs the connection outside a transaction")
+            table: str | None = None
+            insert_sql = ""
+            ncols = 0
+            keep: list[int] | None = None
+            expected: dict[str, int] | None = None
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.execute("PRAGMA defer_foreign_keys = ON")
+                while True:
+                    frame = self._read_frame(f, decompress)
+                    if frame is None:
+                        break
+                    kind, payload = frame
+                    if kind == _FRAME_TABLE:
+                        meta = json.loads(payload)
+                        table, columns = self._target(meta)
+                        archived = [str(c) for c in meta["columns"]]
+                        ncols = len(archived)
+                        # Archived columns missing from this schema are dropped; new ones take defaults.
+                        have = set(columns)
+                        keep = [i for i, c in enumerate(archived) if c in have]
+                        if len(keep) == ncols:
+                            keep = None
+                        names = [c for c in archived if c in have]
+                        insert_sql = (
+                            f"INSERT INTO {table}({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})"
+                        )
+                        counts.setdefault(table, 0)
+                    elif kind == _FRAME_ROWS:
+                        if table is None:
+                            raise ArchiveFormatError("Rows before table header")
+                        rows = _decode_rows(payload, ncols)
+                        if keep is not None:
+                            rows = [tuple(r[i] for i in keep) for r in rows]
+                        self._conn.executemany(insert_sql, rows)
+                        counts[table] += len(rows)
+                        if progress is not None:
+                            progress(table, counts[table])
+                    elif kind == _FRAME_END:
+                        expected = {str(k): int(v) for k, v in json.loads(payload).get("rows", {}).items()}
+                        break
+                    else:
+                        raise ArchiveFormatError(f"Unknown frame kind {kind}")
+                if expected is None:
+                    raise ArchiveFormatError("Truncated archive (no end frame)")
+                if any(counts.get(t, 0) != n for t, n in expected.items()):
+                    raise ArchiveFormatError(f"Row counts differ from the archive: {counts} != {expected}")
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        stats = ArchiveStats(rows=counts, bytes=path.stat().st_size, duration_ms=(time.perf_counter() - t0) * 1000.0)
+        log.info("History import: %s rows, %.1f ms", sum(counts.values()), stats.duration_ms)
+        return stats
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _columns(self, table: str) -> list[str]:
+        return [str(r[1]) for r in self._conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+    def _target(self, meta: dict) -> tuple[str, list[str]]:
+        table = str(meta.get("table", ""))
+        if table not in {t for t, _ in HISTORY_TABLES}:
+            raise ArchiveFormatError(f"Unknown table in archive: {table!r}")
+        return table, self._columns(table)
+
+    def _require_empty(self) -> None:
+        for table, source in HISTORY_TABLES:
+            if self._conn.execute(f"SELECT 1 FROM {source} LIMIT 1").fetchone() is not None:
+                raise ValueError(f"Import needs an empty planner ({table} has rows)")
+
+    @staticmethod
+    def _write_frame(f: BinaryIO, compress: Callable[[bytes], bytes], kind: int, raw: bytes) -> None:
+        packed = compress(raw)
+        f.write(_FRAME.pack(kind, len(raw), len(packed)))
+        f.write(packed)
+
+    @staticmethod
+    def _read_frame(f: BinaryIO, decompress: Callable[[bytes, int], bytes]) -> tuple[int, bytes] | None:
+        head = f.read(_FRAME.size)
+        if not head:
+            return None
+        if len(head) != _FRAME.size:
+            raise ArchiveFormatError("Truncated frame header")
+        kind, raw_len, packed_len = _FRAME.unpack(head)
+        packed = f.read(packed_len)
+        if len(packed) != packed_len:
+            raise ArchiveFormatError("Truncated frame")
+        try:
+            raw = decompress(packed, raw_len)
+        except _DECOMPRESS_ERRORS as e:
+            raise ArchiveFormatError(f"Corrupt frame: {e}") from e
+        if len(raw) != raw_len:
+            raise ArchiveFormatError("Corrupt frame")
+        return kind, raw
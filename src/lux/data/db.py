@@ -9,7 +9,7 @@ from lux.app.config import app_data_dir
 
 def db_path(app_name: str = "Lux Planner", filename: str = "planner.db") -> Path:
     """
-    Single shared DB for the whole system.
+    DB of the default profile (other profiles: lux.app.profiles).
     """
     return app_data_dir(app_name) / filename
 
@@ -19,6 +19,8 @@ def connect(path: Path | None = None) -> sqlite3.Connection:
     conn = sqlite3.connect(str(p))
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    # Only takes effect on a new (empty) file; see lux.data.maintenance for legacy DBs.
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
     conn.execute("PRAGMA journal_mode = WAL;")
     conn.execute("PRAGMA synchronous = NORMAL;")
     return conn
@@ -85,11 +87,11 @@ def apply_migrations(conn: sqlite3.Connection) -> None:
         conn.commit()
 
 
-def ensure_db_ready() -> sqlite3.Connection:
+def ensure_db_ready(path: Path | None = None) -> sqlite3.Connection:
     """
     Convenience: open connection + run migrations.
     Returns a ready-to-use connection.
     """
-    conn = connect()
+    conn = connect(path)
     apply_migrations(conn)
     return conn
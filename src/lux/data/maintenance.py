@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+log = logging.getLogger(__name__)
+
+OPTIMIZE_EVERY_S = 60 * 60
+CHECKPOINT_MIN_WAL_PAGES = 1000     # ~4 MB at the default page size
+VACUUM_PAGES_PER_SLICE = 256
+VACUUM_MIN_FREE_PAGES = 512
+CONVERT_MAX_PAGES = 25_000          # one-time full VACUUM only below ~100 MB
+
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+@dataclass(frozen=True)
+class MaintenanceReport:
+    task: str          # optimize | checkpoint | incremental_vacuum | convert
+    duration_ms: float
+    detail: str
+
+
+class DbMaintenance:
+    """Idle-time and shutdown maintenance for one connection."""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        clock: Callable[[], float] = time.monotonic,
+        history: int = 50,
+    ) -> None:
+        self._conn = conn
+        self._clock = clock
+        self._last_optimize: float | None = None
+        self._reports: deque[MaintenanceReport] = deque(maxlen=max(1, int(history)))
+
+    def reports(self) -> list[MaintenanceReport]:
+        """Most recent slices, oldest first."""
+        return list(self._reports)
+
+    # -------------------------
+    # Idle
+    # -------------------------
+    def step(self) -> bool:
+        """
+        Run the first due task as one slice; True while more slices are pending.
+        Order: statistics (cheap, hourly), then WAL size, then free pages.
+        """
+        if self._conn.in_transaction:
+            return False
+
+        now = self._clock()
+        if self._last_optimize is None or now - self._last_optimize >= OPTIMIZE_EVERY_S:
+            self.optimize()
+            return True
+        if self._wal_pages() >= CHECKPOINT_MIN_WAL_PAGES:
+            self.checkpoint()
+            return True
+        if self._vacuum_enabled() and self._free_pages() >= VACUUM_MIN_FREE_PAGES:
+            self.incremental_vacuum()
+            return self._free_pages() >= VACUUM_MIN_FREE_PAGES
+        return False
+
+    # -------------------------
+    # Shutdown
+    # -------------------------
+    def run_shutdown(self, deadline_s: float = 2.0) -> None:
+        """
+        Best-effort pass before the connection closes, bounded by deadline_s:
+        statistics, free-page slices, then a TRUNCATE checkpoint so the next
+        launch starts with an empty WAL.
+        """
+        if self._conn.in_transaction:
+            return
+        end = self._clock() + max(0.0, deadline_s)
+        self.optimize()
+        while (
+            self._clock() < end
+            and self._vacuum_enabled()
+            and self._free_pages() >= VACUUM_MIN_FREE_PAGES
+        ):
+            self.incremental_vacuum()
+        if self._clock() < end:
+            self.convert_if_small()
+        self.checkpoint()
+
+    # -------------------------
+    # Slices
+    # -------------------------
+    def optimize(self) -> None:
+        """PRAGMA optimize with a bounded analysis (re-gathers stale statistics only)."""
+        def run() -> str:
+            self._conn.execute("PRAGMA analysis_limit = 400")
+            self._conn.execute("PRAGMA optimize")
+            return "ok"
+
+        self._timed("optimize", run)
+        self._last_optimize = self._clock()
+
+    def checkpoint(self) -> None:
+        """Copy the WAL into the database and truncate it to zero bytes."""
+        def run() -> str:
+            row = self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            busy, log_pages, done = (int(row[0]), int(row[1]), int(row[2])) if row else (0, 0, 0)
+            return f"busy={busy} wal_pages={log_pages} checkpointed={done}"
+
+        self._timed("checkpoint", run)
+
+    def incremental_vacuum(self, pages: int = VACUUM_PAGES_PER_SLICE) -> None:
+        """Release up to `pages` free pages back to the file system."""
+        def run() -> str:
+            before = self._free_pages()
+            # execute() steps this pragma once (one page); executescript() runs it to completion.
+            self._conn.executescript(f"PRAGMA incremental_vacuum({max(1, int(pages))});")
+            return f"freed={before - self._free_pages()} remaining={self._free_pages()}"
+
+        self._timed("incremental_vacuum", run)
+
+    def convert_if_small(self) -> None:
+        """
+        One-time switch of a legacy database to auto_vacuum=INCREMENTAL.
+        Needs a full VACUUM, so it only runs while the file is small.
+        """
+        if self._vacuum_enabled() or self._page_count() > CONVERT_MAX_PAGES:
+            return
+
+        def run() -> str:
+            self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._conn.execute("VACUUM")
+            return f"pages={self._page_count()}"
+
+        self._timed("convert", run)
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _timed(self, task: str, run: Callable[[], str]) -> None:
+        t0 = time.perf_counter()
+        try:
+            detail = run()
+        except sqlite3.Error as e:
+            # Fail-soft: maintenance must never take the app down.
+            detail = f"failed: {e}"
+            log.warning("DB maintenance %s failed: %s", task, e)
+        report = MaintenanceReport(task=task, duration_ms=(time.perf_counter() - t0) * 1000.0, detail=detail)
+        self._reports.append(report)
+        log.info("DB maintenance %s: %.1f ms (%s)", task, report.duration_ms, detail)
+
+    def _pragma_int(self, name: str) -> int:
+        row = self._conn.execute(f"PRAGMA {name}").fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def _free_pages(self) -> int:
+        return self._pragma_int("freelist_count")
+
+    def _page_count(self) -> int:
+        return self._pragma_int("page_count")
+
+    def _vacuum_enabled(self) -> bool:
+        return self._pragma_int("auto_vacuum") == _AUTO_VACUUM_INCREMENTAL
+
+    def _wal_pages(self) -> int:
+        """Current WAL size in pages, from the -wal file size (no checkpoint work)."""
+        row = self._conn.execute("PRAGMA database_list").fetchone()
+        path = str(row[2]) if row and row[2] else ""
+        if not path:
+            return 0  # in-memory database
+        try:
+            size = os.path.getsize(path + "-wal")
+        except OSError:
+            return 0
+        return size // max(1, self._pragma_int("page_size"))
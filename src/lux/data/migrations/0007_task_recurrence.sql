@@ -0,0 +1,30 @@
+-- 0007_task_recurrence.sql
+-- Recurring tasks are stored as a rule on the definition; occurrences are expanded
+-- virtually per queried window and only materialized when an instance is
+-- completed, moved or edited.
+-- A materialized instance records the virtual date it replaces in recur_date
+-- (also acts as the exception that suppresses the virtual instance).
+
+ALTER TABLE task_definitions
+ADD COLUMN recur_rule TEXT NULL;    -- RRULE subset, e.g. FREQ=WEEKLY;BYDAY=MO,WE
+
+ALTER TABLE task_definitions
+ADD COLUMN recur_start TEXT NULL;   -- YYYY-MM-DD (DTSTART)
+
+ALTER TABLE task_definitions
+ADD COLUMN recur_until TEXT NULL;   -- YYYY-MM-DD inclusive, resolved from UNTIL/COUNT
+
+ALTER TABLE task_occurrences
+ADD COLUMN recur_date TEXT NULL;    -- YYYY-MM-DD of the virtual instance this row replaces
+
+CREATE INDEX IF NOT EXISTS idx_task_def_recurring
+ON task_definitions(recur_start)
+WHERE recur_rule IS NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_task_occ_recur_key
+ON task_occurrences(task_id, recur_date)
+WHERE recur_date IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_task_occ_recur_date
+ON task_occurrences(recur_date)
+WHERE recur_date IS NOT NULL;
@@ -0,0 +1,38 @@
+-- 0008_schedule_series.sql
+-- Recurring scheduler series (system-owned, feature-agnostic).
+-- One row per series; instances are expanded per queried range, never stored.
+-- Edited/skipped instances are recorded as exceptions; an edited instance is
+-- materialized as a regular one-off scheduled_entries row (entry_id).
+
+CREATE TABLE IF NOT EXISTS scheduled_series (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_kind TEXT NOT NULL,
+    item_ref TEXT NOT NULL,
+    start_dt TEXT NOT NULL,          -- first instance start (DTSTART)
+    end_dt TEXT NOT NULL,            -- first instance end (duration = end_dt - start_dt)
+    rrule TEXT NOT NULL,             -- RRULE subset (see lux.core.recurrence)
+    until_dt TEXT NULL,              -- end of the last instance; NULL = unbounded
+    title_cache TEXT,
+    notes_cache TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_series_start_dt ON scheduled_series(start_dt);
+CREATE INDEX IF NOT EXISTS idx_scheduled_series_until_dt ON scheduled_series(until_dt);
+
+CREATE TABLE IF NOT EXISTS scheduled_series_exceptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    series_id INTEGER NOT NULL,
+    original_start TEXT NOT NULL,    -- start_dt of the suppressed instance
+    entry_id INTEGER NULL,           -- replacement one-off entry; NULL = skipped
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    FOREIGN KEY(series_id) REFERENCES scheduled_series(id) ON DELETE RESTRICT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_series_exc_key
+ON scheduled_series_exceptions(series_id, original_start);
+
+CREATE INDEX IF NOT EXISTS idx_series_exc_original_start
+ON scheduled_series_exceptions(original_start);
@@ -0,0 +1,8 @@
+-- 0009_task_planning.sql
+-- Planning hints on definitions, used when auto-scheduling tasks into free time.
+
+ALTER TABLE task_definitions
+ADD COLUMN priority INTEGER NOT NULL DEFAULT 0;   -- higher is planned first
+
+ALTER TABLE task_definitions
+ADD COLUMN estimate_min INTEGER NULL;            -- expected duration in minutes
@@ -0,0 +1,15 @@
+-- 0010_undo_log.sql
+-- Persisted undo/redo history (see lux.core.undo).
+-- Bounded ring buffer: rows older than the journal capacity are trimmed on write.
+-- undo_ops/redo_ops are compact JSON arrays of [target, name, args] operations.
+
+CREATE TABLE IF NOT EXISTS undo_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    undo_ops TEXT NOT NULL,
+    redo_ops TEXT NOT NULL,
+    undone INTEGER NOT NULL DEFAULT 0,   -- 1 = currently on the redo side
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_undo_log_undone ON undo_log(undone);
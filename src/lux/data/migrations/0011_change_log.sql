@@ -0,0 +1,105 @@
+-- 0011_change_log.sql
+-- System change feed (see lux.core.events / lux.data.change_feed).
+-- Triggers record every write to tracked tables with the date range it touched
+-- (OLD and NEW combined, so a move covers both sides). NULL bounds mean
+-- "unbounded" (e.g. a title change shows on every occurrence of a task).
+-- Rows are append-only and pruned by sequence number once consumed.
+
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,            -- task_definition | task_occurrence | scheduled_entry | ...
+    entity_id INTEGER NOT NULL,
+    op TEXT NOT NULL,                -- insert | update | delete
+    range_start TEXT NULL,           -- YYYY-MM-DD or YYYY-MM-DD HH:MM:SS
+    range_end TEXT NULL,
+    changed_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- Task definitions: recurring rules touch their rule window; other edits are unbounded.
+CREATE TRIGGER IF NOT EXISTS trg_change_task_def_ins
+AFTER INSERT ON task_definitions
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('task_definition', NEW.id, 'insert', NEW.recur_start, NEW.recur_until);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_task_def_upd
+AFTER UPDATE ON task_definitions
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES (
+        'task_definition', NEW.id, 'update',
+        CASE WHEN NEW.recur_rule IS NOT NULL AND OLD.recur_rule IS NOT NULL
+             THEN min(OLD.recur_start, NEW.recur_start) END,
+        CASE WHEN NEW.recur_rule IS NOT NULL AND OLD.recur_rule IS NOT NULL
+             THEN max(OLD.recur_until, NEW.recur_until) END
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_task_occ_ins
+AFTER INSERT ON task_occurrences
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('task_occurrence', NEW.id, 'insert', NEW.due_date, NEW.due_date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_task_occ_upd
+AFTER UPDATE ON task_occurrences
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('task_occurrence', NEW.id, 'update',
+            min(OLD.due_date, NEW.due_date), max(OLD.due_date, NEW.due_date));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_sched_entry_ins
+AFTER INSERT ON scheduled_entries
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('scheduled_entry', NEW.id, 'insert', NEW.start_dt, NEW.end_dt);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_sched_entry_upd
+AFTER UPDATE ON scheduled_entries
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('scheduled_entry', NEW.id, 'update',
+            min(OLD.start_dt, NEW.start_dt), max(OLD.end_dt, NEW.end_dt));
+END;
+
+-- Series: until_dt NULL = unbounded series.
+CREATE TRIGGER IF NOT EXISTS trg_change_sched_series_ins
+AFTER INSERT ON scheduled_series
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('scheduled_series', NEW.id, 'insert', NEW.start_dt, NEW.until_dt);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_sched_series_upd
+AFTER UPDATE ON scheduled_series
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('scheduled_series', NEW.id, 'update',
+            min(OLD.start_dt, NEW.start_dt), max(OLD.until_dt, NEW.until_dt));
+END;
+
+-- Exceptions hide one instance (original_start); deletes come from undo.
+CREATE TRIGGER IF NOT EXISTS trg_change_series_exc_ins
+AFTER INSERT ON scheduled_series_exceptions
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('series_exception', NEW.series_id, 'insert', NEW.original_start, NEW.original_start);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_series_exc_upd
+AFTER UPDATE ON scheduled_series_exceptions
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('series_exception', NEW.series_id, 'update', NEW.original_start, NEW.original_start);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_change_series_exc_del
+AFTER DELETE ON scheduled_series_exceptions
+BEGIN
+    INSERT INTO change_log(entity, entity_id, op, range_start, range_end)
+    VALUES ('series_exception', OLD.series_id, 'delete', OLD.original_start, OLD.original_start);
+END;
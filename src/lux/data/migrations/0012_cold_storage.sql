@@ -0,0 +1,79 @@
+-- 0012_cold_storage.sql
+-- Cold storage for old and archived rows (see lux.data.cold_storage).
+-- Rows are moved (never dropped) from the hot tables into *_history tables in
+-- small background batches; ids are kept, AUTOINCREMENT prevents reuse.
+-- *_all views union both sides for history-aware reads. cold_storage_state
+-- holds the horizon below which active rows may live in history; range reads
+-- starting at or after it only touch the hot table.
+
+CREATE TABLE IF NOT EXISTS task_occurrences_history (
+    id INTEGER PRIMARY KEY,
+    task_id INTEGER NOT NULL,
+    due_date TEXT NOT NULL,
+    due_time TEXT NULL,
+    sort_key INTEGER NOT NULL DEFAULT 0,
+    completed_at TEXT NULL,
+    archived INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    archived_at TEXT NULL,
+    recur_date TEXT NULL,
+    moved_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_task_occ_hist_due_date ON task_occurrences_history(due_date);
+CREATE INDEX IF NOT EXISTS idx_task_occ_hist_recur
+ON task_occurrences_history(task_id, recur_date)
+WHERE recur_date IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_task_occ_hist_recur_date
+ON task_occurrences_history(recur_date)
+WHERE recur_date IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS scheduled_entries_history (
+    id INTEGER PRIMARY KEY,
+    item_kind TEXT NOT NULL,
+    item_ref TEXT NOT NULL,
+    start_dt TEXT NOT NULL,
+    end_dt TEXT NOT NULL,
+    title_cache TEXT,
+    notes_cache TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    moved_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_sched_hist_start_dt ON scheduled_entries_history(start_dt);
+CREATE INDEX IF NOT EXISTS idx_sched_hist_end_dt ON scheduled_entries_history(end_dt);
+
+CREATE VIEW IF NOT EXISTS task_occurrences_all AS
+    SELECT id, task_id, due_date, due_time, sort_key, completed_at, archived,
+           created_at, updated_at, archived_at, recur_date
+      FROM task_occurrences
+    UNION ALL
+    SELECT id, task_id, due_date, due_time, sort_key, completed_at, archived,
+           created_at, updated_at, archived_at, recur_date
+      FROM task_occurrences_history;
+
+CREATE VIEW IF NOT EXISTS scheduled_entries_all AS
+    SELECT id, item_kind, item_ref, start_dt, end_dt, title_cache, notes_cache,
+           archived, created_at, updated_at
+      FROM scheduled_entries
+    UNION ALL
+    SELECT id, item_kind, item_ref, start_dt, end_dt, title_cache, notes_cache,
+           archived, created_at, updated_at
+      FROM scheduled_entries_history;
+
+CREATE TABLE IF NOT EXISTS cold_storage_state (
+    name TEXT PRIMARY KEY,           -- hot table name
+    horizon TEXT NOT NULL            -- active rows before this may be in history
+);
+
+-- Candidate scans for the mover (archived rows past the undo grace period).
+CREATE INDEX IF NOT EXISTS idx_task_occ_archived_updated
+ON task_occurrences(updated_at)
+WHERE archived = 1;
+
+CREATE INDEX IF NOT EXISTS idx_sched_entries_archived_updated
+ON scheduled_entries(updated_at)
+WHERE archived = 1;
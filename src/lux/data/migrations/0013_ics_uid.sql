@@ -0,0 +1,17 @@
+-- 0013_ics_uid.sql
+-- Imported iCalendar items (item_kind = 'ics') are keyed by item_ref:
+--   scheduled_series.item_ref   = UID of a recurring VEVENT
+--   scheduled_entries.item_ref  = UID of a one-off VEVENT, or
+--                                 UID + '#' + RECURRENCE-ID for an edited instance
+-- Partial unique indexes make re-imports upserts (dedupe on UID) without
+-- constraining other item kinds.
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduled_entries_ics_ref
+ON scheduled_entries(item_ref) WHERE item_kind = 'ics';
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduled_series_ics_ref
+ON scheduled_series(item_ref) WHERE item_kind = 'ics';
+
+-- Moved (cold) entries are looked up too, so a re-import does not revive them.
+CREATE INDEX IF NOT EXISTS idx_scheduled_entries_history_ics_ref
+ON scheduled_entries_history(item_ref) WHERE item_kind = 'ics';
@@ -0,0 +1,77 @@
+-- 0014_sync.sql
+-- Sync between planner databases (see lux.data.sync).
+-- sync_ids gives every synced row a stable uid; local ids differ per database.
+-- Uids are assigned on insert (trigger), so a copied file shares the uids of
+-- the rows it was copied with and new rows on either side never collide.
+-- src_peer/src_stamp remember where the current version of a row came from, so
+-- it is not sent straight back to that peer.
+-- sync_peers holds the change_log marks exchanged with each peer:
+--   sent_seq = own changes up to here were acknowledged by the peer
+--   recv_seq = the peer's changes up to here were applied here
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+INSERT OR IGNORE INTO sync_state(key, value) VALUES ('site_id', lower(hex(randomblob(16))));
+
+CREATE TABLE IF NOT EXISTS sync_peers (
+    peer_id TEXT PRIMARY KEY,
+    sent_seq INTEGER NOT NULL DEFAULT 0,
+    recv_seq INTEGER NOT NULL DEFAULT 0,
+    synced_at TEXT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sync_ids (
+    entity TEXT NOT NULL,            -- change_log entity name
+    local_id INTEGER NOT NULL,
+    uid TEXT NOT NULL,
+    src_peer TEXT NULL,
+    src_stamp TEXT NULL,             -- updated_at of the version received from src_peer
+    PRIMARY KEY(entity, local_id)
+) WITHOUT ROWID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_ids_uid ON sync_ids(entity, uid);
+
+-- Backfill existing rows (hot and cold).
+INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+SELECT 'task_definition', id, lower(hex(randomblob(16))) FROM task_definitions;
+
+INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+SELECT 'task_occurrence', id, lower(hex(randomblob(16))) FROM task_occurrences_all;
+
+INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+SELECT 'scheduled_series', id, lower(hex(randomblob(16))) FROM scheduled_series;
+
+INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+SELECT 'scheduled_entry', id, lower(hex(randomblob(16))) FROM scheduled_entries_all;
+
+-- OR IGNORE: thawing a cold row re-inserts it into the hot table with its id.
+CREATE TRIGGER IF NOT EXISTS trg_sync_task_def_ins
+AFTER INSERT ON task_definitions
+BEGIN
+    INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+    VALUES ('task_definition', NEW.id, lower(hex(randomblob(16))));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_task_occ_ins
+AFTER INSERT ON task_occurrences
+BEGIN
+    INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+    VALUES ('task_occurrence', NEW.id, lower(hex(randomblob(16))));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_sched_series_ins
+AFTER INSERT ON scheduled_series
+BEGIN
+    INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+    VALUES ('scheduled_series', NEW.id, lower(hex(randomblob(16))));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_sched_entry_ins
+AFTER INSERT ON scheduled_entries
+BEGIN
+    INSERT OR IGNORE INTO sync_ids(entity, local_id, uid)
+    VALUES ('scheduled_entry', NEW.id, lower(hex(randomblob(16))));
+END;
@@ -0,0 +1,32 @@
+-- 0015_sync_exception_src.sql
+-- Series exceptions have no updated_at, so sync_ids.src_peer/src_stamp cannot
+-- tell a received exception from a local edit. sync_exception_src remembers
+-- which peer the current state of an exception key (row or deletion) came
+-- from; any local write to the key clears it, so only local changes are sent
+-- back to that peer (see lux.data.sync).
+
+CREATE TABLE IF NOT EXISTS sync_exception_src (
+    series_id INTEGER NOT NULL,
+    original_start TEXT NOT NULL,
+    src_peer TEXT NOT NULL,
+    PRIMARY KEY(series_id, original_start)
+) WITHOUT ROWID;
+
+-- apply_changeset writes the exception first, then records the source.
+CREATE TRIGGER IF NOT EXISTS trg_sync_series_exc_ins
+AFTER INSERT ON scheduled_series_exceptions
+BEGIN
+    DELETE FROM sync_exception_src WHERE series_id = NEW.series_id AND original_start = NEW.original_start;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_series_exc_upd
+AFTER UPDATE ON scheduled_series_exceptions
+BEGIN
+    DELETE FROM sync_exception_src WHERE series_id = NEW.series_id AND original_start = NEW.original_start;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sync_series_exc_del
+AFTER DELETE ON scheduled_series_exceptions
+BEGIN
+    DELETE FROM sync_exception_src WHERE series_id = OLD.series_id AND original_start = OLD.original_start;
+END;
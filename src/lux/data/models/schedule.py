@@ -17,6 +17,37 @@ class ScheduledEntryRow:
     archived: bool
     created_at: str
     updated_at: str
+    series_id: Optional[int] = None  # set for instances expanded from a recurring series
+
+
+@dataclass(frozen=True)
+class ScheduledSeriesRow:
+    id: int
+    item_kind: str
+    item_ref: str
+    start_dt: str
+    end_dt: str
+    rrule: str
+    until_dt: Optional[str]
+    title_cache: Optional[str]
+    notes_cache: Optional[str]
+    archived: bool
+    created_at: str
+    updated_at: str
+
+
+@dataclass(frozen=True)
+class ScheduledDaySummary:
+    """Per-day aggregate for month views (no entry rows)."""
+    day: str                  # YYYY-MM-DD
+    count: int
+    hours: tuple[int, ...]    # 24 buckets: entries starting in each hour
+
+    @property
+    def busiest_hour(self) -> Optional[int]:
+        if not self.count:
+            return None
+        return max(range(24), key=lambda h: (self.hours[h], -h))
 
 
 def bool_from_int(v: object) -> bool:
@@ -14,6 +14,11 @@ class TaskDefinitionRow:
     archived: bool
     created_at: str
     updated_at: str
+    recur_rule: Optional[str] = None    # RRULE subset; None for one-off tasks
+    recur_start: Optional[str] = None   # YYYY-MM-DD
+    recur_until: Optional[str] = None   # YYYY-MM-DD inclusive
+    priority: int = 0
+    estimate_min: Optional[int] = None  # planning duration hint (minutes)
 
 
 @dataclass(frozen=True)
@@ -27,6 +32,7 @@ class TaskOccurrenceRow:
     archived: bool
     created_at: str
     updated_at: str
+    recur_date: Optional[str] = None  # virtual instance date this row materializes
 
 
 @dataclass(frozen=True)
@@ -45,6 +51,9 @@ class TaskOccurrenceJoinedRow:
     archived: bool
     created_at: str
     updated_at: str
+    recur_date: Optional[str] = None
+    priority: int = 0
+    estimate_min: Optional[int] = None
 
 
 def bool_from_int(v: object) -> bool:
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+from lux.core.instrumentation import Histogram
+
+log = logging.getLogger(__name__)
+
+PROFILE_FORMAT = 1
+
+SLOW_QUERY_MS = 25.0
+MAX_STATEMENTS = 500
+MAX_SHAPES = 8             # distinct parameter shapes kept per statement
+SLOW_LOGS_PER_STATEMENT = 5
+
+OTHER_STATEMENTS = "<other statements>"
+
+_PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def normalize_sql(sql: str) -> str:
+    return _PARAM_LIST_RE.sub("?, …", " ".join(sql.split()))
+
+
+def param_shape(params: Any) -> str:
+    """Types, not values: "(str, int×3)" or "{day: str}" (values may be personal data)."""
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in sorted(params.items())) + "}"
+    try:
+        names = [type(v).__name__ for v in params]
+    except TypeError:
+        return type(params).__name__
+    runs: list[str] = []
+    i = 0
+    while i < len(names):
+        j = i
+        while j < len(names) and names[j] == names[i]:
+            j += 1
+        runs.append(names[i] if j - i == 1 else f"{names[i]}×{j - i}")
+        i = j
+    return "(" + ", ".join(runs) + ")"
+
+
+@dataclass(frozen=True)
+class StatementStats:
+    sql: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    rows: int
+    slow: int
+    param_shapes: dict[str, int]
+    plan: list[str] | None     # EXPLAIN QUERY PLAN of the first slow execution
+
+
+class _Entry:
+    __slots__ = ("sql", "hist", "rows", "slow", "shapes", "plan")
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+        self.hist = Histogram()
+        self.rows = 0
+        self.slow = 0
+        self.shapes: dict[str, int] = {}
+        self.plan: list[str] | None = None
+
+    def stats(self) -> StatementStats:
+        h = self.hist
+        return StatementStats(
+            sql=self.sql,
+            calls=h.count,
+            total_ms=h.total_ms,
+            mean_ms=h.total_ms / h.count if h.count else 0.0,
+            p50_ms=h.percentile(0.50),
+            p95_ms=h.percentile(0.95),
+            max_ms=h.max_ms,
+            rows=self.rows,
+            slow=self.slow,
+            param_shapes=dict(sorted(self.shapes.items(), key=lambda kv: -kv[1])),
+            plan=self.plan,
+        )
+
+
+class SqlProfiler:
+    """Aggregates statement timings for connections wrapped with wrap()."""
+
+    def __init__(self, slow_ms: float = SLOW_QUERY_MS, enabled: bool = False) -> None:
+        self.slow_ms = float(slow_ms)
+        self.enabled = bool(enabled)
+        self._entries: dict[str, _Entry] = {}   # normalized text -> entry
+        self._by_text: dict[str, _Entry] = {}   # raw text -> entry (skips normalizing)
+
+    def wrap(self, conn: sqlite3.Connection) -> ProfiledConnection:
+        return ProfiledConnection(conn, self)
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self._by_text.clear()
+
+    def stats(self) -> list[StatementStats]:
+        """Per-statement aggregates, most total time first."""
+        return sorted((e.stats() for e in self._entries.values()), key=lambda s: s.total_ms, reverse=True)
+
+    def export(self, path: Path) -> int:
+        """Write the aggregate as JSON; returns the number of statements written."""
+        stats = self.stats()
+        doc = {
+            "format": PROFILE_FORMAT,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "sqlite": sqlite3.sqlite_version,
+            "slow_ms": self.slow_ms,
+            "statements": [asdict(s) for s in stats],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(doc, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        tmp.replace(path)
+        return len(stats)
+
+    # -------------------------
+    # Recording (called by the wrappers)
+    # -------------------------
+    def _entry(self, sql: str) -> _Entry:
+        e = self._by_text.get(sql)
+        if e is not None:
+            return e
+        key = normalize_sql(sql)
+        e = self._entries.get(key)
+        if e is None:
+            if len(self._entries) >= MAX_STATEMENTS:
+                key = OTHER_STATEMENTS
+                e = self._entries.get(key)
+            if e is None:
+                e = self._entries[key] = _Entry(key)
+        if len(self._by_text) < 4 * MAX_STATEMENTS:
+            self._by_text[sql] = e
+        return e
+
+    def _finish(self, conn: sqlite3.Connection, e: _Entry, sql: str, params: Any, ms: float, rows: int) -> None:
+        try:
+            e.hist.record(ms)
+            e.rows += rows
+            shape = param_shape(params) if params is not None else "executemany"
+            if shape in e.shapes or len(e.shapes) < MAX_SHAPES:
+                e.shapes[shape] = e.shapes.get(shape, 0) + 1
+            if ms < self.slow_ms:
+                return
+            e.slow += 1
+            if e.slow > SLOW_LOGS_PER_STATEMENT:
+                return
+            if e.plan is None and params is not None:
+                e.plan = explain(conn, sql, params)
+            log.warning(
+                "Slow query %.1f ms, %d rows, params %s: %s\n%s",
+                ms, rows, shape, e.sql, "\n".join(e.plan or ["(no plan)"]),
+            )
+        except Exception:
+            log.debug("SQL profiling bookkeeping failed", exc_info=True)
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: Any = ()) -> list[str]:
+    """EXPLAIN QUERY PLAN as indented lines (one note line if it fails)."""
+    try:
+        rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    except sqlite3.Error as e:
+        return [f"(explain failed: {e})"]
+    depth: dict[int, int] = {}
+    lines: list[str] = []
+    for r in rows:
+        node, parent, detail = int(r[0]), int(r[1]), str(r[3])
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return lines
+
+
+# -------------------------
+# Wrappers
+# -------------------------
+class ProfiledCursor:
+    """Cursor stand-in; the execution is recorded once all rows are read (or the cursor is dropped)."""
+
+    __slots__ = ("_cur", "_conn", "_profiler", "_entry", "_sql", "_params", "_ms", "_rows", "_done")
+
+    def __init__(
+        self,
+        cur: sqlite3.Cursor,
+        conn: sqlite3.Connection,
+        profiler: SqlProfiler,
+        entry: _Entry,
+        sql: str,
+        params: Any,
+        ms: float,
+    ) -> None:
+        self._cur = cur
+        self._conn = conn
+        self._profiler = profiler
+        self._entry = entry
+        self._sql = sql
+        self._params = params
+        self._ms = ms
+        self._rows = 0
+        self._done = False
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._cur, name)
+
+    def _finish(self) -> None:
+        if not self._done:
+            self._done = True
+            self._profiler._finish(self._conn, self._entry, self._sql, self._params, self._ms, self._rows)
+
+    def __del__(self) -> None:
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def fetchone(self) -> Any:
+        t0 = time.perf_counter_ns()
+        row = self._cur.fetchone()
+        self._ms += (time.perf_counter_ns() - t0) / 1e6
+        if row is not None:
+            self._rows += 1
+        self._finish()  # callers read one row and drop the cursor
+        return row
+
+    def fetchall(self) -> list[Any]:
+        t0 = time.perf_counter_ns()
+        rows = self._cur.fetchall()
+        self._ms += (time.perf_counter_ns() - t0) / 1e6
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        n = self._cur.arraysize if size is None else size
+        t0 = time.perf_counter_ns()
+        rows = self._cur.fetchmany(n)
+        self._ms += (time.perf_counter_ns() - t0) / 1e6
+        self._rows += len(rows)
+        if len(rows) < n:
+            self._finish()
+        return rows
+
+    def __iter__(self) -> ProfiledCursor:
+        return self
+
+    def __next__(self) -> Any:
+        t0 = time.perf_counter_ns()
+        try:
+            row = next(self._cur)
+        except StopIteration:
+            self._ms += (time.perf_counter_ns() - t0) / 1e6
+            self._finish()
+            raise
+        self._ms += (time.perf_counter_ns() - t0) / 1e6
+        self._rows += 1
+        return row
+
+
+class ProfiledConnection:
+    """sqlite3.Connection stand-in for repositories; everything but execute/executemany passes through."""
+
+    __slots__ = ("_conn", "_profiler")
+
+    def __init__(self, conn: sqlite3.Connection, profiler: SqlProfiler) -> None:
+        self._conn = conn
+        self._profiler = profiler
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._conn, name)
+
+    def execute(self, sql: str, params: Any = ()) -> Any:
+        p = self._profiler
+        if not p.enabled:
+            return self._conn.execute(sql, params)
+        t0 = time.perf_counter_ns()
+        cur = self._conn.execute(sql, params)
+        ms = (time.perf_counter_ns() - t0) / 1e6
+        pc = ProfiledCursor(cur, self._conn, p, p._entry(sql), sql, params, ms)
+        if cur.description is None:
+            pc._rows = max(0, cur.rowcount)  # write: rows affected; nothing to fetch
+            pc._finish()
+        return pc
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Any]) -> sqlite3.Cursor:
+        p = self._profiler
+        if not p.enabled:
+            return self._conn.executemany(sql, seq_of_params)
+        t0 = time.perf_counter_ns()
+        cur = self._conn.executemany(sql, seq_of_params)
+        ms = (time.perf_counter_ns() - t0) / 1e6
+        p._finish(self._conn, p._entry(sql), sql, None, ms, max(0, cur.rowcount))
+        return cur
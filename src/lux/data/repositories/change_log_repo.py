@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sqlite3
+
+from lux.core.events import ChangeEvent
+
+
+class ChangeLogRepo:
+    """DB-only access for change_log (rows are written by triggers, never by code)."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def max_seq(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(MAX(seq), 0) AS s FROM change_log").fetchone()
+        return int(row["s"]) if row else 0
+
+    def read_since(self, seq: int, limit: int = 5000) -> list[ChangeEvent]:
+        """Events with seq > `seq` in order (PK range scan)."""
+        rows = self._conn.execute(
+            """
+            SELECT seq, entity, entity_id, op, range_start, range_end
+              FROM change_log
+             WHERE seq > ?
+             ORDER BY seq ASC
+             LIMIT ?
+            """,
+            (int(seq), max(1, int(limit))),
+        ).fetchall()
+        return [
+            ChangeEvent(
+                seq=int(r["seq"]),
+                entity=str(r["entity"]),
+                entity_id=int(r["entity_id"]),
+                op=str(r["op"]),
+                start=r["range_start"],
+                end=r["range_end"],
+            )
+            for r in rows
+        ]
+
+    def prune(self, upto_seq: int) -> None:
+        """Drop consumed rows with seq <= upto_seq (bookkeeping, not user data)."""
+        owned = not self._conn.in_transaction
+        self._conn.execute("DELETE FROM change_log WHERE seq <= ?", (int(upto_seq),))
+        if owned:
+            self._conn.commit()
@@ -1,16 +1,71 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
-from lux.data.models.schedule import ScheduledEntryRow, bool_from_int, now_sqlite
+from lux.core.instrumentation import instrument_methods
+from lux.data.cold_storage import needs_history, thaw
+from lux.data.models.schedule import ScheduledEntryRow, ScheduledSeriesRow, bool_from_int, now_sqlite
 
 
+@instrument_methods("repo.schedule", query=True)
 class ScheduledEntryRepo:
-    """DB-only access for scheduled_entries (no business logic)."""
+    """DB-only access for scheduled_entries and scheduled_series (no business logic)."""
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    def __init__(self, conn: sqlite3.Connection, on_commit: Callable[[], None] | None = None) -> None:
         self._conn = conn
+        self._tx_depth = 0
+        self._on_commit = on_commit  # e.g. ChangeFeed.pump
+
+    # -------------------------
+    # Transactions
+    # -------------------------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into one commit (nestable).
+        Inside a transaction, per-method commits are deferred to the outermost exit.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        except Exception:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.rollback()
+            raise
+        self._tx_depth -= 1
+        if self._tx_depth == 0:
+            self._conn.commit()
+            self._committed()
+
+    def _commit(self) -> None:
+        if self._tx_depth == 0:
+            self._conn.commit()
+            self._committed()
+
+    def _committed(self) -> None:
+        if self._on_commit is not None:
+            self._on_commit()
+
+    # -------------------------
+    # Cold storage
+    # -------------------------
+    def _entry_source(self, start_dt: str, include_archived: bool) -> str:
+        """
+        Hot table for day-to-day ranges; the history union only when the range
+        starts below the cold-storage horizon or archived rows are requested.
+        """
+        if include_archived or needs_history(self._conn, "scheduled_entries", start_dt):
+            return "scheduled_entries_all"
+        return "scheduled_entries"
+
+    def _write_entry(self, sql: str, params: tuple) -> None:
+        """UPDATE one entry by id (last param); thaws it from cold storage if needed."""
+        cur = self._conn.execute(sql, params)
+        if cur.rowcount == 0 and thaw(self._conn, "scheduled_entries", int(params[-1])):
+            self._conn.execute(sql, params)
 
     def create(self, entry_data: dict[str, Any]) -> int:
         created = now_sqlite()
@@ -42,11 +97,11 @@ class ScheduledEntryRepo:
                 updated,
             ),
         )
-        self._conn.commit()
+        self._commit()
         return int(cur.lastrowid)
 
     def update_time(self, entry_id: int, new_start: str, new_end: str) -> None:
-        self._conn.execute(
+        self._write_entry(
             """
             UPDATE scheduled_entries
                SET start_dt = ?,
@@ -56,10 +111,10 @@ class ScheduledEntryRepo:
             """,
             (new_start, new_end, now_sqlite(), entry_id),
         )
-        self._conn.commit()
+        self._commit()
 
     def archive(self, entry_id: int) -> None:
-        self._conn.execute(
+        self._write_entry(
             """
             UPDATE scheduled_entries
                SET archived = 1,
@@ -68,7 +123,27 @@ class ScheduledEntryRepo:
             """,
             (now_sqlite(), entry_id),
         )
-        self._conn.commit()
+        self._commit()
+
+    def set_archived(self, entry_id: int, archived: bool) -> None:
+        """Archive or restore an entry (restore is used by undo only)."""
+        self._write_entry(
+            """
+            UPDATE scheduled_entries
+               SET archived = ?,
+                   updated_at = ?
+             WHERE id = ?
+            """,
+            (1 if archived else 0, now_sqlite(), int(entry_id)),
+        )
+        self._commit()
+
+    def get(self, entry_id: int) -> ScheduledEntryRow | None:
+        row = self._conn.execute(
+            "SELECT * FROM scheduled_entries_all WHERE id = ?",
+            (int(entry_id),),
+        ).fetchone()
+        return _entry_from_row(row) if row else None
 
     def list_for_range(
         self,
@@ -78,6 +153,7 @@ class ScheduledEntryRepo:
         limit: int = 200,
     ) -> list[ScheduledEntryRow]:
         where_archived = "" if include_archived else "AND archived = 0"
+        src = self._entry_source(start_dt, include_archived)
         cur = self._conn.execute(
             f"""
             SELECT
@@ -91,7 +167,7 @@ class ScheduledEntryRepo:
                 archived,
                 created_at,
                 updated_at
-              FROM scheduled_entries
+              FROM {src}
              WHERE start_dt < ?
                AND end_dt > ?
                {where_archived}
@@ -100,22 +176,302 @@ class ScheduledEntryRepo:
             """,
             (end_dt, start_dt, limit),
         )
-        rows = cur.fetchall()
-
-        out: list[ScheduledEntryRow] = []
-        for r in rows:
-            out.append(
-                ScheduledEntryRow(
-                    id=int(r["id"]),
-                    item_kind=str(r["item_kind"]),
-                    item_ref=str(r["item_ref"]),
-                    start_dt=str(r["start_dt"]),
-                    end_dt=str(r["end_dt"]),
-                    title_cache=r["title_cache"],
-                    notes_cache=r["notes_cache"],
-                    archived=bool_from_int(r["archived"]),
-                    created_at=str(r["created_at"]),
-                    updated_at=str(r["updated_at"]),
-                )
+        return [_entry_from_row(r) for r in cur.fetchall()]
+
+    def day_hour_counts(self, start_dt: str, end_dt: str) -> list[tuple[str, int, int]]:
+        """
+        (day, hour, count) for active entries starting in [start_dt, end_dt).
+        Aggregated in SQL (GROUP BY date(start_dt)) so month views never load rows.
+        """
+        src = self._entry_source(start_dt, include_archived=False)
+        cur = self._conn.execute(
+            f"""
+            SELECT date(start_dt) AS day,
+                   CAST(strftime('%H', start_dt) AS INTEGER) AS hour,
+                   COUNT(*) AS n
+              FROM {src}
+             WHERE start_dt >= ?
+               AND start_dt < ?
+               AND archived = 0
+             GROUP BY date(start_dt), hour
+            """,
+            (start_dt, end_dt),
+        )
+        return [(str(r["day"]), int(r["hour"] or 0), int(r["n"])) for r in cur.fetchall()]
+
+    # -------------------------
+    # Recurring series
+    # -------------------------
+    def create_series(self, series_data: dict[str, Any]) -> int:
+        created = now_sqlite()
+        cur = self._conn.execute(
+            """
+            INSERT INTO scheduled_series(
+                item_kind,
+                item_ref,
+                start_dt,
+                end_dt,
+                rrule,
+                until_dt,
+                title_cache,
+                notes_cache,
+                archived,
+                created_at,
+                updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
+            """,
+            (
+                series_data["item_kind"],
+                series_data["item_ref"],
+                series_data["start_dt"],
+                series_data["end_dt"],
+                series_data["rrule"],
+                series_data.get("until_dt"),
+                series_data.get("title_cache"),
+                series_data.get("notes_cache"),
+                created,
+                created,
+            ),
+        )
+        self._commit()
+        return int(cur.lastrowid)
+
+    def get_series(self, series_id: int) -> ScheduledSeriesRow | None:
+        row = self._conn.execute(
+            "SELECT * FROM scheduled_series WHERE id = ?",
+            (int(series_id),),
+        ).fetchone()
+        return _series_from_row(row) if row else None
+
+    def archive_series(self, series_id: int) -> None:
+        self.set_series_archived(series_id, True)
+
+    def set_series_archived(self, series_id: int, archived: bool) -> None:
+        self._conn.execute(
+            """
+            UPDATE scheduled_series
+               SET archived = ?,
+                   updated_at = ?
+             WHERE id = ?
+            """,
+            (1 if archived else 0, now_sqlite(), int(series_id)),
+        )
+        self._commit()
+
+    def list_series_for_range(self, start_dt: str, end_dt: str) -> list[ScheduledSeriesRow]:
+        """Active series that may have instances overlapping [start_dt, end_dt)."""
+        cur = self._conn.execute(
+            """
+            SELECT *
+              FROM scheduled_series
+             WHERE archived = 0
+               AND start_dt < ?
+               AND (until_dt IS NULL OR until_dt > ?)
+             ORDER BY id ASC
+            """,
+            (end_dt, start_dt),
+        )
+        return [_series_from_row(r) for r in cur.fetchall()]
+
+    def add_series_exception(self, series_id: int, original_start: str, entry_id: int | None = None) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO scheduled_series_exceptions(series_id, original_start, entry_id, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(series_id, original_start) DO UPDATE SET entry_id = excluded.entry_id
+            """,
+            (int(series_id), original_start, entry_id, now_sqlite()),
+        )
+        self._commit()
+
+    def get_series_exception(self, series_id: int, original_start: str) -> tuple[bool, int | None]:
+        """(exists, replacement entry_id) for one instance key."""
+        row = self._conn.execute(
+            """
+            SELECT entry_id
+              FROM scheduled_series_exceptions
+             WHERE series_id = ? AND original_start = ?
+            """,
+            (int(series_id), original_start),
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, (int(row["entry_id"]) if row["entry_id"] is not None else None)
+
+    def remove_series_exception(self, series_id: int, original_start: str) -> None:
+        """
+        Drop an instance exception so the expanded instance shows again.
+        Exceptions are expansion bookkeeping, not user data; used by undo only.
+        """
+        self._conn.execute(
+            "DELETE FROM scheduled_series_exceptions WHERE series_id = ? AND original_start = ?",
+            (int(series_id), original_start),
+        )
+        self._commit()
+
+    def list_series_exceptions(self, start_dt: str, end_dt: str) -> set[tuple[int, str]]:
+        """(series_id, original_start) keys with original_start in [start_dt, end_dt)."""
+        cur = self._conn.execute(
+            """
+            SELECT series_id, original_start
+              FROM scheduled_series_exceptions
+             WHERE original_start >= ?
+               AND original_start < ?
+            """,
+            (start_dt, end_dt),
+        )
+        return {(int(r["series_id"]), str(r["original_start"])) for r in cur.fetchall()}
+
+
+    # -------------------------
+    # Bulk upserts by item_ref (external calendars; see migration 0013)
+    # -------------------------
+    def upsert_entries_by_ref(self, kind: str, rows: list[tuple]) -> None:
+        """
+        rows: (item_ref, start_dt, end_dt, title_cache, notes_cache, archived).
+        Unchanged rows are left untouched (no updated_at bump, no change-log row).
+        Commits unless inside transaction().
+        """
+        now = now_sqlite()
+        self._conn.executemany(
+            """
+            INSERT INTO scheduled_entries(
+                item_kind, item_ref, start_dt, end_dt, title_cache, notes_cache, archived, created_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(item_ref) WHERE item_kind = 'ics' DO UPDATE SET
+                start_dt = excluded.start_dt,
+                end_dt = excluded.end_dt,
+                title_cache = excluded.title_cache,
+                notes_cache = excluded.notes_cache,
+                archived = excluded.archived,
+                updated_at = excluded.updated_at
+             WHERE scheduled_entries.start_dt IS NOT excluded.start_dt
+                OR scheduled_entries.end_dt IS NOT excluded.end_dt
+                OR scheduled_entries.title_cache IS NOT excluded.title_cache
+                OR scheduled_entries.notes_cache IS NOT excluded.notes_cache
+                OR scheduled_entries.archived IS NOT excluded.archived
+            """,
+            [(kind, *r, now, now) for r in rows],
+        )
+        self._commit()
+
+    def upsert_series_by_ref(self, kind: str, rows: list[tuple]) -> None:
+        """rows: (item_ref, start_dt, end_dt, rrule, until_dt, title_cache, notes_cache, archived)."""
+        now = now_sqlite()
+        self._conn.executemany(
+            """
+            INSERT INTO scheduled_series(
+                item_kind, item_ref, start_dt, end_dt, rrule, until_dt, title_cache, notes_cache, archived,
+                created_at, updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(item_ref) WHERE item_kind = 'ics' DO UPDATE SET
+                start_dt = excluded.start_dt,
+                end_dt = excluded.end_dt,
+                rrule = excluded.rrule,
+                until_dt = excluded.until_dt,
+                title_cache = excluded.title_cache,
+                notes_cache = excluded.notes_cache,
+                archived = excluded.archived,
+                updated_at = excluded.updated_at
+             WHERE scheduled_series.start_dt IS NOT excluded.start_dt
+                OR scheduled_series.end_dt IS NOT excluded.end_dt
+                OR scheduled_series.rrule IS NOT excluded.rrule
+                OR scheduled_series.until_dt IS NOT excluded.until_dt
+                OR scheduled_series.title_cache IS NOT excluded.title_cache
+                OR scheduled_series.notes_cache IS NOT excluded.notes_cache
+                OR scheduled_series.archived IS NOT excluded.archived
+            """,
+            [(kind, *r, now, now) for r in rows],
+        )
+        self._commit()
+
+    def entry_ids_by_ref(self, kind: str, refs: list[str], history: bool = False) -> dict[str, int]:
+        """item_ref -> id for existing entries (hot table, or cold storage if `history`)."""
+        table = "scheduled_entries_history" if history else "scheduled_entries"
+        return self._ids_by_ref(table, kind, refs)
+
+    def series_ids_by_ref(self, kind: str, refs: list[str]) -> dict[str, int]:
+        return self._ids_by_ref("scheduled_series", kind, refs)
+
+    def _ids_by_ref(self, table: str, kind: str, refs: list[str]) -> dict[str, int]:
+        out: dict[str, int] = {}
+        # Stay under SQLite's host-parameter limit.
+        for i in range(0, len(refs), 500):
+            part = refs[i : i + 500]
+            marks = ",".join("?" for _ in part)
+            cur = self._conn.execute(
+                f"SELECT item_ref, id FROM {table} WHERE item_kind = ? AND item_ref IN ({marks})",
+                (kind, *part),
             )
+            out.update({str(r["item_ref"]): int(r["id"]) for r in cur.fetchall()})
         return out
+
+    def add_series_exceptions(self, rows: list[tuple[int, str, int | None]]) -> None:
+        """Bulk add_series_exception: (series_id, original_start, entry_id)."""
+        now = now_sqlite()
+        self._conn.executemany(
+            """
+            INSERT INTO scheduled_series_exceptions(series_id, original_start, entry_id, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(series_id, original_start) DO UPDATE SET entry_id = excluded.entry_id
+             WHERE scheduled_series_exceptions.entry_id IS NOT excluded.entry_id
+            """,
+            [(int(sid), key, eid, now) for sid, key, eid in rows],
+        )
+        self._commit()
+
+    # -------------------------
+    # Full scans (export)
+    # -------------------------
+    def iter_active_entries(self) -> Iterator[ScheduledEntryRow]:
+        """All non-archived entries, hot and cold, in start order (streamed)."""
+        cur = self._conn.execute("SELECT * FROM scheduled_entries_all WHERE archived = 0 ORDER BY start_dt, id")
+        for r in cur:
+            yield _entry_from_row(r)
+
+    def iter_active_series(self) -> Iterator[ScheduledSeriesRow]:
+        cur = self._conn.execute("SELECT * FROM scheduled_series WHERE archived = 0 ORDER BY id")
+        for r in cur:
+            yield _series_from_row(r)
+
+    def all_series_exceptions(self) -> list[tuple[int, str, int | None]]:
+        """(series_id, original_start, entry_id) for every exception."""
+        cur = self._conn.execute("SELECT series_id, original_start, entry_id FROM scheduled_series_exceptions")
+        return [
+            (int(r["series_id"]), str(r["original_start"]), int(r["entry_id"]) if r["entry_id"] is not None else None)
+            for r in cur.fetchall()
+        ]
+
+def _entry_from_row(r: sqlite3.Row) -> ScheduledEntryRow:
+    return ScheduledEntryRow(
+        id=int(r["id"]),
+        item_kind=str(r["item_kind"]),
+        item_ref=str(r["item_ref"]),
+        start_dt=str(r["start_dt"]),
+        end_dt=str(r["end_dt"]),
+        title_cache=r["title_cache"],
+        notes_cache=r["notes_cache"],
+        archived=bool_from_int(r["archived"]),
+        created_at=str(r["created_at"]),
+        updated_at=str(r["updated_at"]),
+    )
+
+
+def _series_from_row(r: sqlite3.Row) -> ScheduledSeriesRow:
+    return ScheduledSeriesRow(
+        id=int(r["id"]),
+        item_kind=str(r["item_kind"]),
+        item_ref=str(r["item_ref"]),
+        start_dt=str(r["start_dt"]),
+        end_dt=str(r["end_dt"]),
+        rrule=str(r["rrule"]),
+        until_dt=r["until_dt"],
+        title_cache=r["title_cache"],
+        notes_cache=r["notes_cache"],
+        archived=bool_from_int(r["archived"]),
+        created_at=str(r["created_at"]),
+        updated_at=str(r["updated_at"]),
+    )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence
 
+from lux.core.instrumentation import instrument_methods
+from lux.data.cold_storage import needs_history, thaw
 from lux.data.models.tasks import (
     TaskDefinitionRow,
     TaskOccurrenceRow,
@@ -12,6 +15,63 @@ from lux.data.models.tasks import (
 )
 
 
+def _opt_col(row: sqlite3.Row, key: str) -> Optional[str]:
+    """Read an optional column fail-soft (column may be absent before its migration)."""
+    try:
+        v = row[key]
+    except (IndexError, KeyError):
+        return None
+    return str(v) if v is not None else None
+
+
+def _opt_int(row: sqlite3.Row, key: str) -> Optional[int]:
+    v = _opt_col(row, key)
+    try:
+        return int(v) if v is not None else None
+    except ValueError:
+        return None
+
+
+def _definition_from_row(row: sqlite3.Row) -> TaskDefinitionRow:
+    parent_task_id: int | None
+    try:
+        v = row["parent_task_id"]
+        parent_task_id = int(v) if v is not None else None
+    except Exception:
+        parent_task_id = None
+
+    return TaskDefinitionRow(
+        id=int(row["id"]),
+        title=str(row["title"]),
+        notes=str(row["notes"]),
+        parent_task_id=parent_task_id,
+        archived=bool_from_int(row["archived"]),
+        created_at=str(row["created_at"]),
+        updated_at=str(row["updated_at"]),
+        recur_rule=_opt_col(row, "recur_rule"),
+        recur_start=_opt_col(row, "recur_start"),
+        recur_until=_opt_col(row, "recur_until"),
+        priority=_opt_int(row, "priority") or 0,
+        estimate_min=_opt_int(row, "estimate_min"),
+    )
+
+
+def _occurrence_from_row(r: sqlite3.Row) -> TaskOccurrenceRow:
+    return TaskOccurrenceRow(
+        id=int(r["id"]),
+        task_id=int(r["task_id"]),
+        due_date=str(r["due_date"]),
+        due_time=str(r["due_time"]) if r["due_time"] is not None else None,
+        sort_key=int(r["sort_key"]),
+        completed_at=str(r["completed_at"]) if r["completed_at"] is not None else None,
+        archived=bool_from_int(r["archived"]),
+        created_at=str(r["created_at"]),
+        updated_at=str(r["updated_at"]),
+        recur_date=_opt_col(r, "recur_date"),
+    )
+
+
+@instrument_methods("repo.tasks", query=True)
 class TasksRepository:
     """
     Data-layer repository for task definitions and occurrences.
@@ -21,8 +81,56 @@ class TasksRepository:
     - Avoid N+1 by using JOIN for occurrence lists where we need task title.
     """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
+    def __init__(self, conn: sqlite3.Connection, on_commit: Callable[[], None] | None = None) -> None:
         self._conn = conn
+        self._tx_depth = 0
+        self._on_commit = on_commit  # e.g. ChangeFeed.pump
+
+    # -------------------------
+    # Transactions
+    # -------------------------
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into one commit (nestable).
+        Inside a transaction, per-method commits are deferred to the outermost exit.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        except Exception:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.rollback()
+            raise
+        self._tx_depth -= 1
+        if self._tx_depth == 0:
+            self._conn.commit()
+            self._committed()
+
+    def _commit(self) -> None:
+        if self._tx_depth == 0:
+            self._conn.commit()
+            self._committed()
+
+    def _committed(self) -> None:
+        if self._on_commit is not None:
+            self._on_commit()
+
+    def _occurrence_source(self, start_date: str, include_archived: bool) -> str:
+        """
+        Hot table for day-to-day windows; the history union only when the window
+        starts below the cold-storage horizon or archived rows are requested.
+        """
+        if include_archived or needs_history(self._conn, "task_occurrences", start_date):
+            return "task_occurrences_all"
+        return "task_occurrences"
+
+    def _write_occurrence(self, sql: str, params: tuple) -> None:
+        """UPDATE one occurrence by id (last param); thaws it from cold storage if needed."""
+        cur = self._conn.execute(sql, params)
+        if cur.rowcount == 0 and thaw(self._conn, "task_occurrences", int(params[-1])):
+            self._conn.execute(sql, params)
 
     # -------------------------
     # Definitions
@@ -35,7 +143,7 @@ class TasksRepository:
             """,
             (title.strip(), notes or "", parent_task_id),
         )
-        self._conn.commit()
+        self._commit()
         return int(cur.lastrowid)
 
     def get_task(self, task_id: int) -> Optional[TaskDefinitionRow]:
@@ -45,23 +153,7 @@ class TasksRepository:
         ).fetchone()
         if not row:
             return None
-
-        parent_task_id: int | None
-        try:
-            v = row["parent_task_id"]
-            parent_task_id = int(v) if v is not None else None
-        except Exception:
-            parent_task_id = None
-
-        return TaskDefinitionRow(
-            id=int(row["id"]),
-            title=str(row["title"]),
-            notes=str(row["notes"]),
-            parent_task_id=parent_task_id,
-            archived=bool_from_int(row["archived"]),
-            created_at=str(row["created_at"]),
-            updated_at=str(row["updated_at"]),
-        )
+        return _definition_from_row(row)
 
     def list_tasks(self, include_archived: bool = False, limit: int = 200) -> list[TaskDefinitionRow]:
         limit = max(1, min(int(limit), 500))
@@ -72,26 +164,7 @@ class TasksRepository:
             q = "SELECT * FROM task_definitions WHERE archived = 0 ORDER BY id DESC LIMIT ?"
             rows = self._conn.execute(q, (limit,)).fetchall()
 
-        out: list[TaskDefinitionRow] = []
-        for r in rows:
-            try:
-                v = r["parent_task_id"]
-                parent_task_id = int(v) if v is not None else None
-            except Exception:
-                parent_task_id = None
-
-            out.append(
-                TaskDefinitionRow(
-                    id=int(r["id"]),
-                    title=str(r["title"]),
-                    notes=str(r["notes"]),
-                    parent_task_id=parent_task_id,
-                    archived=bool_from_int(r["archived"]),
-                    created_at=str(r["created_at"]),
-                    updated_at=str(r["updated_at"]),
-                )
-            )
-        return out
+        return [_definition_from_row(r) for r in rows]
 
     def archive_task(self, task_id: int) -> None:
         self._conn.execute(
@@ -102,7 +175,112 @@ class TasksRepository:
             """,
             (now_sqlite(), int(task_id)),
         )
-        self._conn.commit()
+        self._commit()
+
+    def set_task_archived(self, task_id: int, archived: bool) -> None:
+        """Archive or restore a definition (restore is used by undo only)."""
+        self._conn.execute(
+            """
+            UPDATE task_definitions
+            SET archived = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (1 if archived else 0, now_sqlite(), int(task_id)),
+        )
+        self._commit()
+
+    def update_task_title(self, task_id: int, title: str) -> None:
+        self._conn.execute(
+            """
+            UPDATE task_definitions
+            SET title = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (title.strip(), now_sqlite(), int(task_id)),
+        )
+        self._commit()
+
+    def set_task_planning(self, task_id: int, priority: int, estimate_min: int | None) -> None:
+        self._conn.execute(
+            """
+            UPDATE task_definitions
+            SET priority = ?, estimate_min = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (int(priority), estimate_min, now_sqlite(), int(task_id)),
+        )
+        self._commit()
+
+    # -------------------------
+    # Recurrence
+    # -------------------------
+    def set_task_recurrence(
+        self,
+        task_id: int,
+        rule: str | None,
+        start_date: str | None,
+        until_date: str | None,
+    ) -> None:
+        """
+        Store (or clear, with rule=None) the recurrence rule on a definition.
+        until_date is the resolved inclusive end (UNTIL or last COUNT instance).
+        """
+        self._conn.execute(
+            """
+            UPDATE task_definitions
+            SET recur_rule = ?, recur_start = ?, recur_until = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (rule, start_date if rule else None, until_date if rule else None, now_sqlite(), int(task_id)),
+        )
+        self._commit()
+
+    def list_recurring_tasks_for_range(self, start_date: str, end_date: str) -> list[TaskDefinitionRow]:
+        """
+        Active recurring definitions whose [recur_start, recur_until] overlaps the window.
+        Bounded by the number of rules, never by instance count.
+        """
+        rows = self._conn.execute(
+            """
+            SELECT *
+            FROM task_definitions
+            WHERE recur_rule IS NOT NULL
+              AND archived = 0
+              AND recur_start <= ?
+              AND (recur_until IS NULL OR recur_until >= ?)
+            ORDER BY id ASC
+            """,
+            (end_date, start_date),
+        ).fetchall()
+        return [_definition_from_row(r) for r in rows]
+
+    def list_recurrence_exceptions(self, start_date: str, end_date: str) -> set[tuple[int, str]]:
+        """
+        (task_id, recur_date) keys of materialized instances in the window.
+        Includes archived rows: an archived materialization suppresses its virtual instance.
+        Always includes cold storage (moved rows still suppress their instance).
+        """
+        rows = self._conn.execute(
+            """
+            SELECT task_id, recur_date
+            FROM task_occurrences_all
+            WHERE recur_date IS NOT NULL
+              AND recur_date >= ? AND recur_date <= ?
+            """,
+            (start_date, end_date),
+        ).fetchall()
+        return {(int(r["task_id"]), str(r["recur_date"])) for r in rows}
+
+    def find_materialized_occurrence(self, task_id: int, recur_date: str) -> Optional[int]:
+        row = self._conn.execute(
+            """
+            SELECT id
+            FROM task_occurrences_all
+            WHERE task_id = ? AND recur_date = ?
+            """,
+            (int(task_id), recur_date),
+        ).fetchone()
+        return int(row["id"]) if row else None
 
     # -------------------------
     # Occurrences
@@ -128,18 +306,19 @@ class TasksRepository:
         due_date: str,
         due_time: str | None = None,
         sort_key: int | None = None,
+        recur_date: str | None = None,
     ) -> int:
         if sort_key is None:
             sort_key = self.next_sort_key_for_date(due_date)
 
         cur = self._conn.execute(
             """
-            INSERT INTO task_occurrences(task_id, due_date, due_time, sort_key, archived)
-            VALUES (?, ?, ?, ?, 0)
+            INSERT INTO task_occurrences(task_id, due_date, due_time, sort_key, recur_date, archived)
+            VALUES (?, ?, ?, ?, ?, 0)
             """,
-            (int(task_id), due_date, due_time, int(sort_key)),
+            (int(task_id), due_date, due_time, int(sort_key), recur_date),
         )
-        self._conn.commit()
+        self._commit()
         return int(cur.lastrowid)
 
     def update_occurrence_due_date(self, occurrence_id: int, target_date: str) -> None:
@@ -148,7 +327,7 @@ class TasksRepository:
         We also re-assign sort_key to keep stable ordering within the target day.
         """
         new_sort = self.next_sort_key_for_date(target_date)
-        self._conn.execute(
+        self._write_occurrence(
             """
             UPDATE task_occurrences
             SET due_date = ?, sort_key = ?, updated_at = ?
@@ -156,7 +335,26 @@ class TasksRepository:
             """,
             (target_date, int(new_sort), now_sqlite(), int(occurrence_id)),
         )
-        self._conn.commit()
+        self._commit()
+
+    def set_occurrence_due(self, occurrence_id: int, due_date: str, sort_key: int) -> None:
+        """Put an occurrence back at an exact (due_date, sort_key) slot (undo of a move)."""
+        self._write_occurrence(
+            """
+            UPDATE task_occurrences
+            SET due_date = ?, sort_key = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (due_date, int(sort_key), now_sqlite(), int(occurrence_id)),
+        )
+        self._commit()
+
+    def get_occurrence(self, occurrence_id: int) -> Optional[TaskOccurrenceRow]:
+        row = self._conn.execute(
+            "SELECT * FROM task_occurrences_all WHERE id = ?",
+            (int(occurrence_id),),
+        ).fetchone()
+        return _occurrence_from_row(row) if row else None
 
     def list_occurrences_for_range(
         self,
@@ -170,11 +368,12 @@ class TasksRepository:
         Date format expected: YYYY-MM-DD
         """
         limit = max(1, min(int(limit), 2000))
+        src = self._occurrence_source(start_date, include_archived)
         if include_archived:
             rows = self._conn.execute(
-                """
+                f"""
                 SELECT *
-                FROM task_occurrences
+                FROM {src}
                 WHERE due_date >= ? AND due_date <= ?
                 ORDER BY due_date ASC, sort_key ASC, id ASC
                 LIMIT ?
@@ -183,9 +382,9 @@ class TasksRepository:
             ).fetchall()
         else:
             rows = self._conn.execute(
-                """
+                f"""
                 SELECT *
-                FROM task_occurrences
+                FROM {src}
                 WHERE archived = 0 AND due_date >= ? AND due_date <= ?
                 ORDER BY due_date ASC, sort_key ASC, id ASC
                 LIMIT ?
@@ -193,22 +392,7 @@ class TasksRepository:
                 (start_date, end_date, limit),
             ).fetchall()
 
-        out: list[TaskOccurrenceRow] = []
-        for r in rows:
-            out.append(
-                TaskOccurrenceRow(
-                    id=int(r["id"]),
-                    task_id=int(r["task_id"]),
-                    due_date=str(r["due_date"]),
-                    due_time=str(r["due_time"]) if r["due_time"] is not None else None,
-                    sort_key=int(r["sort_key"]),
-                    completed_at=str(r["completed_at"]) if r["completed_at"] is not None else None,
-                    archived=bool_from_int(r["archived"]),
-                    created_at=str(r["created_at"]),
-                    updated_at=str(r["updated_at"]),
-                )
-            )
-        return out
+        return [_occurrence_from_row(r) for r in rows]
 
     def list_occurrences_joined_for_range(
         self,
@@ -221,10 +405,11 @@ class TasksRepository:
         Same as list_occurrences_for_range, but JOINs definitions to avoid N+1 reads.
         """
         limit = max(1, min(int(limit), 2000))
+        src = self._occurrence_source(start_date, include_archived)
 
         if include_archived:
             rows = self._conn.execute(
-                """
+                f"""
                 SELECT
                   o.id,
                   o.task_id,
@@ -236,8 +421,11 @@ class TasksRepository:
                   o.completed_at,
                   o.archived,
                   o.created_at,
-                  o.updated_at
-                FROM task_occurrences o
+                  o.updated_at,
+                  o.recur_date,
+                  d.priority,
+                  d.estimate_min
+                FROM {src} o
                 JOIN task_definitions d ON d.id = o.task_id
                 WHERE o.due_date >= ? AND o.due_date <= ?
                 ORDER BY o.due_date ASC, o.sort_key ASC, o.id ASC
@@ -247,7 +435,7 @@ class TasksRepository:
             ).fetchall()
         else:
             rows = self._conn.execute(
-                """
+                f"""
                 SELECT
                   o.id,
                   o.task_id,
@@ -259,8 +447,11 @@ class TasksRepository:
                   o.completed_at,
                   o.archived,
                   o.created_at,
-                  o.updated_at
-                FROM task_occurrences o
+                  o.updated_at,
+                  o.recur_date,
+                  d.priority,
+                  d.estimate_min
+                FROM {src} o
                 JOIN task_definitions d ON d.id = o.task_id
                 WHERE o.archived = 0
                   AND d.archived = 0
@@ -286,14 +477,62 @@ class TasksRepository:
                     archived=bool_from_int(r["archived"]),
                     created_at=str(r["created_at"]),
                     updated_at=str(r["updated_at"]),
+                    recur_date=_opt_col(r, "recur_date"),
+                    priority=_opt_int(r, "priority") or 0,
+                    estimate_min=_opt_int(r, "estimate_min"),
                 )
             )
         return out
 
+    def completion_counts_by_day(self, start_date: str, end_date: str) -> dict[str, tuple[int, int]]:
+        """
+        due_date -> (completed, total) for active occurrences in [start_date, end_date].
+        One GROUP BY query; used by calendar density overlays.
+        """
+        src = self._occurrence_source(start_date, include_archived=False)
+        rows = self._conn.execute(
+            f"""
+            SELECT o.due_date AS day,
+                   SUM(CASE WHEN o.completed_at IS NOT NULL THEN 1 ELSE 0 END) AS done,
+                   COUNT(*) AS total
+            FROM {src} o
+            JOIN task_definitions d ON d.id = o.task_id
+            WHERE o.archived = 0
+              AND d.archived = 0
+              AND o.due_date >= ? AND o.due_date <= ?
+            GROUP BY o.due_date
+            """,
+            (start_date, end_date),
+        ).fetchall()
+        return {str(r["day"]): (int(r["done"] or 0), int(r["total"])) for r in rows}
+
+    def get_occurrence_titles(self, occurrence_ids: Sequence[int]) -> dict[int, str]:
+        """
+        Batch title lookup for occurrences (occurrence -> definition JOIN).
+        One query per 500 ids to stay well under SQLite's bound-parameter limit.
+        """
+        ids = sorted({int(i) for i in occurrence_ids})
+        out: dict[int, str] = {}
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""
+                SELECT o.id, d.title
+                FROM task_occurrences_all o
+                JOIN task_definitions d ON d.id = o.task_id
+                WHERE o.id IN ({marks})
+                """,
+                chunk,
+            ).fetchall()
+            for r in rows:
+                out[int(r["id"])] = str(r["title"])
+        return out
+
     def set_occurrence_completed(self, occurrence_id: int, completed: bool) -> None:
         ts = now_sqlite()
         if completed:
-            self._conn.execute(
+            self._write_occurrence(
                 """
                 UPDATE task_occurrences
                 SET completed_at = ?, updated_at = ?
@@ -302,7 +541,7 @@ class TasksRepository:
                 (ts, ts, int(occurrence_id)),
             )
         else:
-            self._conn.execute(
+            self._write_occurrence(
                 """
                 UPDATE task_occurrences
                 SET completed_at = NULL, updated_at = ?
@@ -310,11 +549,11 @@ class TasksRepository:
                 """,
                 (ts, int(occurrence_id)),
             )
-        self._conn.commit()
+        self._commit()
 
     def archive_occurrence(self, occurrence_id: int) -> None:
         ts = now_sqlite()
-        self._conn.execute(
+        self._write_occurrence(
             """
             UPDATE task_occurrences
             SET archived = 1,
@@ -324,4 +563,31 @@ class TasksRepository:
             """,
             (ts, ts, int(occurrence_id)),
         )
-        self._conn.commit()
+        self._commit()
+
+    def set_occurrence_completed_at(self, occurrence_id: int, completed_at: str | None) -> None:
+        """Restore an exact completion timestamp (undo of a completion toggle)."""
+        self._write_occurrence(
+            """
+            UPDATE task_occurrences
+            SET completed_at = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (completed_at, now_sqlite(), int(occurrence_id)),
+        )
+        self._commit()
+
+    def set_occurrence_archived(self, occurrence_id: int, archived: bool) -> None:
+        """Archive or restore an occurrence (restore is used by undo only)."""
+        ts = now_sqlite()
+        self._write_occurrence(
+            """
+            UPDATE task_occurrences
+            SET archived = ?,
+                archived_at = ?,
+                updated_at = ?
+            WHERE id = ?
+            """,
+            (1 if archived else 0, ts if archived else None, ts, int(occurrence_id)),
+        )
+        self._commit()
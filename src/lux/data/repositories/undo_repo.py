@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sqlite3
+
+from lux.data.models.tasks import now_sqlite
+
+
+class UndoLogRepo:
+    """DB-only access for undo_log (implements lux.core.undo.UndoStore)."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def _write(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        owned = not self._conn.in_transaction
+        cur = self._conn.execute(sql, params)
+        if owned:
+            self._conn.commit()
+        return cur
+
+    def append(self, label: str, undo_json: str, redo_json: str) -> int:
+        cur = self._write(
+            """
+            INSERT INTO undo_log(label, undo_ops, redo_ops, undone, created_at)
+            VALUES (?, ?, ?, 0, ?)
+            """,
+            (label, undo_json, redo_json, now_sqlite()),
+        )
+        return int(cur.lastrowid)
+
+    def set_undone(self, step_id: int, undone: bool) -> None:
+        self._write("UPDATE undo_log SET undone = ? WHERE id = ?", (1 if undone else 0, int(step_id)))
+
+    def discard(self, step_id: int) -> None:
+        self._write("DELETE FROM undo_log WHERE id = ?", (int(step_id),))
+
+    def discard_undone(self) -> None:
+        """A new step invalidates the redo side."""
+        self._write("DELETE FROM undo_log WHERE undone = 1")
+
+    def trim(self, keep: int) -> None:
+        """Ring-buffer bound: drop rows more than `keep` ids behind the newest (PK range delete)."""
+        self._write(
+            "DELETE FROM undo_log WHERE id <= (SELECT MAX(id) FROM undo_log) - ?",
+            (max(1, int(keep)),),
+        )
+
+    def load(self, limit: int) -> list[tuple[int, str, str, str, bool]]:
+        rows = self._conn.execute(
+            """
+            SELECT id, label, undo_ops, redo_ops, undone
+              FROM undo_log
+             ORDER BY id DESC
+             LIMIT ?
+            """,
+            (max(1, int(limit)),),
+        ).fetchall()
+        return [
+            (int(r["id"]), str(r["label"]), str(r["undo_ops"]), str(r["redo_ops"]), bool(r["undone"]))
+            for r in reversed(rows)
+        ]
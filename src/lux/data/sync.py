@@ -0,0 +1,607 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from lux.data.cold_storage import thaw
+from lux.data.models.schedule import now_sqlite
+
+log = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_CHUNK = 500  # stay under SQLite's host-parameter limit
+
+
+class SyncError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _Entity:
+    name: str                     # change_log / sync_ids entity
+    table: str                    # hot table (writes)
+    source: str                   # reads, including cold storage
+    cols: tuple[str, ...]         # synced value columns
+    ref_col: str | None = None    # local id column pointing at `ref_entity`
+    ref_entity: str | None = None
+    ref_required: bool = False
+
+
+# Apply order respects references (parents first).
+_ENTITIES: tuple[_Entity, ...] = (
+    _Entity(
+        "task_definition", "task_definitions", "task_definitions",
+        ("title", "notes", "archived", "created_at", "updated_at",
+         "recur_rule", "recur_start", "recur_until", "priority", "estimate_min"),
+        ref_col="parent_task_id", ref_entity="task_definition",
+    ),
+    _Entity(
+        "task_occurrence", "task_occurrences", "task_occurrences_all",
+        ("due_date", "due_time", "sort_key", "completed_at", "archived",
+         "created_at", "updated_at", "archived_at", "recur_date"),
+        ref_col="task_id", ref_entity="task_definition", ref_required=True,
+    ),
+    _Entity(
+        "scheduled_series", "scheduled_series", "scheduled_series",
+        ("item_kind", "item_ref", "start_dt", "end_dt", "rrule", "until_dt",
+         "title_cache", "notes_cache", "archived", "created_at", "updated_at"),
+    ),
+    _Entity(
+        "scheduled_entry", "scheduled_entries", "scheduled_entries_all",
+        ("item_kind", "item_ref", "start_dt", "end_dt", "title_cache", "notes_cache",
+         "archived", "created_at", "updated_at"),
+    ),
+)
+
+_EXCEPTION = "series_exception"
+
+# item_kind -> entity whose local id a scheduled entry stores in item_ref.
+_ITEM_REF_ENTITIES = {"task_occurrence": "task_occurrence"}
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    site: str        # sender
+    peer: str        # receiver
+    upto: int        # sender's change_log seq covered by this set
+    ack: int         # receiver's seq the sender has already applied
+    full: bool
+    # entity -> wire rows: [uid, ref uid, *cols]; exceptions: [series uid, original_start, entry uid, deleted]
+    rows: dict[str, list[list[Any]]]
+
+    @property
+    def size(self) -> int:
+        return sum(len(r) for r in self.rows.values())
+
+    def to_bytes(self) -> bytes:
+        payload = {
+            "format": FORMAT_VERSION,
+            "site": self.site,
+            "peer": self.peer,
+            "upto": self.upto,
+            "ack": self.ack,
+            "full": self.full,
+            "columns": {e.name: list(e.cols) for e in _ENTITIES},
+            "rows": self.rows,
+        }
+        return gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), compresslevel=6)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ChangeSet:
+        try:
+            raw = json.loads(gzip.decompress(data).decode("utf-8"))
+        except (OSError, ValueError) as e:
+            raise SyncError(f"Not a change set: {e}") from e
+        if not isinstance(raw, dict) or raw.get("format") != FORMAT_VERSION:
+            raise SyncError("Unsupported change set format")
+        for e in _ENTITIES:
+            if raw.get("columns", {}).get(e.name, list(e.cols)) != list(e.cols):
+                raise SyncError(f"Change set columns differ for {e.name}; update both sides")
+        return cls(
+            site=str(raw["site"]),
+            peer=str(raw["peer"]),
+            upto=int(raw["upto"]),
+            ack=int(raw["ack"]),
+            full=bool(raw["full"]),
+            rows={str(k): list(v) for k, v in raw.get("rows", {}).items()},
+        )
+
+
+@dataclass
+class SyncStats:
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    stale: int = 0         # local version newer (kept)
+    merged: int = 0        # matched by natural key
+    unresolved: int = 0    # referenced row unknown here (skipped)
+    deleted: int = 0       # exception tombstones
+    duration_ms: float = 0.0
+
+
+# -------------------------
+# Site and peers
+# -------------------------
+def site_id(conn: sqlite3.Connection) -> str:
+    row = conn.execute("SELECT value FROM sync_state WHERE key = 'site_id'").fetchone()
+    if row is None:
+        raise SyncError("Database has no site id (migration 0014 missing)")
+    return str(row[0])
+
+
+def reset_site_id(conn: sqlite3.Connection) -> str:
+    """Give a copied database file its own identity; peers then see a new site."""
+    new = uuid.uuid4().hex
+    conn.execute("UPDATE sync_state SET value = ? WHERE key = 'site_id'", (new,))
+    conn.commit()
+    return new
+
+
+def _marks(conn: sqlite3.Connection, peer: str) -> tuple[int, int] | None:
+    """(sent_seq, recv_seq) for a known peer, None on first contact."""
+    row = conn.execute("SELECT sent_seq, recv_seq FROM sync_peers WHERE peer_id = ?", (peer,)).fetchone()
+    return (int(row[0]), int(row[1])) if row else None
+
+
+def mark_delivered(conn: sqlite3.Connection, peer: str, upto: int) -> None:
+    """Record that the peer applied our changes up to `upto` (direct sync knows this first-hand)."""
+    conn.execute(
+        """
+        INSERT INTO sync_peers(peer_id, sent_seq) VALUES (?, ?)
+        ON CONFLICT(peer_id) DO UPDATE SET sent_seq = max(sent_seq, excluded.sent_seq)
+        """,
+        (peer, int(upto)),
+    )
+    conn.commit()
+
+
+def _max_seq(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _log_covers(conn: sqlite3.Connection, mark: int) -> bool:
+    """True if every change_log row after `mark` is still there (not pruned)."""
+    row = conn.execute("SELECT MIN(seq) FROM change_log").fetchone()
+    first = int(row[0]) if row and row[0] is not None else _max_seq(conn) + 1
+    return first <= mark + 1
+
+
+def _chunks(seq: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(seq), _CHUNK):
+        yield seq[i : i + _CHUNK]
+
+
+def _uids(conn: sqlite3.Connection, entity: str, ids: Iterable[int]) -> dict[int, str]:
+    ids = sorted(set(ids))
+    out: dict[int, str] = {}
+    for part in _chunks(ids):
+        marks = ",".join("?" for _ in part)
+        cur = conn.execute(
+            f"SELECT local_id, uid FROM sync_ids WHERE entity = ? AND local_id IN ({marks})",
+            (entity, *part),
+        )
+        out.update({int(r[0]): str(r[1]) for r in cur})
+    return out
+
+
+def _local_ids(conn: sqlite3.Connection, entity: str, uids: Iterable[str]) -> dict[str, int]:
+    uids = sorted(set(uids))
+    out: dict[str, int] = {}
+    for part in _chunks(uids):
+        marks = ",".join("?" for _ in part)
+        cur = conn.execute(
+            f"SELECT uid, local_id FROM sync_ids WHERE entity = ? AND uid IN ({marks})",
+            (entity, *part),
+        )
+        out.update({str(r[0]): int(r[1]) for r in cur})
+    return out
+
+
+# -------------------------
+# Export
+# -------------------------
+def build_changeset(conn: sqlite3.Connection, peer: str) -> ChangeSet:
+    """Rows changed since the peer's acknowledged mark (all rows on first contact)."""
+    if conn.in_transaction:
+        raise SyncError("Cannot build a change set inside an open transaction")
+    site = site_id(conn)
+    if peer == site:
+        raise SyncError("Peer is this database")
+
+    conn.execute("BEGIN")  # one read snapshot for the whole set
+    try:
+        marks = _marks(conn, peer)
+        sent, recv = marks or (0, 0)
+        upto = _max_seq(conn)
+        full = marks is None or not _log_covers(conn, sent)
+
+        changed: dict[str, set[Any]] = {}
+        if not full:
+            cur = conn.execute(
+                "SELECT entity, entity_id, range_start FROM change_log WHERE seq > ? AND seq <= ?",
+                (sent, upto),
+            )
+            for entity, entity_id, range_start in cur:
+                key = (int(entity_id), range_start) if entity == _EXCEPTION else int(entity_id)
+                changed.setdefault(str(entity), set()).add(key)
+
+        rows: dict[str, list[list[Any]]] = {}
+        for ent in _ENTITIES:
+            if full:
+                ids = [int(r[0]) for r in conn.execute(f"SELECT id FROM {ent.source}")]
+            else:
+                ids = sorted(changed.get(ent.name, ()))
+            rows[ent.name] = _export_rows(conn, ent, ids, peer)
+        rows[_EXCEPTION] = _export_exceptions(conn, None if full else changed.get(_EXCEPTION, set()), peer)
+    finally:
+        conn.commit()
+
+    return ChangeSet(site=site, peer=peer, upto=upto, ack=recv, full=full, rows=rows)
+
+
+def _export_rows(conn: sqlite3.Connection, ent: _Entity, ids: list[int], peer: str) -> list[list[Any]]:
+    out: list[list[Any]] = []
+    ref_sel = f"t.{ent.ref_col}" if ent.ref_col else "NULL"
+    cols = ", ".join(f"t.{c}" for c in ent.cols)
+    stamp_at = ent.cols.index("updated_at")
+    item_at = ent.cols.index("item_ref") if "item_ref" in ent.cols else -1
+    kind_at = ent.cols.index("item_kind") if "item_kind" in ent.cols else -1
+    for part in _chunks(ids):
+        marks = ",".join("?" for _ in part)
+        batch = conn.execute(
+            f"""
+            SELECT s.uid, s.src_peer, s.src_stamp, {ref_sel}, {cols}
+              FROM {ent.source} t
+              JOIN sync_ids s ON s.entity = ? AND s.local_id = t.id
+             WHERE t.id IN ({marks})
+            """,
+            (ent.name, *part),
+        ).fetchall()
+
+        refs = [r[3] for r in batch if r[3] is not None]
+        ref_uids = _uids(conn, ent.ref_entity, refs) if ent.ref_entity and refs else {}
+        item_uids: dict[str, dict[int, str]] = {}
+        if ent.name == "scheduled_entry":
+            for kind, target in _ITEM_REF_ENTITIES.items():
+                local = [int(r[4 + item_at]) for r in batch if r[4 + kind_at] == kind and str(r[4 + item_at]).isdigit()]
+                item_uids[kind] = _uids(conn, target, local) if local else {}
+
+        for r in batch:
+            uid, src_peer, src_stamp, ref = r[0], r[1], r[2], r[3]
+            vals = list(r[4:])
+            if src_peer == peer and src_stamp == vals[stamp_at]:
+                continue  # the peer's own version, unchanged here since
+            if kind_at >= 0 and vals[kind_at] in item_uids:
+                raw = str(vals[item_at])
+                target_uid = item_uids[vals[kind_at]].get(int(raw)) if raw.isdigit() else None
+                if target_uid is None:
+                    continue  # dangling reference: nothing the peer could resolve
+                vals[item_at] = target_uid
+            out.append([str(uid), ref_uids.get(int(ref)) if ref is not None else None, *vals])
+    return out
+
+
+def _export_exceptions(conn: sqlite3.Connection, keys: set[tuple[int, Any]] | None, peer: str) -> list[list[Any]]:
+    """
+    Exception rows; keys None = all. Keys without a row become tombstones.
+    Keys whose state came from `peer` (unchanged here since) are left out.
+    """
+    from_peer = {
+        (int(r[0]), str(r[1]))
+        for r in conn.execute("SELECT series_id, original_start FROM sync_exception_src WHERE src_peer = ?", (peer,))
+    }
+    if keys is None:
+        found = [
+            tuple(r)
+            for r in conn.execute("SELECT series_id, original_start, entry_id FROM scheduled_series_exceptions")
+            if (int(r[0]), str(r[1])) not in from_peer
+        ]
+        missing: list[tuple[int, str]] = []
+    else:
+        found = []
+        missing = []
+        for sid, original_start in sorted(keys, key=lambda k: (k[0], str(k[1]))):
+            if (sid, str(original_start)) in from_peer:
+                continue  # the peer's own state, unchanged here since
+            row = conn.execute(
+                "SELECT entry_id FROM scheduled_series_exceptions WHERE series_id = ? AND original_start = ?",
+                (sid, original_start),
+            ).fetchone()
+            if row is None:
+                missing.append((sid, original_start))
+            else:
+                found.append((sid, original_start, row[0]))
+
+    series_uids = _uids(conn, "scheduled_series", [k[0] for k in found] + [k[0] for k in missing])
+    entry_uids = _uids(conn, "scheduled_entry", [int(k[2]) for k in found if k[2] is not None])
+    out: list[list[Any]] = []
+    for sid, original_start, entry_id in found:
+        if sid in series_uids:
+            out.append([series_uids[sid], original_start, entry_uids.get(int(entry_id)) if entry_id is not None else None, 0])
+    for sid, original_start in missing:
+        if sid in series_uids:
+            out.append([series_uids[sid], original_start, None, 1])
+    return out
+
+
+# -------------------------
+# Apply
+# -------------------------
+def apply_changeset(conn: sqlite3.Connection, cs: ChangeSet) -> SyncStats:
+    """Merge a peer's change set in one transaction and advance the peer marks."""
+    t0 = time.perf_counter()
+    if conn.in_transaction:
+        raise SyncError("Cannot apply a change set inside an open transaction")
+    site = site_id(conn)
+    if cs.site == site:
+        raise SyncError("Change set comes from this database (a copied file? reset its site id)")
+    if cs.peer != site:
+        raise SyncError("Change set was built for another database")
+
+    stats = SyncStats(received=cs.size)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        wins_ties = cs.site > site
+        for ent in _ENTITIES:
+            _apply_rows(conn, ent, cs.rows.get(ent.name, []), cs.site, wins_ties, stats)
+        _apply_exceptions(conn, cs.rows.get(_EXCEPTION, []), cs.site, stats)
+        conn.execute(
+            """
+            INSERT INTO sync_peers(peer_id, sent_seq, recv_seq, synced_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(peer_id) DO UPDATE SET
+                sent_seq = max(sent_seq, excluded.sent_seq),
+                recv_seq = max(recv_seq, excluded.recv_seq),
+                synced_at = excluded.synced_at
+            """,
+            (cs.site, cs.ack, cs.upto, now_sqlite()),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    stats.duration_ms = (time.perf_counter() - t0) * 1000.0
+    log.info(
+        "Sync from %s: %d rows, %d inserted, %d updated, %d stale, %.1f ms",
+        cs.site, stats.received, stats.inserted, stats.updated, stats.stale, stats.duration_ms,
+    )
+    return stats
+
+
+def _apply_rows(
+    conn: sqlite3.Connection,
+    ent: _Entity,
+    rows: list[list[Any]],
+    src: str,
+    wins_ties: bool,
+    stats: SyncStats,
+) -> None:
+    stamp_at = ent.cols.index("updated_at")
+    pending_refs: list[tuple[int, str]] = []  # (local id, ref uid) resolved after the batch
+
+    for part in _chunks(rows):
+        local = _local_ids(conn, ent.name, [r[0] for r in part])
+        ref_ids = (
+            _local_ids(conn, ent.ref_entity, [r[1] for r in part if r[1] is not None]) if ent.ref_entity else {}
+        )
+        item_ids: dict[str, dict[str, int]] = {}
+        if ent.name == "scheduled_entry":
+            at, kind_at = ent.cols.index("item_ref"), ent.cols.index("item_kind")
+            for kind, target in _ITEM_REF_ENTITIES.items():
+                wanted = [r[2 + at] for r in part if r[2 + kind_at] == kind]
+                item_ids[kind] = _local_ids(conn, target, wanted) if wanted else {}
+
+        for r in part:
+            uid, ref_uid, vals = str(r[0]), r[1], list(r[2:])
+            ref_id = ref_ids.get(ref_uid) if ref_uid is not None else None
+            if ref_uid is not None and ref_id is None:
+                if ent.ref_required:
+                    stats.unresolved += 1
+                    continue
+            if ent.name == "scheduled_entry" and vals[kind_at] in item_ids:
+                target_id = item_ids[vals[kind_at]].get(vals[at])
+                if target_id is None:
+                    stats.unresolved += 1
+                    continue
+                vals[at] = str(target_id)
+
+            local_id = local.get(uid)
+            if local_id is None:
+                local_id = _natural_match(conn, ent, ref_id, vals)
+                if local_id is not None:
+                    _adopt_uid(conn, ent.name, local_id, uid)
+                    stats.merged += 1
+
+            if local_id is None:
+                cols = ent.cols + ((ent.ref_col,) if ent.ref_col else ())
+                params = vals + ([ref_id] if ent.ref_col else [])
+                cur = conn.execute(
+                    f"INSERT INTO {ent.table}({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+                    params,
+                )
+                local_id = int(cur.lastrowid)
+                conn.execute(
+                    "UPDATE sync_ids SET uid = ?, src_peer = ?, src_stamp = ? WHERE entity = ? AND local_id = ?",
+                    (uid, src, vals[stamp_at], ent.name, local_id),
+                )
+                stats.inserted += 1
+            else:
+                current = conn.execute(
+                    f"SELECT {', '.join(ent.cols)}{', ' + ent.ref_col if ent.ref_col else ''} "
+                    f"FROM {ent.source} WHERE id = ?",
+                    (local_id,),
+                ).fetchone()
+                if current is None:
+                    stats.unresolved += 1
+                    continue
+                mine = list(current[: len(ent.cols)])
+                mine_ref = current[len(ent.cols)] if ent.ref_col else None
+                theirs_ref = ref_id if (ref_uid is None or ref_id is not None) else mine_ref
+                if mine == vals and mine_ref == theirs_ref:
+                    continue
+                if not _newer(vals[stamp_at], mine[stamp_at], wins_ties):
+                    stats.stale += 1
+                    continue
+                _update_row(conn, ent, local_id, vals, theirs_ref)
+                conn.execute(
+                    "UPDATE sync_ids SET src_peer = ?, src_stamp = ? WHERE entity = ? AND local_id = ?",
+                    (src, vals[stamp_at], ent.name, local_id),
+                )
+                stats.updated += 1
+
+            if ref_uid is not None and ref_id is None:
+                pending_refs.append((local_id, ref_uid))
+
+    # Optional references to rows later in the same set (e.g. parent tasks).
+    if pending_refs:
+        resolved = _local_ids(conn, ent.ref_entity, [u for _, u in pending_refs])
+        for local_id, ref_uid in pending_refs:
+            ref_id = resolved.get(ref_uid)
+            if ref_id is None:
+                stats.unresolved += 1
+                continue
+            conn.execute(f"UPDATE {ent.table} SET {ent.ref_col} = ? WHERE id = ?", (ref_id, local_id))
+
+
+def _newer(theirs: Any, mine: Any, wins_ties: bool) -> bool:
+    theirs, mine = str(theirs or ""), str(mine or "")
+    return theirs > mine or (theirs == mine and wins_ties)
+
+
+def _update_row(conn: sqlite3.Connection, ent: _Entity, local_id: int, vals: list[Any], ref_id: Any) -> None:
+    cols = ent.cols + ((ent.ref_col,) if ent.ref_col else ())
+    params = vals + ([ref_id] if ent.ref_col else [])
+    sql = f"UPDATE {ent.table} SET {', '.join(f'{c} = ?' for c in cols)} WHERE id = ?"
+    if conn.execute(sql, (*params, local_id)).rowcount == 0 and ent.table != ent.source:
+        # Cold row: thaw it back into the hot table first (see lux.data.cold_storage).
+        if thaw(conn, ent.table, local_id):
+            conn.execute(sql, (*params, local_id))
+
+
+def _natural_match(conn: sqlite3.Connection, ent: _Entity, ref_id: Any, vals: list[Any]) -> int | None:
+    """Local row that is the same item under another uid, or None."""
+    if ent.name == "task_occurrence":
+        recur_date = vals[ent.cols.index("recur_date")]
+        if recur_date is None or ref_id is None:
+            return None
+        row = conn.execute(
+            f"SELECT id FROM {ent.source} WHERE task_id = ? AND recur_date = ?",
+            (ref_id, recur_date),
+        ).fetchone()
+    elif ent.name in ("scheduled_series", "scheduled_entry"):
+        if vals[ent.cols.index("item_kind")] != "ics":
+            return None
+        row = conn.execute(
+            f"SELECT id FROM {ent.source} WHERE item_kind = 'ics' AND item_ref = ?",
+            (vals[ent.cols.index("item_ref")],),
+        ).fetchone()
+    else:
+        return None
+    return int(row[0]) if row else None
+
+
+def _adopt_uid(conn: sqlite3.Connection, entity: str, local_id: int, uid: str) -> None:
+    """Both sides keep the smaller uid of a merged pair, so they converge."""
+    conn.execute(
+        "UPDATE OR IGNORE sync_ids SET uid = ? WHERE entity = ? AND local_id = ? AND uid > ?",
+        (uid, entity, local_id, uid),
+    )
+
+
+def _apply_exceptions(conn: sqlite3.Connection, rows: list[list[Any]], src: str, stats: SyncStats) -> None:
+    if not rows:
+        return
+    series = _local_ids(conn, "scheduled_series", [r[0] for r in rows])
+    entries = _local_ids(conn, "scheduled_entry", [r[2] for r in rows if r[2] is not None])
+    now = now_sqlite()
+    for series_uid, original_start, entry_uid, deleted in rows:
+        sid = series.get(series_uid)
+        entry_id = entries.get(entry_uid) if entry_uid is not None else None
+        if sid is None or (entry_uid is not None and entry_id is None):
+            stats.unresolved += 1
+            continue
+        if deleted:
+            cur = conn.execute(
+                "DELETE FROM scheduled_series_exceptions WHERE series_id = ? AND original_start = ?",
+                (sid, original_start),
+            )
+            stats.deleted += max(0, cur.rowcount)
+            if cur.rowcount > 0:
+                _exception_from(conn, sid, original_start, src)
+            continue
+        cur = conn.execute(
+            """
+            INSERT INTO scheduled_series_exceptions(series_id, original_start, entry_id, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(series_id, original_start) DO UPDATE SET entry_id = excluded.entry_id
+             WHERE scheduled_series_exceptions.entry_id IS NOT excluded.entry_id
+            """,
+            (sid, original_start, entry_id, now),
+        )
+        stats.updated += max(0, cur.rowcount)
+        if cur.rowcount > 0:
+            _exception_from(conn, sid, original_start, src)
+
+
+def _exception_from(conn: sqlite3.Connection, series_id: int, original_start: str, src: str) -> None:
+    """Remember that the key's current state came from `src` (after the write: its triggers clear this)."""
+    conn.execute(
+        "INSERT OR REPLACE INTO sync_exception_src(series_id, original_start, src_peer) VALUES (?, ?, ?)",
+        (series_id, original_start, src),
+    )
+
+
+# -------------------------
+# Transports
+# -------------------------
+def write_changeset(cs: ChangeSet, path: Path) -> int:
+    """Write atomically (the peer may poll the folder); returns the byte size."""
+    path = Path(path)
+    data = cs.to_bytes()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    part = path.with_name(path.name + ".part")
+    part.write_bytes(data)
+    os.replace(part, path)
+    return len(data)
+
+
+def read_changeset(path: Path) -> ChangeSet:
+    return ChangeSet.from_bytes(Path(path).read_bytes())
+
+
+@dataclass
+class SyncResult:
+    sent: int = 0              # rows in our change set
+    received: int = 0          # rows in the peer's change set
+    local: SyncStats = field(default_factory=SyncStats)   # applied here
+    remote: SyncStats = field(default_factory=SyncStats)  # applied on the peer
+
+
+def sync_databases(local: sqlite3.Connection, remote: sqlite3.Connection) -> SyncResult:
+    """
+    Two-way sync of two open databases. Both sets are built before either is
+    applied, so neither side echoes the other's changes in this round.
+    """
+    a, b = site_id(local), site_id(remote)
+    if a == b:
+        # A copied file: the copy (remote) becomes a new site; shared uids keep rows matched.
+        b = reset_site_id(remote)
+
+    ours = build_changeset(local, peer=b)
+    theirs = build_changeset(remote, peer=a)
+    result = SyncResult(sent=ours.size, received=theirs.size)
+    result.remote = apply_changeset(remote, ours)
+    result.local = apply_changeset(local, theirs)
+    mark_delivered(local, b, ours.upto)
+    mark_delivered(remote, a, theirs.upto)
+    return result
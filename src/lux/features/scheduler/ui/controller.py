@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
 from uuid import uuid4
 
 from PySide6.QtCore import QDate, QTime
 
+from lux.core.scheduler.conflicts import IntervalIndex
 from lux.core.scheduler.service import SchedulerService
 
+# Upper bound for one day's load (the service default) and one multi-day load
+# (a busy week is a few hundred rows). A load that hits its bound is never cached.
+_DAY_LIMIT = 500
+_RANGE_LIMIT = 5000
+
 
 @dataclass(frozen=True)
 class SchedulerEntryVM:
@@ -15,6 +21,16 @@ class SchedulerEntryVM:
     start_dt: str
     end_dt: str
     title: str
+    series_id: int | None = None  # set for instances of a recurring series (id is 0)
+    conflicts: int = 0            # number of other entries this one overlaps
+
+
+@dataclass(frozen=True)
+class SchedulerDaySummaryVM:
+    day: str                   # YYYY-MM-DD
+    count: int
+    busiest_hour: int | None   # hour with the most entry starts (None when empty)
+    busiest_count: int = 0
 
 
 class SchedulerController:
@@ -27,8 +43,14 @@ class SchedulerController:
     - Scheduler-native items use item_kind="adhoc" with uuid4 string refs.
     """
 
-    def __init__(self, service: SchedulerService) -> None:
+    def __init__(self, service: SchedulerService, cache=None) -> None:
         self._service = service
+        # Optional shared DayEntriesCache (see prefetch.py); None = always query.
+        self._cache = cache
+        # Conflict index for the last loaded day: (day start iso, index, vms).
+        self._loaded: tuple[str, IntervalIndex[int], list[SchedulerEntryVM]] | None = None
+        # Day (YYYY-MM-DD) whose last load hit _DAY_LIMIT; its rows are incomplete and never cached.
+        self._truncated_day: str | None = None
 
     @staticmethod
     def _day_bounds_iso(qd: QDate) -> tuple[str, str]:
@@ -46,6 +68,13 @@ class SchedulerController:
         dt = datetime(d.year, d.month, d.day, int(qt.hour()), int(qt.minute()), 0)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
 
+    @staticmethod
+    def _shift_iso(dt_str: str, minutes: int) -> str:
+        if not minutes:
+            return dt_str
+        dt = datetime.fromisoformat(str(dt_str).replace("T", " "))
+        return (dt + timedelta(minutes=minutes)).strftime("%Y-%m-%d %H:%M:%S")
+
     @staticmethod
     def _fmt_time(dt_str: str) -> str:
         try:
@@ -54,41 +83,157 @@ class SchedulerController:
         except Exception:
             return ""
 
-    def _resolve_title(self, item_kind: str, item_ref: str, title_cache: str | None) -> str:
-        kind = str(item_kind or "").strip()
+    def _resolve_titles(self, entries) -> list[str]:
+        """
+        Titles for a batch of entries: one registry call, grouped by item_kind.
 
-        # Scheduler-native adhoc entries: always use title_cache (no provider required).
-        if kind == "adhoc":
-            return (title_cache or "").strip() or "Scheduled Item"
+        Scheduler-native adhoc entries always use title_cache (no provider required);
+        unresolved provider labels fall back to title_cache.
+        """
+        pairs = [
+            (str(e.item_kind or "").strip(), str(e.item_ref))
+            for e in entries
+            if str(e.item_kind or "").strip() != "adhoc"
+        ]
+        labels = self._service.registry.resolve_labels(pairs) if pairs else {}
 
-        provider = self._service.registry.get(kind)
-        if provider is not None:
-            try:
-                label = provider.resolve_label(str(item_ref))
-                if label:
-                    return str(label)
-            except Exception:
-                pass
+        out: list[str] = []
+        for e in entries:
+            label = labels.get((str(e.item_kind or "").strip(), str(e.item_ref)))
+            if label:
+                out.append(label)
+            else:
+                out.append((getattr(e, "title_cache", None) or "").strip() or "Scheduled Item")
+        return out
 
-        return (title_cache or "").strip() or "Scheduled Item"
+    def _to_vms(self, entries) -> tuple[IntervalIndex[int], list[SchedulerEntryVM]]:
+        # Built once per load from rows already in memory (no extra DB round-trip).
+        index: IntervalIndex[int] = IntervalIndex(
+            (str(e.start_dt), str(e.end_dt), i) for i, e in enumerate(entries)
+        )
+        counts = index.conflict_counts()
 
-    def list_entries_for_date(self, qd: QDate) -> list[SchedulerEntryVM]:
-        start, end = self._day_bounds_iso(qd)
-        entries = self._service.list_range(start, end, include_archived=False)
+        titles = self._resolve_titles(entries)
 
         out: list[SchedulerEntryVM] = []
-        for e in entries:
-            title = self._resolve_title(e.item_kind, e.item_ref, getattr(e, "title_cache", None))
+        for i, e in enumerate(entries):
             out.append(
                 SchedulerEntryVM(
                     id=int(e.id),
                     start_dt=str(e.start_dt),
                     end_dt=str(e.end_dt),
-                    title=title,
+                    title=titles[i],
+                    series_id=e.series_id,
+                    conflicts=counts.get(i, 0),
                 )
             )
+        return index, out
+
+    def list_entries_for_date(self, qd: QDate) -> list[SchedulerEntryVM]:
+        start, end = self._day_bounds_iso(qd)
+        day = start[:10]
+
+        cached = self._cache.get(day) if self._cache is not None else None
+        if cached is not None:
+            index: IntervalIndex[int] = IntervalIndex(
+                (vm.start_dt, vm.end_dt, i) for i, vm in enumerate(cached)
+            )
+            self._loaded = (start, index, cached)
+            return list(cached)
+
+        entries = self._service.list_range(start, end, include_archived=False, limit=_DAY_LIMIT)
+        index, out = self._to_vms(entries)
+        self._loaded = (start, index, out)
+        self._truncated_day = day if len(entries) >= _DAY_LIMIT else None
+        if self._cache is not None and self._truncated_day is None:
+            self._cache.put(day, out)
+        return out
+
+    def list_entries_for_range(self, first: QDate, days: int) -> dict[str, list[SchedulerEntryVM]]:
+        """
+        Entries for `days` consecutive days starting at `first`, keyed by YYYY-MM-DD.
+
+        One range query for the whole window; entries spanning midnight appear
+        on every day they touch.
+        """
+        d0 = date(first.year(), first.month(), first.day())
+        keys = [(d0 + timedelta(days=i)).isoformat() for i in range(max(1, int(days)))]
+        if self._cache is not None and all(k in self._cache for k in keys):
+            hit = {k: self._cache.get(k) for k in keys}
+            if all(v is not None for v in hit.values()):
+                return {k: list(v) for k, v in hit.items() if v is not None}
+
+        start, _ = self._day_bounds_iso(first)
+        end, _ = self._day_bounds_iso(first.addDays(max(1, int(days))))
+        entries = self._service.list_range(start, end, include_archived=False, limit=_RANGE_LIMIT)
+        _, vms = self._to_vms(entries)
+
+        out: dict[str, list[SchedulerEntryVM]] = {}
+        for k in keys:
+            out[k] = []
+        for vm in vms:
+            for k in keys:
+                day_start = f"{k} 00:00:00"
+                day_end = f"{k} 23:59:59"
+                if vm.start_dt <= day_end and vm.end_dt > day_start:
+                    out[k].append(vm)
+        if self._cache is not None and len(entries) < _RANGE_LIMIT:
+            # Truncated windows are never cached (days could be incomplete).
+            for k in keys:
+                self._cache.put(k, out[k])
+        return out
+
+    def entry_counts(self, first: date, last: date) -> dict[str, int]:
+        """YYYY-MM-DD -> active entry count for first..last (calendar overlay source)."""
+        return {day: sm.count for day, sm in self._service.day_summaries(first, last).items()}
+
+    def day_summaries(self, first: QDate, last: QDate) -> dict[str, SchedulerDaySummaryVM]:
+        """Per-day counts/busiest hour for a month grid (aggregate query, no rows)."""
+        summaries = self._service.day_summaries(
+            date(first.year(), first.month(), first.day()),
+            date(last.year(), last.month(), last.day()),
+        )
+        out: dict[str, SchedulerDaySummaryVM] = {}
+        for day, sm in summaries.items():
+            hour = sm.busiest_hour
+            out[day] = SchedulerDaySummaryVM(
+                day=day,
+                count=sm.count,
+                busiest_hour=hour,
+                busiest_count=sm.hours[hour] if hour is not None else 0,
+            )
         return out
 
+    def conflicts_for_slot(
+        self,
+        qd: QDate,
+        start_time: QTime,
+        end_time: QTime,
+        exclude: SchedulerEntryVM | None = None,
+    ) -> list[SchedulerEntryVM]:
+        """Entries overlapping a proposed slot; served from the loaded day when possible."""
+        return self.conflicts_for_range(
+            qd, self._combine_date_time(qd, start_time), self._combine_date_time(qd, end_time), exclude=exclude
+        )
+
+    def conflicts_for_range(
+        self,
+        qd: QDate,
+        start_iso: str,
+        end_iso: str,
+        exclude: SchedulerEntryVM | None = None,
+    ) -> list[SchedulerEntryVM]:
+        """Like conflicts_for_slot, for a range that may cross midnight (checked against `qd`'s entries)."""
+        day_start, _ = self._day_bounds_iso(qd)
+        if self._loaded is None or self._loaded[0] != day_start:
+            self.list_entries_for_date(qd)
+        if self._loaded is None:
+            return []
+        _, index, vms = self._loaded
+
+        exclude_idx = vms.index(exclude) if exclude is not None and exclude in vms else None
+        return [vms[i] for i in index.overlapping(start_iso, end_iso, exclude=exclude_idx)]
+
     def create_adhoc(
         self,
         qd: QDate,
@@ -96,6 +241,7 @@ class SchedulerController:
         start_time: QTime,
         end_time: QTime,
         notes: str | None = None,
+        rrule: str | None = None,
     ) -> int:
         ttl = (title or "").strip()
         if not ttl:
@@ -104,6 +250,17 @@ class SchedulerController:
         start_iso = self._combine_date_time(qd, start_time)
         end_iso = self._combine_date_time(qd, end_time)
 
+        if rrule:
+            return self._service.schedule_series(
+                item_kind="adhoc",
+                item_ref=str(uuid4()),
+                start=start_iso,
+                end=end_iso,
+                rrule=rrule,
+                title_cache=ttl,
+                notes_cache=notes,
+            )
+
         entry_id = self._service.schedule(
             item_kind="adhoc",
             item_ref=str(uuid4()),
@@ -114,19 +271,68 @@ class SchedulerController:
         )
         return int(entry_id)
 
-    def reschedule_entry(
-        self,
-        entry_id: int,
-        qd: QDate,
-        new_start_time: QTime,
-        new_end_time: QTime,
-    ) -> None:
-        start_iso = self._combine_date_time(qd, new_start_time)
-        end_iso = self._combine_date_time(qd, new_end_time)
-        self._service.reschedule(int(entry_id), start_iso, end_iso)
-
-    def archive_entry(self, entry_id: int) -> None:
-        self._service.archive(int(entry_id))
+    def reschedule_entry(self, vm: SchedulerEntryVM, start_iso: str, end_iso: str) -> int:
+        """Returns the entry id now holding the slot (new for series instances)."""
+        if vm.series_id is not None:
+            # Series instance: materialize as a one-off + exception (series untouched).
+            return self._service.reschedule_instance(vm.series_id, vm.start_dt, start_iso, end_iso)
+        self._service.reschedule(int(vm.id), start_iso, end_iso)
+        return int(vm.id)
+
+    # -------------------------
+    # Optimistic view-model helpers (no I/O)
+    # -------------------------
+    def moved_vm(self, vm: SchedulerEntryVM, qd: QDate, start: QTime, end: QTime) -> SchedulerEntryVM:
+        return replace(
+            vm,
+            start_dt=self._combine_date_time(qd, start),
+            end_dt=self._combine_date_time(qd, end),
+        )
+
+    def shifted_vm(self, vm: SchedulerEntryVM, start_delta_min: int, end_delta_min: int) -> SchedulerEntryVM:
+        """`vm` with its real start/end moved by the given minutes (keeps days for entries crossing midnight)."""
+        return replace(
+            vm,
+            start_dt=self._shift_iso(vm.start_dt, start_delta_min),
+            end_dt=self._shift_iso(vm.end_dt, end_delta_min),
+        )
+
+    @staticmethod
+    def recount_conflicts(vms: list[SchedulerEntryVM]) -> list[SchedulerEntryVM]:
+        ordered = sorted(vms, key=lambda v: v.start_dt)
+        index: IntervalIndex[int] = IntervalIndex((v.start_dt, v.end_dt, i) for i, v in enumerate(ordered))
+        counts = index.conflict_counts()
+        return [
+            v if v.conflicts == counts.get(i, 0) else replace(v, conflicts=counts.get(i, 0))
+            for i, v in enumerate(ordered)
+        ]
+
+    def remember(self, qd: QDate, vms: list[SchedulerEntryVM]) -> None:
+        """Adopt confirmed view models as the loaded (and cached) state of a day."""
+        start, _ = self._day_bounds_iso(qd)
+        index: IntervalIndex[int] = IntervalIndex((v.start_dt, v.end_dt, i) for i, v in enumerate(vms))
+        self._loaded = (start, index, list(vms))
+        if self._cache is not None and start[:10] != self._truncated_day:
+            self._cache.put(start[:10], vms)
+
+    def archive_entry(self, vm: SchedulerEntryVM) -> None:
+        if vm.series_id is not None:
+            self._service.skip_instance(vm.series_id, vm.start_dt)
+            return
+        self._service.archive(int(vm.id))
+
+    @staticmethod
+    def move_delta(vm: SchedulerEntryVM, moved: SchedulerEntryVM) -> dict[str, int]:
+        """Per-day count change for rescheduling `vm` as `moved` (for SchedulerState deltas)."""
+        old_day = str(vm.start_dt)[:10]
+        new_day = str(moved.start_dt)[:10]
+        if old_day == new_day:
+            return {}
+        return {old_day: -1, new_day: 1}
+
+    @staticmethod
+    def archive_delta(vm: SchedulerEntryVM) -> dict[str, int]:
+        return {str(vm.start_dt)[:10]: -1}
 
     def format_time_range(self, start_dt: str, end_dt: str) -> str:
         a = self._fmt_time(start_dt)
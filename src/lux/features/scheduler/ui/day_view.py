@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from PySide6.QtCore import Qt, QDate, QTime
 from PySide6.QtWidgets import (
     QWidget,
@@ -13,29 +15,48 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QTimeEdit,
     QMessageBox,
+    QMenu,
 )
 
+from lux.core import instrumentation
 from lux.core.scheduler.service import SchedulerService
 from lux.features.scheduler.ui.controller import SchedulerController, SchedulerEntryVM
+from lux.features.scheduler.ui.dialogs import confirm_overlap
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher
 from lux.features.scheduler.ui.state import SchedulerState
+from lux.features.scheduler.ui.time_grid import HOUR_PX, DayTimeGrid
+from lux.ui.qt.optimistic import OptimisticCommand, OptimisticQueue
 from lux.ui.qt.widgets.cards import Card
-from lux.ui.qt.widgets.buttons import LuxButton
 
 
 class SchedulerDayView(QWidget):
     """Scheduler Day View (feature-provided).
 
     Contract:
-    - Bounded list for selected date.
+    - Bounded time grid for selected date.
     - Reschedule edits start/end times only (same-day only).
     - Archive hides from default list.
     """
 
-    def __init__(self, scheduler_service: SchedulerService, state: SchedulerState, parent=None) -> None:
+    def __init__(
+        self,
+        scheduler_service: SchedulerService,
+        state: SchedulerState,
+        prefetcher: SchedulerPrefetcher | None = None,
+        parent=None,
+    ) -> None:
         super().__init__(parent)
 
         self._state = state
-        self._ctl = SchedulerController(scheduler_service)
+        self._prefetcher = prefetcher
+        self._ctl = SchedulerController(scheduler_service, cache=prefetcher.cache if prefetcher else None)
+        self._stale = True
+        self._rows: list[SchedulerEntryVM] = []
+        self._own_write = False  # confirmed optimistic write: skip our own reload
+
+        # Archive/reschedule update the grid first; the write runs on the next loop turn.
+        self._queue = OptimisticQueue(self)
+        self._queue.failed.connect(self._on_write_failed)  # type: ignore[arg-type]
 
         self._state.date_changed.connect(self._on_state_date_changed)  # type: ignore[arg-type]
         self._state.data_changed.connect(self._refresh)  # type: ignore[arg-type]
@@ -68,26 +89,26 @@ class SchedulerDayView(QWidget):
         c.setContentsMargins(12, 12, 12, 12)
         c.setSpacing(10)
 
-        caption = QLabel("Entries")
-        caption.setObjectName("MetaCaption")
-        c.addWidget(caption)
+        self._caption = QLabel("Entries")
+        self._caption.setObjectName("MetaCaption")
+        self._caption.setWordWrap(True)
+        c.addWidget(self._caption)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
+        self._scroll = QScrollArea()
+        self._scroll.setWidgetResizable(True)
+        self._scroll.setFrameShape(QFrame.NoFrame)
 
-        self._list_host = QWidget()
-        self._list_lay = QVBoxLayout(self._list_host)
-        self._list_lay.setContentsMargins(0, 0, 0, 0)
-        self._list_lay.setSpacing(8)
+        self._grid = DayTimeGrid()
+        self._grid.entry_activated.connect(lambda vm: self._edit_time(vm, self._state.selected_date()))  # type: ignore[arg-type]
+        self._grid.entry_context.connect(self._on_entry_context)  # type: ignore[arg-type]
+        self._grid.entry_time_changed.connect(self._on_entry_dragged)  # type: ignore[arg-type]
 
-        scroll.setWidget(self._list_host)
-        c.addWidget(scroll, 1)
+        self._scroll.setWidget(self._grid)
+        self._scroll.verticalScrollBar().setValue(8 * HOUR_PX)
+        c.addWidget(self._scroll, 1)
 
         root.addWidget(card, 1)
 
-        self._refresh()
-
     def _on_date_changed(self, qd: QDate) -> None:
         self._state.set_selected_date(qd)
         self._refresh()
@@ -101,77 +122,143 @@ class SchedulerDayView(QWidget):
                 self._date.blockSignals(False)
         self._refresh()
 
-    def _clear_list(self) -> None:
-        while self._list_lay.count():
-            item = self._list_lay.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._stale:
+            self._refresh()
 
     def _refresh(self) -> None:
-        self._clear_list()
+        # Hidden behind the week/month view: reload when shown again.
+        if not self.isVisible():
+            self._stale = True
+            return
+        self._stale = False
+
+        if self._own_write:
+            # Our grid already shows the confirmed state (reconciled in place).
+            self._own_write = False
+            return
+        self._reload()
 
+    @instrumentation.timed("view.scheduler_day.refresh")
+    def _reload(self) -> None:
         qd = self._state.selected_date()
+        day = qd.toString("yyyy-MM-dd")
 
         try:
             rows = self._ctl.list_entries_for_date(qd)
         except Exception as e:
-            err = QLabel(
+            self._caption.setText(
                 "Scheduler failed to load entries.\n\n"
                 f"{type(e).__name__}: {e}"
             )
-            err.setObjectName("MetaCaption")
-            err.setWordWrap(True)
-            self._list_lay.addWidget(err)
-            self._list_lay.addStretch(1)
+            self._rows = []
+            self._grid.set_entries(day, [])
             return
 
-        if not rows:
-            empty = QLabel("No scheduled entries for this day.")
-            empty.setObjectName("MetaCaption")
-            empty.setWordWrap(True)
-            self._list_lay.addWidget(empty)
-            self._list_lay.addStretch(1)
-            return
-
-        for vm in rows:
-            self._list_lay.addWidget(self._make_row(vm, qd))
+        self._show(rows)
 
-        self._list_lay.addStretch(1)
+        if self._prefetcher is not None:
+            self._prefetcher.prefetch_around(qd)
 
-    def _make_row(self, vm: SchedulerEntryVM, qd: QDate) -> QWidget:
-        row = QWidget()
-        r = QHBoxLayout(row)
-        r.setContentsMargins(0, 0, 0, 0)
-        r.setSpacing(10)
+    def _show(self, rows: list[SchedulerEntryVM]) -> None:
+        self._rows = list(rows)
+        if not rows:
+            self._caption.setText("No scheduled entries for this day.")
+        else:
+            clashes = sum(1 for vm in rows if vm.conflicts)
+            text = f"{len(rows)} entries"
+            if clashes:
+                text += f" · ⚠ {clashes} overlapping"
+            self._caption.setText(text + " · drag to move, drag the bottom edge to resize")
+
+        self._grid.set_entries(self._state.selected_date().toString("yyyy-MM-dd"), self._rows)
+
+    # -------------------------
+    # Optimistic commands
+    # -------------------------
+    def _on_write_failed(self, label: str, message: str) -> None:
+        QMessageBox.warning(self, f"{label} failed", f"The change was reverted.\n\n{message}")
+        self._own_write = False
+        self._refresh()
 
-        time_lbl = QLabel(self._ctl.format_time_range(vm.start_dt, vm.end_dt))
-        time_lbl.setObjectName("MetaCaption")
-        time_lbl.setMinimumWidth(72)
-        r.addWidget(time_lbl, 0)
+    def _confirm(self, qd: QDate, delta: dict[str, int]) -> None:
+        self._own_write = self.isVisible()
+        try:
+            self._state.notify_data_changed(delta)
+        finally:
+            self._own_write = False
+        # data_changed cleared the shared day cache; re-seed it with our rows.
+        self._ctl.remember(qd, self._rows)
+
+    def _on_entry_context(self, vm: SchedulerEntryVM, global_pos) -> None:
+        menu = QMenu(self)
+        edit_act = menu.addAction("Edit…")
+        arch_act = menu.addAction("Archive")
+        chosen = menu.exec(global_pos)
+        if chosen is edit_act:
+            self._edit_time(vm, self._state.selected_date())
+        elif chosen is arch_act:
+            self._archive(vm)
+
+    def _on_entry_dragged(self, vm: SchedulerEntryVM, start_delta: int, end_delta: int) -> None:
+        qd = self._state.selected_date()
+        # Shift the real start/end: an entry crossing midnight keeps its other day.
+        moved = self._ctl.shifted_vm(vm, start_delta, end_delta)
+        if moved.start_dt >= moved.end_dt:
+            self._refresh()
+            return
 
-        title_lbl = QLabel(vm.title)
-        title_lbl.setWordWrap(True)
-        r.addWidget(title_lbl, 1)
+        clashes = self._ctl.conflicts_for_range(qd, moved.start_dt, moved.end_dt, exclude=vm)
+        if clashes and not confirm_overlap(self, clashes):
+            self._refresh()
+            return
 
-        edit_btn = LuxButton("Edit")
-        edit_btn.setMinimumHeight(32)
-        edit_btn.clicked.connect(lambda _=False, v=vm: self._edit_time(v, qd))  # type: ignore[arg-type]
-        r.addWidget(edit_btn, 0)
+        # Timed after the overlap prompt: only the optimistic apply and the queued write.
+        with instrumentation.timer("dnd.drop.scheduler_day"):
+            self._reschedule(vm, qd, moved)
+
+    def _reschedule(self, vm: SchedulerEntryVM, qd: QDate, moved: SchedulerEntryVM) -> None:
+        def apply() -> None:
+            rows = [moved if r == vm else r for r in self._rows]
+            self._show(self._ctl.recount_conflicts(rows))
+
+        def confirm(entry_id: int) -> None:
+            if vm.series_id is not None:
+                # The instance became a one-off entry.
+                slot = (vm.series_id, moved.start_dt, moved.end_dt)
+                self._rows = [
+                    replace(r, id=entry_id, series_id=None) if (r.series_id, r.start_dt, r.end_dt) == slot else r
+                    for r in self._rows
+                ]
+                self._grid.set_entries(qd.toString("yyyy-MM-dd"), self._rows)
+            self._confirm(qd, self._ctl.move_delta(vm, moved))
+
+        self._queue.submit(
+            OptimisticCommand(
+                label="Reschedule",
+                apply=apply,
+                write=lambda: self._ctl.reschedule_entry(vm, moved.start_dt, moved.end_dt),
+                rollback=lambda: None,  # _on_write_failed reloads the day
+                confirm=confirm,
+            )
+        )
 
-        arch_btn = LuxButton("Archive")
-        arch_btn.setMinimumHeight(32)
-        arch_btn.clicked.connect(lambda _=False, eid=vm.id: self._archive(eid))  # type: ignore[arg-type]
-        r.addWidget(arch_btn, 0)
+    def _archive(self, vm: SchedulerEntryVM) -> None:
+        qd = self._state.selected_date()
 
-        return row
+        def apply() -> None:
+            self._show(self._ctl.recount_conflicts([r for r in self._rows if r != vm]))
 
-    def _archive(self, entry_id: int) -> None:
-        try:
-            self._ctl.archive_entry(entry_id)
-            self._state.notify_data_changed()
-        except Exception as e:
-            QMessageBox.warning(self, "Archive failed", f"{type(e).__name__}: {e}")
+        self._queue.submit(
+            OptimisticCommand(
+                label="Archive",
+                apply=apply,
+                write=lambda: self._ctl.archive_entry(vm),
+                rollback=lambda: None,  # _on_write_failed reloads the day
+                confirm=lambda _result: self._confirm(qd, self._ctl.archive_delta(vm)),
+            )
+        )
 
     def _edit_time(self, vm: SchedulerEntryVM, qd: QDate) -> None:
         def _parse_time(dt_str: str) -> QTime:
@@ -226,8 +313,8 @@ class SchedulerDayView(QWidget):
             QMessageBox.warning(self, "Invalid time range", "End time must be after start time.")
             return
 
-        try:
-            self._ctl.reschedule_entry(vm.id, qd, start.time(), end.time())
-            self._state.notify_data_changed()
-        except Exception as e:
-            QMessageBox.warning(self, "Reschedule failed", f"{type(e).__name__}: {e}")
+        clashes = self._ctl.conflicts_for_slot(qd, start.time(), end.time(), exclude=vm)
+        if clashes and not confirm_overlap(self, clashes):
+            return
+
+        self._reschedule(vm, qd, self._ctl.moved_vm(vm, qd, start.time(), end.time()))
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, TypeVar
+
+from PySide6.QtCore import Qt, QDate, QRect, QTimer
+from PySide6.QtGui import QColor, QPainter, QPalette
+from PySide6.QtWidgets import QCalendarWidget
+
+log = logging.getLogger(__name__)
+
+# (first, last) inclusive -> YYYY-MM-DD -> value
+EntryCountSource = Callable[[date, date], dict[str, int]]
+TaskRatioSource = Callable[[date, date], dict[str, tuple[int, int]]]
+
+V = TypeVar("V")
+
+# Cached months: the three visible ones plus recently shown ones, least recently shown evicted first.
+_MAX_MONTHS = 12
+
+
+@dataclass
+class _MonthDensity:
+    counts: dict[str, int] = field(default_factory=dict)
+    tasks: dict[str, tuple[int, int]] | None = None  # None = not loaded / invalidated
+
+
+def _month_part(by_day: dict[str, V], year: int, month: int) -> dict[str, V]:
+    prefix = f"{year:04d}-{month:02d}-"
+    return {day: v for day, v in by_day.items() if day.startswith(prefix)}
+
+
+class DensityCalendar(QCalendarWidget):
+    """QCalendarWidget with a per-day load overlay (entry count + task completion bar)."""
+
+    def __init__(
+        self,
+        entry_counts: EntryCountSource,
+        task_ratios: TaskRatioSource | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._entry_counts = entry_counts
+        self._task_ratios = task_ratios
+        self._months: OrderedDict[tuple[int, int], _MonthDensity] = OrderedDict()
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self._ensure_visible_months)  # type: ignore[arg-type]
+
+        self.currentPageChanged.connect(lambda _y, _m: self._ensure_visible_months())  # type: ignore[arg-type]
+        self._ensure_visible_months()
+
+    # -------------------------
+    # Cache
+    # -------------------------
+    @staticmethod
+    def _month_bounds(year: int, month: int) -> tuple[date, date]:
+        first = date(year, month, 1)
+        nxt = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return first, date.fromordinal(nxt.toordinal() - 1)
+
+    def _visible_months(self) -> list[tuple[int, int]]:
+        """Shown month and its neighbours (the grid's leading and trailing days)."""
+        i = self.yearShown() * 12 + self.monthShown() - 1
+        return [(k // 12, k % 12 + 1) for k in (i - 1, i, i + 1)]
+
+    @classmethod
+    def _span(cls, keys: list[tuple[int, int]]) -> tuple[date, date]:
+        return cls._month_bounds(*keys[0])[0], cls._month_bounds(*keys[-1])[1]
+
+    def _ensure_visible_months(self) -> None:
+        keys = self._visible_months()
+        try:
+            missing = [k for k in keys if k not in self._months]
+            if missing:
+                counts = self._entry_counts(*self._span(missing))
+                for k in missing:
+                    self._months[k] = _MonthDensity(counts=_month_part(counts, *k))
+            stale = [k for k in keys if self._months[k].tasks is None]
+            if stale and self._task_ratios is not None:
+                ratios = self._task_ratios(*self._span(stale))
+                for k in stale:
+                    self._months[k].tasks = _month_part(ratios, *k)
+        except Exception:
+            # Fail-soft: the calendar stays usable without the overlay.
+            log.exception("Calendar density load failed")
+            return
+        finally:
+            for k in keys:
+                if k in self._months:
+                    self._months.move_to_end(k)
+            while len(self._months) > _MAX_MONTHS:
+                self._months.popitem(last=False)
+        self.updateCells()
+
+    def apply_delta(self, delta: dict[str, int] | None) -> None:
+        """Patch cached counts from a SchedulerState delta (None = unknown change)."""
+        if delta is None:
+            self._months.clear()
+            self._reload_timer.start()
+            return
+
+        for day, change in delta.items():
+            if not change:
+                continue
+            try:
+                d = date.fromisoformat(day)
+            except ValueError:
+                continue
+            md = self._months.get((d.year, d.month))
+            if md is None:
+                continue  # not cached yet: loaded fresh when shown
+            n = md.counts.get(day, 0) + int(change)
+            if n > 0:
+                md.counts[day] = n
+            else:
+                md.counts.pop(day, None)
+            self.updateCell(QDate(d.year, d.month, d.day))
+
+    def invalidate_tasks(self, first_day: str | None = None, last_day: str | None = None) -> None:
+        """
+        Task writes: drop cached ratios of months overlapping [first_day, last_day]
+        (None bounds are open); the visible months reload once if one was touched.
+        """
+        visible = set(self._visible_months())
+        touched = False
+        for (y, m), md in self._months.items():
+            first, last = self._month_bounds(y, m)
+            if (first_day is not None and first_day > last.isoformat()) or (
+                last_day is not None and last_day < first.isoformat()
+            ):
+                continue
+            md.tasks = None
+            touched = touched or (y, m) in visible
+        if touched:
+            self._reload_timer.start()
+
+    # -------------------------
+    # Painting
+    # -------------------------
+    def paintCell(self, painter: QPainter, rect: QRect, qd: QDate) -> None:
+        super().paintCell(painter, rect, qd)
+
+        md = self._months.get((qd.year(), qd.month()))
+        if md is None:
+            return
+        day = qd.toString("yyyy-MM-dd")
+        count = md.counts.get(day, 0)
+        done, total = (md.tasks or {}).get(day, (0, 0))
+        if not count and not total:
+            return
+
+        accent = self.palette().color(QPalette.Highlight)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        # Entry load: up to four dots along the top edge.
+        if count:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(accent)
+            r = 2
+            for i in range(min(4, count)):
+                painter.drawEllipse(rect.left() + 4 + i * (2 * r + 2), rect.top() + 3, 2 * r, 2 * r)
+
+        # Task completion: thin bar along the bottom edge.
+        if total:
+            bar = QRect(rect.left() + 3, rect.bottom() - 4, rect.width() - 6, 3)
+            track = QColor(accent)
+            track.setAlpha(50)
+            painter.fillRect(bar, track)
+            filled = QRect(bar)
+            filled.setWidth(int(bar.width() * done / total))
+            painter.fillRect(filled, accent)
+
+        painter.restore()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import QMessageBox, QWidget
+
+from lux.features.scheduler.ui.controller import SchedulerEntryVM
+
+
+def confirm_overlap(parent: QWidget, clashes: list[SchedulerEntryVM]) -> bool:
+    """Ask before saving a slot that double-books existing entries."""
+    names = "\n".join(f"• {c.title}" for c in clashes[:5])
+    more = f"\n…and {len(clashes) - 5} more" if len(clashes) > 5 else ""
+    res = QMessageBox.question(
+        parent,
+        "Overlapping entries",
+        f"This time overlaps:\n{names}{more}\n\nSave anyway?",
+    )
+    return res == QMessageBox.Yes
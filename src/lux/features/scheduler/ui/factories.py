@@ -5,9 +5,12 @@ from typing import Callable
 from PySide6.QtWidgets import QWidget
 
 from lux.app.services import SystemServices
-from lux.features.scheduler.ui.day_view import SchedulerDayView
+from lux.core import instrumentation
+from lux.core.events import ENTITY_TASK_DEFINITION, ENTITY_TASK_OCCURRENCE
 from lux.features.scheduler.ui.panel import SchedulerLeftPanel
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher
 from lux.features.scheduler.ui.state import SchedulerState
+from lux.features.scheduler.ui.view_switcher import SchedulerViewSwitcher
 
 
 def make_scheduler_factories() -> tuple[Callable[[SystemServices], QWidget], Callable[[SystemServices], QWidget]]:
@@ -16,11 +19,48 @@ def make_scheduler_factories() -> tuple[Callable[[SystemServices], QWidget], Cal
     System navigation remains dumb: it only holds the returned callables.
     """
     state = SchedulerState()
+    prefetchers: dict[int, SchedulerPrefetcher] = {}
+
+    def prefetcher_for(services: SystemServices) -> SchedulerPrefetcher:
+        # One shared day cache per service; connected to data_changed before any
+        # view so it is cleared before views reload.
+        key = id(services.scheduler_service)
+        pf = prefetchers.get(key)
+        if pf is None:
+            pf = SchedulerPrefetcher(services.scheduler_service, parent=state)
+            if services.change_bus is not None:
+                # Committed writes (undo replays included) drop only the days they touch.
+                services.change_bus.subscribe(pf.apply_changes, entities=pf.WATCHED_ENTITIES)
+            else:
+                state.data_changed.connect(pf.invalidate)  # type: ignore[arg-type]
+            if services.lifecycle is not None:
+                # Warm start: last session's days (re-queried if data changed since).
+                saved = services.lifecycle.load_cache(pf.WARM_CACHE)
+                if saved is not None:
+                    pf.restore_warm(saved.data, current=saved.current)
+                services.lifecycle.register_cache(pf.WARM_CACHE, pf.warm_snapshot)
+            prefetchers[key] = pf
+        instrumentation.register_gauge("cache.scheduler_days.hit_rate", pf.cache.hit_rate)
+        return pf
 
     def make_left(services: SystemServices) -> QWidget:
-        return SchedulerLeftPanel(services.scheduler_service, state)
+        tasks = services.tasks_service
+        panel = SchedulerLeftPanel(
+            services.scheduler_service,
+            state,
+            prefetcher_for(services),
+            task_ratios=tasks.completion_by_day,
+        )
+        if services.change_bus is not None:
+            # Panels are rebuilt on every navigation: unhook with the widget.
+            unsubscribe = services.change_bus.subscribe(
+                panel.apply_task_changes,
+                entities=(ENTITY_TASK_OCCURRENCE, ENTITY_TASK_DEFINITION),
+            )
+            panel.destroyed.connect(lambda *_: unsubscribe())  # type: ignore[arg-type]
+        return panel
 
     def make_right(services: SystemServices) -> QWidget:
-        return SchedulerDayView(services.scheduler_service, state)
+        return SchedulerViewSwitcher(services.scheduler_service, state, prefetcher_for(services))
 
     return make_left, make_right
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt, QDate, QRectF, Signal
+from PySide6.QtGui import QColor, QPainter, QPalette, QPen
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+)
+
+from lux.core import instrumentation
+from lux.core.scheduler.service import SchedulerService
+from lux.features.scheduler.ui.controller import SchedulerController, SchedulerDaySummaryVM
+from lux.features.scheduler.ui.state import SchedulerState
+from lux.ui.qt.widgets.buttons import LuxButton
+from lux.ui.qt.widgets.cards import Card
+
+
+_ROWS = 6
+_HEADER_PX = 24
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+class _MonthCanvas(QWidget):
+    """Painted 6x7 month grid fed by per-day aggregates (count + busiest hour)."""
+
+    day_clicked = Signal(QDate)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._first = QDate.currentDate()     # first visible cell (a Monday)
+        self._month = QDate.currentDate().month()
+        self._selected = QDate.currentDate()
+        self._summaries: dict[str, SchedulerDaySummaryVM] = {}
+        self._max_count = 1
+        self.setMinimumHeight(_HEADER_PX + _ROWS * 56)
+
+    def set_data(
+        self,
+        first: QDate,
+        month: int,
+        selected: QDate,
+        summaries: dict[str, SchedulerDaySummaryVM],
+    ) -> None:
+        self._first = first
+        self._month = month
+        self._selected = selected
+        self._summaries = summaries
+        self._max_count = max([s.count for s in summaries.values()] + [1])
+        self.update()
+
+    def set_selected(self, qd: QDate) -> None:
+        self._selected = qd
+        self.update()
+
+    def _cell(self) -> tuple[float, float]:
+        return (
+            max(1.0, self.width() / 7.0),
+            max(1.0, (self.height() - _HEADER_PX) / float(_ROWS)),
+        )
+
+    def mousePressEvent(self, event) -> None:
+        cw, ch = self._cell()
+        pos = event.position()
+        if pos.y() >= _HEADER_PX:
+            col = int(pos.x() // cw)
+            row = int((pos.y() - _HEADER_PX) // ch)
+            if 0 <= col < 7 and 0 <= row < _ROWS:
+                self.day_clicked.emit(self._first.addDays(row * 7 + col))
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event) -> None:
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing, True)
+
+        pal = self.palette()
+        text = pal.color(QPalette.WindowText)
+        muted = QColor(text)
+        muted.setAlpha(110)
+        grid = QColor(text)
+        grid.setAlpha(40)
+        accent = pal.color(QPalette.Highlight)
+
+        cw, ch = self._cell()
+
+        p.setPen(muted)
+        for col, name in enumerate(_WEEKDAYS):
+            p.drawText(QRectF(col * cw, 0, cw, _HEADER_PX), Qt.AlignCenter, name)
+
+        for idx in range(_ROWS * 7):
+            row, col = divmod(idx, 7)
+            r = QRectF(col * cw, _HEADER_PX + row * ch, cw, ch)
+            qd = self._first.addDays(idx)
+            sm = self._summaries.get(qd.toString("yyyy-MM-dd"))
+
+            if sm is not None and sm.count:
+                # Density shade relative to the busiest day on screen.
+                heat = QColor(accent)
+                heat.setAlpha(25 + int(120 * sm.count / self._max_count))
+                p.fillRect(r.adjusted(1, 1, -1, -1), heat)
+
+            if qd == self._selected:
+                p.setPen(QPen(accent, 2))
+                p.setBrush(Qt.NoBrush)
+                p.drawRect(r.adjusted(1, 1, -1, -1))
+
+            p.setPen(QPen(grid, 1))
+            p.setBrush(Qt.NoBrush)
+            p.drawRect(r)
+
+            p.setPen(text if qd.month() == self._month else muted)
+            p.drawText(r.adjusted(6, 4, -6, -4), Qt.AlignLeft | Qt.AlignTop, str(qd.day()))
+
+            if sm is not None and sm.count:
+                lines = [f"{sm.count} item{'s' if sm.count != 1 else ''}"]
+                if sm.busiest_hour is not None and ch >= 48:
+                    lines.append(f"peak {sm.busiest_hour:02d}:00")
+                p.setPen(text)
+                p.drawText(r.adjusted(6, 4, -6, -4), Qt.AlignLeft | Qt.AlignBottom, "\n".join(lines))
+
+        p.end()
+
+
+class SchedulerMonthView(QWidget):
+    """Scheduler Month View (feature-provided).
+
+    Contract:
+    - One aggregate query per visible month (GROUP BY day; no entry rows).
+    - Clicking a day selects it in SchedulerState.
+    """
+
+    def __init__(self, scheduler_service: SchedulerService, state: SchedulerState, parent=None) -> None:
+        super().__init__(parent)
+
+        self._state = state
+        self._ctl = SchedulerController(scheduler_service)
+        self._stale = True
+        self._loaded_first: QDate | None = None
+
+        self._state.date_changed.connect(self._on_state_date_changed)  # type: ignore[arg-type]
+        self._state.data_changed.connect(self._refresh)  # type: ignore[arg-type]
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(12)
+
+        header = QWidget()
+        h = QHBoxLayout(header)
+        h.setContentsMargins(0, 0, 0, 0)
+        h.setSpacing(10)
+
+        title = QLabel("Month")
+        title.setObjectName("TitleUnified")
+        h.addWidget(title, 0, Qt.AlignVCenter)
+
+        h.addStretch(1)
+
+        prev_btn = LuxButton("‹")
+        prev_btn.clicked.connect(lambda: self._shift(-1))  # type: ignore[arg-type]
+        h.addWidget(prev_btn, 0)
+
+        self._month_lbl = QLabel("")
+        self._month_lbl.setObjectName("MetaCaption")
+        h.addWidget(self._month_lbl, 0, Qt.AlignVCenter)
+
+        next_btn = LuxButton("›")
+        next_btn.clicked.connect(lambda: self._shift(1))  # type: ignore[arg-type]
+        h.addWidget(next_btn, 0)
+
+        root.addWidget(header, 0)
+
+        card = Card()
+        c = QVBoxLayout(card)
+        c.setContentsMargins(12, 12, 12, 12)
+        c.setSpacing(10)
+
+        self._error = QLabel("")
+        self._error.setObjectName("MetaCaption")
+        self._error.setWordWrap(True)
+        self._error.hide()
+        c.addWidget(self._error)
+
+        self._canvas = _MonthCanvas()
+        self._canvas.day_clicked.connect(self._state.set_selected_date)  # type: ignore[arg-type]
+        c.addWidget(self._canvas, 1)
+
+        root.addWidget(card, 1)
+
+    @staticmethod
+    def _grid_start(qd: QDate) -> QDate:
+        first_of_month = QDate(qd.year(), qd.month(), 1)
+        return first_of_month.addDays(1 - first_of_month.dayOfWeek())  # Monday on/before the 1st
+
+    def _shift(self, months: int) -> None:
+        self._state.set_selected_date(self._state.selected_date().addMonths(months))
+
+    def _on_state_date_changed(self, qd: QDate) -> None:
+        # Same month: selection outline only, no reload.
+        if not self._stale and self._loaded_first == self._grid_start(qd):
+            self._canvas.set_selected(qd)
+            return
+        self._refresh()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._stale:
+            self._refresh()
+
+    def _refresh(self, *_args) -> None:
+        if not self.isVisible():
+            self._stale = True
+            return
+        self._stale = False
+        self._reload()
+
+    @instrumentation.timed("view.scheduler_month.refresh")
+    def _reload(self) -> None:
+        selected = self._state.selected_date()
+        first = self._grid_start(selected)
+        self._month_lbl.setText(selected.toString("MMMM yyyy"))
+
+        try:
+            summaries = self._ctl.day_summaries(first, first.addDays(_ROWS * 7 - 1))
+        except Exception as e:
+            self._error.setText(f"Scheduler failed to load the month.\n\n{type(e).__name__}: {e}")
+            self._error.show()
+            self._canvas.set_data(first, selected.month(), selected, {})
+            self._loaded_first = None
+            return
+
+        self._loaded_first = first
+        self._error.hide()
+        self._canvas.set_data(first, selected.month(), selected, summaries)
@@ -1,26 +1,43 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from PySide6.QtCore import QDate, QTime
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QCalendarWidget,
     QScrollArea,
     QFrame,
     QLineEdit,
     QTimeEdit,
     QMessageBox,
+    QComboBox,
 )
 
+from lux.core import instrumentation
+from lux.core.events import ChangeEvent
 from lux.core.scheduler.service import SchedulerService
 from lux.features.scheduler.ui.controller import SchedulerController
+from lux.features.scheduler.ui.density_calendar import DensityCalendar, TaskRatioSource
+from lux.features.scheduler.ui.dialogs import confirm_overlap
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher
 from lux.features.scheduler.ui.state import SchedulerState
 from lux.ui.qt.widgets.buttons import LuxButton
 from lux.ui.qt.widgets.cards import Card
 
 
+# (label, RRULE) — recurring entries are stored as one series row.
+_REPEAT_OPTIONS: list[tuple[str, str]] = [
+    ("Does not repeat", ""),
+    ("Daily", "FREQ=DAILY"),
+    ("Weekdays", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"),
+    ("Weekly", "FREQ=WEEKLY"),
+    ("Monthly", "FREQ=MONTHLY"),
+]
+
+
 class SchedulerLeftPanel(QWidget):
     """Scheduler Left Content Surface (feature-provided).
 
@@ -30,11 +47,19 @@ class SchedulerLeftPanel(QWidget):
     - No DB operations/imports from UI.
     """
 
-    def __init__(self, scheduler_service: SchedulerService, state: SchedulerState, parent=None) -> None:
+    def __init__(
+        self,
+        scheduler_service: SchedulerService,
+        state: SchedulerState,
+        prefetcher: SchedulerPrefetcher | None = None,
+        task_ratios: TaskRatioSource | None = None,
+        parent=None,
+    ) -> None:
         super().__init__(parent)
 
         self._state = state
-        self._ctl = SchedulerController(scheduler_service)
+        self._prefetcher = prefetcher
+        self._ctl = SchedulerController(scheduler_service, cache=prefetcher.cache if prefetcher else None)
 
         self._state.date_changed.connect(self._on_state_date_changed)  # type: ignore[arg-type]
         self._state.data_changed.connect(self._refresh_agenda)  # type: ignore[arg-type]
@@ -57,8 +82,9 @@ class SchedulerLeftPanel(QWidget):
         cal_title.setObjectName("MetaCaption")
         cal_lay.addWidget(cal_title)
 
-        self._cal = QCalendarWidget()
+        self._cal = DensityCalendar(self._ctl.entry_counts, task_ratios)
         self._cal.setSelectedDate(self._state.selected_date())
+        self._state.data_delta.connect(self._cal.apply_delta)  # type: ignore[arg-type]
         self._cal.selectionChanged.connect(self._on_calendar_changed)  # type: ignore[arg-type]
         cal_lay.addWidget(self._cal)
 
@@ -98,6 +124,18 @@ class SchedulerLeftPanel(QWidget):
         tr.addStretch(1)
         q.addWidget(time_row)
 
+        repeat_row = QWidget()
+        rr = QHBoxLayout(repeat_row)
+        rr.setContentsMargins(0, 0, 0, 0)
+        rr.setSpacing(10)
+
+        self._repeat = QComboBox()
+        for label, rule in _REPEAT_OPTIONS:
+            self._repeat.addItem(label, userData=rule)
+        rr.addWidget(QLabel("Repeat"), 0)
+        rr.addWidget(self._repeat, 1)
+        q.addWidget(repeat_row)
+
         btn_row = QHBoxLayout()
         btn_row.setContentsMargins(0, 0, 0, 0)
         btn_row.setSpacing(10)
@@ -141,6 +179,11 @@ class SchedulerLeftPanel(QWidget):
 
         self._refresh_agenda()
 
+    def apply_task_changes(self, events: Sequence[ChangeEvent]) -> None:
+        """Change-feed subscriber (task entities): refresh completion ratios where touched."""
+        for ev in events:
+            self._cal.invalidate_tasks(ev.start_day, ev.end_day)
+
     def _on_calendar_changed(self) -> None:
         self._state.set_selected_date(self._cal.selectedDate())
         self._refresh_agenda()
@@ -165,13 +208,20 @@ class SchedulerLeftPanel(QWidget):
             QMessageBox.information(self, "Invalid time range", "End time must be after start time.")
             return
 
+        clashes = self._ctl.conflicts_for_slot(qd, self._start.time(), self._end.time())
+        if clashes and not confirm_overlap(self, clashes):
+            return
+
         try:
-            self._ctl.create_adhoc(qd, title, self._start.time(), self._end.time())
+            rule = self._repeat.currentData() or None
+            self._ctl.create_adhoc(qd, title, self._start.time(), self._end.time(), rrule=rule)
             self._title.setText("")
-            self._state.notify_data_changed()
+            # A series touches many days: let aggregate views recompute.
+            self._state.notify_data_changed(None if rule else {qd.toString("yyyy-MM-dd"): 1})
         except Exception as e:
             QMessageBox.warning(self, "Create failed", f"{type(e).__name__}: {e}")
 
+    @instrumentation.timed("view.scheduler_panel.agenda")
     def _refresh_agenda(self) -> None:
         while self._agenda_lay.count():
             item = self._agenda_lay.takeAt(0)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Callable, Sequence
+
+from PySide6.QtCore import QObject, QDate, QTimer
+
+from lux.core.events import (
+    ENTITY_SCHEDULED_ENTRY,
+    ENTITY_SCHEDULED_SERIES,
+    ENTITY_SERIES_EXCEPTION,
+    ENTITY_TASK_DEFINITION,
+    ChangeEvent,
+)
+from lux.core.scheduler.service import SchedulerService
+from lux.features.scheduler.ui.controller import SchedulerController, SchedulerEntryVM
+
+log = logging.getLogger(__name__)
+
+# Stale warm sets are re-queried within this many days of the last viewed day.
+_WARM_SPAN_DAYS = 21
+
+
+class DayEntriesCache:
+    """Bounded LRU of per-day entry view models keyed by YYYY-MM-DD."""
+
+    def __init__(
+        self,
+        max_days: int = 120,
+        max_age_s: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max = max(1, int(max_days))
+        self._max_age = float(max_age_s)
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[list[SchedulerEntryVM], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, day: str) -> bool:
+        item = self._data.get(day)
+        return item is not None and item[1] > self._clock()
+
+    def get(self, day: str) -> list[SchedulerEntryVM] | None:
+        item = self._data.get(day)
+        if item is None or item[1] <= self._clock():
+            self._data.pop(day, None)
+            self.misses += 1
+            return None
+        self._data.move_to_end(day)
+        self.hits += 1
+        return item[0]
+
+    def put(self, day: str, vms: list[SchedulerEntryVM]) -> None:
+        self._data[day] = (list(vms), self._clock() + self._max_age)
+        self._data.move_to_end(day)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def discard_days(self, first_day: str | None, last_day: str | None) -> None:
+        """Drop cached days in [first_day, last_day]; None bounds are open. O(cached days)."""
+        for day in [d for d in self._data if (first_day is None or d >= first_day) and (last_day is None or d <= last_day)]:
+            del self._data[day]
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+    def days(self) -> list[str]:
+        """Unexpired cached days, least recently used first."""
+        now = self._clock()
+        return [d for d, (_, expires) in self._data.items() if expires > now]
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Unexpired days as plain dicts (LRU order kept), for persisting across launches."""
+        now = self._clock()
+        return {d: [asdict(vm) for vm in vms] for d, (vms, expires) in self._data.items() if expires > now}
+
+    def restore(self, data: object) -> int:
+        """Load a snapshot() (fresh expiry); malformed days are skipped. Returns days loaded."""
+        if not isinstance(data, dict):
+            return 0
+        loaded = 0
+        for day, rows in data.items():
+            try:
+                self.put(str(day), [SchedulerEntryVM(**row) for row in rows])
+            except (TypeError, ValueError):
+                continue
+            loaded += 1
+        return loaded
+
+
+class SchedulerPrefetcher(QObject):
+    """Loads neighbouring days into a shared DayEntriesCache while the UI is idle."""
+
+    # Lifecycle cache name (see warm_snapshot / restore_warm).
+    WARM_CACHE = "scheduler-days"
+
+    # Change-feed entities that affect cached day lists.
+    WATCHED_ENTITIES = (
+        ENTITY_SCHEDULED_ENTRY,
+        ENTITY_SCHEDULED_SERIES,
+        ENTITY_SERIES_EXCEPTION,
+        ENTITY_TASK_DEFINITION,
+    )
+
+    def __init__(
+        self,
+        service: SchedulerService,
+        cache: DayEntriesCache | None = None,
+        radius_days: int = 3,
+        delay_ms: int = 150,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._cache = cache if cache is not None else DayEntriesCache()
+        self._ctl = SchedulerController(service, cache=self._cache)
+        self._radius = max(0, int(radius_days))
+        self._pending: tuple[QDate, int] | None = None  # (first day, days)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, int(delay_ms)))
+        self._timer.timeout.connect(self._run)  # type: ignore[arg-type]
+
+    @property
+    def cache(self) -> DayEntriesCache:
+        return self._cache
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+        self._timer.stop()
+        self._pending = None
+
+    def apply_changes(self, events: Sequence[ChangeEvent]) -> None:
+        """Change-feed subscriber: drop the days each committed write touched."""
+        for ev in events:
+            if ev.entity == ENTITY_TASK_DEFINITION:
+                if ev.op != "insert":
+                    # A renamed task changes provider labels on any day.
+                    self._cache.clear()
+                    return
+                continue
+            self._cache.discard_days(ev.start_day, ev.end_day)
+
+    def warm_snapshot(self) -> dict[str, Any]:
+        """Cached days for the next launch (lifecycle cache snapshot)."""
+        return {"days": self._cache.snapshot()}
+
+    def restore_warm(self, data: object, current: bool) -> None:
+        """
+        Seed the cache from the last session. If writes were committed since it
+        was saved, only the day keys are used: the span around the most recently
+        used day is prefetched instead of trusting stale view models.
+        """
+        days = data.get("days") if isinstance(data, dict) else None
+        if not isinstance(days, dict) or not days:
+            return
+        if current:
+            self._cache.restore(days)
+            return
+
+        last = QDate.fromString(str(list(days)[-1]), "yyyy-MM-dd")
+        if not last.isValid():
+            return
+        near = [
+            qd for qd in (QDate.fromString(str(d), "yyyy-MM-dd") for d in days)
+            if qd.isValid() and abs(qd.daysTo(last)) <= _WARM_SPAN_DAYS
+        ]
+        first = min(near, key=lambda qd: qd.toJulianDay())
+        span = max(near, key=lambda qd: qd.toJulianDay())
+        self._request(first, first.daysTo(span) + 1)
+
+    def prefetch_around(self, qd: QDate) -> None:
+        """After showing a day: warm qd ± radius days."""
+        self._request(qd.addDays(-self._radius), 2 * self._radius + 1)
+
+    def prefetch_weeks_around(self, week_start: QDate) -> None:
+        """After showing a week: warm the previous and next week."""
+        self._request(week_start.addDays(-7), 21)
+
+    def _request(self, first: QDate, days: int) -> None:
+        self._pending = (first, days)
+        self._timer.start()  # restart = debounce
+
+    def _run(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        first, days = pending
+
+        missing = [i for i in range(days) if first.addDays(i).toString("yyyy-MM-dd") not in self._cache]
+        if not missing:
+            return
+
+        try:
+            # One query covering the missing span (a few cached days inside are re-put).
+            self._ctl.list_entries_for_range(first.addDays(missing[0]), missing[-1] - missing[0] + 1)
+        except Exception:
+            log.exception("Scheduler prefetch failed")
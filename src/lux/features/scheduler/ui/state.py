@@ -11,10 +11,15 @@ class SchedulerState(QObject):
 
     date_changed = Signal(QDate)
     data_changed = Signal()
+    data_delta = Signal(object)  # dict[YYYY-MM-DD, entry count change] | None (unknown)
+    view_mode_changed = Signal(str)
+
+    VIEW_MODES = ("day", "week", "month")
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._selected_date = QDate.currentDate()
+        self._view_mode = "day"
 
     def selected_date(self) -> QDate:
         return self._selected_date
@@ -27,5 +32,19 @@ class SchedulerState(QObject):
         self._selected_date = qd
         self.date_changed.emit(qd)
 
-    def notify_data_changed(self) -> None:
+    def view_mode(self) -> str:
+        return self._view_mode
+
+    def set_view_mode(self, mode: str) -> None:
+        if mode not in self.VIEW_MODES or mode == self._view_mode:
+            return
+        self._view_mode = mode
+        self.view_mode_changed.emit(mode)
+
+    def notify_data_changed(self, delta: dict[str, int] | None = None) -> None:
+        """
+        Broadcast a write. Writers that know which days gained/lost entries pass
+        `delta` so aggregate views can patch counts instead of recomputing.
+        """
+        self.data_delta.emit(dict(delta) if delta is not None else None)
         self.data_changed.emit()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from PySide6.QtCore import Qt, QEvent, QPointF, QRectF, Signal
+from PySide6.QtGui import QColor, QPainter, QPalette, QPen, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from lux.core.scheduler.layout import layout_columns
+from lux.features.scheduler.ui.controller import SchedulerEntryVM
+
+
+HOUR_PX = 48
+_GUTTER_PX = 52
+_SNAP_MIN = 15
+_MIN_DURATION = 15
+_RESIZE_GRIP_PX = 6
+_DRAG_THRESHOLD_PX = 4
+
+
+def _minutes_of_day(dt_str: str, day: str) -> int:
+    """Minutes since midnight of `day`, clamped to the day (entries may span midnight)."""
+    s = str(dt_str).replace("T", " ")
+    if s[:10] < day:
+        return 0
+    if s[:10] > day:
+        return 24 * 60
+    try:
+        return int(s[11:13]) * 60 + int(s[14:16])
+    except ValueError:
+        return 0
+
+
+@dataclass
+class _Block:
+    vm: SchedulerEntryVM
+    start_min: int
+    end_min: int
+    rect: QRectF
+
+
+@dataclass
+class _Drag:
+    block: _Block
+    mode: str            # "move" | "resize"
+    press_y: float
+    start_min: int
+    end_min: int
+    active: bool = False
+
+
+class DayTimeGrid(QWidget):
+    """Painted 24h time grid for one day."""
+
+    entry_activated = Signal(object)              # SchedulerEntryVM (double-click)
+    entry_context = Signal(object, object)        # SchedulerEntryVM, global QPoint
+    entry_time_changed = Signal(object, int, int)  # SchedulerEntryVM, start/end shift in minutes
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._day = ""
+        self._vms: list[SchedulerEntryVM] = []
+        self._columns: dict[int, tuple[int, int]] = {}
+        self._blocks: list[_Block] = []
+        self._grid_layer: QPixmap | None = None
+        self._block_layer: QPixmap | None = None
+        self._drag: _Drag | None = None
+        self.setMinimumHeight(24 * HOUR_PX + 1)
+        self.setMouseTracking(True)
+
+    # -------------------------
+    # Data
+    # -------------------------
+    def set_entries(self, day: str, vms: list[SchedulerEntryVM]) -> None:
+        self._day = day
+        self._vms = list(vms)
+        self._drag = None
+        self._columns = layout_columns(
+            (
+                _minutes_of_day(vm.start_dt, day),
+                max(_minutes_of_day(vm.start_dt, day) + _MIN_DURATION, _minutes_of_day(vm.end_dt, day)),
+                i,
+            )
+            for i, vm in enumerate(self._vms)
+        )
+        self._relayout()
+
+    def _relayout(self) -> None:
+        """Block geometry from cached columns (data change or width change only)."""
+        lane_w = max(1.0, self.width() - _GUTTER_PX - 8)
+        blocks: list[_Block] = []
+        for i, vm in enumerate(self._vms):
+            col, ncols = self._columns.get(i, (0, 1))
+            m0 = _minutes_of_day(vm.start_dt, self._day)
+            m1 = max(m0 + _MIN_DURATION, _minutes_of_day(vm.end_dt, self._day))
+            w = lane_w / ncols
+            blocks.append(_Block(vm=vm, start_min=m0, end_min=m1, rect=self._block_rect(m0, m1, col * w, w)))
+        self._blocks = blocks
+        self._block_layer = None
+        self.update()
+
+    @staticmethod
+    def _y(minutes: float) -> float:
+        return minutes * HOUR_PX / 60.0
+
+    def _block_rect(self, m0: int, m1: int, x_off: float, w: float) -> QRectF:
+        return QRectF(_GUTTER_PX + 4 + x_off + 1, self._y(m0) + 1, max(1.0, w - 2), max(4.0, self._y(m1) - self._y(m0) - 2))
+
+    # -------------------------
+    # Layers
+    # -------------------------
+    def _new_layer(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        return pm
+
+    def _render_grid(self) -> QPixmap:
+        pm = self._new_layer()
+        pal = self.palette()
+        text = pal.color(QPalette.WindowText)
+        line = QColor(text)
+        line.setAlpha(40)
+        half = QColor(text)
+        half.setAlpha(18)
+
+        p = QPainter(pm)
+        for h in range(25):
+            y = int(self._y(h * 60))
+            p.setPen(QPen(line, 1))
+            p.drawLine(_GUTTER_PX, y, self.width(), y)
+            if h < 24:
+                p.setPen(QPen(half, 1, Qt.DashLine))
+                p.drawLine(_GUTTER_PX, int(self._y(h * 60 + 30)), self.width(), int(self._y(h * 60 + 30)))
+                p.setPen(text)
+                p.drawText(QRectF(0, y + 2, _GUTTER_PX - 8, 16), Qt.AlignRight | Qt.AlignTop, f"{h:02d}:00")
+        p.end()
+        return pm
+
+    def _paint_block(self, p: QPainter, vm: SchedulerEntryVM, rect: QRectF, m0: int, m1: int, ghost: bool = False) -> None:
+        pal = self.palette()
+        fill = QColor(200, 80, 60) if vm.conflicts else QColor(pal.color(QPalette.Highlight))
+        fill.setAlpha(120 if ghost else 200)
+        p.setPen(Qt.NoPen)
+        p.setBrush(fill)
+        p.drawRoundedRect(rect, 4, 4)
+
+        p.setPen(pal.color(QPalette.HighlightedText))
+        label = vm.title
+        if rect.height() >= 30:
+            label = f"{self._fmt(m0)}–{self._fmt(m1)}\n{label}"
+        p.drawText(rect.adjusted(4, 2, -4, -2), Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, label)
+
+    def _render_blocks(self, skip: _Block | None = None) -> QPixmap:
+        pm = self._new_layer()
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        for block in self._blocks:
+            if block is not skip:
+                self._paint_block(p, block.vm, block.rect, block.start_min, block.end_min)
+        p.end()
+        return pm
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._grid_layer = None
+        self._relayout()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._grid_layer = None
+            self._block_layer = None
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        if self._grid_layer is None:
+            self._grid_layer = self._render_grid()
+        if self._block_layer is None:
+            self._block_layer = self._render_blocks(skip=self._drag.block if self._drag and self._drag.active else None)
+
+        exposed = QRectF(event.rect())
+        p = QPainter(self)
+        p.drawPixmap(exposed, self._grid_layer, self._layer_rect(exposed))
+        p.drawPixmap(exposed, self._block_layer, self._layer_rect(exposed))
+
+        drag = self._drag
+        if drag is not None and drag.active:
+            p.setRenderHint(QPainter.Antialiasing, True)
+            self._paint_block(p, drag.block.vm, self._drag_rect(drag), drag.start_min, drag.end_min, ghost=True)
+        p.end()
+
+    def _layer_rect(self, r: QRectF) -> QRectF:
+        dpr = self.devicePixelRatioF()
+        return QRectF(r.x() * dpr, r.y() * dpr, r.width() * dpr, r.height() * dpr)
+
+    # -------------------------
+    # Interaction
+    # -------------------------
+    @staticmethod
+    def _fmt(minutes: int) -> str:
+        minutes = max(0, min(24 * 60, int(minutes)))
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+    def _block_at(self, pos: QPointF) -> _Block | None:
+        for block in reversed(self._blocks):  # topmost painted last
+            if block.rect.contains(pos):
+                return block
+        return None
+
+    def _drag_rect(self, drag: _Drag) -> QRectF:
+        r = drag.block.rect
+        return QRectF(r.x(), self._y(drag.start_min) + 1, r.width(), max(4.0, self._y(drag.end_min) - self._y(drag.start_min) - 2))
+
+    def mousePressEvent(self, event) -> None:
+        block = self._block_at(event.position())
+        if block is not None and event.button() == Qt.LeftButton:
+            near_bottom = block.rect.bottom() - event.position().y() <= _RESIZE_GRIP_PX
+            self._drag = _Drag(
+                block=block,
+                mode="resize" if near_bottom else "move",
+                press_y=event.position().y(),
+                start_min=block.start_min,
+                end_min=block.end_min,
+            )
+        elif block is not None and event.button() == Qt.RightButton:
+            self.entry_context.emit(block.vm, event.globalPosition().toPoint())
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:
+        drag = self._drag
+        if drag is None:
+            block = self._block_at(event.position())
+            grip = block is not None and block.rect.bottom() - event.position().y() <= _RESIZE_GRIP_PX
+            self.setCursor(Qt.SizeVerCursor if grip else Qt.ArrowCursor)
+            return
+
+        dy = event.position().y() - drag.press_y
+        if not drag.active:
+            if abs(dy) < _DRAG_THRESHOLD_PX:
+                return
+            drag.active = True
+            self._block_layer = None  # rebuilt once without the dragged block
+            self.update(drag.block.rect.toAlignedRect())
+
+        old = self._drag_rect(drag)
+        delta = int(round(dy * 60.0 / HOUR_PX / _SNAP_MIN)) * _SNAP_MIN
+        b = drag.block
+        if drag.mode == "resize":
+            drag.start_min = b.start_min
+            drag.end_min = max(b.start_min + _MIN_DURATION, min(24 * 60, b.end_min + delta))
+        else:
+            dur = b.end_min - b.start_min
+            start = max(0, min(24 * 60 - dur, b.start_min + delta))
+            drag.start_min, drag.end_min = start, start + dur
+
+        # Only the moving block's old and new rects are repainted.
+        self.update(old.united(self._drag_rect(drag)).toAlignedRect().adjusted(-2, -2, 2, 2))
+
+    def mouseReleaseEvent(self, event) -> None:
+        drag, self._drag = self._drag, None
+        if drag is not None and drag.active:
+            self._block_layer = None
+            self.update()
+            # Shifts, not positions: block ends are clamped to this day, the entry may not be.
+            d_start, d_end = drag.start_min - drag.block.start_min, drag.end_min - drag.block.end_min
+            if d_start or d_end:
+                self.entry_time_changed.emit(drag.block.vm, d_start, d_end)
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event) -> None:
+        block = self._block_at(event.position())
+        if block is not None:
+            self.entry_activated.emit(block.vm)
+        super().mouseDoubleClickEvent(event)
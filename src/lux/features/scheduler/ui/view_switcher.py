@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget
+
+from lux.core.scheduler.service import SchedulerService
+from lux.features.scheduler.ui.day_view import SchedulerDayView
+from lux.features.scheduler.ui.month_view import SchedulerMonthView
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher
+from lux.features.scheduler.ui.state import SchedulerState
+from lux.features.scheduler.ui.week_view import SchedulerWeekView
+from lux.ui.qt.widgets.buttons import LuxButton
+
+
+class SchedulerViewSwitcher(QWidget):
+    """Right-hand Scheduler surface: Day / Week / Month views over shared SchedulerState."""
+
+    def __init__(
+        self,
+        scheduler_service: SchedulerService,
+        state: SchedulerState,
+        prefetcher: SchedulerPrefetcher | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._state = state
+        self._state.view_mode_changed.connect(self._on_mode_changed)  # type: ignore[arg-type]
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(12)
+
+        bar = QHBoxLayout()
+        bar.setContentsMargins(0, 0, 0, 0)
+        bar.setSpacing(8)
+
+        self._stack = QStackedWidget()
+        self._buttons: dict[str, LuxButton] = {}
+        self._pages: dict[str, int] = {}
+
+        views = (
+            ("day", "Day", SchedulerDayView(scheduler_service, state, prefetcher)),
+            ("week", "Week", SchedulerWeekView(scheduler_service, state, prefetcher)),
+            ("month", "Month", SchedulerMonthView(scheduler_service, state)),
+        )
+        for mode, label, view in views:
+            self._pages[mode] = self._stack.addWidget(view)
+            btn = LuxButton(label)
+            btn.setCheckable(True)
+            btn.clicked.connect(lambda _=False, m=mode: self._state.set_view_mode(m))  # type: ignore[arg-type]
+            bar.addWidget(btn, 0)
+            self._buttons[mode] = btn
+
+        bar.addStretch(1)
+        root.addLayout(bar)
+        root.addWidget(self._stack, 1)
+
+        self._on_mode_changed(self._state.view_mode())
+
+    def _on_mode_changed(self, mode: str) -> None:
+        idx = self._pages.get(mode)
+        if idx is None:
+            return
+        self._stack.setCurrentIndex(idx)
+        for m, btn in self._buttons.items():
+            btn.setChecked(m == mode)
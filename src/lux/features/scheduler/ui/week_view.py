@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt, QDate, QRectF, Signal
+from PySide6.QtGui import QColor, QPainter, QPalette, QPen
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QFrame,
+    QScrollArea,
+)
+
+from lux.core import instrumentation
+from lux.core.scheduler.layout import layout_columns
+from lux.core.scheduler.service import SchedulerService
+from lux.features.scheduler.ui.controller import SchedulerController, SchedulerEntryVM
+from lux.features.scheduler.ui.prefetch import SchedulerPrefetcher
+from lux.features.scheduler.ui.state import SchedulerState
+from lux.ui.qt.widgets.buttons import LuxButton
+from lux.ui.qt.widgets.cards import Card
+
+
+_HOUR_PX = 40
+_GUTTER_PX = 48
+_HEADER_PX = 28
+
+
+def _minutes(dt_str: str, day: str) -> int:
+    """Minutes since midnight of `day`, clamped to the day (entries may span midnight)."""
+    if dt_str[:10] < day:
+        return 0
+    if dt_str[:10] > day:
+        return 24 * 60
+    try:
+        return int(dt_str[11:13]) * 60 + int(dt_str[14:16])
+    except ValueError:
+        return 0
+
+
+class _WeekCanvas(QWidget):
+    """Painted 7-day time grid: one paint pass for all entries, no per-entry widgets."""
+
+    day_clicked = Signal(QDate)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._first = QDate.currentDate()
+        self._selected = QDate.currentDate()
+        self._days: list[tuple[str, list[SchedulerEntryVM]]] = []
+        self._columns: list[dict[int, tuple[int, int]]] = []
+        self.setMinimumHeight(_HEADER_PX + 24 * _HOUR_PX)
+
+    def set_data(self, first: QDate, selected: QDate, days: list[tuple[str, list[SchedulerEntryVM]]]) -> None:
+        self._first = first
+        self._selected = selected
+        self._days = days
+        # Overlap columns once per data change, not per paint.
+        self._columns = [
+            layout_columns(
+                (_minutes(vm.start_dt, day), max(_minutes(vm.start_dt, day) + 15, _minutes(vm.end_dt, day)), i)
+                for i, vm in enumerate(vms)
+            )
+            for day, vms in days
+        ]
+        self.update()
+
+    def set_selected(self, qd: QDate) -> None:
+        self._selected = qd
+        self.update()
+
+    def _col_width(self) -> float:
+        return max(1.0, (self.width() - _GUTTER_PX) / 7.0)
+
+    def mousePressEvent(self, event) -> None:
+        x = event.position().x() - _GUTTER_PX
+        if x >= 0:
+            col = int(x // self._col_width())
+            if 0 <= col < 7:
+                self.day_clicked.emit(self._first.addDays(col))
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event) -> None:
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing, True)
+
+        pal = self.palette()
+        text = pal.color(QPalette.WindowText)
+        grid = QColor(text)
+        grid.setAlpha(40)
+        accent = pal.color(QPalette.Highlight)
+        block = QColor(accent)
+        block.setAlpha(170)
+        clash = QColor(200, 80, 60, 190)
+
+        cw = self._col_width()
+        clip = event.rect()
+
+        # Hour grid + gutter labels (only rows intersecting the exposed rect).
+        first_hour = max(0, (clip.top() - _HEADER_PX) // _HOUR_PX)
+        last_hour = min(24, (clip.bottom() - _HEADER_PX) // _HOUR_PX + 1)
+        p.setPen(QPen(grid, 1))
+        for h in range(first_hour, last_hour + 1):
+            y = _HEADER_PX + h * _HOUR_PX
+            p.drawLine(_GUTTER_PX, y, self.width(), y)
+        p.setPen(text)
+        for h in range(first_hour, min(24, last_hour + 1)):
+            y = _HEADER_PX + h * _HOUR_PX
+            p.drawText(QRectF(0, y, _GUTTER_PX - 6, 16), Qt.AlignRight | Qt.AlignTop, f"{h:02d}:00")
+
+        # Day columns
+        for col in range(8):
+            x = _GUTTER_PX + col * cw
+            p.setPen(QPen(grid, 1))
+            p.drawLine(int(x), 0, int(x), self.height())
+
+        for col, (day, vms) in enumerate(self._days):
+            x = _GUTTER_PX + col * cw
+            qd = self._first.addDays(col)
+            if qd == self._selected:
+                sel = QColor(accent)
+                sel.setAlpha(30)
+                p.fillRect(QRectF(x, 0, cw, self.height()), sel)
+
+            p.setPen(text)
+            p.drawText(QRectF(x, 0, cw, _HEADER_PX), Qt.AlignCenter, qd.toString("ddd d"))
+
+            columns = self._columns[col] if col < len(self._columns) else {}
+            for i, vm in enumerate(vms):
+                m0 = _minutes(vm.start_dt, day)
+                m1 = max(m0 + 15, _minutes(vm.end_dt, day))
+                y0 = _HEADER_PX + m0 * _HOUR_PX / 60.0
+                y1 = _HEADER_PX + m1 * _HOUR_PX / 60.0
+                lane, lanes = columns.get(i, (0, 1))
+                lw = (cw - 4) / lanes
+                r = QRectF(x + 2 + lane * lw, y0 + 1, lw - 1, y1 - y0 - 2)
+                if not r.intersects(QRectF(clip)):
+                    continue
+                p.setPen(Qt.NoPen)
+                p.setBrush(clash if vm.conflicts else block)
+                p.drawRoundedRect(r, 4, 4)
+                p.setPen(pal.color(QPalette.HighlightedText))
+                p.drawText(r.adjusted(4, 2, -4, -2), Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, vm.title)
+
+        p.end()
+
+
+class SchedulerWeekView(QWidget):
+    """Scheduler Week View (feature-provided).
+
+    Contract:
+    - One range query for the visible week (series instances included).
+    - Clicking a day selects it in SchedulerState.
+    """
+
+    def __init__(
+        self,
+        scheduler_service: SchedulerService,
+        state: SchedulerState,
+        prefetcher: SchedulerPrefetcher | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._state = state
+        self._prefetcher = prefetcher
+        self._ctl = SchedulerController(scheduler_service, cache=prefetcher.cache if prefetcher else None)
+        self._stale = True
+        self._loaded_first: QDate | None = None
+
+        self._state.date_changed.connect(self._on_state_date_changed)  # type: ignore[arg-type]
+        self._state.data_changed.connect(self._refresh)  # type: ignore[arg-type]
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(12)
+
+        header = QWidget()
+        h = QHBoxLayout(header)
+        h.setContentsMargins(0, 0, 0, 0)
+        h.setSpacing(10)
+
+        title = QLabel("Week")
+        title.setObjectName("TitleUnified")
+        h.addWidget(title, 0, Qt.AlignVCenter)
+
+        h.addStretch(1)
+
+        prev_btn = LuxButton("‹")
+        prev_btn.clicked.connect(lambda: self._shift(-7))  # type: ignore[arg-type]
+        h.addWidget(prev_btn, 0)
+
+        self._range_lbl = QLabel("")
+        self._range_lbl.setObjectName("MetaCaption")
+        h.addWidget(self._range_lbl, 0, Qt.AlignVCenter)
+
+        next_btn = LuxButton("›")
+        next_btn.clicked.connect(lambda: self._shift(7))  # type: ignore[arg-type]
+        h.addWidget(next_btn, 0)
+
+        root.addWidget(header, 0)
+
+        card = Card()
+        c = QVBoxLayout(card)
+        c.setContentsMargins(12, 12, 12, 12)
+        c.setSpacing(10)
+
+        self._error = QLabel("")
+        self._error.setObjectName("MetaCaption")
+        self._error.setWordWrap(True)
+        self._error.hide()
+        c.addWidget(self._error)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.NoFrame)
+
+        self._canvas = _WeekCanvas()
+        self._canvas.day_clicked.connect(self._state.set_selected_date)  # type: ignore[arg-type]
+        scroll.setWidget(self._canvas)
+        scroll.verticalScrollBar().setValue(8 * _HOUR_PX)
+        c.addWidget(scroll, 1)
+
+        root.addWidget(card, 1)
+
+    @staticmethod
+    def _week_start(qd: QDate) -> QDate:
+        return qd.addDays(1 - qd.dayOfWeek())  # Monday
+
+    def _shift(self, days: int) -> None:
+        self._state.set_selected_date(self._state.selected_date().addDays(days))
+
+    def _on_state_date_changed(self, qd: QDate) -> None:
+        # Same week: selection highlight only, no reload.
+        if not self._stale and self._loaded_first == self._week_start(qd):
+            self._canvas.set_selected(qd)
+            return
+        self._refresh()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._stale:
+            self._refresh()
+
+    def _refresh(self, *_args) -> None:
+        if not self.isVisible():
+            self._stale = True
+            return
+        self._stale = False
+        self._reload()
+
+    @instrumentation.timed("view.scheduler_week.refresh")
+    def _reload(self) -> None:
+        selected = self._state.selected_date()
+        first = self._week_start(selected)
+        self._range_lbl.setText(f"{first.toString('d MMM')} – {first.addDays(6).toString('d MMM yyyy')}")
+
+        try:
+            by_day = self._ctl.list_entries_for_range(first, 7)
+        except Exception as e:
+            self._error.setText(f"Scheduler failed to load the week.\n\n{type(e).__name__}: {e}")
+            self._error.show()
+            self._canvas.set_data(first, selected, [])
+            self._loaded_first = None
+            return
+
+        self._loaded_first = first
+        self._error.hide()
+        self._canvas.set_data(first, selected, list(by_day.items()))
+
+        if self._prefetcher is not None:
+            self._prefetcher.prefetch_weeks_around(first)
@@ -21,3 +21,11 @@ class TaskOccurrence:
     due_time: Optional[str] = None # HH:MM or None
     completed: bool = False
     archived: bool = False
+    recur_date: Optional[str] = None  # set for recurring instances (virtual or materialized)
+    priority: int = 0
+    estimate_min: Optional[int] = None
+
+    @property
+    def is_virtual(self) -> bool:
+        """Expanded from a recurrence rule; has no task_occurrences row yet."""
+        return self.id <= 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from typing import Optional
 
 from lux.data.models.tasks import TaskDefinitionRow, TaskOccurrenceJoinedRow, TaskOccurrenceRow
@@ -14,6 +15,9 @@ class TasksRepo:
     def __init__(self, tasks_repo: TasksRepository) -> None:
         self._tasks = tasks_repo
 
+    def transaction(self) -> AbstractContextManager[None]:
+        return self._tasks.transaction()
+
     # ---- Definitions ----
     def create_task(self, title: str, notes: str = "") -> int:
         return self._tasks.create_task(title=title, notes=notes, parent_task_id=None)
@@ -21,6 +25,28 @@ class TasksRepo:
     def get_task(self, task_id: int) -> Optional[TaskDefinitionRow]:
         return self._tasks.get_task(task_id)
 
+    def update_task_title(self, task_id: int, title: str) -> None:
+        self._tasks.update_task_title(task_id=task_id, title=title)
+
+    def set_task_archived(self, task_id: int, archived: bool) -> None:
+        self._tasks.set_task_archived(task_id=task_id, archived=archived)
+
+    def set_task_planning(self, task_id: int, priority: int, estimate_min: int | None) -> None:
+        self._tasks.set_task_planning(task_id=task_id, priority=priority, estimate_min=estimate_min)
+
+    # ---- Recurrence ----
+    def set_task_recurrence(self, task_id: int, rule: str | None, start_date: str | None, until_date: str | None) -> None:
+        self._tasks.set_task_recurrence(task_id=task_id, rule=rule, start_date=start_date, until_date=until_date)
+
+    def list_recurring_tasks_for_range(self, start_date: str, end_date: str) -> list[TaskDefinitionRow]:
+        return self._tasks.list_recurring_tasks_for_range(start_date=start_date, end_date=end_date)
+
+    def list_recurrence_exceptions(self, start_date: str, end_date: str) -> set[tuple[int, str]]:
+        return self._tasks.list_recurrence_exceptions(start_date=start_date, end_date=end_date)
+
+    def find_materialized_occurrence(self, task_id: int, recur_date: str) -> Optional[int]:
+        return self._tasks.find_materialized_occurrence(task_id=task_id, recur_date=recur_date)
+
     # ---- Occurrences ----
     def create_occurrence(
         self,
@@ -28,6 +54,7 @@ class TasksRepo:
         due_date: str,
         due_time: str | None = None,
         sort_key: int | None = None,
+        recur_date: str | None = None,
     ) -> int:
         # sort_key=None -> repo auto-assign next stable sort_key for that day
         return self._tasks.create_occurrence(
@@ -35,11 +62,18 @@ class TasksRepo:
             due_date=due_date,
             due_time=due_time,
             sort_key=sort_key,
+            recur_date=recur_date,
         )
 
     def reschedule_occurrence(self, occurrence_id: int, target_date: str) -> None:
         self._tasks.update_occurrence_due_date(occurrence_id=occurrence_id, target_date=target_date)
 
+    def set_occurrence_due(self, occurrence_id: int, due_date: str, sort_key: int) -> None:
+        self._tasks.set_occurrence_due(occurrence_id=occurrence_id, due_date=due_date, sort_key=sort_key)
+
+    def get_occurrence(self, occurrence_id: int) -> Optional[TaskOccurrenceRow]:
+        return self._tasks.get_occurrence(occurrence_id)
+
     def list_occurrences_for_range_joined(self, start_date: str, end_date: str, limit: int = 500) -> list[TaskOccurrenceJoinedRow]:
         return self._tasks.list_occurrences_joined_for_range(start_date=start_date, end_date=end_date, limit=limit)
 
@@ -47,8 +81,20 @@ class TasksRepo:
     def list_occurrences_for_range(self, start_date: str, end_date: str, limit: int = 500) -> list[TaskOccurrenceRow]:
         return self._tasks.list_occurrences_for_range(start_date=start_date, end_date=end_date, limit=limit)
 
+    def completion_counts_by_day(self, start_date: str, end_date: str) -> dict[str, tuple[int, int]]:
+        return self._tasks.completion_counts_by_day(start_date=start_date, end_date=end_date)
+
+    def get_occurrence_titles(self, occurrence_ids: list[int]) -> dict[int, str]:
+        return self._tasks.get_occurrence_titles(occurrence_ids)
+
     def set_occurrence_completed(self, occurrence_id: int, completed: bool) -> None:
         self._tasks.set_occurrence_completed(occurrence_id=occurrence_id, completed=completed)
 
     def archive_occurrence(self, occurrence_id: int) -> None:
         self._tasks.archive_occurrence(occurrence_id=occurrence_id)
+
+    def set_occurrence_completed_at(self, occurrence_id: int, completed_at: str | None) -> None:
+        self._tasks.set_occurrence_completed_at(occurrence_id=occurrence_id, completed_at=completed_at)
+
+    def set_occurrence_archived(self, occurrence_id: int, archived: bool) -> None:
+        self._tasks.set_occurrence_archived(occurrence_id=occurrence_id, archived=archived)
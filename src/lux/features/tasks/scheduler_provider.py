@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from lux.core.events import ENTITY_TASK_DEFINITION, ChangeBus
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.features.tasks.repo import TasksRepo
+
+TASK_OCCURRENCE_KIND = "task_occurrence"
+
+
+class TasksSchedulerProvider:
+    """Scheduler label provider for item_kind="task_occurrence" (item_ref = occurrence id)."""
+
+    def __init__(self, repo: TasksRepo) -> None:
+        self._repo = repo
+
+    def resolve_label(self, item_ref: str) -> str | None:
+        return self.resolve_labels([item_ref]).get(item_ref)
+
+    def resolve_labels(self, item_refs: Sequence[str]) -> dict[str, str]:
+        ids: dict[int, str] = {}
+        for ref in item_refs:
+            try:
+                ids[int(ref)] = ref
+            except (TypeError, ValueError):
+                continue
+        if not ids:
+            return {}
+
+        titles = self._repo.get_occurrence_titles(list(ids))
+        return {ids[occ_id]: title for occ_id, title in titles.items() if occ_id in ids}
+
+
+def register_tasks_scheduler_provider(
+    registry: SchedulerProviderRegistry,
+    repo: TasksRepo,
+    bus: ChangeBus | None = None,
+) -> None:
+    """Composition-root helper: register the provider and wire change-feed invalidation."""
+    registry.register(TASK_OCCURRENCE_KIND, TasksSchedulerProvider(repo))
+    if bus is not None:
+        # Labels are definition titles: occurrence writes cannot change them.
+        bus.subscribe(
+            lambda events: registry.invalidate(TASK_OCCURRENCE_KIND)
+            if any(e.op != "insert" for e in events) else None,
+            entities=(ENTITY_TASK_DEFINITION,),
+        )
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import logging
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import date, timedelta
+from typing import Iterator
 
+from lux.core.instrumentation import instrument_methods
+from lux.core.recurrence import expand_dates, last_date, parse_rrule
+from lux.core.scheduler.autoschedule import PlanItem
+from lux.core.undo import UndoJournal, UndoOp
+from lux.data.models.tasks import TaskOccurrenceJoinedRow
 from lux.features.tasks.domain import TaskOccurrence
 from lux.features.tasks.repo import TasksRepo
 
+log = logging.getLogger(__name__)
+
+# Undo handler target for this service's inverse operations.
+UNDO_TARGET = "tasks"
+
 
 @dataclass(frozen=True)
 class DateRange:
@@ -17,6 +30,10 @@ def _today_str() -> str:
     return date.today().isoformat()
 
 
+# Planning default when a definition has no estimate.
+DEFAULT_ESTIMATE_MIN = 30
+
+
 def _range_for_days(days: int) -> DateRange:
     days = max(1, min(int(days), 31))
     start = date.today()
@@ -24,6 +41,22 @@ def _range_for_days(days: int) -> DateRange:
     return DateRange(start=start.isoformat(), end=end.isoformat())
 
 
+def _occurrence_from_row(r: TaskOccurrenceJoinedRow) -> TaskOccurrence:
+    return TaskOccurrence(
+        id=r.id,
+        task_id=r.task_id,
+        title=r.title,
+        due_date=r.due_date,
+        due_time=r.due_time,
+        completed=(r.completed_at is not None),
+        archived=r.archived,
+        recur_date=r.recur_date,
+        priority=r.priority,
+        estimate_min=r.estimate_min,
+    )
+
+
+@instrument_methods("service.tasks")
 class TasksService:
     """
     Feature service. UI calls here; DB stays behind repos.
@@ -32,30 +65,67 @@ class TasksService:
     - DB lifecycle is system-owned. This service must be constructed via bootstrap injection.
     """
 
-    def __init__(self, repo: TasksRepo) -> None:
+    def __init__(self, repo: TasksRepo, journal: UndoJournal | None = None) -> None:
         self._repo = repo
+        self._journal = journal
+        if journal is not None:
+            journal.register(UNDO_TARGET, self._apply_undo)
+
+    @contextmanager
+    def batch(self, label: str = "Edit tasks") -> Iterator[None]:
+        """Run several writes as one transaction and one undo step."""
+        group = self._journal.group(label) if self._journal is not None else nullcontext()
+        # The group closes first, so its undo_log row commits (or rolls back) with the batch.
+        with self._repo.transaction(), group:
+            yield
+
+    # -----------------------
+    # Undo
+    # -----------------------
+    def _record(self, label: str, undo: UndoOp | list[UndoOp], redo: UndoOp | list[UndoOp]) -> None:
+        if self._journal is not None:
+            self._journal.record(label, undo, redo)
+
+    def _apply_undo(self, name: str, args: tuple) -> None:
+        """Replay one inverse operation (repo-level: no validation, no re-recording)."""
+        if name == "set_occurrence_archived":
+            self._repo.set_occurrence_archived(int(args[0]), bool(args[1]))
+        elif name == "set_task_archived":
+            self._repo.set_task_archived(int(args[0]), bool(args[1]))
+        elif name == "set_completed_at":
+            self._repo.set_occurrence_completed_at(int(args[0]), args[1])
+        elif name == "set_completed":
+            self._repo.set_occurrence_completed(int(args[0]), bool(args[1]))
+        elif name == "set_due":
+            self._repo.set_occurrence_due(int(args[0]), str(args[1]), int(args[2]))
+        elif name == "reschedule":
+            self._repo.reschedule_occurrence(int(args[0]), str(args[1]))
+        elif name == "set_title":
+            self._repo.update_task_title(int(args[0]), str(args[1]))
+        elif name == "set_planning":
+            self._repo.set_task_planning(int(args[0]), int(args[1]), args[2])
+        else:
+            raise ValueError(f"unknown tasks undo op: {name}")
+
+    @staticmethod
+    def _archived_ops(occurrence_id: int = 0, task_id: int = 0) -> tuple[list[UndoOp], list[UndoOp]]:
+        """(undo, redo) for a create: undo archives the new rows, redo restores them."""
+        undo: list[UndoOp] = []
+        redo: list[UndoOp] = []
+        if occurrence_id:
+            undo.append(UndoOp(UNDO_TARGET, "set_occurrence_archived", (occurrence_id, True)))
+            redo.append(UndoOp(UNDO_TARGET, "set_occurrence_archived", (occurrence_id, False)))
+        if task_id:
+            undo.append(UndoOp(UNDO_TARGET, "set_task_archived", (task_id, True)))
+            redo.insert(0, UndoOp(UNDO_TARGET, "set_task_archived", (task_id, False)))
+        return undo, redo
 
     # -----------------------
     # Primary: Today
     # -----------------------
     def list_today(self, limit: int = 200) -> list[TaskOccurrence]:
         t = _today_str()
-        rows = self._repo.list_occurrences_for_range_joined(t, t, limit=limit)
-
-        out: list[TaskOccurrence] = []
-        for r in rows:
-            out.append(
-                TaskOccurrence(
-                    id=r.id,
-                    task_id=r.task_id,
-                    title=r.title,
-                    due_date=r.due_date,
-                    due_time=r.due_time,
-                    completed=(r.completed_at is not None),
-                    archived=r.archived,
-                )
-            )
-        return out
+        return self._list_window(t, t, limit=limit)
 
     def add_task_for_today(self, title: str) -> int:
         clean = (title or "").strip()
@@ -64,36 +134,214 @@ class TasksService:
 
         task_id = self._repo.create_task(title=clean, notes="")
         occ_id = self._repo.create_occurrence(task_id=task_id, due_date=_today_str(), due_time=None, sort_key=None)
+        self._record("Add task", *self._archived_ops(occurrence_id=occ_id, task_id=task_id))
         return occ_id
 
     def set_completed(self, occurrence_id: int, completed: bool) -> None:
         if occurrence_id <= 0:
             return
+        before = self._repo.get_occurrence(occurrence_id) if self._journal is not None else None
         self._repo.set_occurrence_completed(occurrence_id=occurrence_id, completed=completed)
+        if before is not None:
+            self._record(
+                "Complete task" if completed else "Reopen task",
+                UndoOp(UNDO_TARGET, "set_completed_at", (occurrence_id, before.completed_at)),
+                UndoOp(UNDO_TARGET, "set_completed", (occurrence_id, bool(completed))),
+            )
 
     def archive_occurrence(self, occurrence_id: int) -> None:
         if occurrence_id <= 0:
             return
         self._repo.archive_occurrence(occurrence_id=occurrence_id)
+        self._record(
+            "Archive task",
+            UndoOp(UNDO_TARGET, "set_occurrence_archived", (occurrence_id, False)),
+            UndoOp(UNDO_TARGET, "set_occurrence_archived", (occurrence_id, True)),
+        )
+
+    def rename_task(self, task_id: int, title: str) -> None:
+        clean = (title or "").strip()
+        if task_id <= 0 or not clean:
+            return
+        before = self._repo.get_task(task_id) if self._journal is not None else None
+        self._repo.update_task_title(task_id=task_id, title=clean)
+        if before is not None:
+            self._record(
+                "Rename task",
+                UndoOp(UNDO_TARGET, "set_title", (task_id, before.title)),
+                UndoOp(UNDO_TARGET, "set_title", (task_id, clean)),
+            )
 
     # -----------------------
     # Upcoming (small window)
     # -----------------------
     def list_upcoming(self, days: int = 7, limit: int = 400) -> list[TaskOccurrence]:
         dr = _range_for_days(days)
-        rows = self._repo.list_occurrences_for_range_joined(dr.start, dr.end, limit=limit)
+        return self._list_window(dr.start, dr.end, limit=limit)
+
+    # -----------------------
+    # Recurrence (virtual expansion, lazy materialization)
+    # -----------------------
+    def _list_window(self, start: str, end: str, limit: int) -> list[TaskOccurrence]:
+        """
+        Stored occurrences plus virtual recurring instances for [start, end].
+
+        Cost: one bounded occurrence query + one rules query + one exceptions query,
+        then O(rules + instances in window) in memory.
+        """
+        stored = [_occurrence_from_row(r) for r in self._repo.list_occurrences_for_range_joined(start, end, limit=limit)]
+        virtual = self._expand_recurring(start, end)
+        if not virtual:
+            return stored
+
+        # Stable sort keeps DB ordering (sort_key) for stored rows within a day.
+        merged = sorted(stored + virtual, key=lambda o: o.due_date)
+        return merged[: max(1, int(limit))]
+
+    def _expand_recurring(self, start: str, end: str) -> list[TaskOccurrence]:
+        defs = self._repo.list_recurring_tasks_for_range(start, end)
+        if not defs:
+            return []
+
+        exceptions = self._repo.list_recurrence_exceptions(start, end)
+        ws = date.fromisoformat(start)
+        we = date.fromisoformat(end)
 
         out: list[TaskOccurrence] = []
-        for r in rows:
+        for d in defs:
+            try:
+                rule = parse_rrule(d.recur_rule or "")
+                dtstart = date.fromisoformat(d.recur_start or "")
+            except ValueError:
+                # Fail-soft: a corrupt rule must not break the whole list.
+                continue
+
+            for day in expand_dates(rule, dtstart, ws, we):
+                ds = day.isoformat()
+                if (d.id, ds) in exceptions:
+                    continue
+                out.append(
+                    TaskOccurrence(
+                        id=0,
+                        task_id=d.id,
+                        title=d.title,
+                        due_date=ds,
+                        recur_date=ds,
+                        priority=d.priority,
+                        estimate_min=d.estimate_min,
+                    )
+                )
+        return out
+
+    def completion_by_day(self, start: date, end: date) -> dict[str, tuple[int, int]]:
+        """
+        YYYY-MM-DD -> (completed, total) for start..end inclusive.
+        Stored occurrences are aggregated in SQL; unmaterialized recurring
+        instances count as open.
+        """
+        s, e = start.isoformat(), end.isoformat()
+        out = dict(self._repo.completion_counts_by_day(s, e))
+        for occ in self._expand_recurring(s, e):
+            done, total = out.get(occ.due_date, (0, 0))
+            out[occ.due_date] = (done, total + 1)
+        return out
+
+    def add_recurring_task(self, title: str, rule: str, start_date: str | None = None) -> int:
+        """
+        Create a definition with an RRULE-style rule. No occurrence rows are generated.
+        Returns the task definition id (0 for empty titles). Raises ValueError for invalid rules.
+        """
+        clean = (title or "").strip()
+        if not clean:
+            return 0
+
+        parsed = parse_rrule(rule)
+        dtstart = date.fromisoformat(start_date) if start_date else date.today()
+        until = last_date(parsed, dtstart)
+
+        task_id = self._repo.create_task(title=clean, notes="")
+        self._repo.set_task_recurrence(
+            task_id=task_id,
+            rule=str(rule).strip(),
+            start_date=dtstart.isoformat(),
+            until_date=until.isoformat() if until else None,
+        )
+        self._record("Add recurring task", *self._archived_ops(task_id=task_id))
+        return task_id
+
+    def materialize_occurrence(self, task_id: int, recur_date: str) -> int:
+        """
+        Turn a virtual instance into a real row (idempotent).
+        Called right before an instance is completed, moved or edited.
+        Not recorded for undo: the row looks exactly like the virtual instance,
+        and archiving it on undo would hide that instance.
+        """
+        if task_id <= 0 or not recur_date:
+            return 0
+        existing = self._repo.find_materialized_occurrence(task_id=task_id, recur_date=recur_date)
+        if existing:
+            return existing
+        occ_id = self._repo.create_occurrence(
+            task_id=task_id,
+            due_date=recur_date,
+            due_time=None,
+            sort_key=None,
+            recur_date=recur_date,
+        )
+        return occ_id
+
+    def resolve_occurrence_id(self, occ: TaskOccurrence) -> int:
+        if not occ.is_virtual:
+            return occ.id
+        return self.materialize_occurrence(occ.task_id, occ.recur_date or occ.due_date)
+
+    # -----------------------
+    # Planning (auto-schedule input)
+    # -----------------------
+    def set_task_planning(self, task_id: int, priority: int = 0, estimate_min: int | None = None) -> None:
+        if task_id <= 0:
+            return
+        est = max(5, min(int(estimate_min), 24 * 60)) if estimate_min else None
+        before = self._repo.get_task(task_id) if self._journal is not None else None
+        self._repo.set_task_planning(task_id=task_id, priority=int(priority), estimate_min=est)
+        if before is not None:
+            self._record(
+                "Edit planning",
+                UndoOp(UNDO_TARGET, "set_planning", (task_id, before.priority, before.estimate_min)),
+                UndoOp(UNDO_TARGET, "set_planning", (task_id, int(priority), est)),
+            )
+
+    def plan_items(self, days: int = 7) -> list[PlanItem]:
+        """
+        Open occurrences in the upcoming window as scheduler PlanItems (read-only).
+
+        Virtual recurring instances keep a virtual ref ("virtual:<task_id>:<recur_date>")
+        and are materialized by resolve_ref only if auto_schedule places them. Callers
+        wrap auto_schedule in batch() so those rows commit (or roll back) with the
+        placements.
+        """
+        out: list[PlanItem] = []
+        for occ in self.list_upcoming(days=days, limit=2000):
+            if occ.completed or occ.archived:
+                continue
+            if occ.is_virtual:
+                recur_date = occ.recur_date or occ.due_date
+                item_ref = f"virtual:{occ.task_id}:{recur_date}"
+                resolve = lambda t=occ.task_id, d=recur_date: str(self.materialize_occurrence(t, d) or "")  # noqa: E731
+            elif occ.id > 0:
+                item_ref, resolve = str(occ.id), None
+            else:
+                continue
             out.append(
-                TaskOccurrence(
-                    id=r.id,
-                    task_id=r.task_id,
-                    title=r.title,
-                    due_date=r.due_date,
-                    due_time=r.due_time,
-                    completed=(r.completed_at is not None),
-                    archived=r.archived,
+                PlanItem(
+                    item_kind="task_occurrence",
+                    item_ref=item_ref,
+                    title=occ.title,
+                    day=occ.due_date,
+                    duration_min=occ.estimate_min or DEFAULT_ESTIMATE_MIN,
+                    priority=occ.priority,
+                    fixed_time=occ.due_time,
+                    resolve_ref=resolve,
                 )
             )
         return out
@@ -104,9 +352,18 @@ class TasksService:
     def reschedule_occurrence(self, occurrence_id: int, target_date: str) -> None:
         if occurrence_id <= 0:
             return
+        before = self._repo.get_occurrence(occurrence_id) if self._journal is not None else None
         self._repo.reschedule_occurrence(occurrence_id=occurrence_id, target_date=target_date)
+        if before is not None:
+            self._record(
+                "Move task",
+                UndoOp(UNDO_TARGET, "set_due", (occurrence_id, before.due_date, before.sort_key)),
+                UndoOp(UNDO_TARGET, "reschedule", (occurrence_id, target_date)),
+            )
 
     def create_occurrence_for_date(self, task_definition_id: int, target_date: str) -> int:
         if task_definition_id <= 0:
             return 0
-        return self._repo.create_occurrence(task_id=task_definition_id, due_date=target_date, due_time=None, sort_key=None)
+        occ_id = self._repo.create_occurrence(task_id=task_definition_id, due_date=target_date, due_time=None, sort_key=None)
+        self._record("Copy task", *self._archived_ops(occurrence_id=occ_id))
+        return occ_id
@@ -1,25 +1,85 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
 from PySide6.QtCore import QObject, Signal
 
 from lux.app.services import SystemServices
+from lux.core import instrumentation
 from lux.features.tasks.domain import TaskOccurrence
 from lux.ui.qt.dragdrop import LuxDragPayload
+from lux.ui.qt.optimistic import OptimisticCommand, OptimisticQueue
+
+
+def _occ_key(occ: TaskOccurrence) -> tuple:
+    # Virtual instances have no id yet; (task_id, recur_date) identifies them.
+    return ("id", occ.id) if occ.id > 0 else ("virtual", occ.task_id, occ.recur_date)
 
 
 class TasksController(QObject):
-    changed = Signal()  # simple "refresh" signal
+    changed = Signal()       # data changed outside the cache: views re-query
+    updated = Signal()       # cached view models patched: views re-render, no query
+    failed = Signal(str)     # optimistic write rolled back (user-facing message)
 
     def __init__(self, services: SystemServices, parent=None) -> None:
         super().__init__(parent)
         self._svc = services.tasks_service
+        self._scheduler = services.scheduler_service
+
+        # View-model caches (None = load on next read). Optimistic commands patch
+        # these in place; `changed` drops them.
+        self._today: list[TaskOccurrence] | None = None
+        self._upcoming: tuple[int, list[TaskOccurrence]] | None = None
+
+        self._queue = OptimisticQueue(self)
+        self._queue.failed.connect(lambda label, msg: self.failed.emit(f"{label} failed: {msg}"))  # type: ignore[arg-type]
+        self.changed.connect(self._drop_cache)  # type: ignore[arg-type]
+
+    def _drop_cache(self) -> None:
+        self._today = None
+        self._upcoming = None
 
     # Queries
     def today(self) -> list[TaskOccurrence]:
-        return self._svc.list_today()
+        if self._today is None:
+            self._today = self._svc.list_today()
+        return list(self._today)
 
     def upcoming(self, days: int = 7) -> list[TaskOccurrence]:
-        return self._svc.list_upcoming(days=days)
+        if self._upcoming is None or self._upcoming[0] != days:
+            self._upcoming = (days, self._svc.list_upcoming(days=days))
+        return list(self._upcoming[1])
+
+    # -------------------------
+    # View-model patching
+    # -------------------------
+    def _rollback(self) -> None:
+        # Later commands may have patched the cache too: re-read the truth
+        # instead of restoring a snapshot.
+        self.changed.emit()
+
+    def _patch(self, key: tuple, fn) -> None:
+        """Replace (fn returns occ) or drop (fn returns None) a cached occurrence."""
+        def apply(rows: list[TaskOccurrence]) -> list[TaskOccurrence]:
+            out: list[TaskOccurrence] = []
+            for o in rows:
+                if _occ_key(o) == key:
+                    o = fn(o)
+                    if o is None:
+                        continue
+                out.append(o)
+            return out
+
+        if self._today is not None:
+            self._today = apply(self._today)
+        if self._upcoming is not None:
+            self._upcoming = (self._upcoming[0], apply(self._upcoming[1]))
+
+    def _adopt_id(self, key: tuple, occ_id: int) -> None:
+        """Confirm: a virtual instance was materialized; give its VM the real id."""
+        if key[0] == "virtual" and occ_id > 0:
+            self._patch(key, lambda o: replace(o, id=occ_id))
 
     # Commands
     def add_today(self, title: str) -> None:
@@ -27,23 +87,114 @@ class TasksController(QObject):
         if occ_id:
             self.changed.emit()
 
-    def set_completed(self, occurrence_id: int, completed: bool) -> None:
-        self._svc.set_completed(occurrence_id, completed)
-        self.changed.emit()
+    # Virtual (recurring) instances are materialized on first write.
+    def set_completed(self, occ: TaskOccurrence, completed: bool) -> None:
+        key = _occ_key(occ)
 
-    def archive(self, occurrence_id: int) -> None:
-        self._svc.archive_occurrence(occurrence_id)
-        self.changed.emit()
+        def write() -> int:
+            occ_id = self._svc.resolve_occurrence_id(occ)
+            self._svc.set_completed(occ_id, completed)
+            return occ_id
+
+        # The checkbox already shows the new state: patch silently, no re-render.
+        self._queue.submit(
+            OptimisticCommand(
+                label="Complete task" if completed else "Reopen task",
+                apply=lambda: self._patch(key, lambda o: replace(o, completed=completed)),
+                write=write,
+                rollback=self._rollback,
+                confirm=lambda occ_id: self._adopt_id(key, occ_id),
+            )
+        )
+
+    def archive(self, occ: TaskOccurrence) -> None:
+        key = _occ_key(occ)
+
+        def apply() -> None:
+            self._patch(key, lambda o: None)
+            self.updated.emit()
+
+        self._queue.submit(
+            OptimisticCommand(
+                label="Archive task",
+                apply=apply,
+                write=lambda: self._svc.archive_occurrence(self._svc.resolve_occurrence_id(occ)),
+                rollback=self._rollback,
+            )
+        )
+
+    def plan(self, days: int = 7) -> tuple[int, int]:
+        """
+        Auto-schedule open tasks into free calendar time.
+        Returns (placed, unplaced) counts.
+        """
+        items = self._svc.plan_items(days=days)
+        start = date.today()
+        # Tasks batch: instances materialized for placements commit with them.
+        with self._svc.batch("Auto-schedule"):
+            result = self._scheduler.auto_schedule(
+                items,
+                start_day=start,
+                end_day=start + timedelta(days=max(1, days) - 1),
+                not_before=datetime.now().replace(second=0, microsecond=0),
+            )
+        if result.placed:
+            self.changed.emit()
+        return len(result.placed), len(result.unplaced)
 
     # DnD: date-resolving drop only (targets provide a concrete YYYY-MM-DD)
+    @instrumentation.timed("dnd.drop.tasks")
     def handle_drop(self, payload: LuxDragPayload, target_date: str) -> None:
         if payload.kind == "task_occurrence":
             occ_id = int(payload.data.get("occurrence_id", 0) or 0)
-            if occ_id > 0:
-                self._svc.reschedule_occurrence(occ_id, target_date)
-                self.changed.emit()
+            task_id = int(payload.data.get("task_id", 0) or 0)
+            recur_date = str(payload.data.get("recur_date") or "")
+            key = ("id", occ_id) if occ_id > 0 else ("virtual", task_id, recur_date or None)
+            if occ_id <= 0 and task_id <= 0:
+                return
+
+            def apply() -> None:
+                self._move_cached(key, target_date)
+                self.updated.emit()
+
+            def write() -> int:
+                oid = occ_id if occ_id > 0 else self._svc.materialize_occurrence(task_id, recur_date)
+                if oid > 0:
+                    self._svc.reschedule_occurrence(oid, target_date)
+                return oid
+
+            self._queue.submit(
+                OptimisticCommand(
+                    label="Move task",
+                    apply=apply,
+                    write=write,
+                    rollback=self._rollback,
+                    confirm=lambda oid: self._adopt_id(key, oid),
+                )
+            )
         elif payload.kind == "task_definition":
             task_id = int(payload.data.get("task_id", 0) or 0)
             if task_id > 0:
                 self._svc.create_occurrence_for_date(task_id, target_date)
                 self.changed.emit()
+
+    def _move_cached(self, key: tuple, target_date: str) -> None:
+        moved: list[TaskOccurrence] = []
+
+        def take(o: TaskOccurrence) -> None:  # drop from its old place
+            moved.append(replace(o, due_date=target_date))
+            return None
+
+        self._patch(key, take)
+        if not moved:
+            return
+        occ = moved[0]
+        today = date.today().isoformat()
+        if self._today is not None and target_date == today:
+            self._today.append(occ)
+        if self._upcoming is not None:
+            last = (date.today() + timedelta(days=max(1, self._upcoming[0]) - 1)).isoformat()
+            if today <= target_date <= last:
+                rows = self._upcoming[1]
+                rows.append(occ)
+                rows.sort(key=lambda o: o.due_date)  # stable: keeps per-day order
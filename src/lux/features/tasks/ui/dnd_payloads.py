@@ -17,9 +17,22 @@ def make_task_definition_payload(task_id: int) -> LuxDragPayload:
     return make_payload("task_definition", {"task_id": task_id})
 
 
-def make_task_occurrence_payload(occurrence_id: int) -> LuxDragPayload:
-    """Build a payload for dragging a task occurrence."""
-    return make_payload("task_occurrence", {"occurrence_id": occurrence_id})
+def make_task_occurrence_payload(
+    occurrence_id: int,
+    task_id: int = 0,
+    recur_date: str | None = None,
+) -> LuxDragPayload:
+    """
+    Build a payload for dragging a task occurrence.
+
+    Virtual recurring instances have occurrence_id 0 and carry task_id/recur_date
+    so the drop handler can materialize them.
+    """
+    data: dict = {"occurrence_id": occurrence_id}
+    if occurrence_id <= 0 and recur_date:
+        data["task_id"] = task_id
+        data["recur_date"] = recur_date
+    return make_payload("task_occurrence", data)
 
 
 __all__ = [
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtWidgets import QWidget
+
+from lux.app.services import SystemServices
+from lux.features.tasks.ui.controller import TasksController
+from lux.features.tasks.ui.panel import TasksLeftPanel
+from lux.features.tasks.ui.view import TasksRightView
+
+
+def make_tasks_factories() -> tuple[Callable[[SystemServices], QWidget], Callable[[SystemServices], QWidget]]:
+    """Return left/right widget factories that share one TasksController.
+
+    Both panes read the controller's view-model cache, so a write made in one
+    pane patches (or drops) what the other shows.
+    """
+    controllers: dict[int, TasksController] = {}
+
+    def controller_for(services: SystemServices) -> TasksController:
+        # One per service; unparented so it outlives the panes rebuilt on navigation.
+        key = id(services.tasks_service)
+        ctl = controllers.get(key)
+        if ctl is None:
+            ctl = controllers[key] = TasksController(services)
+        return ctl
+
+    def make_left(services: SystemServices) -> QWidget:
+        return TasksLeftPanel(services, controller=controller_for(services))
+
+    def make_right(services: SystemServices) -> QWidget:
+        return TasksRightView(services, controller=controller_for(services))
+
+    return make_left, make_right
@@ -11,25 +11,26 @@ from PySide6.QtWidgets import (
     QFrame,
     QCheckBox,
     QToolButton,
+    QMessageBox,
 )
 
+from lux.core import instrumentation
 from lux.ui.qt.widgets.buttons import LuxButton
 from lux.ui.qt.widgets.cards import Card
 from lux.features.tasks.ui.controller import TasksController
+from lux.features.tasks.domain import TaskOccurrence
 from lux.app.services import SystemServices
 
 class _OccRow(QWidget):
     def __init__(
         self,
-        occ_id: int,
-        title: str,
-        completed: bool,
+        occ: TaskOccurrence,
         on_toggle,
         on_archive,
         parent=None,
     ) -> None:
         super().__init__(parent)
-        self._occ_id = occ_id
+        self._occ = occ
         self._on_toggle = on_toggle
         self._on_archive = on_archive
 
@@ -38,11 +39,11 @@ class _OccRow(QWidget):
         lay.setSpacing(10)
 
         chk = QCheckBox()
-        chk.setChecked(completed)
+        chk.setChecked(occ.completed)
         chk.stateChanged.connect(self._handle_check)
         lay.addWidget(chk, 0, Qt.AlignTop)
 
-        lbl = QLabel(title)
+        lbl = QLabel(occ.title)
         lbl.setWordWrap(True)
         lay.addWidget(lbl, 1)
 
@@ -54,10 +55,10 @@ class _OccRow(QWidget):
         lay.addWidget(archive_btn, 0, Qt.AlignTop)
 
     def _handle_check(self, state: int) -> None:
-        self._on_toggle(self._occ_id, state == Qt.Checked)
+        self._on_toggle(self._occ, state == Qt.Checked)
 
     def _handle_archive(self) -> None:
-        self._on_archive(self._occ_id)
+        self._on_archive(self._occ)
 
 
 class TasksLeftPanel(QWidget):
@@ -66,13 +67,15 @@ class TasksLeftPanel(QWidget):
     Keeps existing controller wiring (today list + add today).
     """
 
-    def __init__(self, services: SystemServices, parent=None) -> None:
+    def __init__(self, services: SystemServices, controller: TasksController | None = None, parent=None) -> None:
         super().__init__(parent)
 
-        # Create the controller with injected services
-        self._ctl = TasksController(services, self)
+        # Shared with the right view (make_tasks_factories); own one when built alone
+        self._ctl = controller if controller is not None else TasksController(services, self)
 
         self._ctl.changed.connect(self._refresh)
+        self._ctl.updated.connect(self._refresh)
+        self._ctl.failed.connect(lambda msg: QMessageBox.warning(self, "Change reverted", msg))
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -89,6 +92,8 @@ class TasksLeftPanel(QWidget):
 
         plan_btn = LuxButton("Plan")
         plan_btn.setMinimumHeight(36)
+        plan_btn.setToolTip("Place this week's open tasks into free calendar time")
+        plan_btn.clicked.connect(self._on_plan)
         header_row.addWidget(plan_btn, 0)
 
         root.addLayout(header_row)
@@ -175,6 +180,19 @@ class TasksLeftPanel(QWidget):
         self._input.clear()
         self._ctl.add_today(text)
 
+    def _on_plan(self) -> None:
+        try:
+            placed, unplaced = self._ctl.plan(days=7)
+        except Exception as e:
+            QMessageBox.warning(self, "Plan failed", f"{type(e).__name__}: {e}")
+            return
+
+        msg = f"Scheduled {placed} task(s)."
+        if unplaced:
+            msg += f"\n{unplaced} task(s) did not fit into free time."
+        QMessageBox.information(self, "Plan", msg)
+
+    @instrumentation.timed("view.tasks_panel.refresh")
     def _refresh(self) -> None:
         # clear rows but keep trailing stretch
         while self._list_lay.count():
@@ -193,9 +211,7 @@ class TasksLeftPanel(QWidget):
         else:
             for occ in occs:
                 row = _OccRow(
-                    occ_id=occ.id,
-                    title=occ.title,
-                    completed=occ.completed,
+                    occ=occ,
                     on_toggle=self._ctl.set_completed,
                     on_archive=self._ctl.archive,
                 )
@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import date, timedelta
 
 from PySide6.QtCore import Qt, QPoint
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QHBoxLayout, QCheckBox, QFrame, QScrollArea, QApplication)
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QHBoxLayout, QCheckBox, QFrame, QScrollArea, QApplication, QMessageBox)
 
 from lux.app.services import SystemServices
+from lux.core import instrumentation
 from lux.ui.qt.dragdrop import decode_mime, start_system_drag
 from lux.ui.qt.widgets.buttons import LuxButton
 from lux.ui.qt.widgets.cards import Card
@@ -63,7 +64,7 @@ class _OccurrenceRow(QWidget):
         chk = QCheckBox()
         chk.setChecked(occ.completed)
         chk.stateChanged.connect(
-            lambda state, oid=occ.id: self._ctl.set_completed(oid, state == Qt.Checked)
+            lambda state, o=occ: self._ctl.set_completed(o, state == Qt.Checked)
         )
         layout.addWidget(chk, 0, Qt.AlignTop)
 
@@ -83,7 +84,7 @@ class _OccurrenceRow(QWidget):
                 (event.pos() - self._drag_start_pos).manhattanLength()
                 >= QApplication.startDragDistance()
             ):
-                payload = make_task_occurrence_payload(self._occ.id)
+                payload = make_task_occurrence_payload(self._occ.id, self._occ.task_id, self._occ.recur_date)
                 start_system_drag(self, payload)
                 self._drag_start_pos = None
                 return
@@ -102,11 +103,14 @@ class TasksRightView(QWidget):
     - State-changing drops are only accepted on specific-date targets.
     """
 
-    def __init__(self, services: SystemServices, parent=None) -> None:
+    def __init__(self, services: SystemServices, controller: TasksController | None = None, parent=None) -> None:
         super().__init__(parent)
 
-        self._ctl = TasksController(services, self)
+        # Shared with the left panel (make_tasks_factories); own one when built alone
+        self._ctl = controller if controller is not None else TasksController(services, self)
         self._ctl.changed.connect(self._refresh)
+        self._ctl.updated.connect(self._refresh)
+        self._ctl.failed.connect(lambda msg: QMessageBox.warning(self, "Change reverted", msg))
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -145,6 +149,7 @@ class TasksRightView(QWidget):
 
         self._refresh()
 
+    @instrumentation.timed("view.tasks.refresh")
     def _refresh(self) -> None:
         while self._lay.count():
             item = self._lay.takeAt(0)
@@ -10,6 +10,8 @@ from PySide6.QtCore import QEvent, QObject, QMimeData, Qt
 from PySide6.QtGui import QDrag, QKeyEvent
 from PySide6.QtWidgets import QApplication, QWidget
 
+from lux.core import instrumentation
+
 
 MIME_LUX_DND = "application/x-lux-dnd+json"
 _PAYLOAD_VERSION = 1
@@ -159,9 +161,11 @@ def start_system_drag(source: QWidget, payload: LuxDragPayload) -> DragResult:
             pass
 
     if cancel_filter.cancel_reason is not None:
-        return cancel_filter.cancel_reason
-
-    if action == Qt.IgnoreAction:
-        return DragResult.IGNORED
-
-    return DragResult.COMPLETED
+        result = cancel_filter.cancel_reason
+    elif action == Qt.IgnoreAction:
+        result = DragResult.IGNORED
+    else:
+        result = DragResult.COMPLETED
+    # Outcome only: drag.exec() spans the user's gesture, so its duration is not a latency.
+    instrumentation.count(f"dnd.{result.value}")
+    return result
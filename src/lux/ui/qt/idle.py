@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+log = logging.getLogger(__name__)
+
+# Events that count as user activity (postpone background work).
+_INPUT_EVENTS = frozenset(
+    {
+        QEvent.KeyPress,
+        QEvent.MouseButtonPress,
+        QEvent.MouseMove,
+        QEvent.Wheel,
+        QEvent.TouchBegin,
+    }
+)
+
+
+@dataclass
+class _IdleJob:
+    name: str
+    step: Callable[[], bool]   # one bounded slice; True = more work pending
+    pending: bool = True
+
+
+class IdleRunner(QObject):
+    """Mechanics-only runner for background maintenance slices (no feature imports)."""
+
+    def __init__(
+        self,
+        app,
+        idle_ms: int = 3000,
+        tick_ms: int = 60_000,
+        busy_interval_ms: int = 50,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._idle_s = max(0, int(idle_ms)) / 1000.0
+        self._tick_ms = max(1, int(tick_ms))
+        self._busy_ms = max(0, int(busy_interval_ms))
+        self._last_input = time.monotonic()
+        self._jobs: list[_IdleJob] = []
+        self._next = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run)  # type: ignore[arg-type]
+
+        app.installEventFilter(self)
+        self._timer.start(int(self._idle_s * 1000))
+
+    def add(self, name: str, step: Callable[[], bool]) -> None:
+        self._jobs.append(_IdleJob(name=name, step=step))
+
+    def run_all_now(self, deadline_s: float | None = None) -> None:
+        """Drain pending slices synchronously (e.g. on shutdown), optionally bounded."""
+        end = time.monotonic() + deadline_s if deadline_s is not None else None
+        for job in self._jobs:
+            while job.pending and (end is None or time.monotonic() < end):
+                self._run_job(job)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() in _INPUT_EVENTS:
+            self._last_input = time.monotonic()
+        return False
+
+    def _run(self) -> None:
+        idle_for = time.monotonic() - self._last_input
+        if idle_for < self._idle_s:
+            self._timer.start(int((self._idle_s - idle_for) * 1000) + 1)
+            return
+
+        pending = [j for j in self._jobs if j.pending]
+        if not pending:
+            # Everything is done: re-poll all jobs on the slow tick.
+            for job in self._jobs:
+                job.pending = True
+            self._timer.start(self._tick_ms)
+            return
+
+        job = pending[self._next % len(pending)]
+        self._next += 1
+        self._run_job(job)
+        self._timer.start(self._busy_ms)
+
+    @staticmethod
+    def _run_job(job: _IdleJob) -> None:
+        try:
+            job.pending = bool(job.step())
+        except Exception:
+            log.exception("Idle job failed: %s", job.name)
+            job.pending = False
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import logging
+from typing import Callable
+
 from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QMainWindow,
+    QMessageBox,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QToolButton,
     QComboBox,
+    QInputDialog,
 )
 
 from lux.app.navigation import AppModuleSpec
+from lux.app.profiles import ProfileStore
 from lux.app.services import SystemServices
+from lux.core import instrumentation
 from lux.core.settings.store import SettingsStore
 from lux.core.settings.schema import THEMES_AVAILABLE
 from lux.ui.qt.app_shell import AppShell
@@ -20,6 +28,8 @@ from lux.ui.qt.settings_view import SettingsLeftPanel, SettingsRightView, Settin
 import lux.ui.qt.theme as theme_mod
 from lux.ui.qt.widgets.buttons import LuxButton
 
+log = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     def __init__(
@@ -28,6 +38,8 @@ class MainWindow(QMainWindow):
         registry: list[AppModuleSpec],
         services: SystemServices,
         app,
+        profiles: ProfileStore | None = None,
+        on_switch_profile: Callable[[str], None] | None = None,
         parent=None,
     ) -> None:
         super().__init__(parent)
@@ -35,6 +47,8 @@ class MainWindow(QMainWindow):
         self._registry = registry
         self._services = services
         self._app = app
+        self._profiles = profiles
+        self._on_switch_profile = on_switch_profile
 
         self._settings_right: SettingsRightView | None = None
         self._in_settings = False
@@ -79,10 +93,30 @@ class MainWindow(QMainWindow):
         # Overlay menu content
         self.shell.set_overlay_content(self._build_nav_menu())
 
+        # Undo/redo (system-owned journal; replays refresh the active module)
+        QShortcut(QKeySequence.Undo, self, activated=lambda: self._replay_undo(redo=False))
+        QShortcut(QKeySequence.Redo, self, activated=lambda: self._replay_undo(redo=True))
+
         # Start on Journal by default
         self._active_key = "journal"
         self._switch_to(self._active_key)
 
+    def _replay_undo(self, redo: bool) -> None:
+        journal = self._services.undo_journal
+        if journal is None:
+            return
+        try:
+            label = journal.redo() if redo else journal.undo()
+        except Exception as e:
+            log.exception("Undo replay failed")
+            # The step was rolled back and dropped; nothing to refresh.
+            QMessageBox.warning(self, "Redo failed" if redo else "Undo failed", f"{type(e).__name__}: {e}")
+            return
+        if label is None or self._in_settings:
+            return
+        # Replays bypass feature signals: rebuild the module views from the DB.
+        self._switch_to(self._active_key)
+
     def _toggle_menu(self) -> None:
         self.shell.toggle_nav_overlay()
 
@@ -115,6 +149,27 @@ class MainWindow(QMainWindow):
         tr.addWidget(self._theme_combo, 1)
         lay.addWidget(theme_row)
 
+        # Profile row (each profile is its own database; switching rebuilds the window)
+        if self._profiles is not None and self._on_switch_profile is not None:
+            profile_row = QWidget()
+            pr = QHBoxLayout(profile_row)
+            pr.setContentsMargins(0, 0, 0, 0)
+            pr.setSpacing(10)
+
+            p_lbl = QLabel("Profile")
+            p_lbl.setObjectName("MetaCaption")
+
+            self._profile_combo = QComboBox()
+            for profile in self._profiles.list():
+                self._profile_combo.addItem(profile.name, profile.id)
+            self._profile_combo.addItem("New profile…", None)
+            self._profile_combo.setCurrentIndex(max(0, self._profile_combo.findData(self._profiles.active_id)))
+            self._profile_combo.activated.connect(self._on_profile_chosen)
+
+            pr.addWidget(p_lbl)
+            pr.addWidget(self._profile_combo, 1)
+            lay.addWidget(profile_row)
+
         # Feature list
         for spec in self._registry:
             b = LuxButton(spec.title)
@@ -147,6 +202,21 @@ class MainWindow(QMainWindow):
         self._settings.set_theme(theme)
         self._apply_theme()
 
+    def _on_profile_chosen(self, index: int) -> None:
+        assert self._profiles is not None and self._on_switch_profile is not None
+        profile_id = self._profile_combo.itemData(index)
+        if profile_id is None:
+            name, ok = QInputDialog.getText(self, "New profile", "Name:")
+            if not ok or not name.strip():
+                self._profile_combo.setCurrentIndex(max(0, self._profile_combo.findData(self._profiles.active_id)))
+                return
+            profile_id = self._profiles.create(name).id
+        if profile_id == self._profiles.active_id:
+            return
+        # Deferred: the switch replaces this window.
+        switch = self._on_switch_profile
+        QTimer.singleShot(0, lambda: switch(profile_id))
+
     def _on_open_settings(self) -> None:
         self._open_settings()
         QTimer.singleShot(0, self.shell.close_nav_overlay)
@@ -169,7 +239,12 @@ class MainWindow(QMainWindow):
             apply_theme=self._apply_theme,
             apply_font_scale=self._apply_theme,
         )
-        self._settings_right = SettingsRightView(settings=self._settings, callbacks=callbacks)
+        self._settings_right = SettingsRightView(
+            settings=self._settings,
+            callbacks=callbacks,
+            backups=self._services.backup_service,
+            sql_profiler=self._services.sql_profiler,
+        )
         self.shell.set_right_content(self._settings_right)
 
     def _on_select_app(self, key: str):
@@ -184,6 +259,7 @@ class MainWindow(QMainWindow):
                 ww.setParent(None)
                 ww.deleteLater()
 
+    @instrumentation.timed("ui.switch_module")
     def _switch_to(self, key: str) -> None:
         spec = next((s for s in self._registry if s.key == key), None)
         if spec is None:
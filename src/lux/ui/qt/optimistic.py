@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class OptimisticCommand:
+    """One UI command split into its optimistic and durable halves."""
+    label: str
+    apply: Callable[[], None]                          # mutate the view model now (no I/O)
+    write: Callable[[], Any]                           # durable write through a service
+    rollback: Callable[[], None]                       # undo `apply` when the write raises
+    confirm: Optional[Callable[[Any], None]] = None    # reconcile with the write result (e.g. new ids)
+
+
+class OptimisticQueue(QObject):
+    """Mechanics-only optimistic command pipeline (no feature imports)."""
+
+    failed = Signal(str, str)  # label, message
+    drained = Signal()
+
+    _live: weakref.WeakSet[OptimisticQueue] = weakref.WeakSet()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._pending: deque[OptimisticCommand] = deque()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)  # type: ignore[arg-type]
+        OptimisticQueue._live.add(self)
+
+    @classmethod
+    def flush_all(cls) -> int:
+        """Drain every live queue now (shutdown); returns the number of writes run."""
+        ran = 0
+        for queue in list(cls._live):
+            try:
+                n = len(queue)
+                if n:
+                    queue.flush()
+                    ran += n
+            except RuntimeError:
+                # Qt side already deleted: nothing left to drain.
+                cls._live.discard(queue)
+        return ran
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(self, cmd: OptimisticCommand) -> None:
+        try:
+            cmd.apply()
+        except Exception:
+            # Nothing was written yet; just skip the command.
+            log.exception("Optimistic apply failed: %s", cmd.label)
+            return
+        self._pending.append(cmd)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Run all pending writes now (also used before shutdown)."""
+        while self._pending:
+            cmd = self._pending.popleft()
+            try:
+                result = cmd.write()
+            except Exception as e:
+                log.warning("Optimistic write failed (%s): %s", cmd.label, e)
+                try:
+                    cmd.rollback()
+                except Exception:
+                    log.exception("Optimistic rollback failed: %s", cmd.label)
+                self.failed.emit(cmd.label, f"{type(e).__name__}: {e}")
+                continue
+
+            if cmd.confirm is not None:
+                try:
+                    cmd.confirm(result)
+                except Exception:
+                    log.exception("Optimistic confirm failed: %s", cmd.label)
+        self.drained.emit()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from lux.core import instrumentation
+from lux.data.profiling import SqlProfiler
+from lux.ui.qt.widgets.buttons import LuxButton
+
+POLL_MS = 1000
+TOP_STATEMENTS = 5
+
+_COLUMNS = ("Span", "Calls", "p50 ms", "p95 ms", "Max ms", "Queries/call")
+
+
+class PerformancePage(QWidget):
+    def __init__(self, sql_profiler: SqlProfiler | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._sql = sql_profiler
+
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(12)
+
+        t = QLabel("Performance")
+        t.setObjectName("TitleUnified")
+        lay.addWidget(t)
+
+        info = QLabel(
+            "Latency of repository queries, service calls, view refreshes, theme changes and drops "
+            "in this session. Queries/call counts repository calls made inside each span."
+        )
+        info.setObjectName("MetaCaption")
+        info.setWordWrap(True)
+        lay.addWidget(info)
+
+        row = QWidget()
+        r_lay = QHBoxLayout(row)
+        r_lay.setContentsMargins(0, 0, 0, 0)
+        r_lay.setSpacing(10)
+        self._toggle_btn = LuxButton("")
+        self._toggle_btn.clicked.connect(self._on_toggle)  # type: ignore[arg-type]
+        reset_btn = LuxButton("Reset")
+        reset_btn.clicked.connect(self._on_reset)  # type: ignore[arg-type]
+        r_lay.addWidget(self._toggle_btn)
+        r_lay.addWidget(reset_btn)
+        r_lay.addStretch(1)
+        lay.addWidget(row)
+
+        self._status = QLabel("")
+        self._status.setObjectName("MetaCaption")
+        self._status.setWordWrap(True)
+        lay.addWidget(self._status)
+
+        self._table = QTableWidget(0, len(_COLUMNS))
+        self._table.setHorizontalHeaderLabels(list(_COLUMNS))
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionMode(QAbstractItemView.NoSelection)
+        self._table.verticalHeader().setVisible(False)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, len(_COLUMNS)):
+            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        lay.addWidget(self._table, 1)
+
+        self._extras = QLabel("")
+        self._extras.setObjectName("MetaCaption")
+        self._extras.setWordWrap(True)
+        lay.addWidget(self._extras)
+
+        if self._sql is not None:
+            lay.addWidget(self._build_sql_section())
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_MS)
+        self._timer.timeout.connect(self._poll)  # type: ignore[arg-type]
+
+        self._refresh()
+
+    def _build_sql_section(self) -> QWidget:
+        w = QWidget()
+        s_lay = QVBoxLayout(w)
+        s_lay.setContentsMargins(0, 0, 0, 0)
+        s_lay.setSpacing(10)
+
+        row = QWidget()
+        r_lay = QHBoxLayout(row)
+        r_lay.setContentsMargins(0, 0, 0, 0)
+        r_lay.setSpacing(10)
+        self._sql_btn = LuxButton("")
+        self._sql_btn.clicked.connect(self._on_toggle_sql)  # type: ignore[arg-type]
+        export_btn = LuxButton("Export SQL stats…")
+        export_btn.clicked.connect(self._on_export_sql)  # type: ignore[arg-type]
+        r_lay.addWidget(self._sql_btn)
+        r_lay.addWidget(export_btn)
+        r_lay.addStretch(1)
+        s_lay.addWidget(row)
+
+        self._sql_status = QLabel("")
+        self._sql_status.setObjectName("MetaCaption")
+        self._sql_status.setWordWrap(True)
+        s_lay.addWidget(self._sql_status)
+        return w
+
+    def showEvent(self, event) -> None:  # noqa: N802 (Qt override)
+        super().showEvent(event)
+        self._refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:  # noqa: N802 (Qt override)
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _on_toggle(self) -> None:
+        if instrumentation.is_enabled():
+            instrumentation.disable()
+        else:
+            instrumentation.enable()
+        self._refresh()
+
+    def _on_reset(self) -> None:
+        instrumentation.reset()
+        if self._sql is not None:
+            self._sql.reset()
+        self._refresh()
+
+    def _on_toggle_sql(self) -> None:
+        if self._sql is not None:
+            self._sql.enabled = not self._sql.enabled
+        self._refresh()
+
+    def _on_export_sql(self) -> None:
+        if self._sql is None:
+            return
+        default = str(Path.home() / f"lux-sql-profile-{datetime.now().strftime('%Y%m%d-%H%M')}.json")
+        path, _filter = QFileDialog.getSaveFileName(self, "Export SQL stats", default, "JSON (*.json)")
+        if not path:
+            return
+        try:
+            n = self._sql.export(Path(path))
+        except OSError as e:
+            self._sql_status.setText(f"Export failed: {e}")
+            return
+        self._sql_status.setText(f"Exported {n} statements to {path}.")
+
+    def _poll(self) -> None:
+        if self.isVisible():
+            self._refresh()
+
+    def _refresh(self) -> None:
+        enabled = instrumentation.is_enabled()
+        self._toggle_btn.setText("Stop recording" if enabled else "Start recording")
+        snap = instrumentation.snapshot()
+        self._status.setText(
+            ("Recording." if enabled else "Not recording (hot paths skip all timing).")
+            + ("" if snap.timings else " Nothing recorded yet.")
+        )
+
+        self._table.setRowCount(len(snap.timings))
+        for r, s in enumerate(snap.timings):
+            cells = (
+                s.name,
+                str(s.count),
+                f"{s.p50_ms:.2f}",
+                f"{s.p95_ms:.2f}",
+                f"{s.max_ms:.2f}",
+                f"{s.queries_per_call:.1f}" if not s.name.startswith("repo.") else "",
+            )
+            for c, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if c:
+                    item.setTextAlignment(int(Qt.AlignRight | Qt.AlignVCenter))
+                self._table.setItem(r, c, item)
+
+        lines = [
+            f"{name.removesuffix('.hit_rate')}: {v:.0%} hits" if name.endswith(".hit_rate") else f"{name}: {v:g}"
+            for name, v in snap.gauges.items()
+        ]
+        lines += [f"{name}: {n}" for name, n in snap.counters.items()]
+        self._extras.setText("\n".join(lines))
+
+        if self._sql is not None:
+            self._refresh_sql()
+
+    def _refresh_sql(self) -> None:
+        assert self._sql is not None
+        self._sql_btn.setText("Stop SQL profiling" if self._sql.enabled else "Profile SQL")
+        stats = self._sql.stats()
+        slow = sum(s.slow for s in stats)
+        lines = [
+            f"SQL profiling {'on' if self._sql.enabled else 'off'}: {len(stats)} statements, "
+            f"{slow} slow executions (≥ {self._sql.slow_ms:g} ms, logged with their query plan)."
+        ]
+        for s in stats[:TOP_STATEMENTS]:
+            sql = s.sql if len(s.sql) <= 100 else s.sql[:99] + "…"
+            lines.append(f"{s.total_ms:.0f} ms total · {s.calls}× · p95 {s.p95_ms:.2f} ms · {s.rows} rows — {sql}")
+        self._sql_status.setText("\n".join(lines))
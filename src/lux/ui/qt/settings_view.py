@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
 from typing import Callable
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QComboBox,
+    QFileDialog,
     QStackedWidget,
 )
 
 from lux.core.settings.schema import THEMES_AVAILABLE
+from lux.data.backup import BackupResult, BackupService
+from lux.data.profiling import SqlProfiler
 from lux.core.settings.store import SettingsStore
+from lux.ui.qt.performance_view import PerformancePage
 from lux.ui.qt.theme import list_available_font_schemes
 
 
@@ -41,6 +47,8 @@ class SettingsLeftPanel(QWidget):
             ("Appearance", "appearance"),
             ("Shortcuts", "shortcuts"),
             ("Notifications", "notifications"),
+            ("Data", "data"),
+            ("Performance", "performance"),
             ("About", "about"),
         ]:
             b = _list_item_button(title)
@@ -50,11 +58,27 @@ class SettingsLeftPanel(QWidget):
         root.addStretch(1)
 
 
+class _BackupBridge(QObject):
+    # Backup callbacks arrive on the worker thread; signals deliver them queued on the GUI thread.
+    finished = Signal(object)
+
+
 class SettingsRightView(QWidget):
-    def __init__(self, settings: SettingsStore, callbacks: SettingsCallbacks, parent=None) -> None:
+    def __init__(
+        self,
+        settings: SettingsStore,
+        callbacks: SettingsCallbacks,
+        backups: BackupService | None = None,
+        sql_profiler: SqlProfiler | None = None,
+        parent=None,
+    ) -> None:
         super().__init__(parent)
         self._settings = settings
         self._callbacks = callbacks
+        self._backups = backups
+        self._sql_profiler = sql_profiler
+        self._backup_bridge = _BackupBridge(self)
+        self._backup_bridge.finished.connect(self._on_backup_finished)  # type: ignore[arg-type]
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -75,6 +99,8 @@ class SettingsRightView(QWidget):
         self._stack.addWidget(self._build_shortcuts_page())      # 1
         self._stack.addWidget(self._build_notifications_page())  # 2
         self._stack.addWidget(self._build_about_page())          # 3
+        self._stack.addWidget(self._build_data_page())           # 4
+        self._stack.addWidget(PerformancePage(self._sql_profiler))  # 5
 
         self.show_category("appearance")
 
@@ -85,6 +111,8 @@ class SettingsRightView(QWidget):
             "shortcuts": 1,
             "notifications": 2,
             "about": 3,
+            "data": 4,
+            "performance": 5,
         }
         self._stack.setCurrentIndex(mapping.get(k, 0))
 
@@ -212,6 +240,98 @@ class SettingsRightView(QWidget):
             ],
         )
 
+    def _build_data_page(self) -> QWidget:
+        if self._backups is None:
+            return _placeholder_page("Data", ["Backups are not available in this session."])
+
+        from lux.ui.qt.widgets.buttons import LuxButton
+
+        w = QWidget()
+        lay = QVBoxLayout(w)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(12)
+
+        t = QLabel("Data")
+        t.setObjectName("TitleUnified")
+        lay.addWidget(t)
+
+        info = QLabel(
+            "Backups are verified copies of the live database, taken in the background "
+            f"once a day. Folder: {self._backups.dest_dir}"
+        )
+        info.setObjectName("MetaCaption")
+        info.setWordWrap(True)
+        lay.addWidget(info)
+
+        row = QWidget()
+        r_lay = QHBoxLayout(row)
+        r_lay.setContentsMargins(0, 0, 0, 0)
+        r_lay.setSpacing(10)
+        self._backup_btn = LuxButton("Back up now")
+        self._backup_btn.clicked.connect(self._on_backup_now)  # type: ignore[arg-type]
+        self._export_btn = LuxButton("Export snapshot…")
+        self._export_btn.clicked.connect(self._on_export_snapshot)  # type: ignore[arg-type]
+        r_lay.addWidget(self._backup_btn)
+        r_lay.addWidget(self._export_btn)
+        r_lay.addStretch(1)
+        lay.addWidget(row)
+
+        self._backup_status = QLabel("")
+        self._backup_status.setObjectName("MetaCaption")
+        self._backup_status.setWordWrap(True)
+        lay.addWidget(self._backup_status)
+
+        self._backup_list = QLabel("")
+        self._backup_list.setObjectName("MetaCaption")
+        self._backup_list.setWordWrap(True)
+        lay.addWidget(self._backup_list)
+
+        lay.addStretch(1)
+        self._refresh_backup_page()
+        return w
+
+    def _refresh_backup_page(self) -> None:
+        if self._backups is None:
+            return
+        running = self._backups.is_running()
+        self._backup_btn.setEnabled(not running)
+        self._export_btn.setEnabled(not running)
+        if running:
+            self._backup_status.setText("Backup in progress…")
+
+        lines = []
+        for p in self._backups.snapshots():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            when = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
+            lines.append(f"{when}  —  {p.name}  ({st.st_size / 1024:.0f} KB)")
+        self._backup_list.setText("\n".join(lines) if lines else "No backups yet.")
+
+    def _on_backup_now(self) -> None:
+        if self._backups is not None and self._backups.start_snapshot(on_done=self._backup_bridge.finished.emit):
+            self._refresh_backup_page()
+
+    def _on_export_snapshot(self) -> None:
+        if self._backups is None:
+            return
+        default = str(Path.home() / f"lux-planner-{datetime.now().strftime('%Y%m%d')}.db")
+        path, _filter = QFileDialog.getSaveFileName(
+            self, "Export snapshot", default, "SQLite database (*.db);;Compressed (*.db.gz)"
+        )
+        if path and self._backups.start_export(Path(path), on_done=self._backup_bridge.finished.emit):
+            self._refresh_backup_page()
+
+    def _on_backup_finished(self, result: BackupResult) -> None:
+        if result.ok and result.path is not None:
+            self._backup_status.setText(
+                f"Saved {result.path.name} ({result.size_bytes / 1024:.0f} KB, {result.duration_ms:.0f} ms, verified)."
+            )
+        else:
+            self._backup_status.setText(f"Backup failed: {result.detail}")
+        self._refresh_backup_page()
+
     def _on_theme_changed(self, theme: str) -> None:
         self._settings.set_theme(theme)
         self._callbacks.apply_theme()
@@ -10,6 +10,7 @@ from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QApplication
 
 from lux.app.config import repo_root_from_file
+from lux.core import instrumentation
 from lux.core.settings.schema import FONT_SCHEME_DEFAULT, THEME_DEFAULT, THEMES_AVAILABLE
 
 log = logging.getLogger(__name__)
@@ -231,6 +232,46 @@ def _apply_font_scale_to_qss(qss: str, font_scale: float) -> str:
     return re.sub(r"font-size:\s*(\d+)px\s*;", repl, qss)
 
 
+# ----------------------------
+# Compiled stylesheet cache
+# ----------------------------
+# Final QSS per (theme, scale, scheme, source file stamps). Persisted across
+# launches by the lifecycle manager so startup skips the read + substitutions.
+_QSS_CACHE_MAX = 16
+_QSS_CACHE: dict[str, str] = {}
+
+
+def _file_stamp(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _qss_cache_key(qss_path: Path, theme: str, font_scale: float, sid: str) -> str:
+    scheme_path = _font_schemes_dir() / f"{sid}.json" if sid else None
+    scheme_stamp = _file_stamp(scheme_path) if scheme_path is not None else "-"
+    return f"{theme}|{float(font_scale):.4f}|{sid}|{_file_stamp(qss_path)}|{scheme_stamp}"
+
+
+def stylesheet_cache_snapshot() -> dict[str, str]:
+    """Compiled stylesheets, oldest first (JSON-serializable)."""
+    return dict(_QSS_CACHE)
+
+
+def restore_stylesheet_cache(data: object) -> None:
+    """Seed the cache from a saved snapshot (ignored unless it is a str -> str mapping)."""
+    if not isinstance(data, dict):
+        return
+    for k, v in data.items():
+        if isinstance(k, str) and isinstance(v, str):
+            _QSS_CACHE[k] = v
+    while len(_QSS_CACHE) > _QSS_CACHE_MAX:
+        _QSS_CACHE.pop(next(iter(_QSS_CACHE)))
+
+
+@instrumentation.timed("theme.apply")
 def apply_theme_by_name(
     app: QApplication,
     theme_name: str,
@@ -250,6 +291,15 @@ def apply_theme_by_name(
         app.setStyleSheet("")
         return
 
+    sid = _sanitize_font_scheme_id(font_scheme_id) or _sanitize_font_scheme_id(FONT_SCHEME_DEFAULT) or ""
+    key = _qss_cache_key(qss_path, theme, font_scale, sid)
+    cached = _QSS_CACHE.get(key)
+    if cached is not None:
+        instrumentation.count("theme.stylesheet_cache.hit")
+        app.setStyleSheet(cached)
+        return
+    instrumentation.count("theme.stylesheet_cache.miss")
+
     qss = qss_path.read_text(encoding="utf-8")
     qss = _apply_font_scale_to_qss(qss, font_scale=font_scale)
 
@@ -257,8 +307,12 @@ def apply_theme_by_name(
     qss = _substitute_typography_tokens(qss, mapping)
 
     # NOTE: Scheme info is comment-only for debugging; no CSS var overlay emitted.
-    sid = _sanitize_font_scheme_id(font_scheme_id) or _sanitize_font_scheme_id(FONT_SCHEME_DEFAULT) or ""
     if sid:
         qss = f"/* font-scheme: {sid} */\n" + qss
 
+    _QSS_CACHE.pop(key, None)
+    _QSS_CACHE[key] = qss
+    while len(_QSS_CACHE) > _QSS_CACHE_MAX:
+        _QSS_CACHE.pop(next(iter(_QSS_CACHE)))
+
     app.setStyleSheet(qss)
@@ -0,0 +1,102 @@
+"""
+Hot backups (lux.data.backup): verified copies of a live database and snapshot rotation.
+"""
+
+from __future__ import annotations
+
+import gzip
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.data.backup import BackupService, backup_database, list_snapshots, rotate_snapshots
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.tasks_repo import TasksRepository
+
+
+@pytest.fixture
+def live(tmp_path: Path) -> tuple[Path, sqlite3.Connection]:
+    db_file = tmp_path / "planner.db"
+    conn = ensure_db_ready(db_file)
+    tasks = TasksRepository(conn)
+    for i in range(50):
+        tasks.create_task(f"Task {i}")
+    yield db_file, conn
+    conn.close()
+
+
+def _check(path: Path) -> tuple[str, int]:
+    """integrity_check result and task count of a backup file."""
+    conn = sqlite3.connect(str(path))
+    try:
+        return (
+            str(conn.execute("PRAGMA integrity_check").fetchone()[0]),
+            int(conn.execute("SELECT COUNT(*) FROM task_definitions").fetchone()[0]),
+        )
+    finally:
+        conn.close()
+
+
+def test_backup_of_a_live_database_passes_integrity_check(tmp_path, live):
+    db_file, conn = live
+    TasksRepository(conn).create_task("Still in the WAL")
+    progress: list[tuple[int, int]] = []  # (copied, total) pages
+
+    dest = tmp_path / "out" / "copy.db"
+    result = backup_database(db_file, dest, pages_per_step=2, progress=lambda *p: progress.append(p))
+
+    assert result.ok and result.detail == "ok" and result.path == dest
+    assert result.size_bytes == result.path.stat().st_size and result.pages > 0
+    assert progress and progress[-1][0] == progress[-1][1]
+    assert _check(result.path) == ("ok", 51)
+    assert not list((tmp_path / "out").glob("*.part"))
+    assert not (tmp_path / "out" / "copy.db-wal").exists()  # self-contained rollback journal
+
+
+def test_compressed_backup_and_cancel(tmp_path, live):
+    db_file, _ = live
+    result = backup_database(db_file, tmp_path / "copy.db.gz", compress=True)
+    assert result.ok
+    raw = tmp_path / "unzipped.db"
+    raw.write_bytes(gzip.decompress(result.path.read_bytes()))
+    assert _check(raw) == ("ok", 50)
+
+    cancelled = backup_database(db_file, tmp_path / "never.db", pages_per_step=1, cancelled=lambda: True)
+    assert not cancelled.ok and cancelled.path is None and cancelled.detail == "cancelled"
+    assert list(tmp_path.glob("never.db*")) == []
+
+
+def test_rotation_keeps_the_newest_snapshots(tmp_path):
+    dest = tmp_path / "backups"
+    dest.mkdir()
+    for day in range(1, 6):
+        (dest / f"planner-2030010{day}-120000.db.gz").write_bytes(b"")
+    (dest / "export.db").write_bytes(b"")  # not a snapshot: never rotated
+
+    removed = rotate_snapshots(dest, keep=3)
+
+    assert [p.name for p in list_snapshots(dest)] == [
+        "planner-20300105-120000.db.gz",
+        "planner-20300104-120000.db.gz",
+        "planner-20300103-120000.db.gz",
+    ]
+    assert sorted(p.name for p in removed) == ["planner-20300101-120000.db.gz", "planner-20300102-120000.db.gz"]
+    assert (dest / "export.db").exists()
+
+
+def test_service_snapshots_are_rotated_to_keep(tmp_path, live):
+    db_file, _ = live
+    clock = [1_900_000_000.0]
+    service = BackupService(db_file, tmp_path / "backups", keep=2, compress=False, clock=lambda: clock[0])
+    results = []
+
+    for _ in range(4):
+        assert service.start_snapshot(on_done=results.append)
+        assert service.wait(10.0)
+        clock[0] += 60  # distinct snapshot names
+
+    assert all(r.ok for r in results) and service.last_result is results[-1]
+    snapshots = service.snapshots()
+    assert len(snapshots) == 2 and snapshots == [results[3].path, results[2].path]
+    assert all(_check(p) == ("ok", 50) for p in snapshots)
@@ -0,0 +1,165 @@
+"""
+Cold storage (lux.data.cold_storage): moving rows to *_history, reading them back, thawing on edit.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from lux.data.cold_storage import ColdStorage, history_horizon
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.service import TasksService
+
+NOW = datetime(2030, 6, 1, 12, 0, 0)  # hot window: 180 days -> horizon 2029-12-03
+OLD = "2029-01-01 08:00:00"
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "cold.db")
+    yield conn
+    conn.close()
+
+
+def _entry(repo: ScheduledEntryRepo, ref: str, day: str) -> int:
+    return repo.create(
+        {"item_kind": "adhoc", "item_ref": ref, "start_dt": f"{day} 09:00:00", "end_dt": f"{day} 10:00:00"}
+    )
+
+
+def _backdate(conn: sqlite3.Connection, table: str, row_id: int, stamp: str = OLD) -> None:
+    conn.execute(f"UPDATE {table} SET updated_at = ? WHERE id = ?", (stamp, row_id))
+    conn.commit()
+
+
+def _ids(conn: sqlite3.Connection, table: str) -> list[int]:
+    return [r[0] for r in conn.execute(f"SELECT id FROM {table} ORDER BY id")]
+
+
+def _freeze(conn: sqlite3.Connection, batch_rows: int = 2) -> int:
+    cold = ColdStorage(conn, batch_rows=batch_rows)
+    moved = 0
+    for table in ("task_occurrences", "scheduled_entries"):
+        while n := cold.move_batch(table, now=NOW):
+            moved += n
+    return moved
+
+
+@pytest.fixture
+def seeded(conn):
+    """Old finished rows, old and fresh archived rows, and current rows on both tables."""
+    tasks = TasksRepository(conn)
+    sched = ScheduledEntryRepo(conn)
+    tid = tasks.create_task("Water plants")
+    ids = {
+        "occ_done_old": tasks.create_occurrence(tid, "2029-03-01"),
+        "occ_open_old": tasks.create_occurrence(tid, "2029-03-02"),  # not completed: stays hot
+        "occ_archived_old": tasks.create_occurrence(tid, "2030-05-01"),
+        "occ_archived_fresh": tasks.create_occurrence(tid, "2030-05-02"),  # inside the undo grace period
+        "occ_current": tasks.create_occurrence(tid, "2030-06-01"),
+        "entry_old": _entry(sched, "old", "2029-03-01"),
+        "entry_archived_old": _entry(sched, "archived", "2030-05-01"),
+        "entry_current": _entry(sched, "current", "2030-06-01"),
+    }
+    tasks.set_occurrence_completed(ids["occ_done_old"], True)
+    tasks.archive_occurrence(ids["occ_archived_old"])
+    tasks.archive_occurrence(ids["occ_archived_fresh"])
+    _backdate(conn, "task_occurrences", ids["occ_archived_old"])
+    _backdate(conn, "task_occurrences", ids["occ_archived_fresh"], "2030-05-31 00:00:00")
+    sched.archive(ids["entry_archived_old"])
+    _backdate(conn, "scheduled_entries", ids["entry_archived_old"])
+    return tasks, sched, ids
+
+
+# -------------------------
+# Freezing
+# -------------------------
+def test_freeze_moves_only_candidates_and_keeps_every_row(conn, seeded):
+    _, _, ids = seeded
+    before = {t: _ids(conn, t) for t in ("task_occurrences_all", "scheduled_entries_all")}
+
+    assert _freeze(conn) == 4
+    assert _ids(conn, "task_occurrences_history") == [ids["occ_done_old"], ids["occ_archived_old"]]
+    assert _ids(conn, "scheduled_entries_history") == [ids["entry_old"], ids["entry_archived_old"]]
+    assert ids["occ_open_old"] in _ids(conn, "task_occurrences")
+    assert ids["occ_archived_fresh"] in _ids(conn, "task_occurrences")
+    # Every row is in exactly one side.
+    assert {t: _ids(conn, t) for t in before} == before
+    assert history_horizon(conn, "task_occurrences") == "2029-12-03"
+    assert history_horizon(conn, "scheduled_entries") == "2029-12-03 00:00:00"
+
+    assert _freeze(conn) == 0  # nothing left to move
+
+
+def test_no_move_inside_an_open_transaction(conn, seeded):
+    tasks, _, _ = seeded
+    with tasks.transaction():
+        tasks.create_task("Pending write")
+        assert ColdStorage(conn).move_batch("scheduled_entries", now=NOW) == 0
+        assert conn.in_transaction
+    assert _ids(conn, "scheduled_entries_history") == []
+
+
+# -------------------------
+# Reading through the *_all views
+# -------------------------
+def test_range_reads_include_history_below_the_horizon(conn, seeded):
+    tasks, sched, ids = seeded
+    _freeze(conn)
+
+    old = tasks.list_occurrences_for_range("2029-01-01", "2029-12-31")
+    assert [o.id for o in old] == [ids["occ_done_old"], ids["occ_open_old"]]
+    assert [o.id for o in tasks.list_occurrences_for_range("2030-05-01", "2030-06-30", include_archived=True)] == [
+        ids["occ_archived_old"],
+        ids["occ_archived_fresh"],
+        ids["occ_current"],
+    ]
+    assert tasks.get_occurrence(ids["occ_done_old"]).completed_at is not None
+
+    assert [e.id for e in sched.list_for_range("2029-01-01 00:00:00", "2029-12-31 00:00:00")] == [ids["entry_old"]]
+    assert [e.id for e in sched.list_for_range("2030-05-01 00:00:00", "2030-07-01 00:00:00")] == [ids["entry_current"]]
+    assert sched.get(ids["entry_archived_old"]).archived
+    assert [e.id for e in sched.iter_active_entries()] == [ids["entry_old"], ids["entry_current"]]
+
+
+def test_frozen_materializations_still_suppress_their_virtual_instance(conn):
+    service = TasksService(repo=TasksRepo(TasksRepository(conn)))
+    tid = service.add_recurring_task("Stretch", "FREQ=DAILY;COUNT=3", "2029-03-01")
+    occ = service.materialize_occurrence(tid, "2029-03-02")
+    service._repo.set_occurrence_completed(occ, True)
+    _freeze(conn)
+    assert _ids(conn, "task_occurrences_history") == [occ]
+
+    virtual = service._expand_recurring("2029-03-01", "2029-03-31")
+    assert [o.due_date for o in virtual] == ["2029-03-01", "2029-03-03"]
+    assert service.materialize_occurrence(tid, "2029-03-02") == occ  # found in history, not duplicated
+    assert _ids(conn, "task_occurrences_all") == [occ]
+
+
+# -------------------------
+# Thawing
+# -------------------------
+def test_edits_thaw_rows_back_into_the_hot_table(conn, seeded):
+    tasks, sched, ids = seeded
+    _freeze(conn)
+
+    tasks.set_occurrence_completed(ids["occ_done_old"], False)
+    assert ids["occ_done_old"] in _ids(conn, "task_occurrences")
+    assert ids["occ_done_old"] not in _ids(conn, "task_occurrences_history")
+    assert tasks.get_occurrence(ids["occ_done_old"]).completed_at is None
+
+    sched.update_time(ids["entry_old"], "2029-03-01 11:00:00", "2029-03-01 12:00:00")
+    assert _ids(conn, "scheduled_entries") == [ids["entry_old"], ids["entry_current"]]
+    assert sched.get(ids["entry_old"]).start_dt == "2029-03-01 11:00:00"
+
+    # Undo of an archive restores a frozen archived row the same way.
+    sched.set_archived(ids["entry_archived_old"], False)
+    assert _ids(conn, "scheduled_entries_history") == []
+    assert not sched.get(ids["entry_archived_old"]).archived
@@ -0,0 +1,75 @@
+"""
+SQLite housekeeping slices (lux.data.maintenance) against a real database file.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.data.db import ensure_db_ready
+from lux.data.maintenance import OPTIMIZE_EVERY_S, VACUUM_MIN_FREE_PAGES, DbMaintenance
+from lux.data.repositories.tasks_repo import TasksRepository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "maint.db")
+    yield conn
+    conn.close()
+
+
+def _free_pages(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+
+
+def _make_free_pages(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE TABLE scratch (blob BLOB)")
+    conn.executemany("INSERT INTO scratch VALUES (?)", [(b"x" * 4000,) for _ in range(VACUUM_MIN_FREE_PAGES * 2)])
+    conn.commit()
+    conn.execute("DROP TABLE scratch")
+    conn.commit()
+
+
+def test_step_never_runs_inside_an_open_transaction(conn):
+    tasks = TasksRepository(conn)
+    maint = DbMaintenance(conn, clock=_Clock())
+
+    with tasks.transaction():
+        tasks.create_task("Pending write")
+        assert maint.step() is False
+        maint.run_shutdown()  # also a no-op while a transaction is open
+        assert conn.in_transaction
+    assert maint.reports() == []
+    assert maint.step() is True and [r.task for r in maint.reports()] == ["optimize"]
+
+
+def test_step_runs_one_due_slice_at_a_time(conn):
+    clock = _Clock()
+    maint = DbMaintenance(conn, clock=clock)
+    _make_free_pages(conn)
+    maint.checkpoint()  # keep the WAL below the checkpoint threshold
+    free = _free_pages(conn)
+    assert free >= VACUUM_MIN_FREE_PAGES
+
+    assert maint.step() is True  # statistics first
+    while maint.step():
+        pass
+    tasks = [r.task for r in maint.reports()]
+    assert tasks[:2] == ["checkpoint", "optimize"] and set(tasks[2:]) == {"incremental_vacuum"}
+    assert _free_pages(conn) < VACUUM_MIN_FREE_PAGES
+
+    # Statistics are due again only after the interval.
+    assert maint.step() is False
+    clock.now += OPTIMIZE_EVERY_S
+    assert maint.step() is True and maint.reports()[-1].task == "optimize"
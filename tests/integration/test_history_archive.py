@@ -0,0 +1,213 @@
+"""
+Columnar history archive (lux.data.columnar): column encodings, codecs, failure and snapshot behaviour.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.data import columnar
+from lux.data.columnar import CODEC_ZLIB, CODEC_ZSTD, HISTORY_TABLES, ArchiveFormatError, HistoryArchive
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "source.db")
+    _seed(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def target(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "target.db")
+    yield conn
+    conn.close()
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    tasks = TasksRepository(conn)
+    sched = ScheduledEntryRepo(conn)
+    for i in range(25):
+        tid = tasks.create_task(f"Task {i}", notes="" if i % 3 else "ünïcode notes")
+        occ = tasks.create_occurrence(tid, f"2030-01-{i % 28 + 1:02d}")
+        if i % 2:
+            tasks.set_occurrence_completed(occ, True)
+        sched.create(
+            {
+                "item_kind": "task_occurrence",
+                "item_ref": str(occ),
+                "start_dt": f"2030-01-{i % 28 + 1:02d} 09:00:00",
+                "end_dt": f"2030-01-{i % 28 + 1:02d} 10:30:00",
+            }
+        )
+    series = sched.create_series(
+        {
+            "item_kind": "adhoc",
+            "item_ref": "standup",
+            "start_dt": "2030-01-07 09:00:00",
+            "end_dt": "2030-01-07 09:15:00",
+            "rrule": "FREQ=DAILY",
+            "title_cache": "Standup",
+        }
+    )
+    sched.add_series_exception(series, "2030-01-08 09:00:00")
+
+
+def _dump(conn: sqlite3.Connection) -> dict[str, list[tuple]]:
+    return {
+        table: [tuple(r) for r in conn.execute(f"SELECT * FROM {source} ORDER BY id")]
+        for table, source in HISTORY_TABLES
+    }
+
+
+def _count(conn: sqlite3.Connection) -> int:
+    return sum(len(rows) for rows in _dump(conn).values())
+
+
+# -------------------------
+# Column encodings
+# -------------------------
+@pytest.mark.parametrize(
+    ("values", "enc"),
+    [
+        ([None, None, None], columnar._ENC_NULL),
+        ([1, None, -7, 2**40, None, 3], columnar._ENC_INT),
+        ([None, 5], columnar._ENC_INT),
+        ([1.5, None, -0.25, 1e300], columnar._ENC_REAL),
+        (["2030-01-01 09:00:00", None, "1969-12-31 23:59:59", "2030-01-01 09:00:00"], columnar._ENC_DATETIME),
+        (["2030-01-01", "1999-02-28", None], columnar._ENC_DATE),
+        (["a", None, "b", "a", "ünïcode", ""], columnar._ENC_DICT),
+        # Timestamp-shaped but not canonical: must come back byte for byte.
+        (["2025-13-01", "2025-01-01"], columnar._ENC_DICT),
+        (["2030-01-01T09:00:00", "2030-01-01 24:00:00"], columnar._ENC_DICT),
+        ([1, "one", None, 2.5], columnar._ENC_JSON),
+    ],
+)
+def test_column_round_trip(values, enc):
+    got_enc, block = columnar._encode_column(values)
+    assert got_enc == enc
+    assert columnar._decode_column(got_enc, memoryview(block), len(values)) == values
+
+
+def test_rows_round_trip():
+    rows = [
+        (1, "Task", None, "2030-01-01", "2030-01-01 09:00:00", 0.5),
+        (2, "Task", "notes", None, None, None),
+        (9, None, "more", "2030-01-03", "2030-01-02 10:00:00", 2.0),
+    ]
+    assert columnar._decode_rows(columnar._encode_rows(rows), 6) == rows
+
+
+def test_unknown_encoding_is_a_format_error():
+    with pytest.raises(ArchiveFormatError):
+        columnar._decode_column(99, memoryview(b""), 0)
+
+
+# -------------------------
+# Export / import
+# -------------------------
+@pytest.mark.parametrize("codec", [CODEC_ZLIB, CODEC_ZSTD])
+def test_export_import_round_trip(source, target, tmp_path, codec):
+    if codec == CODEC_ZSTD:
+        pytest.importorskip("zstandard")
+    path = tmp_path / "history.luxc"
+
+    exported = HistoryArchive(source, chunk_rows=7, codec=codec).export_to(path)
+    imported = HistoryArchive(target).import_from(path)
+
+    assert path.read_bytes()[5] == codec
+    assert exported.rows == imported.rows and sum(exported.rows.values()) == _count(source)
+    assert _dump(target) == _dump(source)
+
+
+def test_zstd_without_the_package_is_a_format_error(source, tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "_zstd", None)
+    with pytest.raises(ArchiveFormatError):
+        HistoryArchive(source, codec=CODEC_ZSTD).export_to(tmp_path / "history.luxc")
+
+
+def test_import_needs_an_empty_planner(source, tmp_path):
+    path = tmp_path / "history.luxc"
+    HistoryArchive(source).export_to(path)
+    with pytest.raises(ValueError):
+        HistoryArchive(source).import_from(path)
+
+
+def _corrupt_tail(data: bytes) -> bytes:
+    return data[:-10]
+
+
+def _corrupt_middle(data: bytes) -> bytes:
+    mid = len(data) // 2
+    return data[:mid] + bytes(b ^ 0xFF for b in data[mid : mid + 8]) + data[mid + 8 :]
+
+
+def _corrupt_magic(data: bytes) -> bytes:
+    return b"NOPE" + data[4:]
+
+
+def _drop_end_frame(data: bytes) -> bytes:
+    # The END frame is the last frame; cut exactly before its header.
+    f = columnar._FRAME
+    pos, last = 6, 6
+    while pos < len(data):
+        _kind, _raw, packed = f.unpack_from(data, pos)
+        last = pos
+        pos += f.size + packed
+    return data[:last]
+
+
+@pytest.mark.parametrize("damage", [_corrupt_tail, _corrupt_middle, _corrupt_magic, _drop_end_frame])
+def test_damaged_archive_leaves_the_planner_empty(source, target, tmp_path, damage):
+    path = tmp_path / "history.luxc"
+    HistoryArchive(source, chunk_rows=5, codec=CODEC_ZLIB).export_to(path)
+    path.write_bytes(damage(path.read_bytes()))
+
+    with pytest.raises(ArchiveFormatError):
+        HistoryArchive(target).import_from(path)
+
+    assert not target.in_transaction
+    assert _count(target) == 0
+    # A good archive still imports afterwards.
+    HistoryArchive(source, codec=CODEC_ZLIB).export_to(path)
+    HistoryArchive(target).import_from(path)
+    assert _dump(target) == _dump(source)
+
+
+def test_export_reads_one_snapshot(source, target, tmp_path):
+    before = _dump(source)
+    writer = ensure_db_ready(tmp_path / "source.db")
+    wrote = []
+
+    def progress(table: str, _rows: int) -> None:
+        # Another connection writes mid-export, into tables not yet read.
+        if not wrote:
+            tid = TasksRepository(writer).create_task("Late task")
+            ScheduledEntryRepo(writer).create(
+                {
+                    "item_kind": "adhoc",
+                    "item_ref": "late",
+                    "start_dt": "2030-02-01 09:00:00",
+                    "end_dt": "2030-02-01 10:00:00",
+                }
+            )
+            wrote.append(tid)
+
+    path = tmp_path / "history.luxc"
+    try:
+        stats = HistoryArchive(source, chunk_rows=4).export_to(path, progress=progress)
+    finally:
+        writer.close()
+
+    assert wrote and not source.in_transaction
+    assert stats.rows == {table: len(rows) for table, rows in before.items()}
+    HistoryArchive(target).import_from(path)
+    assert _dump(target) == before
+    assert _count(source) == _count(target) + 2  # the late rows are there, just not in this export
@@ -0,0 +1,199 @@
+"""
+iCalendar import/export for the scheduler (lux.core.scheduler.ics_io) against a real SQLite file.
+"""
+
+from __future__ import annotations
+
+import io
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.core.scheduler.ics_io import export_ics, import_ics
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+
+STAMP = "2000-01-01 00:00:00"
+
+SERIES = (
+    "BEGIN:VEVENT",
+    "UID:standup@example.com",
+    "DTSTART:20300107T090000",
+    "DTEND:20300107T091500",
+    "RRULE:FREQ=DAILY;COUNT=10",
+    "SUMMARY:Standup",
+    "END:VEVENT",
+)
+OVERRIDE = (
+    "BEGIN:VEVENT",
+    "UID:standup@example.com",
+    "RECURRENCE-ID:20300109T090000",
+    "DTSTART:20300109T100000",
+    "DTEND:20300109T101500",
+    "SUMMARY:Standup (late)",
+    "END:VEVENT",
+)
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "ics.db")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def repo(conn) -> ScheduledEntryRepo:
+    return ScheduledEntryRepo(conn)
+
+
+def _ics(*events: tuple[str, ...]) -> list[str]:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0"]
+    for ev in events:
+        lines.extend(ev)
+    lines.append("END:VCALENDAR")
+    return [line + "\r\n" for line in lines]
+
+
+def _event(uid: str, day: int, summary: str, *extra: str) -> tuple[str, ...]:
+    return (
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTART:203001{day:02d}T130000",
+        f"DTEND:203001{day:02d}T140000",
+        f"SUMMARY:{summary}",
+        *extra,
+        "END:VEVENT",
+    )
+
+
+def _exceptions(conn: sqlite3.Connection) -> list[tuple[str, str, str | None]]:
+    """(series ref, original_start, override entry ref)."""
+    rows = conn.execute(
+        """
+        SELECT s.item_ref, x.original_start, e.item_ref
+          FROM scheduled_series_exceptions x
+          JOIN scheduled_series s ON s.id = x.series_id
+          LEFT JOIN scheduled_entries e ON e.id = x.entry_id
+         ORDER BY x.original_start
+        """
+    )
+    return [tuple(r) for r in rows]
+
+
+def _entries(conn: sqlite3.Connection) -> list[tuple]:
+    rows = conn.execute("SELECT item_ref, start_dt, title_cache, archived FROM scheduled_entries ORDER BY item_ref")
+    return [tuple(r) for r in rows]
+
+
+# -------------------------
+# Import
+# -------------------------
+def test_events_map_to_entries_and_series(conn, repo):
+    stats = import_ics(
+        repo,
+        _ics(
+            _event("one@example.com", 3, "Dentist"),
+            _event("gone@example.com", 4, "Cancelled call", "STATUS:CANCELLED"),
+            _event("odd@example.com", 5, "Hourly", "RRULE:FREQ=HOURLY"),
+            SERIES,
+        ),
+    )
+
+    assert (stats.events, stats.entries, stats.series, stats.unsupported_rules) == (4, 3, 1, 1)
+    assert _entries(conn) == [
+        ("gone@example.com", "2030-01-04 13:00:00", "Cancelled call", 1),
+        ("odd@example.com", "2030-01-05 13:00:00", "Hourly", 0),
+        ("one@example.com", "2030-01-03 13:00:00", "Dentist", 0),
+    ]
+    series = conn.execute("SELECT item_kind, rrule, until_dt FROM scheduled_series").fetchall()
+    assert [tuple(r) for r in series] == [("ics", "FREQ=DAILY;COUNT=10", "2030-01-16 09:15:00")]
+
+
+def test_override_before_its_series_is_linked_in_a_later_batch(conn, repo):
+    stats = import_ics(repo, _ics(OVERRIDE, _event("filler@example.com", 3, "Filler"), SERIES), batch_size=1)
+
+    assert (stats.overrides, stats.exceptions, stats.orphan_overrides) == (1, 1, 0)
+    assert _exceptions(conn) == [
+        ("standup@example.com", "2030-01-09 09:00:00", "standup@example.com#2030-01-09 09:00:00"),
+    ]
+
+
+def test_override_without_a_series_stays_a_one_off(conn, repo):
+    stats = import_ics(repo, _ics(OVERRIDE), batch_size=1)
+    assert (stats.overrides, stats.orphan_overrides, stats.exceptions) == (1, 1, 0)
+    assert [e[0] for e in _entries(conn)] == ["standup@example.com#2030-01-09 09:00:00"]
+
+
+@pytest.mark.parametrize("override_first", [True, False])
+@pytest.mark.parametrize("batch_size", [1, 100])
+def test_exdate_and_override_on_the_same_start_keep_the_override(conn, repo, override_first, batch_size):
+    series = SERIES[:-1] + ("EXDATE:20300109T090000,20300111T090000", "END:VEVENT")
+    events = (OVERRIDE, series) if override_first else (series, OVERRIDE)
+
+    import_ics(repo, _ics(*events), batch_size=batch_size)
+
+    assert _exceptions(conn) == [
+        ("standup@example.com", "2030-01-09 09:00:00", "standup@example.com#2030-01-09 09:00:00"),
+        ("standup@example.com", "2030-01-11 09:00:00", None),
+    ]
+
+
+def test_reimport_updates_by_uid_without_duplicates(conn, repo):
+    first = _ics(_event("a@example.com", 3, "Alpha"), _event("b@example.com", 4, "Beta"), SERIES, OVERRIDE)
+    import_ics(repo, first)
+    conn.execute("UPDATE scheduled_entries SET updated_at = ?", (STAMP,))
+    conn.commit()
+
+    second = _ics(_event("a@example.com", 3, "Alpha"), _event("b@example.com", 6, "Beta, moved"), SERIES, OVERRIDE)
+    stats = import_ics(repo, second)
+
+    assert stats.entries == 3 and stats.exceptions == 1
+    assert _entries(conn) == [
+        ("a@example.com", "2030-01-03 13:00:00", "Alpha", 0),
+        ("b@example.com", "2030-01-06 13:00:00", "Beta, moved", 0),
+        ("standup@example.com#2030-01-09 09:00:00", "2030-01-09 10:00:00", "Standup (late)", 0),
+    ]
+    assert conn.execute("SELECT COUNT(*) FROM scheduled_series").fetchone()[0] == 1
+    assert len(_exceptions(conn)) == 1
+    # Unchanged rows are left untouched.
+    stamps = dict(conn.execute("SELECT item_ref, updated_at FROM scheduled_entries").fetchall())
+    assert stamps["a@example.com"] == STAMP and stamps["b@example.com"] != STAMP
+
+
+def test_cancelled_reimport_archives(conn, repo):
+    import_ics(repo, _ics(_event("a@example.com", 3, "Alpha")))
+    import_ics(repo, _ics(_event("a@example.com", 3, "Alpha", "STATUS:CANCELLED")))
+    assert _entries(conn) == [("a@example.com", "2030-01-03 13:00:00", "Alpha", 1)]
+
+
+# -------------------------
+# Export
+# -------------------------
+def test_export_then_import_reproduces_the_calendar(conn, repo, tmp_path):
+    series = SERIES[:-1] + ("EXDATE:20300111T090000", "END:VEVENT")
+    import_ics(repo, _ics(_event("a@example.com", 3, "Alpha"), series, OVERRIDE))
+    native = repo.create(
+        {
+            "item_kind": "adhoc",
+            "item_ref": "note",
+            "start_dt": "2030-01-05 08:00:00",
+            "end_dt": "2030-01-05 08:30:00",
+            "title_cache": "Native",
+        }
+    )
+
+    out = io.StringIO()
+    assert export_ics(repo, out) == 4
+
+    other = ensure_db_ready(tmp_path / "other.db")
+    try:
+        stats = import_ics(ScheduledEntryRepo(other), io.StringIO(out.getvalue(), newline=""))
+        assert (stats.entries, stats.series, stats.overrides, stats.errors) == (3, 1, 1, [])
+        assert _exceptions(other) == _exceptions(conn)
+        titles = sorted(r[2] for r in _entries(other))
+        assert titles == ["Alpha", "Native", "Standup (late)"]
+        assert f"entry-{native}@lux-planner" in {r[0] for r in _entries(other)}
+    finally:
+        other.close()
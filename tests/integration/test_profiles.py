@@ -0,0 +1,195 @@
+"""
+Profiles (lux.app.profiles): registry file, session pool and the cross-profile agenda, on temp dirs.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.app.lifecycle import Lifecycle
+from lux.app.profiles import DEFAULT_PROFILE, Profile, ProfilePool, ProfileSession, ProfileStore, combined_agenda
+from lux.app.services import SystemServices
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.core.scheduler.service import SchedulerService
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.service import TasksService
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _open_session(profile: Profile) -> ProfileSession:
+    """A bootstrap-like factory without Qt: connection, services and a closing lifecycle."""
+    conn = ensure_db_ready(profile.db_file)
+    lifecycle = Lifecycle(cache_dir=profile.cache_dir)
+    lifecycle.add_shutdown_hook("db", lambda _budget: conn.close(), required=True)
+    services = SystemServices(
+        scheduler_service=SchedulerService(repo=ScheduledEntryRepo(conn), registry=SchedulerProviderRegistry()),
+        tasks_service=TasksService(repo=TasksRepo(TasksRepository(conn))),
+        lifecycle=lifecycle,
+    )
+    return ProfileSession(profile=profile, conn=conn, services=services, lifecycle=lifecycle)
+
+
+def _is_open(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError:
+        return False
+    return True
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ProfileStore:
+    return ProfileStore(tmp_path)
+
+
+# -------------------------
+# ProfileStore
+# -------------------------
+def test_store_persists_profiles_and_the_active_one(tmp_path, store):
+    work = store.create("Work")
+    other = store.create("work!")  # same slug: gets a suffix
+    store.set_active(work.id)
+    store.rename(other.id, "Side project")
+
+    assert (work.id, other.id) == ("work", "work-2")
+    assert work.db_file == tmp_path / "profiles" / "work" / "planner.db" and work.data_dir.is_dir()
+    assert store.get(DEFAULT_PROFILE).data_dir == tmp_path  # the pre-profile location
+
+    reloaded = ProfileStore(tmp_path)
+    assert [(p.id, p.name) for p in reloaded.list()] == [
+        (DEFAULT_PROFILE, "Default"),
+        ("work", "Work"),
+        ("work-2", "Side project"),
+    ]
+    assert reloaded.active_id == "work"
+
+    with pytest.raises(ValueError):
+        store.create("  ")
+    with pytest.raises(KeyError):
+        store.set_active("missing")
+
+
+def test_unreadable_registry_falls_back_to_the_default(tmp_path):
+    (tmp_path / "profiles.json").write_text("{not json", encoding="utf-8")
+    store = ProfileStore(tmp_path)
+    assert [p.id for p in store.list()] == [DEFAULT_PROFILE] and store.active_id == DEFAULT_PROFILE
+
+
+# -------------------------
+# ProfilePool
+# -------------------------
+def test_switching_keeps_sessions_warm_until_idle(store):
+    clock = _Clock()
+    work = store.create("Work")
+    pool = ProfilePool(store, _open_session, idle_release_s=60, max_open=3, clock=clock)
+
+    home = pool.activate(DEFAULT_PROFILE)
+    clock.now = 10
+    office = pool.activate(work.id)
+    assert pool.open_ids() == [DEFAULT_PROFILE, work.id] and pool.active is office
+    assert store.active_id == work.id
+
+    # Each session writes to its own database.
+    home.services.scheduler_service.schedule("adhoc", "gym", "2030-01-07 07:00:00", "2030-01-07 08:00:00")
+    office.services.scheduler_service.schedule("adhoc", "standup", "2030-01-07 09:00:00", "2030-01-07 09:15:00")
+    assert [r.item_ref for r in home.services.scheduler_service.list_range("2030-01-07", "2030-01-08")] == ["gym"]
+
+    # Switching back reuses the open session.
+    clock.now = 20
+    assert pool.activate(DEFAULT_PROFILE) is home
+
+    clock.now = 79
+    pool.release_idle()
+    assert pool.open_ids() == [DEFAULT_PROFILE, work.id]
+    clock.now = 80
+    pool.release_idle()
+    assert pool.open_ids() == [DEFAULT_PROFILE]
+    assert office.lifecycle.is_shut_down and not _is_open(office.conn)
+    assert _is_open(home.conn)  # the active session is never released for idleness
+
+
+def test_max_open_releases_the_least_recently_used(store):
+    clock = _Clock()
+    ids = [DEFAULT_PROFILE] + [store.create(name).id for name in ("Work", "Club")]
+    pool = ProfilePool(store, _open_session, max_open=2, clock=clock)
+
+    sessions = {}
+    for t, pid in enumerate(ids):
+        clock.now = float(t)
+        sessions[pid] = pool.activate(pid)
+
+    assert pool.open_ids() == ["work", "club"]
+    assert not _is_open(sessions[DEFAULT_PROFILE].conn)
+
+    pool.close_all(budget_s=1.0)
+    assert pool.open_ids() == [] and pool.active is None
+    assert all(s.lifecycle.is_shut_down for s in sessions.values())
+
+
+def test_idle_jobs_run_for_the_active_profile_only(store):
+    work = store.create("Work")
+    calls: list[str] = []
+
+    def factory(profile: Profile) -> ProfileSession:
+        session = _open_session(profile)
+        session.idle_jobs["tick"] = lambda: calls.append(profile.id) or True
+        return session
+
+    pool = ProfilePool(store, factory)
+    assert pool.run_idle("tick") is False  # nothing open yet
+    pool.activate(DEFAULT_PROFILE)
+    pool.activate(work.id)
+    assert pool.run_idle("tick") is True and pool.run_idle("missing") is False
+    assert calls == [work.id]
+    pool.close_all(budget_s=1.0)
+
+
+# -------------------------
+# combined_agenda
+# -------------------------
+def test_combined_agenda_merges_entries_and_series_across_profiles(store):
+    work = store.create("Work")
+    empty = store.create("Never opened")  # no database file yet
+    pool = ProfilePool(store, _open_session)
+    home = pool.activate(DEFAULT_PROFILE).services.scheduler_service
+    office = pool.activate(work.id).services.scheduler_service
+
+    home.schedule("adhoc", "gym", "2030-01-07 07:00:00", "2030-01-07 08:00:00", title_cache="Gym")
+    home.schedule("adhoc", "late", "2030-01-09 07:00:00", "2030-01-09 08:00:00", title_cache="Out of range")
+    sid = office.schedule_series(
+        "adhoc", "standup", "2030-01-06 09:00:00", "2030-01-06 09:15:00", "FREQ=DAILY", title_cache="Standup"
+    )
+    office.skip_instance(sid, "2030-01-08 09:00:00")
+    office.schedule("adhoc", "review", "2030-01-07 09:00:00", "2030-01-07 10:00:00", title_cache="Review")
+    archived = office.schedule("adhoc", "gone", "2030-01-07 11:00:00", "2030-01-07 12:00:00")
+    office.archive(archived)
+
+    agenda = combined_agenda(store.list(), "2030-01-07 00:00:00", "2030-01-09 00:00:00")
+
+    # Ordered by start; ties within a profile are in no particular order.
+    assert [(a.profile_id, a.start_dt) for a in agenda] == [
+        (DEFAULT_PROFILE, "2030-01-07 07:00:00"),
+        ("work", "2030-01-07 09:00:00"),
+        ("work", "2030-01-07 09:00:00"),
+    ]
+    assert {a.title for a in agenda} == {"Gym", "Standup", "Review"}  # the skipped 01-08 standup is absent
+    assert {a.series_id for a in agenda if a.title == "Standup"} == {sid}
+    assert not empty.db_file.exists()
+
+    # Read-only: the live sessions keep writing while the agenda is read.
+    office.schedule("adhoc", "after", "2030-01-08 13:00:00", "2030-01-08 14:00:00", title_cache="After")
+    assert [a.title for a in combined_agenda([work], "2030-01-08 00:00:00", "2030-01-09 00:00:00")] == ["After"]
+    pool.close_all(budget_s=1.0)
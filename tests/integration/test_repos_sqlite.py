@@ -0,0 +1,238 @@
+"""
+Repositories and sync against real SQLite files (temp dirs, full migrations).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.change_log_repo import ChangeLogRepo
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.data.sync import (
+    SyncError,
+    apply_changeset,
+    build_changeset,
+    mark_delivered,
+    read_changeset,
+    site_id,
+    sync_databases,
+    write_changeset,
+)
+
+STAMP = "2030-01-01 12:00:00"
+
+
+@pytest.fixture
+def db_a(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "a.db")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_b(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "b.db")
+    yield conn
+    conn.close()
+
+
+def _titles(conn: sqlite3.Connection) -> list[str]:
+    return [r[0] for r in conn.execute("SELECT title FROM task_definitions ORDER BY title")]
+
+
+def _uid(conn: sqlite3.Connection, entity: str, local_id: int) -> str:
+    return conn.execute(
+        "SELECT uid FROM sync_ids WHERE entity = ? AND local_id = ?", (entity, local_id)
+    ).fetchone()[0]
+
+
+def _local_id(conn: sqlite3.Connection, entity: str, uid: str) -> int:
+    return int(conn.execute("SELECT local_id FROM sync_ids WHERE entity = ? AND uid = ?", (entity, uid)).fetchone()[0])
+
+
+def _exceptions(conn: sqlite3.Connection) -> set[tuple[str, str, str | None]]:
+    """(series uid, original_start, entry uid) — comparable across databases."""
+    out = set()
+    for sid, original_start, entry_id in conn.execute(
+        "SELECT series_id, original_start, entry_id FROM scheduled_series_exceptions"
+    ):
+        entry_uid = _uid(conn, "scheduled_entry", entry_id) if entry_id is not None else None
+        out.add((_uid(conn, "scheduled_series", sid), original_start, entry_uid))
+    return out
+
+
+def _edit_title(conn: sqlite3.Connection, task_id: int, title: str, stamp: str) -> None:
+    # Explicit stamps: updated_at has one-second resolution.
+    conn.execute("UPDATE task_definitions SET title = ?, updated_at = ? WHERE id = ?", (title, stamp, task_id))
+    conn.commit()
+
+
+def _set_site(conn: sqlite3.Connection, site: str) -> None:
+    conn.execute("UPDATE sync_state SET value = ? WHERE key = 'site_id'", (site,))
+    conn.commit()
+
+
+# -------------------------
+# Sync
+# -------------------------
+def test_first_contact_sends_everything(db_a, db_b):
+    tasks = TasksRepository(db_a)
+    tid = tasks.create_task("Write report")
+    occ = tasks.create_occurrence(tid, "2030-01-02")
+    entry = ScheduledEntryRepo(db_a).create(
+        {
+            "item_kind": "task_occurrence",
+            "item_ref": str(occ),
+            "start_dt": "2030-01-02 09:00:00",
+            "end_dt": "2030-01-02 10:00:00",
+        }
+    )
+
+    cs = build_changeset(db_a, peer=site_id(db_b))
+    assert cs.full
+    stats = apply_changeset(db_b, cs)
+
+    assert stats.inserted == 3 and stats.unresolved == 0
+    assert _titles(db_b) == ["Write report"]
+    # The entry points at the occurrence by its local id on the receiving side.
+    b_occ = _local_id(db_b, "task_occurrence", _uid(db_a, "task_occurrence", occ))
+    b_entry = _local_id(db_b, "scheduled_entry", _uid(db_a, "scheduled_entry", entry))
+    assert ScheduledEntryRepo(db_b).get(b_entry).item_ref == str(b_occ)
+
+    # Applying the same set again changes nothing.
+    again = apply_changeset(db_b, cs)
+    assert (again.inserted, again.updated) == (0, 0)
+
+
+def test_edits_on_each_side_meet(db_a, db_b):
+    a_tasks, b_tasks = TasksRepository(db_a), TasksRepository(db_b)
+    a_tasks.create_task("From A")
+    b_tasks.create_task("From B")
+    sync_databases(db_a, db_b)
+    assert _titles(db_a) == _titles(db_b) == ["From A", "From B"]
+
+    a_id = _local_id(db_a, "task_definition", _uid(db_b, "task_definition", 1))
+    _edit_title(db_a, a_id, "From B, edited on A", STAMP)
+    b_id = _local_id(db_b, "task_definition", _uid(db_a, "task_definition", 1))
+    _edit_title(db_b, b_id, "From A, edited on B", STAMP)
+
+    result = sync_databases(db_a, db_b)
+    assert (result.sent, result.received) == (1, 1)
+    assert _titles(db_a) == _titles(db_b) == ["From A, edited on B", "From B, edited on A"]
+
+    # Nothing new: the next round is empty (received rows are not echoed back).
+    quiet = sync_databases(db_a, db_b)
+    assert (quiet.sent, quiet.received) == (0, 0)
+
+
+def test_equal_stamps_go_to_the_higher_site_id(db_a, db_b):
+    _set_site(db_a, "1" * 32)
+    _set_site(db_b, "f" * 32)
+    tid = TasksRepository(db_a).create_task("Shared")
+    sync_databases(db_a, db_b)
+    b_tid = _local_id(db_b, "task_definition", _uid(db_a, "task_definition", tid))
+
+    _edit_title(db_a, tid, "A wins?", STAMP)
+    _edit_title(db_b, b_tid, "B wins", STAMP)
+
+    result = sync_databases(db_a, db_b)
+    assert result.remote.stale == 1 and result.local.updated == 1
+    assert _titles(db_a) == _titles(db_b) == ["B wins"]
+
+
+def test_copied_file_gets_its_own_site(db_a, tmp_path):
+    tasks = TasksRepository(db_a)
+    tasks.create_task("Before copy")
+    copy = sqlite3.connect(tmp_path / "copy.db")
+    db_a.backup(copy)
+    copy.close()
+    db_c = ensure_db_ready(tmp_path / "copy.db")
+    try:
+        assert site_id(db_c) == site_id(db_a)
+        with pytest.raises(SyncError):
+            apply_changeset(db_c, build_changeset(db_a, peer="someone-else"))
+
+        tasks.create_task("After copy")
+        result = sync_databases(db_a, db_c)
+
+        assert site_id(db_c) != site_id(db_a)
+        assert result.remote.merged == 0 and result.remote.inserted == 1  # shared uid: no duplicate
+        assert _titles(db_c) == ["After copy", "Before copy"]
+    finally:
+        db_c.close()
+
+
+def test_series_override_and_exdate_round_trip(db_a, db_b, tmp_path):
+    a_sched = ScheduledEntryRepo(db_a)
+    series = a_sched.create_series(
+        {
+            "item_kind": "adhoc",
+            "item_ref": "standup",
+            "start_dt": "2030-01-07 09:00:00",
+            "end_dt": "2030-01-07 09:15:00",
+            "rrule": "FREQ=DAILY",
+            "title_cache": "Standup",
+        }
+    )
+    sync_databases(db_a, db_b)
+
+    # On B: skip one instance (EXDATE) and move another (override entry).
+    b_sched = ScheduledEntryRepo(db_b)
+    b_series = _local_id(db_b, "scheduled_series", _uid(db_a, "scheduled_series", series))
+    b_sched.add_series_exception(b_series, "2030-01-08 09:00:00")
+    moved = b_sched.create(
+        {
+            "item_kind": "adhoc",
+            "item_ref": "standup",
+            "start_dt": "2030-01-09 10:00:00",
+            "end_dt": "2030-01-09 10:15:00",
+            "title_cache": "Standup",
+        }
+    )
+    b_sched.add_series_exception(b_series, "2030-01-09 09:00:00", entry_id=moved)
+
+    # Through a shared folder this time.
+    path = tmp_path / "outbox" / "b-to-a.luxsync"
+    write_changeset(build_changeset(db_b, peer=site_id(db_a)), path)
+    cs = read_changeset(path)
+    apply_changeset(db_a, cs)
+    mark_delivered(db_b, site_id(db_a), cs.upto)
+    assert _exceptions(db_a) == _exceptions(db_b) and len(_exceptions(db_a)) == 2
+
+    # Dropping the skip on B sends a tombstone; the override stays.
+    b_sched.remove_series_exception(b_series, "2030-01-08 09:00:00")
+    result = sync_databases(db_a, db_b)
+    assert result.local.deleted == 1
+    assert _exceptions(db_a) == _exceptions(db_b) == {
+        (_uid(db_a, "scheduled_series", series), "2030-01-09 09:00:00", _uid(db_b, "scheduled_entry", moved)),
+    }
+
+    # A received the override from B; turning it into a skip on A still goes back to B.
+    a_sched.add_series_exception(series, "2030-01-09 09:00:00", entry_id=None)
+    sync_databases(db_a, db_b)
+    assert _exceptions(db_a) == _exceptions(db_b) == {
+        (_uid(db_a, "scheduled_series", series), "2030-01-09 09:00:00", None),
+    }
+
+
+def test_pruned_change_log_forces_a_full_set(db_a, db_b):
+    tasks = TasksRepository(db_a)
+    tasks.create_task("Old")
+    sync_databases(db_a, db_b)
+    assert not build_changeset(db_a, peer=site_id(db_b)).full  # caught up: incremental
+
+    tid = tasks.create_task("New")
+    log = ChangeLogRepo(db_a)
+    log.prune(log.max_seq())  # the peer's mark now points into pruned history
+
+    cs = build_changeset(db_a, peer=site_id(db_b))
+    assert cs.full
+    stats = apply_changeset(db_b, cs)
+    assert stats.inserted == 1 and stats.updated == 0
+    assert _titles(db_b) == ["New", "Old"]
+    assert _local_id(db_b, "task_definition", _uid(db_a, "task_definition", tid)) > 0
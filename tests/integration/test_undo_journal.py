@@ -0,0 +1,233 @@
+"""
+Undo journal (lux.core.undo) with its undo_log store and the scheduler service.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.core.scheduler.service import SchedulerService
+from lux.core.undo import UndoJournal, UndoOp
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.undo_repo import UndoLogRepo
+
+
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "undo.db")
+    yield conn
+    conn.close()
+
+
+class _Recorder:
+    """Undo handler that logs replayed ops."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple]] = []
+
+    def __call__(self, name: str, args: tuple) -> None:
+        self.calls.append((name, tuple(args)))
+
+
+def _journal(store: UndoLogRepo | None = None, capacity: int = 200) -> tuple[UndoJournal, _Recorder]:
+    journal = UndoJournal(capacity=capacity, store=store)
+    handler = _Recorder()
+    journal.register("t", handler)
+    return journal, handler
+
+
+def _op(name: str, *args) -> UndoOp:
+    return UndoOp("t", name, args)
+
+
+def _log(conn: sqlite3.Connection) -> list[tuple[str, int]]:
+    return [tuple(r) for r in conn.execute("SELECT label, undone FROM undo_log ORDER BY id")]
+
+
+def _schedule(svc: SchedulerService, ref: str, hour: int) -> int:
+    return svc.schedule("adhoc", ref, f"2030-01-07 {hour:02d}:00:00", f"2030-01-07 {hour:02d}:30:00")
+
+
+def _active(conn: sqlite3.Connection) -> list[str]:
+    return [r[0] for r in conn.execute("SELECT item_ref FROM scheduled_entries WHERE archived = 0 ORDER BY id")]
+
+
+# -------------------------
+# Journal
+# -------------------------
+def test_group_merges_records_into_one_step():
+    journal, handler = _journal()
+    with journal.group("Outer"):
+        journal.record("a", _op("undo_a"), _op("redo_a"))
+        with journal.group("Inner"):
+            journal.record("b", [_op("undo_b1"), _op("undo_b2")], _op("redo_b"))
+        assert not journal.can_undo()  # nothing is pushed before the outermost group closes
+
+    assert journal.undo_label() == "Outer"
+    assert journal.undo() == "Outer"
+    # Later writes are undone first; each record's own ops keep their order.
+    assert handler.calls == [("undo_b1", ()), ("undo_b2", ()), ("undo_a", ())]
+    assert not journal.can_undo()
+
+    handler.calls.clear()
+    assert journal.redo() == "Outer"
+    assert handler.calls == [("redo_a", ()), ("redo_b", ())]
+
+
+def test_group_that_raises_records_nothing():
+    journal, _ = _journal()
+    with pytest.raises(ValueError):
+        with journal.group("Broken"):
+            journal.record("a", _op("undo_a"), _op("redo_a"))
+            raise ValueError("boom")
+    assert not journal.can_undo()
+
+    journal.record("after", _op("undo"), _op("redo"))
+    assert journal.undo_label() == "after"  # the next record is its own step, not part of a stale group
+
+
+def test_replays_are_not_recorded_and_new_records_clear_redo():
+    journal, _ = _journal()
+    journal.register("t", lambda name, args: journal.record("echo", _op("x"), _op("y")))
+    journal.record("one", _op("undo"), _op("redo"))
+    journal.undo()
+    assert (journal.can_undo(), journal.redo_label()) == (False, "one")
+
+    journal.record("two", _op("undo"), _op("redo"))
+    assert (journal.undo_label(), journal.can_redo()) == ("two", False)
+
+
+def test_capacity_is_a_ring(conn):
+    store = UndoLogRepo(conn)
+    journal, handler = _journal(store, capacity=3)
+    for i in range(5):
+        journal.record(f"step {i}", _op("undo", i), _op("redo", i))
+
+    assert [label for label, _ in _log(conn)] == ["step 2", "step 3", "step 4"]
+    labels = []
+    while journal.can_undo():
+        labels.append(journal.undo())
+    assert labels == ["step 4", "step 3", "step 2"]
+    assert [args for _, args in handler.calls] == [(4,), (3,), (2,)]
+
+
+def test_reload_restores_undo_and_redo_sides(conn):
+    store = UndoLogRepo(conn)
+    first, _ = _journal(store)
+    first.record("one", _op("undo", 1), _op("redo", 1))
+    first.record("two", _op("undo", 2), _op("redo", 2))
+    first.record("three", _op("undo", 3), _op("redo", 3))
+    first.undo()
+    first.undo()
+    assert _log(conn) == [("one", 0), ("two", 1), ("three", 1)]
+
+    # A new session (same file) picks up where the last one stopped.
+    second, handler = _journal(UndoLogRepo(conn))
+    second.load()
+    assert (second.undo_label(), second.redo_label()) == ("one", "two")
+    assert second.redo() == "two" and second.redo() == "three" and second.redo() is None
+    assert handler.calls == [("redo", (2,)), ("redo", (3,))]
+    assert _log(conn) == [("one", 0), ("two", 0), ("three", 0)]
+
+    # Recording after a reload still drops the persisted redo side.
+    second.undo()
+    second.record("four", _op("undo", 4), _op("redo", 4))
+    assert _log(conn) == [("one", 0), ("two", 0), ("four", 0)]
+
+
+def test_reload_skips_unreadable_rows(conn):
+    store = UndoLogRepo(conn)
+    store.append("broken", "not json", "[]")
+    journal, _ = _journal(store)
+    journal.record("good", _op("undo"), _op("redo"))
+
+    reloaded, _ = _journal(UndoLogRepo(conn))
+    reloaded.load()
+    assert reloaded.undo() == "good" and not reloaded.can_undo()
+
+
+def test_failed_replay_drops_the_step_and_rolls_back(conn):
+    repo = ScheduledEntryRepo(conn)
+    journal, _ = _journal(UndoLogRepo(conn))
+    journal.set_atomic(repo.transaction)
+    entry = repo.create(
+        {"item_kind": "adhoc", "item_ref": "x", "start_dt": "2030-01-07 09:00:00", "end_dt": "2030-01-07 10:00:00"}
+    )
+
+    def partial(name: str, args: tuple) -> None:
+        if name == "archive":
+            repo.set_archived(entry, True)
+        else:
+            raise RuntimeError("row changed outside the journal")
+
+    journal.register("t", partial)
+    journal.record("kept", _op("noop"), _op("noop"))
+    journal.record("broken", [_op("archive"), _op("fail")], _op("redo"))
+
+    with pytest.raises(RuntimeError):
+        journal.undo()
+
+    assert repo.get(entry).archived is False  # the first op was rolled back with the step
+    assert not conn.in_transaction
+    assert (journal.undo_label(), journal.can_redo()) == ("kept", False)
+    assert _log(conn) == [("kept", 0)]
+
+
+def test_missing_handler_is_a_failed_replay():
+    journal = UndoJournal()
+    journal.record("orphan", UndoOp("nobody", "x"), UndoOp("nobody", "y"))
+    with pytest.raises(LookupError):
+        journal.undo()
+    assert not journal.can_undo() and not journal.can_redo()
+
+
+# -------------------------
+# Service batches
+# -------------------------
+def test_batch_commits_its_undo_step_with_the_writes(conn, tmp_path):
+    observer = sqlite3.connect(tmp_path / "undo.db")
+    seen: list[tuple[int, int]] = []
+
+    def on_commit() -> None:
+        # What another connection sees at the moment the batch commits.
+        entries = observer.execute("SELECT COUNT(*) FROM scheduled_entries").fetchone()[0]
+        steps = observer.execute("SELECT COUNT(*) FROM undo_log").fetchone()[0]
+        seen.append((entries, steps))
+
+    repo = ScheduledEntryRepo(conn, on_commit=on_commit)
+    journal = UndoJournal(store=UndoLogRepo(conn), atomic=repo.transaction)
+    svc = SchedulerService(repo=repo, registry=SchedulerProviderRegistry(), journal=journal)
+    try:
+        with svc.batch("Plan morning"):
+            _schedule(svc, "a", 9)
+            _schedule(svc, "b", 10)
+        assert seen == [(2, 1)]  # one commit holding both rows and the step
+
+        assert _log(conn) == [("Plan morning", 0)]
+        assert journal.undo() == "Plan morning"
+        assert _active(conn) == []
+        assert journal.redo() == "Plan morning"
+        assert _active(conn) == ["a", "b"]
+    finally:
+        observer.close()
+
+
+def test_failed_batch_leaves_no_rows_and_no_step(conn):
+    repo = ScheduledEntryRepo(conn)
+    journal = UndoJournal(store=UndoLogRepo(conn), atomic=repo.transaction)
+    svc = SchedulerService(repo=repo, registry=SchedulerProviderRegistry(), journal=journal)
+    _schedule(svc, "before", 8)
+
+    with pytest.raises(ValueError):
+        with svc.batch("Half done"):
+            _schedule(svc, "a", 9)
+            svc.schedule("adhoc", "bad", "2030-01-07 12:00:00", "2030-01-07 11:00:00")
+
+    assert _active(conn) == ["before"]
+    assert _log(conn) == [("Schedule entry", 0)]
+    assert journal.undo_label() == "Schedule entry"
@@ -0,0 +1,213 @@
+"""
+Free-slot finder and greedy planner (lux.core.scheduler.autoschedule), and SchedulerService.auto_schedule.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from lux.core.scheduler.autoschedule import PlanItem, WorkingHours, free_intervals, merge_intervals, plan
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.core.scheduler.service import SchedulerService
+from lux.core.undo import UndoJournal
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.service import TasksService
+
+DAY = date(2030, 1, 7)
+
+
+def _item(ref: str, minutes: int = 30, day: str = "2030-01-07", **kw) -> PlanItem:
+    return PlanItem(item_kind="adhoc", item_ref=ref, title=ref, day=day, duration_min=minutes, **kw)
+
+
+def _slots(result) -> list[tuple[str, str, str]]:
+    return [(p.item.item_ref, p.start_dt, p.end_dt) for p in result.placed]
+
+
+# -------------------------
+# Intervals
+# -------------------------
+def test_merge_intervals():
+    assert merge_intervals([(5, 8), (1, 3), (3, 4), (7, 10), (12, 12), (11, 9)]) == [(1, 4), (5, 10)]
+    assert merge_intervals([]) == []
+
+
+def test_free_intervals():
+    busy = [(0, 5), (10, 12), (12, 15), (30, 40)]
+    assert free_intervals(busy, 8, 35) == [(8, 10), (15, 30)]
+    assert free_intervals(busy, 2, 4) == []
+    assert free_intervals(busy, 40, 50) == [(40, 50)]
+    assert free_intervals([], 3, 7) == [(3, 7)]
+    assert free_intervals([(0, 100)], 10, 20) == []
+
+
+# -------------------------
+# plan
+# -------------------------
+def test_longest_first_and_items_that_do_not_fit():
+    busy = [("2030-01-07 09:00:00", "2030-01-07 10:00:00"), ("2030-01-07 10:30:00", "2030-01-07 17:00:00")]
+    result = plan([_item("a", 30), _item("b", 60), _item("c", 45)], busy, DAY, DAY)
+
+    # Free: 10:00-10:30 and 17:00-18:00. b (60) takes the evening, c (45) fits nowhere, a (30) the gap.
+    assert _slots(result) == [
+        ("a", "2030-01-07 10:00:00", "2030-01-07 10:30:00"),
+        ("b", "2030-01-07 17:00:00", "2030-01-07 18:00:00"),
+    ]
+    assert [it.item_ref for it in result.unplaced] == ["c"]
+
+
+def test_working_hours_and_not_before():
+    hours = WorkingHours(start="07:30", end="08:30")
+    result = plan([_item("a", 45), _item("b", 45)], [], DAY, DAY + timedelta(days=1), hours=hours)
+    # One 45-minute slot per one-hour window: b spills to the next day.
+    assert _slots(result) == [
+        ("a", "2030-01-07 07:30:00", "2030-01-07 08:15:00"),
+        ("b", "2030-01-08 07:30:00", "2030-01-08 08:15:00"),
+    ]
+
+    late = plan([_item("a", 30)], [], DAY, DAY, not_before="2030-01-07 17:45:00")
+    assert _slots(late) == [] and [it.item_ref for it in late.unplaced] == ["a"]
+
+    # An item longer than the working day never fits.
+    assert [it.item_ref for it in plan([_item("long", 10 * 60)], [], DAY, DAY).unplaced] == ["long"]
+
+
+def test_priority_pins_and_item_days():
+    busy = [("2030-01-07 09:00:00", "2030-01-07 17:30:00")]
+    items = [
+        _item("low", 30),
+        _item("high", 30, priority=5),
+        _item("pinned", 30, day="2030-01-08", fixed_time="14:00"),
+        _item("pinned-busy", 30, fixed_time="10:00"),  # slot taken: packed like any other item
+        _item("later", 30, day="2030-01-09"),
+    ]
+    result = plan(items, busy, DAY, DAY + timedelta(days=2))
+
+    assert _slots(result) == [
+        ("high", "2030-01-07 17:30:00", "2030-01-07 18:00:00"),
+        ("low", "2030-01-08 09:00:00", "2030-01-08 09:30:00"),
+        ("pinned-busy", "2030-01-08 09:30:00", "2030-01-08 10:00:00"),
+        ("pinned", "2030-01-08 14:00:00", "2030-01-08 14:30:00"),
+        ("later", "2030-01-09 09:00:00", "2030-01-09 09:30:00"),
+    ]
+
+
+def test_empty_range_leaves_everything_unplaced():
+    items = [_item("a")]
+    result = plan(items, [], DAY, DAY - timedelta(days=1))
+    assert result.placed == [] and result.unplaced == items
+
+
+# -------------------------
+# SchedulerService.auto_schedule
+# -------------------------
+@pytest.fixture
+def conn(tmp_path: Path) -> sqlite3.Connection:
+    conn = ensure_db_ready(tmp_path / "plan.db")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def services(conn) -> tuple[TasksService, SchedulerService]:
+    journal = UndoJournal()
+    schedule_repo = ScheduledEntryRepo(conn)
+    journal.set_atomic(schedule_repo.transaction)
+    tasks = TasksService(repo=TasksRepo(TasksRepository(conn)), journal=journal)
+    scheduler = SchedulerService(repo=schedule_repo, registry=SchedulerProviderRegistry(), journal=journal)
+    return tasks, scheduler
+
+
+def _occurrences(conn: sqlite3.Connection) -> list[tuple[int, str]]:
+    return [tuple(r) for r in conn.execute("SELECT task_id, recur_date FROM task_occurrences ORDER BY id")]
+
+
+def _entries(conn: sqlite3.Connection) -> list[str]:
+    return [r[0] for r in conn.execute("SELECT item_ref FROM scheduled_entries WHERE archived = 0 ORDER BY id")]
+
+
+def _auto_schedule(tasks: TasksService, scheduler: SchedulerService):
+    """What the tasks controller does: plan inside a tasks batch."""
+    today = date.today()
+    with tasks.batch("Auto-schedule"):
+        return scheduler.auto_schedule(
+            tasks.plan_items(days=3),
+            start_day=today,
+            end_day=today + timedelta(days=2),
+            hours=WorkingHours(start="00:00", end="23:59"),
+        )
+
+
+def test_virtual_instance_is_materialized_once_for_its_placement(conn, services):
+    tasks, scheduler = services
+    today = date.today()
+    tid = tasks.add_recurring_task("Stretch", "FREQ=DAILY;COUNT=2", today.isoformat())
+
+    items = tasks.plan_items(days=3)
+    assert [it.item_ref for it in items] == [f"virtual:{tid}:{today}", f"virtual:{tid}:{today + timedelta(days=1)}"]
+    assert _occurrences(conn) == []  # planning alone writes nothing
+
+    result = _auto_schedule(tasks, scheduler)
+    occurrences = _occurrences(conn)
+    assert len(result.placed) == 2
+    assert occurrences == [(tid, today.isoformat()), (tid, (today + timedelta(days=1)).isoformat())]
+    ids = [str(r[0]) for r in conn.execute("SELECT id FROM task_occurrences ORDER BY id")]
+    assert sorted(_entries(conn)) == sorted(ids)
+
+    # The instances are real and on the calendar now: a second run places and materializes nothing.
+    again = _auto_schedule(tasks, scheduler)
+    assert again.placed == [] and _occurrences(conn) == occurrences and len(_entries(conn)) == 2
+
+
+def test_failed_placement_rolls_back_materialized_instances(conn, services, monkeypatch):
+    tasks, scheduler = services
+    tasks.add_recurring_task("Stretch", "FREQ=DAILY;COUNT=2", date.today().isoformat())
+    real_schedule = scheduler.schedule
+    calls = []
+
+    def flaky(**kw):
+        calls.append(kw)
+        if len(calls) == 2:
+            raise ValueError("disk full")
+        return real_schedule(**kw)
+
+    monkeypatch.setattr(scheduler, "schedule", flaky)
+    with pytest.raises(ValueError):
+        _auto_schedule(tasks, scheduler)
+
+    assert _occurrences(conn) == [] and _entries(conn) == []
+    assert not conn.in_transaction
+
+
+def test_placement_whose_ref_resolves_empty_is_unplaced(conn, services):
+    _, scheduler = services
+    today = date.today()
+    items = [
+        PlanItem("adhoc", "kept", "Kept", today.isoformat()),
+        PlanItem("adhoc", "gone", "Gone", today.isoformat(), resolve_ref=lambda: ""),
+    ]
+    result = scheduler.auto_schedule(items, today, today, hours=WorkingHours(start="00:00", end="23:59"))
+
+    assert [p.item.item_ref for p in result.placed] == ["kept"]
+    assert [it.item_ref for it in result.unplaced] == ["gone"]
+    assert _entries(conn) == ["kept"]
+
+
+def test_items_already_on_the_calendar_are_skipped(conn, services):
+    _, scheduler = services
+    today = date.today()
+    scheduler.schedule("adhoc", "done", f"{today} 09:00:00", f"{today} 10:00:00")
+    result = scheduler.auto_schedule(
+        [PlanItem("adhoc", "done", "Done", today.isoformat()), PlanItem("adhoc", "new", "New", today.isoformat())],
+        today,
+        today,
+    )
+    assert [p.item.item_ref for p in result.placed] == ["new"]
+    assert result.placed[0].start_dt == f"{today} 10:00:00"
@@ -0,0 +1,101 @@
+"""
+Interval index and sweep-line conflict detection (lux.core.scheduler.conflicts).
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from lux.core.scheduler.conflicts import IntervalIndex
+
+
+def _overlaps(a_start, a_end, b_start, b_end) -> bool:
+    return a_start < b_end and b_start < a_end
+
+
+def _brute_overlapping(items, start, end, exclude=None) -> list:
+    ordered = sorted(items, key=lambda t: (t[0], t[1]))
+    return [k for s, e, k in ordered if _overlaps(s, e, start, end) and k != exclude]
+
+
+def _brute_conflicts(items) -> list:
+    ordered = sorted(items, key=lambda t: (t[0], t[1]))
+    return sorted(
+        (ordered[i][2], ordered[j][2])
+        for i in range(len(ordered))
+        for j in range(i + 1, len(ordered))
+        if _overlaps(ordered[i][0], ordered[i][1], ordered[j][0], ordered[j][1])
+    )
+
+
+def _random_items(rng: random.Random, n: int) -> list[tuple[int, int, int]]:
+    # A small coordinate space forces ties, touching ends and duplicates; a few are empty.
+    items = []
+    for k in range(n):
+        s = rng.randrange(0, 50)
+        items.append((s, s + rng.choice([0, 1, 1, 2, 3, 5, 8, 20]), k))
+    return items
+
+
+# -------------------------
+# Edge cases
+# -------------------------
+def test_empty_index():
+    index = IntervalIndex([])
+    assert len(index) == 0
+    assert index.overlapping(0, 10) == []
+    assert index.conflicts() == [] and index.conflict_counts() == {}
+
+
+def test_touching_intervals_do_not_overlap():
+    index = IntervalIndex([(0, 10, "a"), (10, 20, "b"), (20, 30, "c")])
+    assert index.conflicts() == []
+    assert index.overlapping(10, 20) == ["b"]
+    assert index.overlapping(9, 11) == ["a", "b"]
+    assert index.overlapping(30, 40) == []
+
+
+def test_identical_intervals_all_conflict():
+    index = IntervalIndex([(5, 9, "a"), (5, 9, "b"), (5, 9, "c")])
+    assert sorted(index.conflicts()) == [("a", "b"), ("a", "c"), ("b", "c")]
+    assert index.conflict_counts() == {"a": 2, "b": 2, "c": 2}
+    assert index.overlapping(5, 9, exclude="b") == ["a", "c"]
+
+
+def test_empty_query_and_empty_intervals():
+    index = IntervalIndex([(0, 10, "a"), (5, 5, "point")])
+    assert index.overlapping(5, 5) == []  # an empty query overlaps nothing
+    assert index.overlapping(4, 6) == ["a", "point"]
+    assert index.overlapping(5, 6) == ["a"]
+    assert index.conflicts() == [("a", "point")]
+
+
+def test_scheduler_timestamps():
+    rows = [
+        ("2030-01-07 09:00:00", "2030-01-07 10:00:00", 1),
+        ("2030-01-07 09:30:00", "2030-01-07 09:45:00", 2),
+        ("2030-01-07 10:00:00", "2030-01-07 11:00:00", 3),
+    ]
+    index = IntervalIndex(rows)
+    assert index.conflicts() == [(1, 2)]
+    assert index.overlapping("2030-01-07 09:59:59", "2030-01-07 10:00:01") == [1, 3]
+
+
+# -------------------------
+# Against a brute-force O(n^2) reference
+# -------------------------
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    items = _random_items(rng, rng.randrange(1, 120))
+    index = IntervalIndex(items)
+
+    assert sorted(index.conflicts()) == _brute_conflicts(items)
+    for _ in range(50):
+        a, b = rng.randrange(-5, 80), rng.randrange(-5, 80)
+        start, end = min(a, b), max(a, b)
+        exclude = rng.choice([None, rng.randrange(len(items))])
+        expected = _brute_overlapping(items, start, end, exclude) if start < end else []
+        assert index.overlapping(start, end, exclude=exclude) == expected
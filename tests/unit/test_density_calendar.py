@@ -0,0 +1,39 @@
+"""
+Density calendar month cache (needs PySide6; runs on the offscreen platform).
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+
+from lux.features.scheduler.ui.density_calendar import _MAX_MONTHS, DensityCalendar
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication([])
+
+
+def test_month_cache_is_bounded_and_keeps_the_visible_months(app):
+    spans = []
+    cal = DensityCalendar(lambda first, last: spans.append((first, last)) or {})
+    cal.setCurrentPage(2030, 1)
+
+    for _ in range(36):
+        cal.showNextMonth()
+    assert len(cal._months) == _MAX_MONTHS
+    assert set(cal._visible_months()) <= set(cal._months)
+
+    # Months still cached are not queried again; evicted ones are.
+    queried = len(spans)
+    cal.showPreviousMonth()
+    assert len(spans) == queried
+    cal.setCurrentPage(2030, 1)
+    assert len(spans) == queried + 1
@@ -0,0 +1,199 @@
+"""
+iCalendar reading and writing (lux.core.ics): folding, parameters, times and durations.
+"""
+
+from __future__ import annotations
+
+import io
+import time
+
+import pytest
+
+from lux.core.ics import IcsEvent, IcsWriter, _split_property, _unfold, iter_events
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    """Local zone for UTC/TZID conversion (winter dates below: UTC-5)."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _events(*body: str, errors: list[str] | None = None) -> list[IcsEvent]:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", *body, "END:VCALENDAR"]
+    return list(iter_events((line + "\r\n" for line in lines), errors=errors))
+
+
+def _one(*props: str) -> IcsEvent:
+    (ev,) = _events("BEGIN:VEVENT", "UID:e1", *props, "END:VEVENT")
+    return ev
+
+
+# -------------------------
+# Lines and parameters
+# -------------------------
+def test_unfold_joins_space_and_tab_continuations():
+    lines = ["SUMMARY:Long\r\n", " er text\r\n", "\t and more\r\n", "UID:x\r\n"]
+    assert list(_unfold(lines)) == ["SUMMARY:Longer text and more", "UID:x"]
+
+
+def test_folded_summary_is_read_whole():
+    ev = _one("DTSTART:20300107T090000", "SUMMARY:Quarterly plan", " ning review")
+    assert ev.summary == "Quarterly planning review"
+
+
+def test_quoted_parameters_may_hold_separators():
+    name, params, value = _split_property('ATTENDEE;CN="Doe, Jane: PM";ROLE=CHAIR:mailto:jane@example.com')
+    assert (name, value) == ("ATTENDEE", "mailto:jane@example.com")
+    assert params == {"CN": "Doe, Jane: PM", "ROLE": "CHAIR"}
+
+    assert _split_property("dtstart;value=date:20300107") == ("DTSTART", {"VALUE": "date"}, "20300107")
+    assert _split_property("NO SEPARATOR") is None
+
+
+def test_quoted_tzid_is_used(new_york):
+    ev = _one('DTSTART;TZID="Europe/Berlin";X-NOTE="a:b;c":20300107T150000', "DURATION:PT1H")
+    assert (ev.start, ev.end) == ("2030-01-07 09:00:00", "2030-01-07 10:00:00")
+
+
+def test_escaped_text_is_unescaped():
+    ev = _one("DTSTART:20300107T090000", r"SUMMARY:Lunch\, then \;plans\nline two\\done")
+    assert ev.summary == "Lunch, then ;plans\nline two\\done"
+
+
+# -------------------------
+# Times
+# -------------------------
+def test_utc_values_convert_to_local(new_york):
+    ev = _one("DTSTART:20300107T140000Z", "DTEND:20300107T150000Z")
+    assert (ev.start, ev.end) == ("2030-01-07 09:00:00", "2030-01-07 10:00:00")
+
+
+def test_unknown_tzid_and_floating_values_stay_as_written(new_york):
+    assert _one("DTSTART;TZID=Mars/Olympus:20300107T090000").start == "2030-01-07 09:00:00"
+    assert _one("DTSTART:20300107T090000").start == "2030-01-07 09:00:00"
+
+
+def test_all_day_spans_midnight_to_midnight():
+    ev = _one("DTSTART;VALUE=DATE:20300107")
+    assert (ev.start, ev.end) == ("2030-01-07 00:00:00", "2030-01-08 00:00:00")
+    # A bare 8-digit value is a date even without VALUE=DATE.
+    ev = _one("DTSTART:20300107", "DTEND:20300110")
+    assert (ev.start, ev.end) == ("2030-01-07 00:00:00", "2030-01-10 00:00:00")
+
+
+@pytest.mark.parametrize(
+    ("duration", "end"),
+    [
+        ("PT1H30M", "2030-01-07 10:30:00"),
+        ("P1D", "2030-01-08 09:00:00"),
+        ("P1W", "2030-01-14 09:00:00"),
+        ("PT45S", "2030-01-07 09:00:45"),
+        ("-PT15M", "2030-01-07 09:30:00"),  # not positive: point event
+    ],
+)
+def test_duration_without_dtend(duration, end):
+    assert _one("DTSTART:20300107T090000", f"DURATION:{duration}").end == end
+
+
+def test_missing_end_gets_a_point_span():
+    assert _one("DTSTART:20300107T090000").end == "2030-01-07 09:30:00"
+
+
+def test_recurrence_fields():
+    ev = _one(
+        "DTSTART:20300107T090000",
+        "RRULE:FREQ=DAILY;COUNT=5",
+        "EXDATE:20300108T090000,20300109T090000",
+        "EXDATE;VALUE=DATE:20300110",
+    )
+    assert ev.rrule == "FREQ=DAILY;COUNT=5"
+    assert ev.exdates == ("2030-01-08 09:00:00", "2030-01-09 09:00:00", "2030-01-10 00:00:00")
+
+    edited = _one("DTSTART:20300108T100000", "RECURRENCE-ID:20300108T090000", "RRULE:FREQ=DAILY", "STATUS:CANCELLED")
+    assert edited.recurrence_id == "2030-01-08 09:00:00" and edited.rrule is None and edited.cancelled
+
+
+# -------------------------
+# Structure
+# -------------------------
+def test_nested_components_and_bad_events_are_skipped():
+    errors: list[str] = []
+    events = _events(
+        "BEGIN:VTIMEZONE",
+        "DTSTART:19700101T000000",
+        "END:VTIMEZONE",
+        "BEGIN:VEVENT",
+        "UID:good",
+        "DTSTART:20300107T090000",
+        "BEGIN:VALARM",
+        "DTSTART:20300101T000000",
+        "END:VALARM",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "UID:no-start",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "UID:bad-time",
+        "DTSTART:tomorrow",
+        "END:VEVENT",
+        errors=errors,
+    )
+    assert [(e.uid, e.start) for e in events] == [("good", "2030-01-07 09:00:00")]
+    assert len(errors) == 2
+
+
+def test_missing_uid_gets_a_stable_one():
+    body = ("BEGIN:VEVENT", "DTSTART:20300107T090000", "SUMMARY:No uid", "END:VEVENT")
+    first, second = _events(*body)[0], _events(*body)[0]
+    assert first.uid.startswith("lux-") and first.uid == second.uid
+    assert _events("BEGIN:VEVENT", "DTSTART:20300107T090000", "SUMMARY:Other", "END:VEVENT")[0].uid != first.uid
+
+
+# -------------------------
+# Writing
+# -------------------------
+def test_writer_folds_at_75_octets_and_reads_back():
+    ev = IcsEvent(
+        uid="long@example.com",
+        start="2030-01-07 09:00:00",
+        end="2030-01-07 10:00:00",
+        summary="Überprüfung; " * 12,
+        description="line one\nline two, with ä comma",
+        rrule="FREQ=WEEKLY;BYDAY=MO,WE",
+        exdates=("2030-01-09 09:00:00",),
+    )
+    out = io.StringIO()
+    with IcsWriter(out) as writer:
+        writer.write(ev)
+    assert writer.count == 1
+
+    text = out.getvalue()
+    physical = text.split("\r\n")
+    assert all(len(line.encode("utf-8")) <= 75 for line in physical)
+    assert any(line.startswith(" ") for line in physical)
+    assert list(iter_events(io.StringIO(text, newline=""))) == [ev]
+
+
+def test_writer_round_trips_all_day_and_overrides():
+    events = [
+        IcsEvent(uid="day", start="2030-01-07 00:00:00", end="2030-01-09 00:00:00", summary="Trip"),
+        IcsEvent(
+            uid="series",
+            start="2030-01-08 10:00:00",
+            end="2030-01-08 10:30:00",
+            summary="Moved",
+            recurrence_id="2030-01-08 09:00:00",
+            cancelled=True,
+        ),
+    ]
+    out = io.StringIO()
+    with IcsWriter(out) as writer:
+        for ev in events:
+            writer.write(ev)
+    text = out.getvalue()
+    assert "DTSTART;VALUE=DATE:20300107\r\n" in text
+    assert list(iter_events(io.StringIO(text, newline=""))) == events
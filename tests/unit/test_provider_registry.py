@@ -0,0 +1,185 @@
+"""
+Scheduler label providers (lux.core.scheduler.provider_registry): cache expiry/eviction and batched resolution.
+"""
+
+from __future__ import annotations
+
+from lux.core.scheduler.provider_registry import LabelCache, SchedulerProviderRegistry, SingleRefProviderAdapter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _SingleProvider:
+    """Implements only resolve_label (wrapped by SingleRefProviderAdapter)."""
+
+    def __init__(self, labels: dict[str, str]) -> None:
+        self.labels = labels
+        self.calls: list[str] = []
+
+    def resolve_label(self, item_ref: str) -> str | None:
+        self.calls.append(item_ref)
+        if item_ref == "boom":
+            raise RuntimeError("provider failure")
+        return self.labels.get(item_ref)
+
+
+class _BulkProvider:
+    def __init__(self, labels: dict[str, str]) -> None:
+        self.labels = labels
+        self.calls: list[list[str]] = []
+        self.fail = False
+
+    def resolve_label(self, item_ref: str) -> str | None:
+        return self.labels.get(item_ref)
+
+    def resolve_labels(self, item_refs) -> dict[str, str]:
+        self.calls.append(list(item_refs))
+        if self.fail:
+            raise RuntimeError("db locked")
+        return {r: self.labels[r] for r in item_refs if r in self.labels}
+
+
+# -------------------------
+# LabelCache
+# -------------------------
+def test_entries_expire_after_the_ttl():
+    clock = _Clock()
+    cache = LabelCache(ttl_s=10, clock=clock)
+    cache.put("task", "1", "Write report")
+    cache.put("task", "2", None)  # cached miss
+
+    clock.now += 9.9
+    assert cache.get("task", "1") == (True, "Write report")
+    assert cache.get("task", "2") == (True, None)
+
+    clock.now += 0.1
+    assert cache.get("task", "1") == (False, None)
+    assert cache.get("task", "2") == (False, None)
+    assert (cache.hits, cache.misses) == (2, 2) and cache.hit_rate() == 0.5
+
+
+def test_put_refreshes_the_ttl():
+    clock = _Clock()
+    cache = LabelCache(ttl_s=10, clock=clock)
+    cache.put("task", "1", "Old")
+    clock.now += 8
+    cache.put("task", "1", "New")
+    clock.now += 8
+    assert cache.get("task", "1") == (True, "New")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LabelCache(max_entries=2, clock=_Clock())
+    cache.put("task", "1", "one")
+    cache.put("task", "2", "two")
+    assert cache.get("task", "1") == (True, "one")  # 1 is now the most recent
+    cache.put("task", "3", "three")
+
+    assert cache.get("task", "2") == (False, None)
+    assert cache.get("task", "1") == (True, "one")
+    assert cache.get("task", "3") == (True, "three")
+
+
+def test_invalidate_by_kind_refs_or_all():
+    cache = LabelCache(clock=_Clock())
+    for kind in ("task", "habit"):
+        for ref in ("1", "2"):
+            cache.put(kind, ref, f"{kind} {ref}")
+
+    cache.invalidate("task", ["1"])
+    assert cache.get("task", "1")[0] is False and cache.get("task", "2")[0] is True
+    cache.invalidate("task")
+    assert cache.get("task", "2")[0] is False and cache.get("habit", "1")[0] is True
+    cache.invalidate()
+    assert cache.get("habit", "1")[0] is False
+
+
+# -------------------------
+# SingleRefProviderAdapter
+# -------------------------
+def test_single_ref_adapter_skips_failures_and_empty_labels():
+    provider = _SingleProvider({"1": "One", "2": ""})
+    adapter = SingleRefProviderAdapter(provider)
+    assert adapter.resolve_labels(["1", "2", "boom", "missing"]) == {"1": "One"}
+    assert provider.calls == ["1", "2", "boom", "missing"]
+    assert adapter.resolve_label("1") == "One"
+
+
+# -------------------------
+# SchedulerProviderRegistry.resolve_labels
+# -------------------------
+def test_one_bulk_call_per_kind_then_served_from_cache():
+    clock = _Clock()
+    registry = SchedulerProviderRegistry(LabelCache(ttl_s=60, clock=clock))
+    tasks = _BulkProvider({"1": "Task one", "2": "Task two"})
+    habits = _BulkProvider({"h": "Read"})
+    registry.register("task_occurrence", tasks)
+    registry.register("habit", habits)
+
+    pairs = [
+        ("task_occurrence", "1"),
+        ("habit", "h"),
+        ("task_occurrence", "2"),
+        ("task_occurrence", "1"),
+        ("task_occurrence", "gone"),
+        ("unknown_kind", "x"),
+    ]
+    expected = {("task_occurrence", "1"): "Task one", ("task_occurrence", "2"): "Task two", ("habit", "h"): "Read"}
+    assert registry.resolve_labels(pairs) == expected
+    assert tasks.calls == [["1", "2", "gone"]] and habits.calls == [["h"]]
+
+    # Hits and cached misses: no provider calls until the TTL runs out.
+    assert registry.resolve_labels(pairs) == expected
+    assert len(tasks.calls) == 1
+    clock.now += 61
+    registry.resolve_labels(pairs)
+    assert len(tasks.calls) == 2
+
+
+def test_single_ref_providers_are_adapted_and_batched_per_kind():
+    registry = SchedulerProviderRegistry(LabelCache(clock=_Clock()))
+    legacy = _SingleProvider({"a": "Alpha", "b": "Beta"})
+    registry.register("legacy", legacy)
+
+    assert isinstance(registry.get("legacy"), SingleRefProviderAdapter)
+    assert registry.resolve_labels([("legacy", "a"), ("legacy", "boom"), ("legacy", "b")]) == {
+        ("legacy", "a"): "Alpha",
+        ("legacy", "b"): "Beta",
+    }
+    # The failing ref was cached as a miss with the rest of the batch.
+    assert registry.resolve_labels([("legacy", "boom")]) == {}
+    assert legacy.calls == ["a", "boom", "b"]
+
+
+def test_failed_bulk_call_is_not_cached():
+    registry = SchedulerProviderRegistry(LabelCache(clock=_Clock()))
+    provider = _BulkProvider({"1": "One"})
+    registry.register("task", provider)
+
+    provider.fail = True
+    assert registry.resolve_labels([("task", "1")]) == {}
+    provider.fail = False
+    assert registry.resolve_labels([("task", "1")]) == {("task", "1"): "One"}
+    assert len(provider.calls) == 2
+
+
+def test_register_and_invalidate_drop_cached_labels():
+    registry = SchedulerProviderRegistry(LabelCache(clock=_Clock()))
+    provider = _BulkProvider({"1": "Before"})
+    registry.register("task", provider)
+    registry.resolve_labels([("task", "1")])
+
+    provider.labels["1"] = "After"
+    assert registry.resolve_labels([("task", "1")]) == {("task", "1"): "Before"}
+    registry.invalidate("task", ["1"])
+    assert registry.resolve_labels([("task", "1")]) == {("task", "1"): "After"}
+
+    replacement = _BulkProvider({"1": "Replaced"})
+    registry.register(" task ", replacement)
+    assert registry.resolve_labels([("task", "1")]) == {("task", "1"): "Replaced"}
@@ -0,0 +1,70 @@
+"""
+Scheduler controller day loads and the shared day cache (needs PySide6 for QDate).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QDate
+
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.features.scheduler.ui.controller import _DAY_LIMIT, _RANGE_LIMIT, SchedulerController
+from lux.features.scheduler.ui.prefetch import DayEntriesCache
+
+
+@dataclass(frozen=True)
+class _Row:
+    id: int
+    start_dt: str
+    end_dt: str
+    item_kind: str = "adhoc"
+    item_ref: str = ""
+    title_cache: str = "Entry"
+    series_id: int | None = None
+
+
+class _Service:
+    """list_range over a fixed number of rows on 2030-01-07, honouring the limit like the real service."""
+
+    def __init__(self, rows: int) -> None:
+        self.registry = SchedulerProviderRegistry()
+        self.rows = [_Row(i + 1, "2030-01-07 09:00:00", "2030-01-07 10:00:00") for i in range(rows)]
+        self.limits: list[int] = []
+
+    def list_range(self, start, end, include_archived=False, limit=500):
+        self.limits.append(limit)
+        return self.rows[:limit]
+
+
+def test_complete_day_is_cached():
+    service = _Service(3)
+    cache = DayEntriesCache()
+    ctl = SchedulerController(service, cache=cache)
+
+    assert len(ctl.list_entries_for_date(QDate(2030, 1, 7))) == 3
+    assert "2030-01-07" in cache
+    ctl.list_entries_for_date(QDate(2030, 1, 7))
+    assert service.limits == [_DAY_LIMIT]  # second load served from the cache
+
+
+def test_truncated_day_is_never_cached():
+    service = _Service(_DAY_LIMIT + 10)
+    cache = DayEntriesCache()
+    ctl = SchedulerController(service, cache=cache)
+
+    vms = ctl.list_entries_for_date(QDate(2030, 1, 7))
+    assert len(vms) == _DAY_LIMIT and "2030-01-07" not in cache
+
+    ctl.remember(QDate(2030, 1, 7), vms[:-1])  # an optimistic edit on the partial day
+    assert "2030-01-07" not in cache
+    ctl.list_entries_for_date(QDate(2030, 1, 7))
+    assert service.limits == [_DAY_LIMIT, _DAY_LIMIT]
+
+    # The window load has a higher bound: the full day fits and is cached.
+    assert len(ctl.list_entries_for_range(QDate(2030, 1, 7), 1)["2030-01-07"]) == _DAY_LIMIT + 10
+    assert service.limits[-1] == _RANGE_LIMIT and "2030-01-07" in cache
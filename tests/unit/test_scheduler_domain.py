@@ -0,0 +1,180 @@
+"""
+Recurrence rules (lux.core.recurrence) and recurring task instances (TasksService).
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from lux.core.recurrence import RecurrenceRule, expand_dates, format_rrule, last_date, parse_rrule
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.tasks_repo import TasksRepository
+from lux.features.tasks.repo import TasksRepo
+from lux.features.tasks.service import TasksService
+
+
+def _d(s: str) -> date:
+    return date.fromisoformat(s)
+
+
+def _expand(rule: str, dtstart: str, start: str, end: str) -> list[str]:
+    return [d.isoformat() for d in expand_dates(parse_rrule(rule), _d(dtstart), _d(start), _d(end))]
+
+
+# -------------------------
+# parse_rrule
+# -------------------------
+def test_parse_rrule_reads_every_supported_part():
+    rule = parse_rrule("RRULE:freq=weekly;interval=2;byday=fr,mo;until=20250131")
+    assert rule == RecurrenceRule(freq="WEEKLY", interval=2, by_weekday=(0, 4), until=_d("2025-01-31"))
+    assert format_rrule(rule) == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR;UNTIL=20250131"
+    assert parse_rrule(format_rrule(rule)) == rule
+
+
+@pytest.mark.parametrize("until", ["20250131", "20250131T235959Z", "2025-01-31"])
+def test_parse_rrule_until_formats(until):
+    assert parse_rrule(f"FREQ=DAILY;UNTIL={until}").until == _d("2025-01-31")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "INTERVAL=2",
+        "FREQ=HOURLY",
+        "FREQ=DAILY;INTERVAL=0",
+        "FREQ=DAILY;BYDAY=MO",
+        "FREQ=WEEKLY;BYDAY=XX",
+        "FREQ=DAILY;COUNT=0",
+        "FREQ=DAILY;COUNT=3;UNTIL=20250101",
+        "FREQ=DAILY;UNTIL=tomorrow",
+        "FREQ=DAILY;oops",
+    ],
+)
+def test_parse_rrule_rejects(text):
+    with pytest.raises(ValueError):
+        parse_rrule(text)
+
+
+# -------------------------
+# Expansion
+# -------------------------
+def test_count_bounds_the_series():
+    rule = parse_rrule("FREQ=DAILY;INTERVAL=2;COUNT=3")
+    assert last_date(rule, _d("2025-01-01")) == _d("2025-01-05")
+    assert _expand("FREQ=DAILY;INTERVAL=2;COUNT=3", "2025-01-01", "2024-12-01", "2025-02-01") == [
+        "2025-01-01",
+        "2025-01-03",
+        "2025-01-05",
+    ]
+    assert _expand("FREQ=DAILY;INTERVAL=2;COUNT=3", "2025-01-01", "2025-01-06", "2025-02-01") == []
+
+
+def test_until_is_inclusive():
+    assert _expand("FREQ=WEEKLY;UNTIL=20250115", "2025-01-01", "2025-01-01", "2025-12-31") == [
+        "2025-01-01",
+        "2025-01-08",
+        "2025-01-15",
+    ]
+
+
+def test_monthly_skips_months_without_the_day():
+    assert _expand("FREQ=MONTHLY", "2025-01-31", "2025-01-01", "2025-08-31") == [
+        "2025-01-31",
+        "2025-03-31",
+        "2025-05-31",
+        "2025-07-31",
+        "2025-08-31",
+    ]
+    # Skipped months do not use up COUNT.
+    assert last_date(parse_rrule("FREQ=MONTHLY;COUNT=3"), _d("2025-01-31")) == _d("2025-05-31")
+
+
+def test_yearly_feb_29_only_in_leap_years():
+    assert _expand("FREQ=YEARLY", "2024-02-29", "2024-01-01", "2033-12-31") == [
+        "2024-02-29",
+        "2028-02-29",
+        "2032-02-29",
+    ]
+
+
+def test_weekly_byday_starts_at_dtstart():
+    # 2025-01-01 is a Wednesday: the Monday of that week is before DTSTART.
+    assert _expand("FREQ=WEEKLY;BYDAY=MO,WE,FR", "2025-01-01", "2024-12-30", "2025-01-12") == [
+        "2025-01-01",
+        "2025-01-03",
+        "2025-01-06",
+        "2025-01-08",
+        "2025-01-10",
+    ]
+    assert _expand("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH", "2025-01-06", "2025-01-06", "2025-01-26") == [
+        "2025-01-07",
+        "2025-01-09",
+        "2025-01-21",
+        "2025-01-23",
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule",
+    ["FREQ=DAILY;INTERVAL=3", "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,SA", "FREQ=MONTHLY;INTERVAL=5", "FREQ=YEARLY"],
+)
+def test_seeking_matches_walking_from_dtstart(rule):
+    dtstart, start, end = "2020-02-29", "2031-06-01", "2033-06-30"
+    walked = [d for d in _expand(rule, dtstart, dtstart, end) if d >= start]
+    assert _expand(rule, dtstart, start, end) == walked
+
+
+# -------------------------
+# Recurring tasks
+# -------------------------
+@pytest.fixture
+def tasks(tmp_path: Path) -> TasksService:
+    conn = ensure_db_ready(tmp_path / "tasks.db")
+    yield TasksService(repo=TasksRepo(TasksRepository(conn)))
+    conn.close()
+
+
+def _count_rows(svc: TasksService) -> int:
+    return len(svc._repo.list_occurrences_for_range_joined("0000-01-01", "9999-12-31", limit=10_000))
+
+
+def test_expand_recurring_yields_virtual_instances(tasks):
+    tid = tasks.add_recurring_task("Water plants", "FREQ=WEEKLY;BYDAY=MO,TH;COUNT=4", "2025-01-06")
+
+    occs = tasks._expand_recurring("2025-01-01", "2025-01-31")
+
+    assert [o.due_date for o in occs] == ["2025-01-06", "2025-01-09", "2025-01-13", "2025-01-16"]
+    assert all(o.is_virtual and o.task_id == tid and o.recur_date == o.due_date for o in occs)
+    assert _count_rows(tasks) == 0  # nothing is written for virtual instances
+
+
+def test_expand_recurring_skips_materialized_and_corrupt_rules(tasks):
+    tid = tasks.add_recurring_task("Stretch", "FREQ=DAILY", "2025-01-01")
+    broken = tasks.add_recurring_task("Broken", "FREQ=DAILY", "2025-01-01")
+    tasks._repo.set_task_recurrence(task_id=broken, rule="FREQ=SOMETIMES", start_date="2025-01-01", until_date=None)
+    occ_id = tasks.materialize_occurrence(tid, "2025-01-02")
+
+    virtual = tasks._expand_recurring("2025-01-01", "2025-01-03")
+    assert [(o.task_id, o.due_date) for o in virtual] == [(tid, "2025-01-01"), (tid, "2025-01-03")]
+
+    listed = tasks._list_window("2025-01-01", "2025-01-03", limit=100)
+    assert [(o.id, o.due_date) for o in listed] == [(0, "2025-01-01"), (occ_id, "2025-01-02"), (0, "2025-01-03")]
+
+
+def test_materialize_occurrence_is_idempotent(tasks):
+    tid = tasks.add_recurring_task("Review", "FREQ=DAILY", date.today().isoformat())
+    day = (date.today() + timedelta(days=1)).isoformat()
+
+    first = tasks.materialize_occurrence(tid, day)
+    assert first > 0
+    assert tasks.materialize_occurrence(tid, day) == first
+    assert _count_rows(tasks) == 1
+
+    # A listed instance now resolves to the stored row, not a new one.
+    occ = next(o for o in tasks.list_upcoming(days=7) if o.task_id == tid and o.due_date == day)
+    assert not occ.is_virtual and tasks.resolve_occurrence_id(occ) == first
+    assert tasks.materialize_occurrence(0, day) == 0 and tasks.materialize_occurrence(tid, "") == 0
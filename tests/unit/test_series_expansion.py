@@ -0,0 +1,182 @@
+"""
+Batched series expansion (lux.core.scheduler.expansion) and series exceptions in SchedulerService.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from lux.core.recurrence import expand_dates, parse_rrule
+from lux.core.scheduler.expansion import EpochFormatter, SeriesSpec, expand_batch, series_end, to_epoch
+from lux.core.scheduler.provider_registry import SchedulerProviderRegistry
+from lux.core.scheduler.service import SchedulerService
+from lux.data.db import ensure_db_ready
+from lux.data.repositories.schedule_repo import ScheduledEntryRepo
+
+_DAY = 86_400
+fmt = EpochFormatter()
+
+
+def _spec(rule: str, start: str, minutes: int, key: int = 0) -> SeriesSpec:
+    first = to_epoch(start)
+    return SeriesSpec(key=key, rule=parse_rrule(rule), first_start=first, duration=minutes * 60)
+
+
+def _expand(specs: list[SeriesSpec], start: str, end: str) -> list[tuple[str, str, int]]:
+    return [(fmt(s), fmt(e), k) for s, e, k in expand_batch(specs, to_epoch(start), to_epoch(end))]
+
+
+def _reference(specs: list[SeriesSpec], range_start: int, range_end: int) -> list[tuple[int, int, int]]:
+    """Day-by-day expansion via lux.core.recurrence, filtered to instances overlapping the range."""
+    out = []
+    for spec in specs:
+        d0 = date(1970, 1, 1) + timedelta(seconds=spec.first_start)
+        tod = spec.first_start % _DAY
+        lo = date(1970, 1, 1) + timedelta(days=(range_start - spec.duration) // _DAY - 1)
+        hi = date(1970, 1, 1) + timedelta(days=range_end // _DAY + 1)
+        for d in expand_dates(spec.rule, d0, lo, hi):
+            s = (d - date(1970, 1, 1)).days * _DAY + tod
+            if s < range_end and s + spec.duration > range_start:
+                out.append((s, s + spec.duration, spec.key))
+    return sorted(out)
+
+
+# -------------------------
+# expand_batch
+# -------------------------
+def test_weekly_byday_with_count():
+    # 2030-01-07 is a Monday.
+    spec = _spec("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3", "2030-01-07 09:00:00", 60)
+    assert _expand([spec], "2030-01-01 00:00:00", "2030-03-01 00:00:00") == [
+        ("2030-01-07 09:00:00", "2030-01-07 10:00:00", 0),
+        ("2030-01-09 09:00:00", "2030-01-09 10:00:00", 0),
+        ("2030-01-14 09:00:00", "2030-01-14 10:00:00", 0),
+    ]
+
+
+def test_weekly_byday_before_dtstart_is_skipped_and_until_is_inclusive():
+    # DTSTART is a Wednesday: that week's Monday is not an instance.
+    spec = _spec("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;UNTIL=20300121", "2030-01-09 18:00:00", 30)
+    assert [s for s, _, _ in _expand([spec], "2030-01-01 00:00:00", "2030-03-01 00:00:00")] == [
+        "2030-01-09 18:00:00",
+        "2030-01-21 18:00:00",
+    ]
+
+
+def test_instances_overlapping_the_range_edges_are_included():
+    # Overnight shift 22:00-02:00: the instance starting the day before reaches into the range.
+    spec = _spec("FREQ=DAILY", "2030-01-01 22:00:00", 240)
+    got = _expand([spec], "2030-01-05 00:00:00", "2030-01-06 00:00:00")
+    assert [s for s, _, _ in got] == ["2030-01-04 22:00:00", "2030-01-05 22:00:00"]
+
+    # Half-open range: an instance ending exactly at range_start, or starting at range_end, is out.
+    touching = _spec("FREQ=DAILY", "2030-01-01 08:00:00", 60)
+    assert _expand([touching], "2030-01-05 09:00:00", "2030-01-06 08:00:00") == []
+
+
+def test_results_are_merged_by_start_across_series():
+    specs = [
+        _spec("FREQ=DAILY;COUNT=2", "2030-01-07 10:00:00", 30, key=1),
+        _spec("FREQ=WEEKLY", "2030-01-07 09:00:00", 30, key=2),
+        _spec("FREQ=MONTHLY", "2029-12-07 08:00:00", 30, key=3),
+    ]
+    assert [(s, k) for s, _, k in _expand(specs, "2030-01-07 00:00:00", "2030-01-09 00:00:00")] == [
+        ("2030-01-07 08:00:00", 3),
+        ("2030-01-07 09:00:00", 2),
+        ("2030-01-07 10:00:00", 1),
+        ("2030-01-08 10:00:00", 1),
+    ]
+
+
+def test_empty_and_inverted_ranges():
+    spec = _spec("FREQ=DAILY", "2030-01-01 09:00:00", 30)
+    assert expand_batch([spec], to_epoch("2030-01-05 00:00:00"), to_epoch("2030-01-05 00:00:00")) == []
+    assert expand_batch([spec], to_epoch("2030-01-06 00:00:00"), to_epoch("2030-01-05 00:00:00")) == []
+    assert expand_batch([], 0, 10**9) == []
+    assert _expand([spec], "2029-01-01 00:00:00", "2030-01-01 09:00:00") == []  # before DTSTART
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=DAILY",
+        "FREQ=DAILY;INTERVAL=3;COUNT=40",
+        "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+        "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,SU;UNTIL=20300601",
+        "FREQ=WEEKLY;COUNT=10",
+        "FREQ=MONTHLY;INTERVAL=2",
+        "FREQ=MONTHLY;COUNT=6",
+        "FREQ=YEARLY;UNTIL=20400101",
+    ],
+)
+def test_matches_recurrence_expand_dates(rule):
+    rng = random.Random(rule)
+    base = to_epoch("2030-01-01 00:00:00")
+    for _ in range(40):
+        first = base + rng.randrange(0, 60) * _DAY + rng.randrange(0, 96) * 900
+        spec = SeriesSpec(key=7, rule=parse_rrule(rule), first_start=first, duration=rng.choice([900, 3600, 30 * 3600]))
+        range_start = base + rng.randrange(-10, 200) * _DAY + rng.randrange(0, _DAY)
+        range_end = range_start + rng.randrange(1, 45 * _DAY)
+        assert expand_batch([spec], range_start, range_end) == _reference([spec], range_start, range_end)
+
+
+# -------------------------
+# series_end
+# -------------------------
+def test_series_end():
+    assert series_end(_spec("FREQ=DAILY", "2030-01-01 09:00:00", 30)) is None
+    count = _spec("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3", "2030-01-07 09:00:00", 60)
+    assert fmt(series_end(count)) == "2030-01-14 10:00:00"
+    until = _spec("FREQ=DAILY;UNTIL=20300110", "2030-01-01 23:00:00", 120)
+    assert fmt(series_end(until)) == "2030-01-11 01:00:00"  # the last instance runs past midnight
+
+    # Never earlier than the last expanded instance's end.
+    for spec in (count, until):
+        last = expand_batch([spec], spec.first_start, spec.first_start + 400 * _DAY)[-1]
+        assert series_end(spec) >= last[1]
+
+
+# -------------------------
+# Series exceptions (SchedulerService)
+# -------------------------
+@pytest.fixture
+def scheduler(tmp_path: Path) -> SchedulerService:
+    conn = ensure_db_ready(tmp_path / "schedule.db")
+    yield SchedulerService(repo=ScheduledEntryRepo(conn), registry=SchedulerProviderRegistry())
+    conn.close()
+
+
+def _week(svc: SchedulerService) -> list[tuple[str, int]]:
+    """(start, series_id) for the week of 2030-01-07; stored entries have series_id None."""
+    return [(r.start_dt, r.series_id) for r in svc.list_range("2030-01-07 00:00:00", "2030-01-14 00:00:00")]
+
+
+def test_exceptions_with_and_without_a_replacement(scheduler):
+    sid = scheduler.schedule_series(
+        "adhoc", "standup", "2030-01-07 09:00:00", "2030-01-07 09:15:00", "FREQ=WEEKLY;BYDAY=MO,TU,WE;COUNT=6"
+    )
+
+    scheduler.skip_instance(sid, "2030-01-08 09:00:00")
+    moved = scheduler.reschedule_instance(sid, "2030-01-09 09:00:00", "2030-01-09 11:00:00", "2030-01-09 11:15:00")
+
+    assert _week(scheduler) == [
+        ("2030-01-07 09:00:00", sid),
+        ("2030-01-09 11:00:00", None),  # the replacement entry, not an instance
+    ]
+    assert scheduler._repo.get(moved).start_dt == "2030-01-09 11:00:00"
+    # Other weeks are untouched.
+    later = scheduler.list_range("2030-01-14 00:00:00", "2030-01-21 00:00:00")
+    assert [r.start_dt for r in later] == ["2030-01-14 09:00:00", "2030-01-15 09:00:00", "2030-01-16 09:00:00"]
+
+
+def test_exception_hides_an_instance_that_started_before_the_range(scheduler):
+    sid = scheduler.schedule_series("adhoc", "night", "2030-01-01 22:00:00", "2030-01-02 02:00:00", "FREQ=DAILY")
+    window = ("2030-01-05 00:00:00", "2030-01-05 12:00:00")
+    assert [r.start_dt for r in scheduler.list_range(*window)] == ["2030-01-04 22:00:00"]
+
+    scheduler.skip_instance(sid, "2030-01-04 22:00:00")
+    assert scheduler.list_range(*window) == []
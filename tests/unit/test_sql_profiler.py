@@ -0,0 +1,84 @@
+"""
+Per-statement SQL profiling (lux.data.profiling) over an in-memory connection.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from lux.data.profiling import SqlProfiler, normalize_sql, param_shape
+
+
+@pytest.fixture
+def conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO t (name) VALUES (?)", [(f"n{i}",) for i in range(10)])
+    yield conn
+    conn.close()
+
+
+def _by_sql(profiler: SqlProfiler) -> dict:
+    return {s.sql: s for s in profiler.stats()}
+
+
+def test_normalize_and_param_shape():
+    assert normalize_sql("SELECT *\n  FROM t\n WHERE id IN (?, ?,?)") == "SELECT * FROM t WHERE id IN (?, …)"
+    assert param_shape(("a", 1, 2, 3)) == "(str, int×3)"
+    assert param_shape({"day": "2030-01-07"}) == "{day: str}"
+    assert param_shape(()) == "()"
+
+
+def test_disabled_profiler_records_nothing(conn):
+    profiler = SqlProfiler()
+    wrapped = profiler.wrap(conn)
+    assert isinstance(wrapped.execute("SELECT 1"), sqlite3.Cursor)  # raw pass-through
+    assert profiler.stats() == []
+
+
+def test_calls_and_rows_are_aggregated_per_statement(conn):
+    profiler = SqlProfiler(slow_ms=1e9, enabled=True)
+    db = profiler.wrap(conn)
+
+    # IN-lists of any length share one entry; each read pattern counts its rows.
+    assert len(db.execute("SELECT id FROM t WHERE id IN (?, ?)", (1, 2)).fetchall()) == 2
+    assert len(db.execute("SELECT id FROM t WHERE id IN (?, ?, ?)", (1, 2, 3)).fetchall()) == 3
+    assert db.execute("SELECT name FROM t WHERE id = ?", (4,)).fetchone() == ("n3",)
+    assert db.execute("SELECT name FROM t WHERE id = ?", (99,)).fetchone() is None
+    assert sum(1 for _ in db.execute("SELECT id FROM t")) == 10
+    db.execute("UPDATE t SET name = ? WHERE id <= ?", ("x", 4))
+    db.executemany("DELETE FROM t WHERE id = ?", [(9,), (10,)])
+
+    stats = _by_sql(profiler)
+    in_list = stats["SELECT id FROM t WHERE id IN (?, …)"]
+    assert (in_list.calls, in_list.rows) == (2, 5)
+    assert in_list.param_shapes == {"(int×2)": 1, "(int×3)": 1}
+    by_id = stats["SELECT name FROM t WHERE id = ?"]
+    assert (by_id.calls, by_id.rows) == (2, 1)
+    assert stats["SELECT id FROM t"].rows == 10
+    assert stats["UPDATE t SET name = ? WHERE id <= ?"].rows == 4
+    delete = stats["DELETE FROM t WHERE id = ?"]
+    assert (delete.calls, delete.rows, delete.param_shapes) == (1, 2, {"executemany": 1})
+    assert all(s.slow == 0 and s.plan is None for s in stats.values())
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 8  # results are unchanged
+
+    profiler.reset()
+    assert profiler.stats() == []
+
+
+def test_slow_statements_get_a_query_plan_and_export(conn, tmp_path):
+    profiler = SqlProfiler(slow_ms=0.0, enabled=True)
+    db = profiler.wrap(conn)
+    db.execute("SELECT name FROM t WHERE id = ?", (1,)).fetchall()
+    db.execute("SELECT name FROM t WHERE id = ?", (2,)).fetchall()
+
+    (stat,) = profiler.stats()
+    assert stat.slow == 2 and stat.plan and "t" in stat.plan[0]
+
+    path = tmp_path / "out" / "profile.json"
+    assert profiler.export(path) == 1
+    doc = json.loads(path.read_text(encoding="utf-8"))
+    assert doc["format"] == 1 and doc["statements"][0]["calls"] == 2